@@ -0,0 +1,227 @@
+"""Inverted label/role index for accessibility-style lookups.
+
+Why this exists:
+- AX trees on big dashboards routinely exceed tens of thousands of nodes.
+- Linear scans with hard caps silently miss controls that live past the cap.
+- The same "role + visible name" lookup is needed by AX tools, Tier-0 locators
+  and the in-memory affordance resolver.
+
+The index is built once per snapshot (O(n)) and then answers queries without
+scanning every entry:
+- normalized role → ids
+- normalized name → ids (exact)
+- sorted distinct names (bisect prefix ranges; a flattened prefix trie)
+- name tokens → ids, plus a 1..3-gram index over the distinct tokens (substring candidates,
+  verified on the small candidate set)
+
+Ranking stays compatible with the historical linear scan: exact (100) > prefix (80) > substring (50),
+ties keep document order.
+"""
+
+from __future__ import annotations
+
+import bisect
+from collections.abc import Iterable
+from typing import Any
+
+SCORE_EXACT = 100
+SCORE_PREFIX = 80
+SCORE_SUBSTRING = 50
+
+_GRAM = 3
+
+
+def norm_text(text: Any) -> str:
+    """Whitespace-collapse + casefold (shared normalization for roles and names)."""
+    return " ".join(str(text or "").split()).casefold()
+
+
+class LabelIndex:
+    """Immutable role/name index over a sequence of (role, name) entries.
+
+    Entry ids are positions in the input sequence (document order).
+    """
+
+    __slots__ = ("_roles", "_names", "_by_role", "_by_name", "_by_token", "_sorted_names", "_vocab", "_grams")
+
+    def __init__(self, entries: Iterable[tuple[Any, Any]]) -> None:
+        self._roles: list[str] = []
+        self._names: list[str] = []
+        self._by_role: dict[str, list[int]] = {}
+        self._by_name: dict[str, list[int]] = {}
+        self._by_token: dict[str, list[int]] = {}
+
+        for i, (role, name) in enumerate(entries):
+            r = norm_text(role)
+            n = norm_text(name)
+            self._roles.append(r)
+            self._names.append(n)
+            if r:
+                self._by_role.setdefault(r, []).append(i)
+            if n:
+                self._by_name.setdefault(n, []).append(i)
+                seen: set[str] = set()
+                for tok in n.split(" "):
+                    if tok and tok not in seen:
+                        seen.add(tok)
+                        self._by_token.setdefault(tok, []).append(i)
+
+        self._sorted_names: list[str] = sorted(self._by_name)
+        self._vocab: tuple[str, ...] = tuple(self._by_token)
+        # gram (1..3 chars) → ids into `_vocab` (ascending). Short grams keep 1-2 char queries indexed.
+        self._grams: dict[str, list[int]] = {}
+        for t, tok in enumerate(self._vocab):
+            for k in range(1, _GRAM + 1):
+                for g in {tok[j : j + k] for j in range(len(tok) - k + 1)}:
+                    self._grams.setdefault(g, []).append(t)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def role(self, idx: int) -> str:
+        return self._roles[idx]
+
+    def name(self, idx: int) -> str:
+        return self._names[idx]
+
+    def ids_for_roles(self, roles: Iterable[str]) -> list[int]:
+        """Return ids whose normalized role is in `roles` (document order)."""
+        out: list[int] = []
+        for r in {norm_text(r) for r in roles}:
+            out.extend(self._by_role.get(r, ()))
+        out.sort()
+        return out
+
+    def exact(self, name: Any) -> list[int]:
+        """Return ids whose normalized name equals `name` (document order)."""
+        return list(self._by_name.get(norm_text(name), ()))
+
+    def _prefix_names(self, q: str) -> list[str]:
+        names = self._sorted_names
+        out: list[str] = []
+        i = bisect.bisect_left(names, q)
+        while i < len(names) and names[i].startswith(q):
+            out.append(names[i])
+            i += 1
+        return out
+
+    def _substring_candidates(self, q: str) -> set[int]:
+        # Every query token is a contiguous run of non-space chars, so it must live inside
+        # a single name token. Use the most selective (longest) one to pick postings.
+        pivot = max(q.split(" "), key=len)
+        k = min(len(pivot), _GRAM)
+        postings = sorted(
+            (self._grams.get(pivot[j : j + k], ()) for j in range(len(pivot) - k + 1)),
+            key=len,
+        )
+        if not postings or not postings[0]:
+            return set()
+        toks = set(postings[0])
+        for p in postings[1:]:
+            toks.intersection_update(p)
+            if not toks:
+                return set()
+        cands: set[int] = set()
+        for t in toks:
+            tok = self._vocab[t]
+            if pivot in tok:
+                cands.update(self._by_token[tok])
+        return cands
+
+    def search(self, *, name: Any = None, roles: Iterable[str] | None = None) -> list[tuple[int, int]]:
+        """Return [(score, id)] ranked by score desc, then document order.
+
+        - `roles`: optional allowed role set (already alias-expanded by the caller).
+        - `name`: optional query; exact > prefix > substring. Empty-name entries never match a name query.
+        """
+        role_set = {norm_text(r) for r in roles if norm_text(r)} if roles else set()
+        q = norm_text(name)
+
+        if not q:
+            ids = self.ids_for_roles(role_set) if role_set else list(range(len(self._names)))
+            return [(0, i) for i in ids]
+
+        scores: dict[int, int] = {}
+        for n in self._prefix_names(q):
+            score = SCORE_EXACT if n == q else SCORE_PREFIX
+            for i in self._by_name[n]:
+                scores[i] = score
+        for i in self._substring_candidates(q):
+            if i not in scores and q in self._names[i]:
+                scores[i] = SCORE_SUBSTRING
+
+        out = [(s, i) for i, s in scores.items() if not role_set or self._roles[i] in role_set]
+        out.sort(key=lambda t: (-t[0], t[1]))
+        return out
+
+
+class AxIndex:
+    """AX snapshot (Accessibility.getFullAXTree / queryAXTree nodes) + LabelIndex.
+
+    Non-ignored nodes only; per-node values are normalized once at build time.
+    """
+
+    __slots__ = ("records", "labels", "_focusable")
+
+    def __init__(self, nodes: list[dict[str, Any]]) -> None:
+        self.records: list[dict[str, Any]] = []
+        self._focusable: list[int] = []
+        for n in nodes:
+            if not isinstance(n, dict) or n.get("ignored") is True:
+                continue
+            props = _ax_props(n)
+            backend_id = n.get("backendDOMNodeId") or n.get("backendDomNodeId") or 0
+            rec = {
+                "role": str(_ax_value(n.get("role")) or ""),
+                "name": str(_ax_value(n.get("name")) or ""),
+                "backendDOMNodeId": int(backend_id) if isinstance(backend_id, (int, float)) else backend_id,
+                "focusable": props.get("focusable"),
+                "disabled": props.get("disabled"),
+                "editable": props.get("editable"),
+            }
+            if rec["focusable"] is True:
+                self._focusable.append(len(self.records))
+            self.records.append(rec)
+        self.labels = LabelIndex((r["role"], r["name"]) for r in self.records)
+
+    def search(self, *, name: Any = None, roles: Iterable[str] | None = None) -> list[tuple[int, dict[str, Any]]]:
+        """Ranked [(score, record)] with the focusable/disabled adjustments applied."""
+        scored: list[tuple[int, int, dict[str, Any]]] = []
+        for score, i in self.labels.search(name=name, roles=roles):
+            rec = self.records[i]
+            adj = score + (10 if rec["focusable"] else 0) + (-20 if rec["disabled"] else 0)
+            scored.append((adj, i, rec))
+        scored.sort(key=lambda t: (-t[0], t[1]))
+        return [(s, rec) for s, _i, rec in scored]
+
+    def interactive(self, roles: Iterable[str]) -> list[dict[str, Any]]:
+        """Records with a role in `roles` or focusable=True (document order)."""
+        ids = set(self.labels.ids_for_roles(roles))
+        ids.update(self._focusable)
+        return [self.records[i] for i in sorted(ids)]
+
+
+def _ax_value(value: Any) -> Any:
+    if isinstance(value, dict) and "value" in value:
+        return value.get("value")
+    return value
+
+
+def _ax_props(node: dict[str, Any]) -> dict[str, bool]:
+    """Collect boolean AX properties in one pass (instead of one scan per property)."""
+    out: dict[str, bool] = {}
+    props = node.get("properties")
+    if not isinstance(props, list):
+        return out
+    for p in props:
+        if not isinstance(p, dict):
+            continue
+        pname = p.get("name")
+        if not isinstance(pname, str) or pname in out:
+            continue
+        v = _ax_value(p.get("value"))
+        if isinstance(v, bool):
+            out[pname] = v
+        elif isinstance(v, str) and v.lower() in {"true", "false"}:
+            out[pname] = v.lower() == "true"
+    return out
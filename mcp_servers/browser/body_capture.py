@@ -0,0 +1,493 @@
+"""Eager response-body capture (opt-in, armed before actions, streamed to disk).
+
+`net(action="trace", capture="body")` fetches bodies lazily with `Network.getResponseBody`;
+by then Chrome has often evicted them (navigation, buffer pressure) and large bodies come
+back as one base64 string held in memory. Eager capture instead:
+
+- opens a dedicated CDP connection to the tab (its own Network buffers, its own read loop);
+- on `Network.responseReceived` matching the rules (URL substrings, resource types, MIME
+  prefixes) opens an append-only artifact and calls `Network.streamResourceContent`;
+- writes `bufferedData` and every subsequent `Network.dataReceived.data` chunk straight to
+  that artifact, closing it on `loadingFinished` (abort on `loadingFailed`);
+- falls back to one `Network.getResponseBody` after `loadingFinished` when streaming is not
+  supported for the request (or the Chrome build).
+
+Memory stays flat: only per-request bookkeeping is kept. Disk is bounded by `budget_bytes`:
+with `evict="oldest"` completed bodies are deleted oldest-first to make room; with
+`evict="none"` new bodies are skipped once the budget is spent. Each body is capped at
+`max_body_bytes` (marked `truncated`). Bodies are stored raw (local artifacts); consumers
+such as `build_net_trace` redact when they read them back.
+
+Launch/attach mode only: extension mode has no second CDP connection to stream on.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import mimetypes
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from contextlib import suppress
+from dataclasses import dataclass, field
+from typing import Any
+
+from .config import BrowserConfig
+from .server.artifacts import ArtifactStore, ArtifactStream, artifact_store
+from .server.redaction import redact_url_brief
+from .session_cdp import CdpConnection
+from .tools.base import SmartToolError, get_session
+
+_DEFAULT_TYPES = ("XHR", "Fetch", "Document")
+_MAX_ENTRIES = 2000
+
+
+@dataclass(frozen=True)
+class CaptureRules:
+    include: tuple[str, ...] = ()
+    exclude: tuple[str, ...] = ()
+    types: frozenset[str] = frozenset(_DEFAULT_TYPES)
+    mime: tuple[str, ...] = ()
+    max_body_bytes: int = 5_000_000
+
+    def matches(self, *, url: str, rtype: str, mime: str) -> bool:
+        u = url.lower()
+        if self.types and rtype not in self.types:
+            return False
+        if self.include and not any(p in u for p in self.include):
+            return False
+        if self.exclude and any(p in u for p in self.exclude):
+            return False
+        return not self.mime or any(mime.lower().startswith(m) for m in self.mime)
+
+
+def _ext_for(mime: str) -> str:
+    m = mime.split(";", 1)[0].strip().lower()
+    if m.endswith("json"):
+        return ".json"
+    return mimetypes.guess_extension(m) or ".bin"
+
+
+@dataclass
+class _Body:
+    request_id: str
+    url: str
+    mime: str
+    status: int | None
+    stream: ArtifactStream
+    started: float
+    streaming: bool = False
+    fallback: bool = False
+    truncated: bool = False
+
+
+@dataclass
+class BodyCapture:
+    """Event-driven body capture state machine (transport-agnostic; see `_CaptureWorker`).
+
+    `send(method, params) -> id` issues a CDP command; `on_message` receives every CDP
+    message (events and command responses) from the same connection.
+    """
+
+    store: ArtifactStore
+    rules: CaptureRules
+    send: Callable[[str, dict[str, Any]], int]
+    budget_bytes: int = 50_000_000
+    evict: str = "oldest"
+
+    stored_bytes: int = 0
+    evicted: int = 0
+    skipped: int = 0
+    _active: dict[str, _Body] = field(default_factory=dict)
+    # requestId -> captured entry (oldest first; the eviction order)
+    _done: OrderedDict[str, dict[str, Any]] = field(default_factory=OrderedDict)
+    # command id -> (requestId, method)
+    _pending: dict[int, tuple[str, str]] = field(default_factory=dict)
+    # requestId -> content path (kept out of entries: no absolute paths in tool output)
+    _paths: dict[str, str] = field(default_factory=dict, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def on_message(self, msg: dict[str, Any]) -> None:
+        if "id" in msg:
+            pending = self._pending.pop(msg.get("id"), None) if isinstance(msg.get("id"), int) else None
+            if pending is not None:
+                self._on_result(pending[0], pending[1], msg)
+            return
+        params = msg.get("params") if isinstance(msg.get("params"), dict) else {}
+        rid = params.get("requestId")
+        if not isinstance(rid, str):
+            return
+        method = msg.get("method")
+        if method == "Network.responseReceived":
+            self._on_response(rid, params)
+        elif method == "Network.dataReceived":
+            body = self._active.get(rid)
+            if body is not None and body.streaming and isinstance(params.get("data"), str):
+                self._write_b64(body, params["data"])
+        elif method == "Network.loadingFinished":
+            body = self._active.get(rid)
+            if body is not None:
+                if body.fallback or not body.streaming:
+                    body.fallback = True
+                    self._pending[self.send("Network.getResponseBody", {"requestId": rid})] = (rid, "body")
+                else:
+                    self._finish(body)
+        elif method == "Network.loadingFailed":
+            body = self._active.pop(rid, None)
+            if body is not None:
+                self._abort(body)
+
+    def _on_response(self, rid: str, params: dict[str, Any]) -> None:
+        resp = params.get("response") if isinstance(params.get("response"), dict) else {}
+        url = resp.get("url") if isinstance(resp.get("url"), str) else ""
+        mime = resp.get("mimeType") if isinstance(resp.get("mimeType"), str) else ""
+        rtype = params.get("type") if isinstance(params.get("type"), str) else ""
+        if rid in self._active or not url or not self.rules.matches(url=url, rtype=rtype, mime=mime):
+            return
+        if self.evict == "none" and self.stored_bytes >= self.budget_bytes:
+            self.skipped += 1
+            return
+        stream = self.store.open_stream(
+            kind="response_body",
+            mime_type=mime or "application/octet-stream",
+            ext=_ext_for(mime),
+            metadata={"requestId": rid, "url": redact_url_brief(url), "type": rtype},
+        )
+        status = resp.get("status")
+        self._active[rid] = _Body(
+            request_id=rid,
+            url=url,
+            mime=mime,
+            status=int(status) if isinstance(status, (int, float)) else None,
+            stream=stream,
+            started=time.monotonic(),
+        )
+        self._pending[self.send("Network.streamResourceContent", {"requestId": rid})] = (rid, "stream")
+
+    def _on_result(self, rid: str, kind: str, msg: dict[str, Any]) -> None:
+        body = self._active.get(rid)
+        if body is None:
+            return
+        result = msg.get("result") if isinstance(msg.get("result"), dict) else None
+        if kind == "stream":
+            if body.fallback:
+                return  # loadingFinished came first: getResponseBody is already reading it whole
+            if result is None:
+                body.fallback = True  # unsupported / already finished: read it whole at the end
+                return
+            body.streaming = True
+            if isinstance(result.get("bufferedData"), str):
+                self._write_b64(body, result["bufferedData"])
+            return
+        # Fallback getResponseBody.
+        if result is not None and isinstance(result.get("body"), str):
+            raw = result["body"]
+            data = base64.b64decode(raw) if result.get("base64Encoded") else raw.encode("utf-8")
+            self._write(body, data)
+            self._finish(body)
+        else:
+            self._active.pop(rid, None)
+            self._abort(body)
+
+    def _abort(self, body: _Body) -> None:
+        self.stored_bytes -= body.stream.bytes
+        body.stream.abort()
+
+    def _write_b64(self, body: _Body, data: str) -> None:
+        try:
+            self._write(body, base64.b64decode(data))
+        except Exception:
+            body.truncated = True
+
+    def _write(self, body: _Body, data: bytes) -> None:
+        room = self.rules.max_body_bytes - body.stream.bytes
+        if len(data) > room:
+            data, body.truncated = data[: max(0, room)], True
+        if not data:
+            return
+        if not self._reserve(len(data)):
+            body.truncated = True
+            data = data[: max(0, self.budget_bytes - self.stored_bytes)]
+            if not data:
+                return
+        body.stream.write(data)
+        self.stored_bytes += len(data)
+
+    def _reserve(self, n: int) -> bool:
+        """Make room for `n` bytes within the budget (evicting completed bodies oldest-first)."""
+        while self.stored_bytes + n > self.budget_bytes:
+            if self.evict != "oldest" or not self._done:
+                return False
+            with self._lock:
+                rid, entry = self._done.popitem(last=False)
+            self._drop(rid, entry)
+        return True
+
+    def _drop(self, rid: str, entry: dict[str, Any]) -> None:
+        self._paths.pop(rid, None)
+        with suppress(Exception):
+            self.store.delete(artifact_id=entry["artifactId"])
+        self.stored_bytes -= int(entry.get("bytes") or 0)
+        self.evicted += 1
+
+    def _finish(self, body: _Body) -> None:
+        self._active.pop(body.request_id, None)
+        ref = body.stream.close(truncated=body.truncated)
+        entry = {
+            "requestId": body.request_id,
+            "url": redact_url_brief(body.url),
+            "status": body.status,
+            "mimeType": body.mime,
+            "bytes": ref.bytes,
+            "truncated": body.truncated,
+            "mode": "getResponseBody" if body.fallback else "stream",
+            "ms": int((time.monotonic() - body.started) * 1000),
+            "artifactId": ref.id,
+        }
+        self._paths[body.request_id] = ref.path
+        with self._lock:
+            self._done[body.request_id] = entry
+            overflow = [self._done.popitem(last=False) for _ in range(len(self._done) - _MAX_ENTRIES)]
+        for rid, old in overflow:
+            self._drop(rid, old)
+
+    def lookup(self, request_id: str) -> dict[str, Any] | None:
+        with self._lock:
+            entry = self._done.get(request_id)
+            return dict(entry) if entry is not None else None
+
+    def read_body(self, request_id: str, *, max_bytes: int) -> tuple[bytes, bool] | None:
+        """Read back (a prefix of) a captured body: (data, truncated)."""
+        entry = self.lookup(request_id)
+        if entry is None:
+            return None
+        path = self._paths.get(request_id)
+        limit = max_bytes if max_bytes > 0 else int(entry["bytes"])
+        try:
+            with open(str(path), "rb") as fh:
+                data = fh.read(limit + 1)
+        except OSError:
+            return None
+        return data[:limit], bool(entry.get("truncated")) or len(data) > limit
+
+    def status(self, *, items: int = 0) -> dict[str, Any]:
+        with self._lock:
+            done = list(self._done.values())
+        out: dict[str, Any] = {
+            "captured": len(done),
+            "inFlight": len(self._active),
+            "storedBytes": self.stored_bytes,
+            "budgetBytes": self.budget_bytes,
+            "evict": self.evict,
+            "evicted": self.evicted,
+            "skipped": self.skipped,
+        }
+        if items:
+            out["items"] = done[-items:]
+        return out
+
+    def close(self) -> None:
+        for body in list(self._active.values()):
+            self._abort(body)
+        self._active.clear()
+
+    def purge(self) -> None:
+        """Close and delete every captured body (the capture is being replaced)."""
+        self.close()
+        with self._lock:
+            done = list(self._done.items())
+            self._done.clear()
+        for rid, entry in done:
+            self._drop(rid, entry)
+
+
+class _CaptureWorker:
+    """Owns the dedicated CDP connection and feeds `BodyCapture` from its read loop."""
+
+    def __init__(self, ws_url: str, tab_id: str, make: Callable[[Callable[[str, dict[str, Any]], int]], BodyCapture]):
+        self.ws_url = ws_url
+        self.error: str | None = None
+        self._conn = CdpConnection(ws_url, timeout=5.0)
+        self._next_id = 1_000_000
+        self.capture = make(self._send)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"mcp-body-capture-{tab_id}", daemon=True)
+
+    def _send(self, method: str, params: dict[str, Any]) -> int:
+        self._next_id += 1
+        self._conn.ws.send(json.dumps({"id": self._next_id, "method": method, "params": params}))
+        return self._next_id
+
+    def start(self) -> None:
+        try:
+            # Generous buffers so the getResponseBody fallback still finds late bodies.
+            self._conn.send("Network.enable", {"maxTotalBufferSize": 100_000_000, "maxResourceBufferSize": 20_000_000})
+            self._thread.start()
+        except Exception:
+            with suppress(Exception):
+                self._conn.close()
+            raise
+
+    def _run(self) -> None:
+        try:
+            while not self._stop.is_set():
+                try:
+                    self._conn.ws.settimeout(0.5)
+                    raw = self._conn.ws.recv()
+                except Exception as exc:  # noqa: BLE001
+                    if isinstance(exc, TimeoutError) or "timed out" in str(exc).lower():
+                        continue
+                    raise
+                with suppress(ValueError):
+                    msg = json.loads(raw)
+                    if isinstance(msg, dict):
+                        self.capture.on_message(msg)
+        except Exception as exc:  # noqa: BLE001
+            if not self._stop.is_set():
+                self.error = str(exc)
+        finally:
+            self.capture.close()
+            with suppress(Exception):
+                self._conn.close()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join(timeout=2.0)
+
+
+_workers: dict[str, _CaptureWorker] = {}
+_workers_lock = threading.Lock()
+
+
+def get_body_capture(tab_id: str | None) -> BodyCapture | None:
+    """The live (or last stopped) capture for a tab, for trace enrichment."""
+    with _workers_lock:
+        worker = _workers.get(tab_id or "")
+    return worker.capture if worker is not None else None
+
+
+def start_body_capture(
+    config: BrowserConfig,
+    *,
+    include: list[str] | None = None,
+    exclude: list[str] | None = None,
+    types: list[str] | None = None,
+    mime: list[str] | None = None,
+    max_body_bytes: int = 5_000_000,
+    budget_bytes: int = 50_000_000,
+    evict: str = "oldest",
+) -> dict[str, Any]:
+    """Arm eager body capture for the current tab (replaces a previous capture)."""
+    if evict not in {"oldest", "none"}:
+        raise SmartToolError(
+            tool="net",
+            action="capture",
+            reason=f"Unknown evict policy: {evict}",
+            suggestion='Use evict="oldest" (drop oldest bodies) or evict="none" (stop when full)',
+        )
+    rules = CaptureRules(
+        include=tuple(p.lower() for p in include or ()),
+        exclude=tuple(p.lower() for p in exclude or ()),
+        types=frozenset(types) if types else frozenset(_DEFAULT_TYPES),
+        mime=tuple(m.lower() for m in mime or ()),
+        max_body_bytes=max(1024, min(int(max_body_bytes), 200_000_000)),
+    )
+    budget = max(rules.max_body_bytes, min(int(budget_bytes), 2_000_000_000))
+
+    with get_session(config, ensure_diagnostics=False) as (session, target):
+        conn = getattr(session, "conn", None)
+        ws_url = getattr(conn, "ws_url", None)
+        if not isinstance(conn, CdpConnection) or not isinstance(ws_url, str) or not ws_url:
+            raise SmartToolError(
+                tool="net",
+                action="capture",
+                reason="Eager body capture needs a direct CDP connection (not available in extension mode)",
+                suggestion='Use net(action="trace", capture="body") for lazy body reads instead',
+            )
+        tab_id = str(session.tab_id or target.get("id") or "")
+
+    stop_body_capture(tab_id)
+    previous = get_body_capture(tab_id)
+    if previous is not None:
+        # Each capture has its own disk budget: drop the old bodies instead of stacking budgets.
+        previous.purge()
+    try:
+        worker = _CaptureWorker(
+            ws_url,
+            tab_id,
+            lambda send: BodyCapture(store=artifact_store, rules=rules, send=send, budget_bytes=budget, evict=evict),
+        )
+        worker.start()
+    except Exception as exc:  # noqa: BLE001
+        raise SmartToolError(
+            tool="net",
+            action="capture",
+            reason=f"Failed to open capture connection: {exc}",
+            suggestion="Ensure the tab is still open and retry",
+        ) from exc
+    with _workers_lock:
+        _workers[tab_id] = worker
+    return {
+        "armed": True,
+        "tabId": tab_id,
+        "rules": {
+            "include": list(rules.include),
+            "exclude": list(rules.exclude),
+            "types": sorted(rules.types),
+            "mime": list(rules.mime),
+            "maxBodyBytes": rules.max_body_bytes,
+        },
+        "budgetBytes": budget,
+        "evict": evict,
+    }
+
+
+def stop_body_capture(tab_id: str | None, *, items: int = 0) -> dict[str, Any] | None:
+    """Disarm capture for a tab; captured bodies stay readable until the next start (which deletes them)."""
+    with _workers_lock:
+        worker = _workers.get(tab_id or "")
+    if worker is None:
+        return None
+    worker.stop()
+    return {"armed": False, **body_capture_status(tab_id, items=items)}
+
+
+def body_capture_status(tab_id: str | None, *, items: int = 0) -> dict[str, Any]:
+    with _workers_lock:
+        worker = _workers.get(tab_id or "")
+    if worker is None:
+        return {"armed": False}
+    alive = worker._thread.is_alive()
+    return {
+        "armed": alive,
+        **({"error": worker.error} if worker.error else {}),
+        **worker.capture.status(items=items),
+    }
+
+
+def body_capture_action(config: BrowserConfig, tab_id: str, args: dict[str, Any]) -> dict[str, Any]:
+    """`net(action="capture", enable=true|false, ...)` step arguments -> status payload."""
+    items = max(0, min(int(args.get("items", 0) or 0), 50))
+    enable = args.get("enable", True)
+    if enable is False or str(enable).strip().lower() in {"false", "0", "off", "stop"}:
+        return stop_body_capture(tab_id, items=items) or {"armed": False}
+    if enable == "status":
+        return body_capture_status(tab_id, items=items)
+
+    def _list(v: Any) -> list[str] | None:
+        if isinstance(v, str) and v.strip():
+            return [v.strip()]
+        return [str(x) for x in v if str(x).strip()] if isinstance(v, list) else None
+
+    return start_body_capture(
+        config,
+        include=_list(args.get("include")),
+        exclude=_list(args.get("exclude")),
+        types=_list(args.get("types")),
+        mime=_list(args.get("mime")),
+        max_body_bytes=int(args.get("maxBodyBytes", 5_000_000) or 5_000_000),
+        budget_bytes=int(args.get("budgetBytes", 50_000_000) or 50_000_000),
+        evict=str(args.get("evict", "oldest") or "oldest").strip().lower(),
+    )
@@ -28,6 +28,7 @@ from .diagnostics import DIAGNOSTICS_SCRIPT_SOURCE, DIAGNOSTICS_SCRIPT_VERSION
 from .http_client import HttpClientError
 from .sensitivity import is_sensitive_key
 from .telemetry import Tier0Telemetry
+from .telemetry_vitals import timeline_enable_params
 
 if TYPE_CHECKING:
     from .extension_gateway import ExtensionGateway
@@ -52,6 +53,7 @@ class BrowserSession:
         self._network_enabled = False
         self._log_enabled = False
         self._performance_enabled = False
+        self._timeline_enabled = False
 
     def __enter__(self) -> BrowserSession:
         self.enable_page()
@@ -97,6 +99,7 @@ class BrowserSession:
         network: bool = False,
         log: bool = False,
         performance: bool = False,
+        timeline: bool = False,
         strict: bool = True,
     ) -> None:
         """Enable common CDP domains with caching and batching.
@@ -127,6 +130,9 @@ class BrowserSession:
         if performance and not self._performance_enabled:
             cmds.append({"method": "Performance.enable", "params": {}})
             flags.append("performance")
+        if timeline and not self._timeline_enabled:
+            cmds.append({"method": "PerformanceTimeline.enable", "params": timeline_enable_params()})
+            flags.append("timeline")
 
         if not cmds:
             return
@@ -147,6 +153,8 @@ class BrowserSession:
                     self._log_enabled = True
                 elif f == "performance":
                     self._performance_enabled = True
+                elif f == "timeline":
+                    self._timeline_enabled = True
             return
         except Exception:
             # Fall back below.
@@ -171,6 +179,8 @@ class BrowserSession:
                 self._log_enabled = True
             elif f == "performance":
                 self._performance_enabled = True
+            elif f == "timeline":
+                self._timeline_enabled = True
 
         if strict and failures:
             failed_names = ", ".join(m for m, _ in failures if m)
@@ -269,9 +279,8 @@ class BrowserSession:
         # Fail-fast when a blocking JS dialog is open (Runtime.evaluate can hang indefinitely).
         # This relies on Tier-0 telemetry (best-effort); if telemetry is not enabled, we proceed.
         try:
-            telemetry = session_manager.get_telemetry(self.tab_id)
-            if telemetry is not None and getattr(telemetry, "dialog_open", False):
-                meta = getattr(telemetry, "dialog_last", None)
+            dialog_open, meta = session_manager.tier0_dialog(self.tab_id)
+            if dialog_open:
                 details = meta.get("type") if isinstance(meta, dict) else "dialog"
                 raise HttpClientError(f"Blocking JS dialog is open ({details}). Handle it via dialog() then retry.")
         except HttpClientError:
@@ -316,12 +325,8 @@ class BrowserSession:
 
                 if opened is not None:
                     # Best-effort: reflect the dialog state in Tier-0 so subsequent calls can fail fast.
-                    try:
-                        telemetry = session_manager.get_telemetry(self.tab_id)
-                        if telemetry is not None:
-                            telemetry.dialog_open = True
-                    except Exception:
-                        pass
+                    with suppress(Exception):
+                        session_manager.tier0_query(self.tab_id, lambda t: setattr(t, "dialog_open", True))
                     raise HttpClientError(
                         "Runtime.evaluate blocked by a JS dialog. Handle it via dialog() and retry."
                     ) from exc
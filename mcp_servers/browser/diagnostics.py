@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-DIAGNOSTICS_SCRIPT_VERSION = "7"
+from .dom_roots import COLLECT_ROOTS_JS
+
+DIAGNOSTICS_SCRIPT_VERSION = "8"
 
 
 # NOTE: This script is intentionally self-contained and idempotent.
@@ -24,7 +26,7 @@ DIAGNOSTICS_SCRIPT_VERSION = "7"
 # - clear(): reset buffers
 DIAGNOSTICS_SCRIPT_SOURCE = r"""
 (() => {
-  const VERSION = "7";
+  const VERSION = "8";
   const g = globalThis;
 
   if (g.__mcpDiag && g.__mcpDiag.__version === VERSION) {
@@ -47,6 +49,8 @@ DIAGNOSTICS_SCRIPT_SOURCE = r"""
         network: [],
       };
 
+  __MCP_COLLECT_ROOTS__
+
   function now() {
     return Date.now();
   }
@@ -943,47 +947,8 @@ DIAGNOSTICS_SCRIPT_SOURCE = r"""
     const limit = Math.max(0, Math.min(200, opts.limit || 50));
     const offset = Math.max(0, opts.offset || 0);
 
-    // Collect document + open shadow roots + same-origin iframes (best-effort).
-    const ROOTS = (() => {
-      const roots = [];
-      const queue = [{ root: document, depth: 0 }];
-      const MAX_ROOTS = 60;
-      const MAX_DEPTH = 6;
-      const MAX_SCAN = 4000;
-
-      while (queue.length && roots.length < MAX_ROOTS) {
-        const item = queue.shift();
-        const root = item && item.root;
-        const depth = item && typeof item.depth === "number" ? item.depth : 0;
-        if (!root) continue;
-        if (roots.includes(root)) continue;
-        roots.push(root);
-        if (depth >= MAX_DEPTH) continue;
-        if (!root.querySelectorAll) continue;
-
-        let scanned = 0;
-        for (const el of root.querySelectorAll("*")) {
-          scanned += 1;
-          if (scanned > MAX_SCAN) break;
-          if (el && el.shadowRoot) {
-            queue.push({ root: el.shadowRoot, depth: depth + 1 });
-            if (roots.length + queue.length >= MAX_ROOTS) break;
-          }
-          if (el && (el.tagName === "IFRAME" || el.tagName === "FRAME")) {
-            try {
-              const doc = el.contentDocument || (el.contentWindow && el.contentWindow.document);
-              if (doc) {
-                queue.push({ root: doc, depth: depth + 1 });
-                if (roots.length + queue.length >= MAX_ROOTS) break;
-              }
-            } catch (_e3) {
-              // Cross-origin frame; ignore.
-            }
-          }
-        }
-      }
-      return roots;
-    })();
+    // Collect document + open shadow roots + same-origin iframes (cached per document).
+    const ROOTS = __mcpCollectRoots(document);
 
     const queryAll = (selector, maxTotal) => {
       const out = [];
@@ -1269,4 +1234,4 @@ DIAGNOSTICS_SCRIPT_SOURCE = r"""
 
   return { ok: true, installed: true, version: VERSION, upgraded: !!prev };
 })()
-"""
+""".replace("__MCP_COLLECT_ROOTS__", COLLECT_ROOTS_JS)
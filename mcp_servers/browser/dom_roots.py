@@ -0,0 +1,201 @@
+"""In-page root discovery shared by DEEP_QUERY_JS and the diagnostics script.
+
+`__mcpCollectRoots(start)` returns `start` followed by every reachable open shadow root
+and same-origin (i)frame document, breadth-first.
+
+Discovery is one TreeWalker pass per root. A TreeWalker never crosses shadow or frame
+boundaries, so every element is visited exactly once (O(total elements)); visited roots
+live in a Set and the queue is index-based.
+
+For documents the result is cached per document (WeakMap) and kept current by a
+MutationObserver registered on every discovered root:
+- added subtrees are scanned incrementally on the next call,
+- removals prune roots whose host/frame left the tree,
+- a swapped iframe document, or more than MAX_PENDING added nodes queued between calls
+  (bulk re-renders), forces a full rebuild; the pending list never grows past the cap.
+
+`attachShadow` on an already-scanned host produces no mutation record, so two bounded
+checks cover it: custom elements (the usual late attachers, on upgrade) seen without a
+shadow root are kept in a capped watch list and re-checked on every call, and every
+REBUILD_EVERY calls the cache is rebuilt anyway (built-in hosts, watch list overflow).
+
+Kept as a plain string without imports so `diagnostics.py` can embed it without
+pulling in the tools package.
+"""
+
+from __future__ import annotations
+
+COLLECT_ROOTS_JS = r"""
+const __mcpCollectRoots = (start) => {
+  const MAX_ROOTS = 10000;
+  const MAX_PENDING = 5000;
+  const MAX_WATCHED_HOSTS = 2000;
+  const REBUILD_EVERY = 50;
+  const SHOW_ELEMENT = 1;
+  const OBSERVE = { childList: true, subtree: true };
+
+  const frameDoc = (el) => {
+    try {
+      return el.contentDocument || (el.contentWindow && el.contentWindow.document) || null;
+    } catch (e) {
+      return null; // Cross-origin frame.
+    }
+  };
+
+  const visit = (el, queue, state) => {
+    const sr = el.shadowRoot;
+    const tag = el.tagName;
+    if (sr) {
+      if (!state.seen.has(sr)) queue.push(sr);
+    } else if (tag && tag.indexOf('-') > 0 && state.hosts.length < MAX_WATCHED_HOSTS) {
+      state.hosts.push(el); // may attach a shadow root on upgrade, without a mutation record
+    }
+    if (tag === 'IFRAME' || tag === 'FRAME') {
+      const doc = frameDoc(el);
+      state.frames.set(el, doc);
+      if (doc && !state.seen.has(doc)) queue.push(doc);
+    }
+  };
+
+  const scanTree = (node, queue, state) => {
+    const owner = node.nodeType === 9 ? node : node.ownerDocument;
+    if (!owner || typeof owner.createTreeWalker !== 'function') return;
+    if (node.nodeType === 1) visit(node, queue, state);
+    const walker = owner.createTreeWalker(node, SHOW_ELEMENT);
+    for (let el = walker.nextNode(); el; el = walker.nextNode()) visit(el, queue, state);
+  };
+
+  const drain = (queue, state) => {
+    for (let qi = 0; qi < queue.length && state.roots.length < MAX_ROOTS; qi++) {
+      const root = queue[qi];
+      if (!root || state.seen.has(root)) continue;
+      state.seen.add(root);
+      state.roots.push(root);
+      if (state.observer) {
+        try {
+          state.observer.observe(root, OBSERVE);
+        } catch (e) {
+          // ignore
+        }
+      }
+      scanTree(root, queue, state);
+    }
+  };
+
+  const build = (root, observer) => {
+    const state = {
+      roots: [],
+      seen: new Set(),
+      frames: new Map(),
+      pending: [],
+      hosts: [],
+      calls: 0,
+      overflow: false,
+      prune: false,
+      version: 0,
+      observer,
+    };
+    drain([root], state);
+    return state;
+  };
+
+  const onRecords = (state, records) => {
+    for (const rec of records) {
+      const added = rec.addedNodes;
+      for (let i = 0; i < added.length && !state.overflow; i++) {
+        if (added[i].nodeType !== 1) continue;
+        if (state.pending.length >= MAX_PENDING) {
+          state.overflow = true; // cheaper to rebuild than to scan every added subtree
+          state.pending = [];
+        } else {
+          state.pending.push(added[i]);
+        }
+      }
+      if (!state.prune && rec.removedNodes.length && state.roots.length > 1) state.prune = true;
+    }
+    if (records.length) state.version += 1;
+  };
+
+  const isLive = (root, start) => {
+    if (root === start) return true;
+    if (root.nodeType === 11) return !!(root.host && root.host.isConnected);
+    try {
+      const frame = root.defaultView && root.defaultView.frameElement;
+      return !!(frame && frame.isConnected && frameDoc(frame) === root);
+    } catch (e) {
+      return false;
+    }
+  };
+
+  if (!start || start.nodeType !== 9 || typeof MutationObserver !== 'function') {
+    return start ? build(start, null).roots : [];
+  }
+
+  const g = globalThis;
+  const caches = g.__mcpRootCaches || (g.__mcpRootCaches = new WeakMap());
+  let state = caches.get(start);
+
+  if (state) {
+    onRecords(state, state.observer.takeRecords());
+    state.calls += 1;
+    let stale = state.overflow || state.calls >= REBUILD_EVERY;
+    if (!stale) {
+      for (const [el, doc] of state.frames) {
+        if (el.isConnected && frameDoc(el) !== doc) {
+          stale = true;
+          break;
+        }
+      }
+    }
+    if (stale) {
+      state.observer.disconnect();
+      caches.delete(start);
+      state = null;
+    }
+  }
+
+  if (!state) {
+    const holder = {};
+    const observer = new MutationObserver((records) => holder.state && onRecords(holder.state, records));
+    state = build(start, observer);
+    holder.state = state;
+    caches.set(start, state);
+    return state.roots;
+  }
+
+  if (state.prune) {
+    state.prune = false;
+    const kept = [];
+    for (const root of state.roots) {
+      if (isLive(root, start)) kept.push(root);
+      else state.seen.delete(root);
+    }
+    state.roots = kept;
+    for (const el of Array.from(state.frames.keys())) {
+      if (!el.isConnected) state.frames.delete(el);
+    }
+  }
+
+  const queue = [];
+  if (state.hosts.length) {
+    const hosts = state.hosts;
+    state.hosts = [];
+    for (const el of hosts) {
+      if (!el.isConnected) continue;
+      const sr = el.shadowRoot;
+      if (!sr) state.hosts.push(el);
+      else if (!state.seen.has(sr)) queue.push(sr);
+    }
+  }
+  if (state.pending.length) {
+    const pending = state.pending;
+    state.pending = [];
+    for (const el of pending) {
+      if (el.isConnected) scanTree(el, queue, state);
+    }
+  }
+  if (queue.length) drain(queue, state);
+
+  return state.roots;
+};
+"""
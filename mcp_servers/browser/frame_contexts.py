@@ -0,0 +1,242 @@
+"""Per-tab frame → execution context registry (Tier-0, event-driven).
+
+Maintained from CDP events on the Tier-0 bus instead of walking `Page.getFrameTree`
+on every call:
+- Page.frameAttached / frameNavigated / frameDetached → frame tree (url, origin, parent)
+- Runtime.executionContextCreated / Destroyed / Cleared → contextId per frame (main world)
+
+Runtime.enable replays existing contexts, so contexts are complete after (re)connect.
+Frames are not replayed by Page.enable: the registry is seeded once from a frame tree
+and marked unseeded again when the bus reconnects (`Tier0.busConnected`).
+
+Frames hosted in another renderer process (site-isolated iframes) appear in the tree
+but have no context on the page session; callers fall back to `Page.createIsolatedWorld`
+for frames that are still in-process and to a flat child session for the rest
+(`tools/page/frames.eval_in_frames`).
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+FRAME_EVENTS = frozenset(
+    {
+        "Page.frameAttached",
+        "Page.frameNavigated",
+        "Page.frameDetached",
+        "Runtime.executionContextCreated",
+        "Runtime.executionContextDestroyed",
+        "Runtime.executionContextsCleared",
+        "Tier0.busConnected",
+    }
+)
+
+_MAX_CONTEXTS = 4096
+
+
+class FrameContextRegistry:
+    """Thread-safe frame/context map for one tab."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._frames: dict[str, dict[str, Any]] = {}
+        self._contexts: dict[int, dict[str, Any]] = {}
+        self._default: dict[str, int] = {}
+        self._main: str | None = None
+        self.seeded = False
+
+    # ── ingest ──────────────────────────────────────────────────────────────
+
+    def ingest(self, method: str, params: dict[str, Any]) -> None:
+        with self._lock:
+            if method == "Runtime.executionContextCreated":
+                self._context_created(params.get("context"))
+            elif method == "Runtime.executionContextDestroyed":
+                self._context_destroyed(params.get("executionContextId"))
+            elif method == "Runtime.executionContextsCleared":
+                self._contexts.clear()
+                self._default.clear()
+            elif method == "Page.frameAttached":
+                frame_id = params.get("frameId")
+                if isinstance(frame_id, str) and frame_id:
+                    rec = self._frames.setdefault(frame_id, {"frameId": frame_id})
+                    parent = params.get("parentFrameId")
+                    if isinstance(parent, str) and parent:
+                        rec["parentFrameId"] = parent
+            elif method == "Page.frameNavigated":
+                self._upsert_frame(params.get("frame"))
+            elif method == "Page.frameDetached":
+                frame_id = params.get("frameId")
+                if isinstance(frame_id, str) and frame_id:
+                    if params.get("reason") == "swap":
+                        # Moved to another renderer process: keep the frame, drop its context.
+                        self._default.pop(frame_id, None)
+                    else:
+                        self._drop_frame(frame_id)
+            elif method == "Tier0.busConnected":
+                self.seeded = False
+
+    def _context_created(self, ctx: Any) -> None:
+        if not isinstance(ctx, dict) or not isinstance(ctx.get("id"), int):
+            return
+        aux = ctx.get("auxData") if isinstance(ctx.get("auxData"), dict) else {}
+        frame_id = aux.get("frameId") if isinstance(aux.get("frameId"), str) else None
+        cid = int(ctx["id"])
+        rec = {
+            "id": cid,
+            "frameId": frame_id,
+            "origin": ctx.get("origin") if isinstance(ctx.get("origin"), str) else None,
+            "name": ctx.get("name") if isinstance(ctx.get("name"), str) else None,
+            "uniqueId": ctx.get("uniqueId") if isinstance(ctx.get("uniqueId"), str) else None,
+            "isDefault": bool(aux.get("isDefault")),
+        }
+        self._contexts[cid] = rec
+        while len(self._contexts) > _MAX_CONTEXTS:
+            oldest = next(iter(self._contexts))
+            self._context_destroyed(oldest)
+        if frame_id and rec["isDefault"]:
+            self._default[frame_id] = cid
+            frame = self._frames.setdefault(frame_id, {"frameId": frame_id})
+            if rec["origin"] and not frame.get("origin"):
+                frame["origin"] = rec["origin"]
+
+    def _context_destroyed(self, cid: Any) -> None:
+        if not isinstance(cid, int):
+            return
+        rec = self._contexts.pop(cid, None)
+        frame_id = rec.get("frameId") if isinstance(rec, dict) else None
+        if frame_id and self._default.get(frame_id) == cid:
+            del self._default[frame_id]
+
+    def _upsert_frame(self, frame: Any) -> None:
+        if not isinstance(frame, dict) or not isinstance(frame.get("id"), str):
+            return
+        frame_id = frame["id"]
+        rec = self._frames.setdefault(frame_id, {"frameId": frame_id})
+        parent = frame.get("parentId")
+        if isinstance(parent, str) and parent:
+            rec["parentFrameId"] = parent
+        else:
+            rec.pop("parentFrameId", None)
+            self._main = frame_id
+        for src, dst in (("url", "url"), ("securityOrigin", "origin"), ("name", "name"), ("mimeType", "mimeType")):
+            value = frame.get(src)
+            if isinstance(value, str) and value:
+                rec[dst] = value
+            else:
+                rec.pop(dst, None)
+
+    def _drop_frame(self, frame_id: str) -> None:
+        doomed = {frame_id}
+        changed = True
+        while changed:
+            changed = False
+            for fid, rec in self._frames.items():
+                if fid not in doomed and rec.get("parentFrameId") in doomed:
+                    doomed.add(fid)
+                    changed = True
+        for fid in doomed:
+            self._frames.pop(fid, None)
+            cid = self._default.pop(fid, None)
+            if cid is not None:
+                self._contexts.pop(cid, None)
+
+    def seed(self, frame_tree: dict[str, Any]) -> None:
+        """Replace the frame tree from a `Page.getFrameTree` result (contexts are kept)."""
+        with self._lock:
+            known = set()
+            stack = [frame_tree]
+            while stack:
+                node = stack.pop()
+                if not isinstance(node, dict):
+                    continue
+                frame = node.get("frame")
+                self._upsert_frame(frame)
+                if isinstance(frame, dict) and isinstance(frame.get("id"), str):
+                    known.add(frame["id"])
+                children = node.get("childFrames")
+                if isinstance(children, list):
+                    stack.extend(children)
+            for fid in [f for f in self._frames if f not in known]:
+                self._frames.pop(fid, None)
+                self._default.pop(fid, None)
+            self.seeded = True
+
+    # ── queries ─────────────────────────────────────────────────────────────
+
+    def frame_tree(self) -> dict[str, Any] | None:
+        """Return the registry as a `Page.getFrameTree`-shaped tree (None if unknown)."""
+        with self._lock:
+            if not self._main or self._main not in self._frames:
+                return None
+            children: dict[str, list[str]] = {}
+            for fid, rec in self._frames.items():
+                parent = rec.get("parentFrameId")
+                if isinstance(parent, str):
+                    children.setdefault(parent, []).append(fid)
+
+            def _node(fid: str) -> dict[str, Any]:
+                rec = self._frames[fid]
+                frame = {"id": fid}
+                for src, dst in (
+                    ("url", "url"),
+                    ("origin", "securityOrigin"),
+                    ("name", "name"),
+                    ("mimeType", "mimeType"),
+                ):
+                    if rec.get(src):
+                        frame[dst] = rec[src]
+                if rec.get("parentFrameId"):
+                    frame["parentId"] = rec["parentFrameId"]
+                return {"frame": frame, "childFrames": [_node(c) for c in children.get(fid, [])]}
+
+            return _node(self._main)
+
+    def frames(self) -> list[dict[str, Any]]:
+        """Flat frame list (tree order, main first) with `contextId` where known."""
+        tree = self.frame_tree()
+        out: list[dict[str, Any]] = []
+        stack: list[tuple[dict[str, Any], int]] = [(tree, 0)] if tree else []
+        with self._lock:
+            while stack:
+                node, depth = stack.pop()
+                frame = node["frame"]
+                item = {
+                    "frameId": frame["id"],
+                    "depth": depth,
+                    **({"parentFrameId": frame["parentId"]} if frame.get("parentId") else {}),
+                    **({"url": frame["url"]} if frame.get("url") else {}),
+                    **({"origin": frame["securityOrigin"]} if frame.get("securityOrigin") else {}),
+                    **({"name": frame["name"]} if frame.get("name") else {}),
+                }
+                cid = self._default.get(frame["id"])
+                if cid is not None:
+                    item["contextId"] = cid
+                out.append(item)
+                stack.extend((child, depth + 1) for child in reversed(node["childFrames"]))
+        return out
+
+    def context_id(self, frame_id: str) -> int | None:
+        with self._lock:
+            return self._default.get(frame_id)
+
+    @property
+    def main_frame_id(self) -> str | None:
+        return self._main
+
+    def resolve(self, selector: str) -> list[dict[str, Any]]:
+        """Resolve a frame selector: "all" | "main" | frameId | URL/name substring."""
+        frames = self.frames()
+        sel = str(selector or "").strip()
+        if not sel or sel == "all":
+            return frames
+        if sel == "main":
+            return frames[:1]
+        exact = [f for f in frames if f["frameId"] == sel]
+        if exact:
+            return exact
+        needle = sel.lower()
+        return [
+            f for f in frames if needle in str(f.get("url") or "").lower() or needle == str(f.get("name") or "").lower()
+        ]
@@ -0,0 +1,489 @@
+"""Streaming HAR 1.2 export from Tier-0 network events.
+
+`net(action="har")` starts a recorder on the tab's Tier-0 telemetry (raw `Network.*`
+events via `Tier0Telemetry.net_sink`) and writes each HAR entry to an append-only
+artifact as soon as its request completes. The file is a valid HAR document once the
+recorder is stopped: the `{"log": {..., "entries": [` prefix is written up front and the
+closing brackets on stop.
+
+Memory is bounded by in-flight requests (`max_in_flight`), not by session length, so
+tens of thousands of requests are fine.
+
+`feed` runs inside `Tier0Telemetry.apply` under the shard lock, so it only queues the
+event; a per-recorder writer thread folds events, reads captured bodies and writes the
+artifact. Writer or sink failures are kept and reported by `har_status`.
+
+- timings: `Network.responseReceived.response.timing` (blocked/dns/connect/ssl/send/wait),
+  `receive` up to `loadingFinished.timestamp`
+- sizes: `loadingFinished.encodedDataLength` (`response._transferSize`, `bodySize`)
+- headers/URLs redacted via `server/redaction` (unless `redact=false`)
+- bodies (optional): request `postData` from the event, response text from eager body
+  capture (`net(action="capture")`) when it has the request; entries wait briefly for it.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import queue
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from datetime import datetime, timezone
+from typing import Any
+from urllib.parse import parse_qsl, urlsplit
+
+from .server.artifacts import ArtifactRef, ArtifactStream, artifact_store
+from .server.hints import artifact_get_hint
+from .server.redaction import redact_headers, redact_text_content, redact_url
+
+HAR_CREATOR = {"name": "mcp-browser", "version": "1.0"}
+# How long a completed entry may wait for its eagerly captured body.
+_BODY_WAIT_S = 2.0
+_MAX_AWAITING = 256
+# Events queued for the writer thread; beyond this they are dropped (and counted).
+_MAX_QUEUED = 20_000
+# Writer wake-up interval while idle (expires entries waiting for a body).
+_IDLE_S = 0.25
+_STOP = object()
+
+BodyReader = Callable[[str, int], "tuple[bytes, bool] | None"]
+
+
+def _iso(epoch_s: float | None) -> str:
+    ts = epoch_s if isinstance(epoch_s, (int, float)) and epoch_s > 0 else time.time()
+    return datetime.fromtimestamp(ts, tz=timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def _har_headers(headers: Any, *, redact: bool) -> list[dict[str, str]]:
+    if not isinstance(headers, dict):
+        return []
+    src = redact_headers(headers) if redact else headers
+    return [{"name": str(k), "value": str(v)} for k, v in src.items()]
+
+
+def _har_timings(timing: Any, *, end_ms: float | None) -> dict[str, float]:
+    """HAR timings from a CDP ResourceTiming (ms offsets from `requestTime`; -1 = n/a)."""
+    out = {"blocked": -1.0, "dns": -1.0, "connect": -1.0, "ssl": -1.0, "send": 0.0, "wait": 0.0, "receive": 0.0}
+    if not isinstance(timing, dict):
+        if end_ms is not None:
+            out["receive"] = round(max(0.0, end_ms), 3)
+        return out
+
+    def t(key: str) -> float:
+        v = timing.get(key)
+        return float(v) if isinstance(v, (int, float)) else -1.0
+
+    def span(start: str, end: str) -> float:
+        s, e = t(start), t(end)
+        return round(e - s, 3) if s >= 0 and e >= s else -1.0
+
+    first = next((v for v in (t("dnsStart"), t("connectStart"), t("sendStart")) if v >= 0), -1.0)
+    out["blocked"] = round(first, 3) if first >= 0 else -1.0
+    out["dns"] = span("dnsStart", "dnsEnd")
+    out["connect"] = span("connectStart", "connectEnd")
+    out["ssl"] = span("sslStart", "sslEnd")
+    out["send"] = max(0.0, span("sendStart", "sendEnd"))
+    headers_end = t("receiveHeadersEnd")
+    out["wait"] = round(max(0.0, headers_end - t("sendEnd")), 3) if headers_end >= 0 and t("sendEnd") >= 0 else 0.0
+    if end_ms is not None and headers_end >= 0:
+        out["receive"] = round(max(0.0, end_ms - headers_end), 3)
+    return out
+
+
+class HarRecorder:
+    """Folds raw `Network.*` events into HAR entries and streams them to `stream`."""
+
+    def __init__(
+        self,
+        stream: ArtifactStream,
+        *,
+        redact: bool = True,
+        bodies: bool = False,
+        max_body_bytes: int = 200_000,
+        body_reader: BodyReader | None = None,
+        max_in_flight: int = 5000,
+    ) -> None:
+        self.stream = stream
+        self.redact = redact
+        self.bodies = bodies
+        self.max_body_bytes = max_body_bytes
+        self.body_reader = body_reader
+        self.max_in_flight = max_in_flight
+        self.entries = 0
+        self.dropped = 0
+        self.lost_events = 0
+        self.error: str | None = None
+        self._inflight: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        # requestId -> (deadline, entry) completed entries waiting for a captured body
+        self._awaiting: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._finished = False
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=_MAX_QUEUED)
+        stream.write('{"log":{"version":"1.2","creator":' + json.dumps(HAR_CREATOR) + ',"pages":[],"entries":[\n')
+        self._writer = threading.Thread(target=self._run, name="har-writer", daemon=True)
+        self._writer.start()
+
+    # ── event folding ────────────────────────────────────────────────────────
+
+    def feed(self, method: str, params: dict[str, Any]) -> None:
+        """Queue one raw event (called under the telemetry lock: no I/O here)."""
+        if self._closed or not isinstance(params.get("requestId"), str):
+            return
+        try:
+            self._queue.put_nowait((method, params))
+        except queue.Full:
+            self.lost_events += 1
+
+    def flush(self, timeout_s: float = 5.0) -> bool:
+        """Block until every event fed so far has been folded and written (False: timed out)."""
+        done = threading.Event()
+        if self._closed or not self._writer.is_alive():
+            return True
+        self._queue.put(done)
+        return done.wait(timeout_s)
+
+    def _run(self) -> None:
+        while True:
+            try:
+                item = self._queue.get(timeout=_IDLE_S)
+            except queue.Empty:
+                item = None
+            if item is _STOP:
+                return
+            if isinstance(item, threading.Event):
+                item.set()
+                continue
+            try:
+                with self._lock:
+                    if item is not None:
+                        self._fold(*item)
+                    self._flush_awaiting(force=False)
+            except Exception as exc:
+                # Keep recording; `har_status` surfaces the last failure.
+                self.error = f"{type(exc).__name__}: {exc}"
+
+    def _fold(self, method: str, params: dict[str, Any]) -> None:
+        rid = params["requestId"]
+        if method == "Network.requestWillBeSent":
+            redirect = params.get("redirectResponse")
+            rec = self._inflight.pop(rid, None)
+            if rec is not None and isinstance(redirect, dict):
+                rec["response"] = redirect
+                self._complete(rid, rec, end_ts=params.get("timestamp"), size=redirect.get("encodedDataLength"))
+            self._start(rid, params)
+        elif method == "Network.responseReceived":
+            rec = self._inflight.get(rid)
+            if rec is not None and isinstance(params.get("response"), dict):
+                rec["response"] = params["response"]
+        elif method == "Network.loadingFinished":
+            rec = self._inflight.pop(rid, None)
+            if rec is not None:
+                self._complete(rid, rec, end_ts=params.get("timestamp"), size=params.get("encodedDataLength"))
+        elif method == "Network.loadingFailed":
+            rec = self._inflight.pop(rid, None)
+            if rec is not None:
+                rec["error"] = str(params.get("errorText") or "failed")
+                self._complete(rid, rec, end_ts=params.get("timestamp"), size=None)
+
+    def _start(self, rid: str, params: dict[str, Any]) -> None:
+        req = params.get("request")
+        if not isinstance(req, dict):
+            return
+        self._inflight[rid] = {
+            "request": req,
+            "wallTime": params.get("wallTime"),
+            "timestamp": params.get("timestamp"),
+            "type": params.get("type"),
+        }
+        while len(self._inflight) > self.max_in_flight:
+            self._inflight.popitem(last=False)
+            self.dropped += 1
+
+    def _complete(self, rid: str, rec: dict[str, Any], *, end_ts: Any, size: Any) -> None:
+        entry = self._entry(rec, end_ts=end_ts, size=size)
+        wants_body = self.bodies and self.body_reader is not None and "error" not in rec and rec.get("response")
+        if wants_body and not self._attach_body(rid, entry):
+            self._awaiting[rid] = (time.monotonic() + _BODY_WAIT_S, entry)
+            if len(self._awaiting) > _MAX_AWAITING:
+                self._flush_awaiting(force=True, limit=len(self._awaiting) - _MAX_AWAITING)
+            return
+        self._write(entry)
+
+    def _entry(self, rec: dict[str, Any], *, end_ts: Any, size: Any) -> dict[str, Any]:
+        req = rec["request"]
+        resp = rec.get("response") if isinstance(rec.get("response"), dict) else {}
+        url = str(req.get("url") or "")
+        if self.redact:
+            url = redact_url(url)
+        timing = resp.get("timing") if isinstance(resp.get("timing"), dict) else None
+        start = rec.get("timestamp")
+        base = timing.get("requestTime") if isinstance(timing, dict) else start
+        end_ms = (
+            (float(end_ts) - float(base)) * 1000.0
+            if isinstance(end_ts, (int, float)) and isinstance(base, (int, float))
+            else None
+        )
+        timings = _har_timings(timing, end_ms=end_ms)
+        if isinstance(timing, dict) and isinstance(start, (int, float)) and isinstance(base, (int, float)):
+            # Queueing before `requestTime` (offsets start there) is blocked time too.
+            queued = (float(base) - float(start)) * 1000.0
+            if queued > 0:
+                timings["blocked"] = round(max(0.0, timings["blocked"]) + queued, 3)
+        # HAR 1.2: `time` is the sum of the non-negative phases (`ssl` is part of `connect`).
+        total = sum(v for k, v in timings.items() if k != "ssl" and v > 0)
+
+        request: dict[str, Any] = {
+            "method": str(req.get("method") or "GET"),
+            "url": url,
+            "httpVersion": str(resp.get("protocol") or ""),
+            "cookies": [],
+            "headers": _har_headers(req.get("headers"), redact=self.redact),
+            "queryString": [{"name": k, "value": v} for k, v in parse_qsl(urlsplit(url).query, keep_blank_values=True)],
+            "headersSize": -1,
+            "bodySize": -1,
+        }
+        post = req.get("postData")
+        if isinstance(post, str):
+            text = redact_text_content(post) if self.redact else post
+            mime = next((v for k, v in (req.get("headers") or {}).items() if str(k).lower() == "content-type"), "")
+            request["postData"] = {"mimeType": str(mime), "text": text}
+            request["bodySize"] = len(post.encode("utf-8", errors="replace"))
+
+        transfer = int(size) if isinstance(size, (int, float)) else -1
+        status = resp.get("status")
+        response: dict[str, Any] = {
+            "status": int(status) if isinstance(status, (int, float)) else 0,
+            "statusText": str(resp.get("statusText") or rec.get("error") or ""),
+            "httpVersion": str(resp.get("protocol") or ""),
+            "cookies": [],
+            "headers": _har_headers(resp.get("headers"), redact=self.redact),
+            "content": {"size": max(0, transfer), "mimeType": str(resp.get("mimeType") or "")},
+            "redirectURL": str(
+                next((v for k, v in (resp.get("headers") or {}).items() if str(k).lower() == "location"), "")
+            ),
+            "headersSize": -1,
+            "bodySize": transfer,
+            "_transferSize": transfer,
+        }
+        if rec.get("error"):
+            response["_error"] = rec["error"]
+
+        entry: dict[str, Any] = {
+            "startedDateTime": _iso(rec.get("wallTime")),
+            "time": round(total, 3),
+            "request": request,
+            "response": response,
+            "cache": {},
+            "timings": timings,
+        }
+        if isinstance(resp.get("remoteIPAddress"), str):
+            entry["serverIPAddress"] = resp["remoteIPAddress"]
+        if isinstance(rec.get("type"), str):
+            entry["_resourceType"] = rec["type"]
+        return entry
+
+    # ── bodies ───────────────────────────────────────────────────────────────
+
+    def _attach_body(self, rid: str, entry: dict[str, Any]) -> bool:
+        try:
+            got = self.body_reader(rid, self.max_body_bytes) if self.body_reader is not None else None
+        except Exception:
+            got = None
+        if got is None:
+            return False
+        data, truncated = got
+        content = entry["response"]["content"]
+        content["size"] = max(content["size"], len(data))
+        try:
+            text = data.decode("utf-8")
+            content["text"] = redact_text_content(text) if self.redact else text
+        except UnicodeDecodeError:
+            content["text"] = base64.b64encode(data).decode("ascii")
+            content["encoding"] = "base64"
+        if truncated:
+            content["comment"] = "truncated"
+        return True
+
+    def _flush_awaiting(self, *, force: bool, limit: int | None = None) -> None:
+        now = time.monotonic()
+        for n, rid in enumerate(list(self._awaiting), start=1):
+            deadline, entry = self._awaiting[rid]
+            if not self._attach_body(rid, entry) and not force and now < deadline:
+                # Completion order ~ capture order: the rest are newer.
+                break
+            del self._awaiting[rid]
+            self._write(entry)
+            if limit is not None and n >= limit:
+                break
+
+    # ── output ───────────────────────────────────────────────────────────────
+
+    def _write(self, entry: dict[str, Any]) -> None:
+        self.stream.write(("," if self.entries else "") + json.dumps(entry, ensure_ascii=False) + "\n")
+        self.entries += 1
+
+    def _stop_writer(self, timeout_s: float) -> None:
+        if not self._closed:
+            self._closed = True
+            self._queue.put(_STOP)
+            self._writer.join(timeout_s)
+
+    def abort(self) -> None:
+        """Stop without finalizing (the partial artifact is deleted)."""
+        self._stop_writer(1.0)
+        with self._lock:
+            self.stream.abort()
+
+    def close(self, timeout_s: float = 10.0) -> ArtifactRef:
+        self._stop_writer(timeout_s)
+        with self._lock:
+            if not self._finished:
+                self._finished = True
+                self._flush_awaiting(force=True)
+                self.stream.write("]}}\n")
+            incomplete = len(self._inflight)
+            self._inflight.clear()
+        meta: dict[str, Any] = {"entries": self.entries, "inFlightAtStop": incomplete, "dropped": self.dropped}
+        if self.lost_events:
+            meta["lostEvents"] = self.lost_events
+        if self.error:
+            meta["error"] = self.error
+        return self.stream.close(truncated=bool(self.dropped or self.lost_events), metadata=meta)
+
+
+_recorders: dict[str, HarRecorder] = {}
+_recorders_lock = threading.Lock()
+
+
+def start_har(
+    tab_id: str,
+    *,
+    attach: Callable[[Callable[[str, dict[str, Any]], None] | None], bool],
+    redact: bool = True,
+    bodies: bool = False,
+    max_body_bytes: int = 200_000,
+    body_reader: BodyReader | None = None,
+) -> dict[str, Any] | None:
+    """Start recording this tab (replacing a previous recorder). None when Tier-0 is unavailable."""
+    stop_har(tab_id, attach=attach)
+    stream = artifact_store.open_stream(
+        kind="har", mime_type="application/json", ext=".har", metadata={"tabId": tab_id, "redact": redact}
+    )
+    rec = HarRecorder(stream, redact=redact, bodies=bodies, max_body_bytes=max_body_bytes, body_reader=body_reader)
+    if not attach(rec.feed):
+        rec.abort()
+        return None
+    with _recorders_lock:
+        _recorders[tab_id] = rec
+    return {"recording": True, "tabId": tab_id, "bodies": bodies, "redact": redact}
+
+
+def stop_har(
+    tab_id: str,
+    *,
+    attach: Callable[[Callable[[str, dict[str, Any]], None] | None], bool],
+    export: bool = False,
+    name: str | None = None,
+    overwrite: bool = False,
+) -> dict[str, Any] | None:
+    """Stop recording and finalize the HAR artifact. None when nothing was recording."""
+    with _recorders_lock:
+        rec = _recorders.pop(tab_id, None)
+    if rec is None:
+        return None
+    attach(None)
+    ref = rec.close()
+    out: dict[str, Any] = {
+        "recording": False,
+        "entries": rec.entries,
+        "dropped": rec.dropped,
+        "artifact": {
+            "id": ref.id,
+            "kind": ref.kind,
+            "mimeType": ref.mime_type,
+            "bytes": ref.bytes,
+            "createdAt": ref.created_at,
+        },
+        "next": [artifact_get_hint(artifact_id=ref.id, offset=0, max_chars=4000)],
+    }
+    if export:
+        res = artifact_store.export(artifact_id=ref.id, name=name, overwrite=overwrite)
+        if isinstance(res, dict) and isinstance(res.get("export"), dict):
+            out["export"] = res["export"]
+    return out
+
+
+def har_status(tab_id: str, *, sink_error: Callable[[], str | None] | None = None) -> dict[str, Any]:
+    """Recorder state; `sink_error` reports why telemetry detached the recorder's sink (if it did)."""
+    with _recorders_lock:
+        rec = _recorders.get(tab_id)
+    if rec is None:
+        return {"recording": False}
+    out: dict[str, Any] = {
+        "recording": True,
+        "entries": rec.entries,
+        "inFlight": len(rec._inflight),
+        "dropped": rec.dropped,
+    }
+    if rec.lost_events:
+        out["lostEvents"] = rec.lost_events
+    detached = sink_error() if sink_error is not None else None
+    if detached:
+        # Telemetry no longer feeds this recorder: the HAR stops growing until restarted.
+        out["recording"] = False
+        out["error"] = f"net sink detached: {detached}"
+    elif rec.error:
+        out["error"] = rec.error
+    return out
+
+
+def har_action(tab_id: str, args: dict[str, Any]) -> dict[str, Any]:
+    """`net(action="har", enable=true|false|"status", ...)` step arguments -> payload."""
+    from .body_capture import get_body_capture
+    from .session import session_manager
+    from .tools.base import SmartToolError
+
+    def attach(sink: Callable[[str, dict[str, Any]], None] | None) -> bool:
+        return session_manager.set_tier0_net_sink(tab_id, sink)
+
+    def sink_error() -> str | None:
+        return session_manager.tier0_query(tab_id, lambda t: t.net_sink_error)
+
+    enable = args.get("enable", True)
+    if enable == "status":
+        return har_status(tab_id, sink_error=sink_error)
+    if enable is False or str(enable).strip().lower() in {"false", "0", "off", "stop"}:
+        name = args.get("name")
+        out = stop_har(
+            tab_id,
+            attach=attach,
+            export=bool(args.get("export", False)),
+            name=str(name) if isinstance(name, str) and name.strip() else None,
+            overwrite=bool(args.get("overwrite", False)),
+        )
+        return out or {"recording": False}
+
+    def body_reader(rid: str, max_bytes: int) -> tuple[bytes, bool] | None:
+        cap = get_body_capture(tab_id)
+        return cap.read_body(rid, max_bytes=max_bytes) if cap is not None and cap.lookup(rid) else None
+
+    redact = args.get("redact")
+    out = start_har(
+        tab_id,
+        attach=attach,
+        redact=True if redact is None else bool(redact),
+        bodies=bool(args.get("bodies", False)),
+        max_body_bytes=max(0, min(int(args.get("maxBodyBytes", 200_000) or 0), 5_000_000)),
+        body_reader=body_reader,
+    )
+    if out is None:
+        raise SmartToolError(
+            tool="net",
+            action="har",
+            reason="Tier-0 telemetry not available for this tab",
+            suggestion="Ensure MCP_TIER0=1 (default), navigate() to a normal http(s) page, then retry",
+        )
+    return out
@@ -0,0 +1,288 @@
+"""Offline replay of recorded traffic (HAR or net-trace artifacts) via `Fetch.fulfillRequest`.
+
+`net(action="replay", artifact="<id>")` loads a HAR (`net(action="har")`) or a stored
+net trace (`net(action="trace", store=true, capture="body")`) into a `ReplayIndex` and
+installs it on the tab's Fetch interceptor (`net_rules`), ahead of any `rules`.
+
+Lookup is O(1): dict keys are `(method, normalized URL, sha1(request body))`, with a
+`(method, normalized URL)` fallback for bodies that differ (or were redacted at record
+time). URLs are normalized by lowercasing scheme/host, dropping the fragment, sorting query
+parameters and dropping `ignoreQuery` keys (cache busters). Recordings that were redacted
+are matched by redacting the live URL the same way. Repeated requests to the same key are
+answered in recorded order, cycling.
+
+Unmatched requests follow `fallthrough`: "continue" (live network, default), "block"
+(fail as offline) or "404".
+
+Responses recorded without their body (HAR `content.size > 0` but no `content.text`, or a
+net trace without `capture="body"`) are not indexed, so they follow `fallthrough` instead
+of replaying as empty 200s; `stats()` counts them as `skippedNoBody`.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import threading
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from .config import BrowserConfig
+from .net_rules import install_responder, remove_responder, responder_status
+from .server.artifacts import artifact_store
+from .server.redaction import redact_url
+from .tools.base import SmartToolError
+
+FALLTHROUGH = ("continue", "block", "404")
+# Replayed bodies are already decoded; length/encoding headers would lie.
+_DROP_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+_MAX_SOURCE_BYTES = 500_000_000
+# Statuses whose responses carry no body (an empty replay is faithful).
+_NO_BODY_STATUS = frozenset({204, 205, 304})
+
+
+def normalize_url(url: str, *, ignore_query: frozenset[str] = frozenset()) -> str:
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+    query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k not in ignore_query)
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or "/", urlencode(query), ""))
+
+
+def body_hash(body: Any) -> str:
+    if not isinstance(body, str) or not body:
+        return ""
+    return hashlib.sha1(body.encode("utf-8", errors="replace"), usedforsecurity=False).hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
+class Recorded:
+    status: int
+    headers: tuple[tuple[str, str], ...] = ()
+    body_b64: str = ""
+    error: str = ""
+
+
+class ReplayIndex:
+    """Recorded responses keyed for O(1) lookup (see module docstring)."""
+
+    def __init__(self, *, fallthrough: str = "continue", ignore_query: frozenset[str] = frozenset()) -> None:
+        self.fallthrough = fallthrough
+        self.ignore_query = ignore_query
+        self.redacted = False
+        self.entries = 0
+        self.served = 0
+        self.missed = 0
+        self.skipped = 0
+        self._exact: dict[tuple[str, str, str], deque[Recorded]] = {}
+        self._loose: dict[tuple[str, str], deque[Recorded]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, method: str, url: str, post: Any, rec: Recorded) -> None:
+        m, u = method.upper(), normalize_url(url, ignore_query=self.ignore_query)
+        self._exact.setdefault((m, u, body_hash(post)), deque()).append(rec)
+        self._loose.setdefault((m, u), deque()).append(rec)
+        self.entries += 1
+
+    def _take(self, bucket: deque[Recorded] | None) -> Recorded | None:
+        if not bucket:
+            return None
+        rec = bucket[0]
+        bucket.rotate(-1)
+        return rec
+
+    def lookup(self, method: str, url: str, post: Any) -> Recorded | None:
+        m = method.upper()
+        candidates = [url, redact_url(url)] if self.redacted else [url]
+        with self._lock:
+            for cand in candidates:
+                u = normalize_url(cand, ignore_query=self.ignore_query)
+                rec = self._take(self._exact.get((m, u, body_hash(post)))) or self._take(self._loose.get((m, u)))
+                if rec is not None:
+                    return rec
+        return None
+
+    def respond(self, params: dict[str, Any]) -> tuple[str, dict[str, Any], int] | None:
+        rid = str(params.get("requestId"))
+        req = params.get("request") if isinstance(params.get("request"), dict) else {}
+        rec = self.lookup(str(req.get("method") or "GET"), str(req.get("url") or ""), req.get("postData"))
+        if rec is None:
+            self.missed += 1
+            if self.fallthrough == "block":
+                return "Fetch.failRequest", {"requestId": rid, "errorReason": "InternetDisconnected"}, 0
+            if self.fallthrough == "404":
+                return "Fetch.fulfillRequest", {"requestId": rid, "responseCode": 404, "body": ""}, 0
+            return None
+        self.served += 1
+        if rec.error:
+            return "Fetch.failRequest", {"requestId": rid, "errorReason": "Failed"}, 0
+        headers = [{"name": k, "value": v} for k, v in rec.headers]
+        return (
+            "Fetch.fulfillRequest",
+            {"requestId": rid, "responseCode": rec.status, "responseHeaders": headers, "body": rec.body_b64},
+            0,
+        )
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "entries": self.entries,
+            "keys": len(self._loose),
+            "served": self.served,
+            "missed": self.missed,
+            "fallthrough": self.fallthrough,
+            **({"skippedNoBody": self.skipped} if self.skipped else {}),
+        }
+
+
+def _keep_header(name: str, value: str) -> bool:
+    return name.lower() not in _DROP_HEADERS and not value.startswith("<redacted")
+
+
+def _b64(text: Any, *, encoded: bool) -> str:
+    if not isinstance(text, str) or not text:
+        return ""
+    return text if encoded else base64.b64encode(text.encode("utf-8")).decode("ascii")
+
+
+def _body_missing(method: Any, status: int, size: Any, body_b64: str) -> bool:
+    """A response that had a body which was not recorded (replaying it would serve an empty body)."""
+    if body_b64 or status == 0 or status in _NO_BODY_STATUS or 100 <= status < 200 or 300 <= status < 400:
+        return False
+    return str(method or "GET").upper() != "HEAD" and isinstance(size, (int, float)) and size > 0
+
+
+def index_har(obj: dict[str, Any], index: ReplayIndex) -> None:
+    entries = obj.get("log", {}).get("entries") if isinstance(obj.get("log"), dict) else None
+    for e in entries if isinstance(entries, list) else ():
+        req, resp = e.get("request"), e.get("response")
+        if not isinstance(req, dict) or not isinstance(resp, dict) or not isinstance(req.get("url"), str):
+            continue
+        content = resp.get("content") if isinstance(resp.get("content"), dict) else {}
+        headers = tuple(
+            (str(h.get("name")), str(h.get("value")))
+            for h in resp.get("headers") or ()
+            if isinstance(h, dict) and _keep_header(str(h.get("name")), str(h.get("value")))
+        )
+        post = req.get("postData", {}).get("text") if isinstance(req.get("postData"), dict) else None
+        status = int(resp.get("status") or 0)
+        body = _b64(content.get("text"), encoded=content.get("encoding") == "base64")
+        if _body_missing(req.get("method"), status, content.get("size"), body):
+            index.skipped += 1
+            continue
+        rec = Recorded(
+            status=status,
+            headers=headers,
+            body_b64=body,
+            error=str(resp.get("_error") or ("failed" if status == 0 else "")),
+        )
+        index.add(str(req.get("method") or "GET"), req["url"], post, rec)
+
+
+def index_net_trace(obj: dict[str, Any], index: ReplayIndex) -> None:
+    for it in obj.get("items") or ():
+        if not isinstance(it, dict):
+            continue
+        url = it.get("urlFull") or it.get("url")
+        if not isinstance(url, str) or not url:
+            continue
+        selected = it.get("respHeaders", {}).get("selected") if isinstance(it.get("respHeaders"), dict) else None
+        ctype = selected.get("content-type") if isinstance(selected, dict) else None
+        body = str(it.get("responseBodyBase64") or _b64(it.get("responseBody"), encoded=False))
+        status = int(it.get("status") or 0)
+        if _body_missing(it.get("method"), status, it.get("encodedDataLength"), body):
+            index.skipped += 1
+            continue
+        rec = Recorded(
+            status=status,
+            headers=(("Content-Type", ctype),) if isinstance(ctype, str) else (),
+            body_b64=body,
+            error=str(it.get("errorText") or ("failed" if it.get("ok") is False and not it.get("status") else "")),
+        )
+        index.add(str(it.get("method") or "GET"), url, it.get("requestPostData"), rec)
+
+
+def load_replay_index(
+    *,
+    artifact_id: str | None = None,
+    path: str | None = None,
+    fallthrough: str = "continue",
+    ignore_query: frozenset[str] = frozenset(),
+) -> ReplayIndex:
+    """Build an index from an artifact id or a local .har/.json file (ValueError on bad input)."""
+    if fallthrough not in FALLTHROUGH:
+        raise ValueError(f"fallthrough must be one of {', '.join(FALLTHROUGH)}")
+    try:
+        src = artifact_store.content_path(artifact_id=artifact_id) if artifact_id else Path(str(path)).expanduser()
+    except (FileNotFoundError, ValueError) as exc:
+        raise ValueError(f"Replay source not found: {artifact_id}") from exc
+    if not src.is_file():
+        raise ValueError(f"Replay source not found: {path}")
+    if src.stat().st_size > _MAX_SOURCE_BYTES:
+        raise ValueError(f"Replay source is larger than {_MAX_SOURCE_BYTES} bytes")
+    try:
+        with src.open("rb") as fh:
+            obj = json.load(fh)
+    except ValueError as exc:
+        raise ValueError(f"Replay source is not valid JSON: {exc}") from exc
+    if not isinstance(obj, dict):
+        raise ValueError("Replay source must be a HAR or net-trace JSON object")
+
+    index = ReplayIndex(fallthrough=fallthrough, ignore_query=ignore_query)
+    if isinstance(obj.get("log"), dict):
+        index_har(obj, index)
+    else:
+        index_net_trace(obj, index)
+    if artifact_id:
+        meta = artifact_store.get_meta(artifact_id=artifact_id).get("meta") or {}
+        index.redacted = bool(meta.get("redact", True))
+    return index
+
+
+def replay_action(config: BrowserConfig, tab_id: str, args: dict[str, Any]) -> dict[str, Any]:
+    """`net(action="replay", artifact=..., fallthrough=..., enable=true|false|"status")` -> payload."""
+    enable = args.get("enable", True)
+    if enable == "status":
+        return responder_status(tab_id, "replay")
+    if enable is False or str(enable).strip().lower() in {"false", "0", "off", "stop"}:
+        return remove_responder(tab_id, "replay") or {"active": False}
+
+    artifact_id = args.get("artifact") or args.get("id")
+    path = args.get("path")
+    ignore = args.get("ignoreQuery")
+    try:
+        if not artifact_id and not path:
+            raise ValueError("Missing replay source")
+        index = load_replay_index(
+            artifact_id=str(artifact_id) if artifact_id else None,
+            path=str(path) if path else None,
+            fallthrough=str(args.get("fallthrough", "continue") or "continue").strip().lower(),
+            ignore_query=frozenset(str(k) for k in ignore) if isinstance(ignore, list) else frozenset(),
+        )
+    except ValueError as exc:
+        raise SmartToolError(
+            tool="net",
+            action="replay",
+            reason=str(exc),
+            suggestion='Record with net(action="har", redact=false) (or trace store=true, capture="body"), '
+            'then net(action="replay", artifact="<id>", fallthrough="continue"|"block"|"404")',
+        ) from exc
+    if not index.entries and index.skipped:
+        raise SmartToolError(
+            tool="net",
+            action="replay",
+            reason=f"Replay source has no recorded response bodies ({index.skipped} entries without one)",
+            suggestion='Record with net(action="har", bodies=true) or net(action="trace", store=true, capture="body")',
+        )
+    if not index.entries:
+        raise SmartToolError(
+            tool="net",
+            action="replay",
+            reason="Replay source has no entries",
+            suggestion="Record a session first (net(action='har'))",
+        )
+    return install_responder(config, tab_id, "replay", index)
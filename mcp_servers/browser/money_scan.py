@@ -0,0 +1,297 @@
+"""Streaming money-field scanner for captured JSON bodies (used by `net_trace` insights).
+
+`net(action="trace", capture="body")` surfaces a small `money` block (amounts, prices,
+currencies, payment-vs-cart mismatches). Parsing every body with `json.loads` and walking
+the tree caps out on large API responses and holds the whole tree in memory. Instead:
+
+- `_Lexer` tokenizes text chunks with one compiled regex (strings, numbers, literals,
+  punctuation); tokens split across chunks are carried over, nothing is built. Containers
+  past the depth/array caps are skipped bracket-to-bracket without tokenizing them;
+- `scan_money_fields` keeps only a stack of open containers (path, currency, pending hits)
+  and emits `{url, source, path, value, currency?}` records in document order. A currency
+  key anywhere in an object applies to the money fields of that object and of its
+  descendants without their own currency (the same rule as a full-tree walk);
+- scanning stops early once a body has yielded `stop_after` strong hits (or `max_hits`);
+- `scan_money_items` runs the per-body scans in a thread pool. Bodies that were captured
+  to disk (`bodyArtifact`) but truncated in the trace are scanned from the file in chunks,
+  so the in-memory size cap no longer hides their fields.
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+MONEY_KEY_RE = re.compile(r"(amount|price|total|subtotal|tax|vat)", re.IGNORECASE)
+CURRENCY_KEY_RE = re.compile(r"currency|curr|iso", re.IGNORECASE)
+
+_TOKEN_RE = re.compile(
+    r'\s*(?:([{}\[\]:,])|"((?:[^"\\]|\\.)*)"|(-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)|(true|false|null))',
+    re.DOTALL,
+)
+# Everything up to the next bracket outside a string (one C-level match per bracket).
+_SKIP_RE = re.compile(r'(?:[^"\[\]{}]+|"(?:[^"\\]|\\.)*")*', re.DOTALL)
+# A single string/number token longer than this is treated as malformed input.
+_MAX_CARRY_CHARS = 4_000_000
+_CHUNK_CHARS = 256 * 1024
+_MAX_ARRAY_ITEMS = 200
+_MAX_DEPTH = 12
+
+Token = tuple[str, Any]
+
+
+class _Lexer:
+    """Pull tokenizer over text chunks; a token split across chunks waits for the next one."""
+
+    def __init__(self, chunks: Iterable[str]) -> None:
+        self._chunks = iter(chunks)
+        self.buf = ""
+        self.pos = 0
+        self.final = False
+
+    def _fill(self) -> bool:
+        if self.final or len(self.buf) - self.pos > _MAX_CARRY_CHARS:
+            return False
+        nxt = next(self._chunks, None)
+        if nxt is None:
+            self.final = True
+        else:
+            self.buf = self.buf[self.pos :] + nxt
+            self.pos = 0
+        return True
+
+    def next_token(self) -> Token | None:
+        """Next ("punct", ch) | ("str", raw) | ("num", n) | ("lit", v) token; None at end or on bad input."""
+        while True:
+            m = _TOKEN_RE.match(self.buf, self.pos)
+            end = m.end() if m is not None else 0
+            # A number at the very end of the buffer may continue in the next chunk ("12" + ".5").
+            if m is None or (
+                m.group(3) is not None
+                and not self.final
+                and len(self.buf) - end <= 2
+                and not self.buf[end:].strip(".eE+-")
+            ):
+                if not self._fill():
+                    return None
+                continue
+            self.pos = end
+            punct, raw, num, lit = m.groups()
+            if punct is not None:
+                return "punct", punct
+            if raw is not None:
+                return "str", raw
+            if num is not None:
+                return "num", float(num) if any(c in num for c in ".eE") else int(num)
+            return "lit", {"true": True, "false": False}.get(lit)
+
+    def skip_container(self) -> None:
+        """Consume the rest of a container whose opening bracket was just read."""
+        depth = 1
+        while True:
+            self.pos = _SKIP_RE.match(self.buf, self.pos).end()  # type: ignore[union-attr]
+            ch = self.buf[self.pos : self.pos + 1]
+            if ch and ch in "[{":
+                depth += 1
+            elif ch and ch in "]}":
+                depth -= 1
+            elif not self._fill():  # end of buffer or a string split across chunks
+                return
+            else:
+                continue
+            self.pos += 1
+            if depth == 0:
+                return
+
+
+def iter_json_tokens(chunks: Iterable[str]) -> Iterator[Token]:
+    """Yield tokens from text chunks (strings raw, escapes intact); stops silently on bad input."""
+    lexer = _Lexer(chunks)
+    while (tok := lexer.next_token()) is not None:
+        yield tok
+
+
+def _unescape(raw: str) -> str:
+    if "\\" not in raw:
+        return raw
+    try:
+        return json.loads(f'"{raw}"')
+    except ValueError:
+        return raw
+
+
+class _Frame:
+    __slots__ = ("is_obj", "path", "depth", "key", "index", "currency", "pending")
+
+    def __init__(self, is_obj: bool, path: str, depth: int) -> None:
+        self.is_obj = is_obj
+        self.path = path
+        self.depth = depth
+        self.key: str | None = None
+        self.index = 0
+        self.currency: str | None = None
+        self.pending: list[dict[str, Any]] = []
+
+
+def scan_money_fields(
+    chunks: Iterable[str],
+    *,
+    url: str,
+    source: str,
+    score: Callable[[dict[str, Any]], int] | None = None,
+    strong_score: int = 60,
+    stop_after: int = 32,
+    max_hits: int = 512,
+) -> list[dict[str, Any]]:
+    """Scan JSON text for numeric money fields without materializing the document."""
+    out: list[dict[str, Any]] = []
+    stack: list[_Frame] = []
+    strong = 0
+    expect_key = False
+
+    def _child_path(parent: _Frame) -> str:
+        if parent.is_obj:
+            return f"{parent.path}.{parent.key}" if parent.path else str(parent.key)
+        return f"{parent.path}[{parent.index}]" if parent.path else f"[{parent.index}]"
+
+    def _resolve(frame: _Frame) -> None:
+        # Hits without their own currency inherit this object's, else wait for an ancestor's.
+        if frame.currency:
+            for rec in frame.pending:
+                rec["currency"] = frame.currency
+        elif stack:
+            stack[-1].pending.extend(frame.pending)
+        frame.pending = []
+
+    def _value_done() -> None:
+        if stack:
+            top = stack[-1]
+            if top.is_obj:
+                top.key = None
+            else:
+                top.index += 1
+
+    lexer = _Lexer(chunks)
+    while (token := lexer.next_token()) is not None:
+        kind, tok = token
+        top = stack[-1] if stack else None
+        if kind == "punct":
+            if tok in "{[":
+                if top is None:
+                    frame = _Frame(tok == "{", "", 0)
+                elif top.depth >= _MAX_DEPTH or (not top.is_obj and top.index >= _MAX_ARRAY_ITEMS):
+                    lexer.skip_container()  # beyond the depth/array caps: no hits can come from it
+                    _value_done()
+                    continue
+                else:
+                    frame = _Frame(tok == "{", _child_path(top), top.depth + 1)
+                stack.append(frame)
+                expect_key = frame.is_obj
+            elif tok in "}]":
+                if top is None:
+                    break
+                _resolve(stack.pop())
+                _value_done()
+                if not stack or strong >= stop_after or len(out) >= max_hits:
+                    break
+            elif tok == ",":
+                expect_key = bool(top is not None and top.is_obj)
+            continue
+
+        if top is None:
+            break  # scalar root: nothing to scan
+        if top.is_obj and expect_key and kind == "str":
+            top.key = _unescape(tok)
+            expect_key = False
+            continue
+        if not top.is_obj or top.key is None:
+            _value_done()
+            continue
+        key = top.key
+        if kind == "str" and top.currency is None and CURRENCY_KEY_RE.search(key):
+            cur = _unescape(tok).strip()
+            if cur:
+                top.currency = cur.upper()
+        elif kind == "num" and MONEY_KEY_RE.search(key):
+            rec: dict[str, Any] = {"url": url, "source": source, "path": _child_path(top), "value": tok}
+            out.append(rec)
+            top.pending.append(rec)
+            if score is not None and score(rec) >= strong_score:
+                strong += 1
+        _value_done()
+
+    # Early stop (or truncated input): apply whatever currencies the open objects already have.
+    while stack:
+        _resolve(stack.pop())
+    return out
+
+
+def _text_chunks(text: str) -> Iterator[str]:
+    for i in range(0, len(text), _CHUNK_CHARS):
+        yield text[i : i + _CHUNK_CHARS]
+
+
+def _file_chunks(path: Path) -> Iterator[str]:
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    with path.open("rb") as fh:
+        while data := fh.read(_CHUNK_CHARS):
+            yield decoder.decode(data)
+    yield decoder.decode(b"", final=True)
+
+
+def _looks_like_json(text: Any) -> bool:
+    if not isinstance(text, str):
+        return False
+    s = text.lstrip()[:1]
+    return s in ("{", "[")
+
+
+def scan_money_items(
+    items: list[dict[str, Any]],
+    *,
+    body_path: Callable[[str], Path | None] | None = None,
+    score: Callable[[dict[str, Any]], int] | None = None,
+    max_workers: int = 4,
+) -> list[dict[str, Any]]:
+    """Scan request/response bodies of trace items in a thread pool; hits in item order."""
+    jobs: list[tuple[str, str, str, Path | None]] = []
+    for it in items:
+        if not isinstance(it, dict):
+            continue
+        url = it.get("url") if isinstance(it.get("url"), str) else ""
+        if not url:
+            continue
+        post = it.get("requestPostData")
+        if _looks_like_json(post):
+            jobs.append((url, "requestPostData", post, None))
+        body = it.get("responseBody")
+        if not _looks_like_json(body):
+            continue
+        ref = it.get("bodyArtifact")
+        path = None
+        if it.get("responseBodyTruncated") and isinstance(ref, dict) and body_path is not None:
+            path = body_path(str(ref.get("id") or ""))
+        jobs.append((url, "responseBody", body, path))
+
+    def _run(job: tuple[str, str, str, Path | None]) -> list[dict[str, Any]]:
+        url, source, text, path = job
+        if path is not None:
+            try:
+                return scan_money_fields(_file_chunks(path), url=url, source=source, score=score)
+            except OSError:
+                pass  # evicted since the trace was built: the in-trace prefix still has signal
+        if not MONEY_KEY_RE.search(text):
+            return []
+        return scan_money_fields(_text_chunks(text), url=url, source=source, score=score)
+
+    if len(jobs) <= 1:
+        results = [_run(j) for j in jobs]
+    else:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(jobs)))) as ex:
+            results = list(ex.map(_run, jobs))
+    return [rec for hits in results for rec in hits]
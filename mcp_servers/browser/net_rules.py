@@ -0,0 +1,506 @@
+"""Request interception rules (CDP Fetch domain): block / continue / fulfill / delay.
+
+`net(action="rules", rules=[...], profile="fast")` compiles a rule table once and
+answers every `Fetch.requestPaused` from it:
+
+- host rules (`"example.com"`, `"*.doubleclick.net"`) live in a reversed-label trie, so a
+  lookup walks the request host's labels once regardless of how many host rules exist;
+- URL globs (`"*://*/ads/*"`, `"https://cdn.example/*.mp4"`) are translated once and joined
+  into one alternation regex (first rule wins via `lastgroup`); a single-label `"*.png"` /
+  `"*.mp4"` is a file-extension glob (URL path ends with it, query string ignored), not a
+  host wildcard;
+- resource-type rules (`{"types": ["Image", "Font"]}`) are a dict lookup.
+
+No regex is compiled per request; the earliest matching rule (table order) wins and gets
+its hit counter bumped. Unmatched requests continue untouched.
+
+Transport: launch/attach mode opens a dedicated CDP connection for the tab (its own Fetch
+session, like `body_capture`); extension mode drives the tab through the gateway
+(`Fetch.requestPaused` via gateway events, replies via gateway `cdp_send`). The same
+per-tab interceptor also serves `net(action="replay")` (see `har_replay`).
+"""
+
+from __future__ import annotations
+
+import base64
+import fnmatch
+import json
+import mimetypes
+import re
+import threading
+from contextlib import suppress
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Protocol
+from urllib.parse import urlsplit
+
+from .config import BrowserConfig
+from .session_cdp import CdpConnection, ExtensionCdpConnection
+from .tools.base import SmartToolError, get_session
+
+RULE_ACTIONS = ("block", "continue", "fulfill", "delay")
+_MAX_RULES = 2000
+_MAX_FULFILL_BYTES = 10_000_000
+_MAX_DELAY_MS = 30_000
+
+_TRACKER_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googlesyndication.com",
+    "doubleclick.net",
+    "adservice.google.com",
+    "connect.facebook.net",
+    "analytics.tiktok.com",
+    "bat.bing.com",
+    "hotjar.com",
+    "mc.yandex.ru",
+    "segment.io",
+    "cdn.segment.com",
+    "mixpanel.com",
+    "amplitude.com",
+    "fullstory.com",
+    "clarity.ms",
+    "newrelic.com",
+    "nr-data.net",
+    "sentry.io",
+    "criteo.com",
+    "taboola.com",
+    "outbrain.com",
+)
+
+PROFILES: dict[str, list[dict[str, Any]]] = {
+    "trackers": [{"match": f"*.{h}", "action": "block"} for h in _TRACKER_HOSTS],
+    "fast": [
+        *({"match": f"*.{h}", "action": "block"} for h in _TRACKER_HOSTS),
+        {"types": ["Image", "Media", "Font"], "action": "block"},
+    ],
+}
+
+
+@dataclass
+class Rule:
+    index: int
+    match: str
+    action: str
+    types: frozenset[str] = frozenset()
+    delay_ms: int = 0
+    status: int = 200
+    headers: list[dict[str, str]] = field(default_factory=list)
+    body_b64: str = ""
+    hits: int = 0
+
+    def summary(self) -> dict[str, Any]:
+        out: dict[str, Any] = {"rule": self.index, "match": self.match or "*", "action": self.action, "hits": self.hits}
+        if self.types:
+            out["types"] = sorted(self.types)
+        return out
+
+
+def _is_host_pattern(pat: str) -> bool:
+    wildcard = pat.startswith("*.")
+    bare = pat[2:] if wildcard else pat
+    if wildcard and "." not in bare:
+        return False  # "*.png": file extension, see `_glob_regex`
+    return bool(bare) and not any(c in bare for c in "/*?[:")
+
+
+def _glob_regex(pat: str) -> str:
+    if pat.startswith("*.") and not any(c in pat[2:] for c in "./*?[:"):
+        return rf"(?s:[^?#]*\.{re.escape(pat[2:])})(?:[?#].*)?\Z"
+    return fnmatch.translate(pat)
+
+
+class RuleTable:
+    """Compiled rule table (see module docstring). `decide` is O(host labels) + one regex."""
+
+    def __init__(self, rules: list[Rule]) -> None:
+        self.rules = rules
+        # Reversed host labels -> {"": [(index, subdomains_ok)], label: child}
+        self._trie: dict[str, Any] = {}
+        self._by_type: dict[str, int] = {}
+        self._any: int | None = None
+        globs: list[str] = []
+        self._typed_globs: list[tuple[Rule, re.Pattern[str]]] = []
+        for r in rules:
+            pat = r.match.strip().lower()
+            if not pat or pat == "*":
+                if r.types:
+                    for t in r.types:
+                        self._by_type.setdefault(t, r.index)
+                elif self._any is None:
+                    self._any = r.index
+            elif _is_host_pattern(pat):
+                wildcard = pat.startswith("*.")
+                node = self._trie
+                for label in reversed((pat[2:] if wildcard else pat).split(".")):
+                    node = node.setdefault(label, {})
+                # "*.x" matches x and its subdomains (Chrome blocklist semantics); "x" only x.
+                node.setdefault("", []).append((r.index, wildcard))
+            elif r.types:
+                self._typed_globs.append((r, re.compile(_glob_regex(pat))))
+            else:
+                globs.append(f"(?P<r{r.index}>{_glob_regex(pat)})")
+        self._glob_re = re.compile("|".join(globs)) if globs else None
+
+    def _host_hits(self, host: str) -> list[int]:
+        hits: list[int] = []
+        labels = host.split(".")
+        node = self._trie
+        for depth, label in enumerate(reversed(labels), start=1):
+            node = node.get(label)
+            if node is None:
+                break
+            for idx, subdomains in node.get("", ()):
+                if subdomains or depth == len(labels):
+                    hits.append(idx)
+        return hits
+
+    def decide(self, url: str, rtype: str) -> Rule | None:
+        u = url.lower()
+        best: int | None = self._any
+        try:
+            host = (urlsplit(u).hostname or "").rstrip(".")
+        except ValueError:
+            host = ""
+        for idx in self._host_hits(host) if host and self._trie else ():
+            r = self.rules[idx]
+            if (not r.types or rtype in r.types) and (best is None or idx < best):
+                best = idx
+        t_idx = self._by_type.get(rtype)
+        if t_idx is not None and (best is None or t_idx < best):
+            best = t_idx
+        if self._glob_re is not None:
+            m = self._glob_re.match(u)
+            if m is not None and m.lastgroup:
+                g_idx = int(m.lastgroup[1:])
+                if best is None or g_idx < best:
+                    best = g_idx
+        for r, rx in self._typed_globs:
+            if best is not None and r.index >= best:
+                break
+            if rtype in r.types and rx.match(u):
+                best = r.index
+                break
+        if best is None:
+            return None
+        rule = self.rules[best]
+        rule.hits += 1
+        return rule
+
+    def respond(self, params: dict[str, Any]) -> tuple[str, dict[str, Any], int] | None:
+        req = params.get("request") if isinstance(params.get("request"), dict) else {}
+        rtype = params.get("resourceType") if isinstance(params.get("resourceType"), str) else ""
+        rule = self.decide(str(req.get("url") or ""), rtype)
+        if rule is None:
+            return None
+        method, reply = fetch_reply(rule, str(params.get("requestId")))
+        return method, reply, rule.delay_ms if rule.action == "delay" else 0
+
+    def stats(self) -> dict[str, Any]:
+        return {"rules": len(self.rules), "hits": [r.summary() for r in self.rules if r.hits]}
+
+
+def compile_rules(raw: Any, *, profile: str | None = None) -> RuleTable:
+    """Validate + compile user rules (profile rules first). Raises ValueError with a readable reason."""
+    specs: list[Any] = []
+    if profile:
+        if profile not in PROFILES:
+            raise ValueError(f"Unknown profile {profile!r} (known: {', '.join(PROFILES)})")
+        specs.extend(PROFILES[profile])
+    if raw is not None and not isinstance(raw, list):
+        raise ValueError("rules must be a list of {match, action, ...} objects")
+    specs.extend(raw or [])
+    if len(specs) > _MAX_RULES:
+        raise ValueError(f"Too many rules ({len(specs)} > {_MAX_RULES})")
+
+    rules: list[Rule] = []
+    for i, spec in enumerate(specs):
+        if not isinstance(spec, dict):
+            raise ValueError(f"rules[{i}] must be an object")
+        action = str(spec.get("action") or "block").strip().lower()
+        if action not in RULE_ACTIONS:
+            raise ValueError(f"rules[{i}].action must be one of {', '.join(RULE_ACTIONS)}")
+        match = str(spec.get("match") or spec.get("url") or spec.get("host") or "").strip()
+        types_raw = spec.get("types")
+        types = frozenset(str(t) for t in types_raw) if isinstance(types_raw, list) else frozenset()
+        if not match and not types:
+            raise ValueError(f"rules[{i}] needs match (host or URL glob) and/or types")
+        rule = Rule(index=i, match=match, action=action, types=types)
+
+        if action == "delay":
+            rule.delay_ms = max(0, min(int(spec.get("delayMs", spec.get("ms", 0)) or 0), _MAX_DELAY_MS))
+        elif action == "fulfill":
+            rule.status = int(spec.get("status", 200) or 200)
+            body = b""
+            if isinstance(spec.get("file"), str) and spec["file"].strip():
+                path = Path(spec["file"]).expanduser()
+                if not path.is_file():
+                    raise ValueError(f"rules[{i}].file not found: {spec['file']}")
+                if path.stat().st_size > _MAX_FULFILL_BYTES:
+                    raise ValueError(f"rules[{i}].file is larger than {_MAX_FULFILL_BYTES} bytes")
+                body = path.read_bytes()
+                ctype = spec.get("contentType") or mimetypes.guess_type(path.name)[0]
+            else:
+                text = spec.get("body")
+                body = (
+                    (text if isinstance(text, str) else json.dumps(text)).encode("utf-8") if text is not None else b""
+                )
+                ctype = spec.get("contentType")
+            rule.body_b64 = base64.b64encode(body).decode("ascii")
+            rule.headers = [{"name": "Content-Type", "value": str(ctype or "application/octet-stream")}]
+        rules.append(rule)
+    return RuleTable(rules)
+
+
+class Responder(Protocol):
+    """Answers one `Fetch.requestPaused`: (CDP method, params, delay ms), or None to pass."""
+
+    def respond(self, params: dict[str, Any]) -> tuple[str, dict[str, Any], int] | None: ...
+
+    def stats(self) -> dict[str, Any]: ...
+
+
+_RESPONDER_ORDER = ["replay", "rules"]
+
+
+def fetch_reply(rule: Rule | None, request_id: str) -> tuple[str, dict[str, Any]]:
+    """The CDP command answering one paused request."""
+    if rule is None or rule.action in {"continue", "delay"}:
+        return "Fetch.continueRequest", {"requestId": request_id}
+    if rule.action == "block":
+        return "Fetch.failRequest", {"requestId": request_id, "errorReason": "BlockedByClient"}
+    return "Fetch.fulfillRequest", {
+        "requestId": request_id,
+        "responseCode": rule.status,
+        "responseHeaders": rule.headers,
+        "body": rule.body_b64,
+    }
+
+
+class _Interceptor:
+    """Answers `Fetch.requestPaused` for one tab on a background thread.
+
+    One interceptor per tab (the extension shares a single debugger session per tab), with
+    named responders consulted in install order (`replay` before `rules`); the first
+    non-None answer wins, otherwise the request continues.
+    """
+
+    def __init__(self, conn: Any, tab_id: str) -> None:
+        self.tab_id = tab_id
+        self.paused = 0
+        self.failures = 0
+        self.error: str | None = None
+        self.responders: dict[str, Responder] = {}
+        self._conn = conn
+        self._extension = isinstance(conn, ExtensionCdpConnection)
+        self._next_id = 2_000_000
+        self._send_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"mcp-fetch-{tab_id}", daemon=True)
+
+    def _send(self, method: str, params: dict[str, Any]) -> None:
+        if self._extension:
+            self._conn.send(method, params)
+            return
+        with self._send_lock:
+            self._next_id += 1
+            self._conn.ws.send(json.dumps({"id": self._next_id, "method": method, "params": params}))
+
+    def start(self) -> None:
+        self._conn.send("Fetch.enable", {"patterns": [{"urlPattern": "*", "requestStage": "Request"}]})
+        self._thread.start()
+
+    def _failed(self, exc: Exception) -> None:
+        self.failures += 1
+        self.error = str(exc) or type(exc).__name__
+
+    def handle(self, params: dict[str, Any]) -> None:
+        """Answer one paused request; a failing responder or reply falls back to continuing it."""
+        rid = params.get("requestId")
+        if not isinstance(rid, str):
+            return
+        self.paused += 1
+        answer = None
+        try:
+            for responder in list(self.responders.values()):
+                answer = responder.respond(params)
+                if answer is not None:
+                    break
+        except Exception as exc:  # noqa: BLE001
+            self._failed(exc)
+            answer = None
+        method, reply, delay_ms = answer or ("Fetch.continueRequest", {"requestId": rid}, 0)
+        if delay_ms > 0:
+            timer = threading.Timer(delay_ms / 1000.0, self._reply_quiet, (method, reply, rid))
+            timer.daemon = True
+            timer.start()
+            return
+        self._reply(method, reply, rid)
+
+    def _reply(self, method: str, params: dict[str, Any], rid: str) -> None:
+        try:
+            self._send(method, params)
+        except Exception as exc:  # noqa: BLE001
+            if method == "Fetch.continueRequest":
+                raise
+            # e.g. an invalid fulfill payload: never leave the request paused.
+            self._failed(exc)
+            self._send("Fetch.continueRequest", {"requestId": rid})
+
+    def _reply_quiet(self, method: str, params: dict[str, Any], rid: str) -> None:
+        with suppress(Exception):
+            self._reply(method, params, rid)
+
+    def _next_event(self) -> dict[str, Any] | None:
+        if self._extension:
+            return self._conn.wait_for_event("Fetch.requestPaused", timeout=0.5)
+        try:
+            self._conn.ws.settimeout(0.5)
+            raw = self._conn.ws.recv()
+        except Exception as exc:  # noqa: BLE001
+            if isinstance(exc, TimeoutError) or "timed out" in str(exc).lower():
+                return None
+            raise
+        try:
+            msg = json.loads(raw)
+        except ValueError:
+            return None
+        if isinstance(msg, dict) and msg.get("method") == "Fetch.requestPaused" and isinstance(msg.get("params"), dict):
+            return msg["params"]
+        return None
+
+    def _run(self) -> None:
+        try:
+            while not self._stop.is_set():
+                params = self._next_event()
+                if params is not None:
+                    self.handle(params)
+        except Exception as exc:  # noqa: BLE001
+            if not self._stop.is_set():
+                self.error = str(exc)
+                # Nothing answers paused requests any more: release the tab.
+                self._release()
+
+    def _release(self) -> None:
+        with suppress(Exception):
+            self._conn.send("Fetch.disable", {})
+        if not self._extension:
+            with suppress(Exception):
+                self._conn.close()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join(timeout=2.0)
+        self._release()
+
+    def status(self, kind: str) -> dict[str, Any]:
+        responder = self.responders.get(kind)
+        return {
+            "active": self._thread.is_alive() and responder is not None,
+            "mode": "extension" if self._extension else "cdp",
+            "paused": self.paused,
+            **({"failures": self.failures} if self.failures else {}),
+            **(responder.stats() if responder is not None else {}),
+            **({"error": self.error} if self.error else {}),
+        }
+
+
+_interceptors: dict[str, _Interceptor] = {}
+_interceptors_lock = threading.Lock()
+
+
+def _open_conn(session: Any, *, action: str) -> Any:
+    conn = getattr(session, "conn", None)
+    if isinstance(conn, ExtensionCdpConnection):
+        # Gateway connections are shared and cheap; a fresh handle avoids racing the session's timeout.
+        return ExtensionCdpConnection(conn.gateway, conn.tab_id, timeout=conn.timeout)
+    ws_url = getattr(conn, "ws_url", None)
+    if not isinstance(ws_url, str) or not ws_url:
+        raise SmartToolError(
+            tool="net",
+            action=action,
+            reason="No CDP connection for the current tab",
+            suggestion="Navigate to a page first, then retry",
+        )
+    return CdpConnection(ws_url, timeout=5.0)
+
+
+def install_responder(config: BrowserConfig, tab_id: str, kind: str, responder: Responder) -> dict[str, Any]:
+    """Install (or replace) a named responder on the tab's interceptor, starting it if needed."""
+    with _interceptors_lock:
+        icp = _interceptors.get(tab_id)
+        if icp is not None and icp._thread.is_alive():
+            icp.responders[kind] = responder
+            # Replay answers before rules (a recorded response beats a live-network decision).
+            icp.responders = {k: icp.responders[k] for k in sorted(icp.responders, key=_RESPONDER_ORDER.index)}
+            return icp.status(kind)
+    if icp is not None:
+        remove_responder(tab_id, kind)
+    with get_session(config, ensure_diagnostics=False) as (session, _target):
+        conn = _open_conn(session, action=kind)
+    icp = _Interceptor(conn, tab_id)
+    icp.responders[kind] = responder
+    try:
+        icp.start()
+    except Exception as exc:  # noqa: BLE001
+        raise SmartToolError(
+            tool="net",
+            action=kind,
+            reason=f"Fetch.enable failed: {exc}",
+            suggestion="Ensure the tab is still open and retry",
+        ) from exc
+    with _interceptors_lock:
+        _interceptors[tab_id] = icp
+    return icp.status(kind)
+
+
+def remove_responder(tab_id: str, kind: str) -> dict[str, Any] | None:
+    """Remove a responder; the interceptor (and Fetch) stops with the last one."""
+    with _interceptors_lock:
+        icp = _interceptors.get(tab_id)
+        if icp is None:
+            return None
+        out = icp.status(kind) if kind in icp.responders else None
+        icp.responders.pop(kind, None)
+        last = not icp.responders or not icp._thread.is_alive()
+        if last:
+            _interceptors.pop(tab_id, None)
+    if last:
+        icp.stop()
+    return {**out, "active": False} if out is not None else None
+
+
+def responder_status(tab_id: str, kind: str) -> dict[str, Any]:
+    with _interceptors_lock:
+        icp = _interceptors.get(tab_id)
+    if icp is None or kind not in icp.responders:
+        return {"active": False}
+    return icp.status(kind)
+
+
+def net_rules_action(config: BrowserConfig, tab_id: str, args: dict[str, Any]) -> dict[str, Any]:
+    """`net(action="rules", rules=[...], profile=..., enable=true|false|"status")` -> payload."""
+    enable = args.get("enable", True)
+    if enable == "status":
+        return responder_status(tab_id, "rules")
+    if enable is False or str(enable).strip().lower() in {"false", "0", "off", "stop"}:
+        return remove_responder(tab_id, "rules") or {"active": False}
+
+    profile = args.get("profile")
+    try:
+        table = compile_rules(args.get("rules"), profile=str(profile).strip().lower() if profile else None)
+    except (TypeError, ValueError) as exc:
+        raise SmartToolError(
+            tool="net",
+            action="rules",
+            reason=str(exc),
+            suggestion='Use rules=[{"match": "*.doubleclick.net", "action": "block"}] or profile="fast"',
+        ) from exc
+    if not table.rules:
+        raise SmartToolError(
+            tool="net",
+            action="rules",
+            reason="No rules",
+            suggestion='Provide rules=[...] and/or profile="fast" (or enable=false to remove rules)',
+        )
+    return {**install_responder(config, tab_id, "rules", table), **({"profile": profile} if profile else {})}
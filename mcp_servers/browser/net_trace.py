@@ -13,19 +13,23 @@ Design goals:
 from __future__ import annotations
 
 import base64
-import json
-import re
 import time
 from collections import Counter
 from contextlib import suppress
+from pathlib import Path
 from typing import Any
 from urllib.parse import parse_qsl, urlsplit
 
+from .body_capture import get_body_capture
 from .config import BrowserConfig
+from .money_scan import scan_money_items
 from .server.artifacts import artifact_store
 from .server.hints import artifact_get_hint
 from .server.redaction import redact_text_content
 from .session import session_manager
+from .telemetry_net_index import DoneRequestIndex, select_done
+from .telemetry_net_index import status_bucket as _status_bucket
+from .telemetry_net_index import url_host as _url_host
 from .tools.base import SmartToolError, get_session
 
 
@@ -62,31 +66,6 @@ def _to_int_default(v: Any, *, default: int, min_v: int, max_v: int) -> int:
     return max(min_v, min(n, max_v))
 
 
-def _url_host(url: str) -> str:
-    try:
-        return (urlsplit(url).hostname or "").lower()
-    except Exception:
-        return ""
-
-
-def _status_bucket(status: Any) -> str:
-    try:
-        s = int(status)
-    except Exception:
-        return "unknown"
-    if 100 <= s < 200:
-        return "1xx"
-    if 200 <= s < 300:
-        return "2xx"
-    if 300 <= s < 400:
-        return "3xx"
-    if 400 <= s < 500:
-        return "4xx"
-    if 500 <= s < 600:
-        return "5xx"
-    return "other"
-
-
 _SENSITIVE_QUERY_KEY_HINTS = (
     "token",
     "auth",
@@ -103,6 +82,11 @@ _SENSITIVE_QUERY_KEY_HINTS = (
 )
 
 
+def _is_text_mime(mime: str) -> bool:
+    m = mime.split(";", 1)[0].strip().lower()
+    return m.startswith("text/") or any(t in m for t in ("json", "javascript", "xml", "x-www-form-urlencoded"))
+
+
 def _safe_query_keys(url_full: str) -> list[str]:
     """Return query parameter *names* only (never values).
 
@@ -245,9 +229,6 @@ def _body_preview(
     return picked
 
 
-_MONEY_KEY_RE = re.compile(r"(amount|price|total|subtotal|tax|vat)", re.IGNORECASE)
-_CURRENCY_KEY_RE = re.compile(r"currency|curr|iso", re.IGNORECASE)
-
 # Common currency minor unit mapping (ISO 4217, partial; default=2).
 _CURRENCY_DECIMALS: dict[str, int] = {
     # 0-decimal
@@ -275,23 +256,6 @@ _CURRENCY_DECIMALS: dict[str, int] = {
 }
 
 
-def _json_try_parse(text: Any, *, max_chars: int = 120_000) -> Any | None:
-    """Best-effort JSON parse for bounded trace bodies (already redacted)."""
-    if not isinstance(text, str):
-        return None
-    s = text.strip()
-    if not s:
-        return None
-    if len(s) > max_chars:
-        return None
-    if not (s.startswith("{") or s.startswith("[")):
-        return None
-    try:
-        return json.loads(s)
-    except Exception:
-        return None
-
-
 def _money_kind_from_url(url: str) -> str:
     """Heuristic classification of a URL for money/checkout correlation."""
     u = (url or "").lower()
@@ -302,74 +266,6 @@ def _money_kind_from_url(url: str) -> str:
     return "other"
 
 
-def _walk_money_fields(
-    obj: Any,
-    *,
-    url: str,
-    source: str,
-    currency_ctx: str | None = None,
-    path: str = "",
-    depth: int = 0,
-    max_depth: int = 12,
-    out: list[dict[str, Any]],
-) -> None:
-    if depth > max_depth:
-        return
-
-    if isinstance(obj, dict):
-        cur = currency_ctx
-        # Update currency context from this dict.
-        for k, v in obj.items():
-            if not isinstance(k, str):
-                continue
-            if _CURRENCY_KEY_RE.search(k) and isinstance(v, str) and v.strip():
-                cur = v.strip().upper()
-                break
-
-        for k, v in obj.items():
-            if not isinstance(k, str):
-                continue
-            p2 = f"{path}.{k}" if path else k
-
-            if isinstance(v, (int, float)) and _MONEY_KEY_RE.search(k):
-                rec: dict[str, Any] = {
-                    "url": url,
-                    "source": source,
-                    "path": p2,
-                    "value": v,
-                }
-                if isinstance(cur, str) and cur:
-                    rec["currency"] = cur
-                out.append(rec)
-
-            _walk_money_fields(
-                v,
-                url=url,
-                source=source,
-                currency_ctx=cur,
-                path=p2,
-                depth=depth + 1,
-                max_depth=max_depth,
-                out=out,
-            )
-        return
-
-    if isinstance(obj, list):
-        for i, v in enumerate(obj[:200]):
-            p2 = f"{path}[{i}]" if path else f"[{i}]"
-            _walk_money_fields(
-                v,
-                url=url,
-                source=source,
-                currency_ctx=currency_ctx,
-                path=p2,
-                depth=depth + 1,
-                max_depth=max_depth,
-                out=out,
-            )
-        return
-
-
 def _money_score(rec: dict[str, Any]) -> int:
     p = str(rec.get("path") or "").lower()
     u = str(rec.get("url") or "").lower()
@@ -416,30 +312,24 @@ def _money_normalize(rec: dict[str, Any]) -> dict[str, Any]:
     return out
 
 
+def _captured_body_path(artifact_id: str) -> Path | None:
+    try:
+        path = artifact_store.content_path(artifact_id=artifact_id)
+    except (FileNotFoundError, ValueError):
+        return None
+    return path if path.is_file() else None
+
+
 def _extract_money_insights(
     *, full_items: list[dict[str, Any]], max_values: int = 8, max_mismatches: int = 3
 ) -> dict[str, Any] | None:
     """Extract bounded money signals from captured request/response bodies.
 
     This is designed to surface *high-signal* checkout/price bugs without exporting artifacts
-    and running ad-hoc parsing.
+    and running ad-hoc parsing. Bodies are scanned as token streams (see `money_scan`), so
+    large responses are covered without being parsed into memory.
     """
-    raw: list[dict[str, Any]] = []
-
-    for it in full_items:
-        if not isinstance(it, dict):
-            continue
-        url = it.get("url") if isinstance(it.get("url"), str) else ""
-        if not url:
-            continue
-
-        req = _json_try_parse(it.get("requestPostData"))
-        if req is not None:
-            _walk_money_fields(req, url=url, source="requestPostData", out=raw)
-
-        resp = _json_try_parse(it.get("responseBody"))
-        if resp is not None:
-            _walk_money_fields(resp, url=url, source="responseBody", out=raw)
+    raw = scan_money_items(full_items, body_path=_captured_body_path, score=_money_score)
 
     if not raw:
         return None
@@ -527,6 +417,8 @@ def build_net_trace(
     include: Any = None,
     exclude: Any = None,
     types_raw: Any = None,
+    hosts_raw: Any = None,
+    status_raw: Any = None,
     capture: str = "meta",
     redact: bool = True,
     max_body_bytes: int = 80_000,
@@ -559,28 +451,15 @@ def build_net_trace(
     offset = max(0, int(offset))
     limit = max(0, min(int(limit), 200))
 
-    # Ensure telemetry exists (best-effort) so `_req_done` is populated.
-    telemetry = session_manager.get_telemetry(tab_id)
-    if telemetry is None:
-        with suppress(Exception), get_session(config, ensure_diagnostics=False) as (sess, _t):
-            session_manager.ensure_telemetry(sess)
-        telemetry = session_manager.get_telemetry(tab_id)
-
-    done = getattr(telemetry, "_req_done", None) if telemetry is not None else None
-    if not isinstance(done, dict):
-        raise SmartToolError(
-            tool="net",
-            action="trace",
-            reason="Tier-0 trace buffer not available for this tab",
-            suggestion="Ensure MCP_TIER0=1 (default) and retry; if it still fails, navigate() to a normal http(s) page first",
-        )
-
     include_pats = [p.lower() for p in _to_str_list(include)]
     exclude_pats = [p.lower() for p in _to_str_list(exclude)]
 
     types = set(_to_str_list(types_raw))
-    # Defaults: keep signal cheap. If no explicit include/types, prefer XHR/Fetch.
-    if not include_pats and not types:
+    # Exact hostnames and status buckets ("4xx") / codes ("404"); both are index lookups.
+    hosts = {h.lower() for h in _to_str_list(hosts_raw)}
+    statuses = {s.strip().lower() for s in _to_str_list(status_raw) if s.strip()}
+    # Defaults: keep signal cheap. If no explicit filters, prefer XHR/Fetch.
+    if not include_pats and not types and not hosts and not statuses:
         types = {"XHR", "Fetch"}
 
     capture = str(capture or "meta").strip().lower()
@@ -590,46 +469,51 @@ def build_net_trace(
     max_body_bytes = _to_int_default(max_body_bytes, default=80_000, min_v=0, max_v=2_000_000)
     max_total_bytes = _to_int_default(max_total_bytes, default=600_000, min_v=0, max_v=10_000_000)
 
-    # Iterate newest-first (dict preserves insertion order in Py3.7+).
-    done_items = list(done.items())
-    done_items.reverse()
+    def _select(tel: Any) -> tuple[list[tuple[str, dict[str, Any]]], int, dict[str, Any] | None] | None:
+        done = getattr(tel, "_req_done", None)
+        if not isinstance(done, dict):
+            return None
+        index = getattr(tel, "done_index", None)
+        if not isinstance(index, DoneRequestIndex):
+            index = None
+        page, total = select_done(
+            done,
+            index,
+            types=types,
+            hosts=hosts,
+            statuses=statuses,
+            include=include_pats,
+            exclude=exclude_pats,
+            since=since,
+            offset=offset,
+            limit=limit,
+        )
+        # Copies: the bus thread keeps updating records once the lock is released.
+        page = [(rid, dict(meta)) for rid, meta in page]
+        # Whole-buffer totals straight from the running counters.
+        return page, total, index.counters() if index is not None else None
+
+    # Select under the shard lock (the bus thread keeps appending); newest first.
+    selected = session_manager.tier0_query(tab_id, _select)
+    if selected is None:
+        # Ensure telemetry exists (best-effort) so `_req_done` is populated.
+        with suppress(Exception), get_session(config, ensure_diagnostics=False) as (sess, _t):
+            session_manager.ensure_telemetry(sess)
+        selected = session_manager.tier0_query(tab_id, _select)
+    if selected is None:
+        raise SmartToolError(
+            tool="net",
+            action="trace",
+            reason="Tier-0 trace buffer not available for this tab",
+            suggestion="Ensure MCP_TIER0=1 (default) and retry; if it still fails, navigate() to a normal http(s) page first",
+        )
+    page, total, buffer = selected
+    done = dict(page)
 
     matched: list[dict[str, Any]] = []
     matched_ids: list[str] = []
-    total = 0
-    off = int(offset or 0)
-
-    for req_id, meta in done_items:
-        if not isinstance(req_id, str) or not req_id:
-            continue
-        if not isinstance(meta, dict):
-            continue
-
-        end_ts = meta.get("endTs")
-        if not isinstance(end_ts, int):
-            end_ts = meta.get("ts") if isinstance(meta.get("ts"), int) else None
-        if since is not None and isinstance(end_ts, int) and end_ts <= since:
-            continue
-
+    for req_id, meta in page:
         rtype = meta.get("type")
-        if types and (not isinstance(rtype, str) or rtype not in types):
-            continue
-
-        url_full = meta.get("urlFull")
-        if not isinstance(url_full, str) or not url_full:
-            url_full = meta.get("url") if isinstance(meta.get("url"), str) else ""
-        u_l = url_full.lower() if isinstance(url_full, str) else ""
-
-        if include_pats and not any(p in u_l for p in include_pats):
-            continue
-        if exclude_pats and any(p in u_l for p in exclude_pats):
-            continue
-
-        total += 1
-        if off > 0:
-            off -= 1
-            continue
-
         rec: dict[str, Any] = {
             "requestId": req_id,
             "ts": meta.get("endTs") if isinstance(meta.get("endTs"), int) else meta.get("ts"),
@@ -649,8 +533,6 @@ def build_net_trace(
 
         matched.append(rec)
         matched_ids.append(req_id)
-        if limit and len(matched) >= limit:
-            break
 
     out: dict[str, Any] = {
         "trace": {
@@ -661,8 +543,11 @@ def build_net_trace(
             "include": include_pats,
             "exclude": exclude_pats,
             "types": sorted(types) if types else [],
+            **({"hosts": sorted(hosts)} if hosts else {}),
+            **({"status": sorted(statuses)} if statuses else {}),
             "capture": capture,
             "summary": _summarize_trace(matched=matched, done=done),
+            **({"buffer": buffer} if buffer is not None else {}),
             "items": matched,
         }
     }
@@ -692,6 +577,7 @@ def build_net_trace(
     # Optionally enrich with request/response bodies (best-effort).
     full_items: list[dict[str, Any]] | None = None
     if (capture_request or capture_body) and matched_ids:
+        eager = get_body_capture(tab_id) if capture_body else None
 
         def _enrich(sess: Any) -> None:
             nonlocal full_items
@@ -743,31 +629,9 @@ def build_net_trace(
                         bytes_budget = max(0, bytes_budget - len(post))
 
             if capture_body and (bytes_budget > 0 or max_total_bytes == 0):
-                cmds = [{"method": "Network.getResponseBody", "params": {"requestId": rid}} for rid in matched_ids]
-                res = sess.send_many(cmds, stop_on_error=False)
-                for i, r in enumerate(res):
-                    if i >= len(full_items):
-                        break
-                    if not isinstance(r, dict):
-                        continue
-                    if r.get("ok") is False and isinstance(r.get("error"), str):
-                        full_items[i]["responseBodyError"] = r.get("error")
-                        continue
-                    body = r.get("body")
-                    base64_encoded = r.get("base64Encoded") is True
-                    if not isinstance(body, str) or not body:
-                        continue
-
-                    raw_bytes: bytes
-                    if base64_encoded:
-                        try:
-                            raw_bytes = base64.b64decode(body.encode("utf-8"), validate=False)
-                        except Exception:
-                            full_items[i]["responseBodyError"] = "base64 decode failed"
-                            continue
-                    else:
-                        raw_bytes = body.encode("utf-8", errors="replace")
 
+                def _put_body(i: int, raw_bytes: bytes, base64_encoded: bool) -> None:
+                    nonlocal bytes_budget
                     if max_body_bytes and len(raw_bytes) > max_body_bytes:
                         raw_bytes = raw_bytes[:max_body_bytes]
                         full_items[i]["responseBodyTruncated"] = True
@@ -783,7 +647,7 @@ def build_net_trace(
                         full_items[i]["responseBodyBase64Bytes"] = len(raw_bytes)
                         if bytes_budget > 0:
                             bytes_budget = max(0, bytes_budget - len(raw_bytes))
-                        continue
+                        return
 
                     text = raw_bytes.decode("utf-8", errors="replace")
                     if redact:
@@ -792,6 +656,45 @@ def build_net_trace(
                     if bytes_budget > 0:
                         bytes_budget = max(0, bytes_budget - len(text))
 
+                # Bodies streamed to disk by an armed net(action="capture") survive Chrome's
+                # buffer eviction; only the rest are fetched lazily.
+                lazy: list[int] = []
+                for i, rid in enumerate(matched_ids[: len(full_items)]):
+                    entry = eager.lookup(rid) if eager is not None else None
+                    got = eager.read_body(rid, max_bytes=max_body_bytes) if entry is not None else None
+                    if entry is None or got is None:
+                        lazy.append(i)
+                        continue
+                    data, truncated = got
+                    full_items[i]["bodyArtifact"] = {"id": entry["artifactId"], "bytes": entry["bytes"]}
+                    if truncated:
+                        full_items[i]["responseBodyTruncated"] = True
+                    _put_body(i, data, not _is_text_mime(str(entry.get("mimeType") or "")))
+
+                cmds = [{"method": "Network.getResponseBody", "params": {"requestId": matched_ids[i]}} for i in lazy]
+                res = sess.send_many(cmds, stop_on_error=False) if cmds else []
+                for i, r in zip(lazy, res, strict=False):
+                    if not isinstance(r, dict):
+                        continue
+                    if r.get("ok") is False and isinstance(r.get("error"), str):
+                        full_items[i]["responseBodyError"] = r.get("error")
+                        continue
+                    body = r.get("body")
+                    base64_encoded = r.get("base64Encoded") is True
+                    if not isinstance(body, str) or not body:
+                        continue
+
+                    raw_bytes: bytes
+                    if base64_encoded:
+                        try:
+                            raw_bytes = base64.b64decode(body.encode("utf-8"), validate=False)
+                        except Exception:
+                            full_items[i]["responseBodyError"] = "base64 decode failed"
+                            continue
+                    else:
+                        raw_bytes = body.encode("utf-8", errors="replace")
+                    _put_body(i, raw_bytes, base64_encoded)
+
         active = session_manager.get_active_shared_session()
         if active:
             sess, _t = active
@@ -8,6 +8,7 @@ Design goals:
 from __future__ import annotations
 
 import base64
+import contextlib
 import json
 import os
 import re
@@ -50,6 +51,97 @@ class ArtifactRef:
     stored_chars: int | None = None
 
 
+class ArtifactStream:
+    """Append-only writer for large artifacts (content is never held in memory).
+
+    Metadata is written on close(); until then the artifact is invisible to list/get.
+    """
+
+    def __init__(
+        self,
+        store: ArtifactStore,
+        *,
+        artifact_id: str,
+        kind: str,
+        mime_type: str,
+        ext: str,
+        metadata: dict[str, Any] | None = None,
+    ) -> None:
+        self._store = store
+        self.id = artifact_id
+        self.kind = kind
+        self.mime_type = mime_type
+        self.ext = ext
+        self.metadata = dict(metadata) if isinstance(metadata, dict) else {}
+        self.path = store._content_path(artifact_id, ext)
+        self.bytes = 0
+        self._fh = self.path.open("wb")
+        self._ref: ArtifactRef | None = None
+
+    def write(self, data: bytes | str) -> int:
+        if self._fh is None:
+            raise ValueError("artifact stream is closed")
+        raw = data.encode("utf-8") if isinstance(data, str) else bytes(data)
+        self._fh.write(raw)
+        self.bytes += len(raw)
+        return len(raw)
+
+    def write_jsonl(self, items: list[Any]) -> int:
+        """Write one JSON document per line; returns the number of lines written."""
+        if not items:
+            return 0
+        self.write("".join(json.dumps(it, ensure_ascii=False) + "\n" for it in items))
+        return len(items)
+
+    def close(self, *, truncated: bool = False, metadata: dict[str, Any] | None = None) -> ArtifactRef:
+        if self._ref is not None:
+            return self._ref
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+        if isinstance(metadata, dict):
+            self.metadata.update(metadata)
+        size = self.path.stat().st_size
+        meta = {
+            "id": self.id,
+            "kind": self.kind,
+            "mimeType": self.mime_type,
+            "ext": self.ext,
+            "bytes": size,
+            "createdAt": _now_iso(),
+            "truncated": bool(truncated),
+            **({"meta": self.metadata} if self.metadata else {}),
+        }
+        self._store._meta_path(self.id).write_text(json.dumps(meta, ensure_ascii=False, indent=2), encoding="utf-8")
+        self._ref = ArtifactRef(
+            id=self.id,
+            kind=str(self.kind or ""),
+            mime_type=str(self.mime_type or "application/octet-stream"),
+            bytes=int(size),
+            created_at=str(meta["createdAt"]),
+            path=str(self.path),
+            truncated=bool(truncated),
+        )
+        return self._ref
+
+    def abort(self) -> None:
+        """Close and delete partial content (no metadata is written)."""
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+        with contextlib.suppress(Exception):
+            self.path.unlink()
+
+    def __enter__(self) -> ArtifactStream:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:  # noqa: ANN001
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
+
+
 class ArtifactStore:
     def __init__(self, base_dir: Path | None = None) -> None:
         self.base_dir = base_dir or (_repo_root() / "data" / "artifacts")
@@ -234,6 +326,25 @@ class ArtifactStore:
             truncated=False,
         )
 
+    def open_stream(
+        self,
+        *,
+        kind: str,
+        mime_type: str,
+        ext: str,
+        metadata: dict[str, Any] | None = None,
+    ) -> ArtifactStream:
+        """Open an append-only artifact (JSONL exports, traces, bodies) written in chunks."""
+        base_id = _make_id(kind or "stream")
+        self._validate_id(base_id)
+        ext = ext if ext.startswith(".") else f".{ext}"
+        artifact_id = base_id
+        n = 1
+        while self._content_path(artifact_id, ext).exists() or self._meta_path(artifact_id).exists():
+            n += 1
+            artifact_id = f"{base_id[:120]}_{n}"
+        return ArtifactStream(self, artifact_id=artifact_id, kind=kind, mime_type=mime_type, ext=ext, metadata=metadata)
+
     def list(self, *, limit: int = 20, kind: str | None = None) -> list[dict[str, Any]]:
         limit = max(0, min(int(limit), 200))
         out: list[tuple[float, dict[str, Any]]] = []
@@ -284,6 +395,14 @@ class ArtifactStore:
             raise ValueError("invalid artifact metadata")
         return meta
 
+    def content_path(self, *, artifact_id: str) -> Path:
+        """Local content file of an artifact (for streaming readers; never exposed in tool output)."""
+        meta = self.get_meta(artifact_id=artifact_id)
+        content_path = self._content_path(str(meta["id"]), str(meta.get("ext") or ".bin"))
+        if not content_path.exists():
+            raise FileNotFoundError("artifact content not found")
+        return content_path
+
     def get_text_slice(
         self,
         *,
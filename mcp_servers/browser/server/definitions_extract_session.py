@@ -0,0 +1,25 @@
+"""Extract-content cursor/export schema fragments."""
+
+from __future__ import annotations
+
+from typing import Any
+
+EXTRACT_SESSION_PROPERTIES: dict[str, Any] = {
+    "cursor": {
+        "description": (
+            "Extraction session (main/links/images/table+table_index). "
+            "true = materialize the list once in-page and return a cursor id; "
+            "'<cursor>' = read offset/limit from the cached list (O(limit)). "
+            "The cache is dropped on navigation/DOM mutation and rebuilt transparently."
+        ),
+        "oneOf": [{"type": "boolean"}, {"type": "string"}],
+    },
+    "export": {
+        "type": "boolean",
+        "default": False,
+        "description": (
+            "Stream ALL items of a list content_type into a JSONL artifact in chunks "
+            "(returns a compact summary + artifact ref instead of items)."
+        ),
+    },
+}
@@ -0,0 +1,16 @@
+"""Frame-targeting schema fragments."""
+
+from __future__ import annotations
+
+from typing import Any
+
+JS_FRAME_PROPERTIES: dict[str, Any] = {
+    "frame": {
+        "type": "string",
+        "description": (
+            "Evaluate inside frames instead of the top document: 'all', 'main', a frameId, "
+            "or a URL/name substring (see page(detail='frames')). Returns per-frame results; "
+            "cross-origin frames in the page's renderer are reachable via their CDP context."
+        ),
+    },
+}
@@ -0,0 +1,29 @@
+"""net(action='trace') indexed filter schema fragments."""
+
+from __future__ import annotations
+
+from typing import Any
+
+NET_TRACE_INDEX_PROPERTIES: dict[str, Any] = {
+    "types": {
+        "description": "Resource types (e.g., XHR, Fetch). Defaults to XHR/Fetch if no filters are set.",
+        "oneOf": [
+            {"type": "string"},
+            {"type": "array", "items": {"type": "string"}},
+        ],
+    },
+    "hosts": {
+        "description": "Exact hostnames (indexed lookup).",
+        "oneOf": [
+            {"type": "string"},
+            {"type": "array", "items": {"type": "string"}},
+        ],
+    },
+    "status": {
+        "description": "Status buckets (2xx/4xx/5xx/unknown) or exact codes (404) (indexed lookup).",
+        "oneOf": [
+            {"type": "string"},
+            {"type": "array", "items": {"type": "string"}},
+        ],
+    },
+}
@@ -0,0 +1,59 @@
+"""page(detail=...) capture-mode schema fragments."""
+
+from __future__ import annotations
+
+from typing import Any
+
+PAGE_CAPTURE_DETAILS: list[str] = ["snapshot", "profile", "trace", "memory"]
+
+PAGE_CAPTURE_PROPERTIES: dict[str, Any] = {
+    "view": {
+        "type": "string",
+        "enum": ["summary", "text", "links", "locators", "hit"],
+        "default": "summary",
+        "description": "detail='snapshot': which view to answer from the single DOMSnapshot capture.",
+    },
+    "x": {"type": "number", "description": "detail='snapshot', view='hit': viewport X coordinate."},
+    "y": {"type": "number", "description": "detail='snapshot', view='hit': viewport Y coordinate."},
+    "duration_ms": {
+        "type": "integer",
+        "default": 3000,
+        "description": "detail='profile'|'trace'|'memory': recording window in ms (100..60000); audit coverage: post-load window.",
+    },
+    "sampling_interval_us": {
+        "type": "integer",
+        "description": "detail='profile': Profiler sampling interval in microseconds (default: Chrome's).",
+    },
+    "coverage": {
+        "type": "boolean",
+        "default": False,
+        "description": (
+            "detail='profile': also collect best-effort function coverage while recording; "
+            "detail='audit': add a JS/CSS coverage phase (unused bytes per resource + JSONL artifact)."
+        ),
+    },
+    "coverage_reload": {
+        "type": "boolean",
+        "default": True,
+        "description": "detail='audit' + coverage: reload under instrumentation so load-time code counts as used.",
+    },
+    "categories": {
+        "type": "array",
+        "items": {"type": "string"},
+        "description": "detail='trace': trace categories (default: DevTools timeline set).",
+    },
+    "heap_sampling_bytes": {
+        "type": "integer",
+        "description": "detail='memory': average bytes between allocation samples (default: 32768).",
+    },
+    "gc": {
+        "type": "boolean",
+        "default": False,
+        "description": "detail='memory': force a GC before the before/after metrics (live sizes only).",
+    },
+    "max_chars": {
+        "type": "integer",
+        "default": 8000,
+        "description": "detail='snapshot', view='text': text budget (bounded server-side).",
+    },
+}
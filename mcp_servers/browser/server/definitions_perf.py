@@ -0,0 +1,25 @@
+"""flow/run performance-instrumentation schema fragments."""
+
+from __future__ import annotations
+
+from typing import Any
+
+FLOW_PERF_PROPERTIES: dict[str, Any] = {
+    "profile_memory": {
+        "type": "boolean",
+        "default": False,
+        "description": (
+            "Sample JS heap / DOM nodes / listeners after every step (after a forced GC) and flag "
+            "monotonic growth (memory.leakSuspected) (default: false)"
+        ),
+    },
+    "throttle": {
+        "type": "string",
+        "description": (
+            'Network/CPU throttling for the whole run: "3g" | "slow-4g" | "fast-4g" | "offline", optionally '
+            'combined with a CPU slowdown "cpu2x".."cpu20x" (e.g. "slow-4g+cpu4x"). Restored after the last '
+            "step; the report's throttle block has phase timings and stretch factors vs the last unthrottled "
+            "run of the same steps"
+        ),
+    },
+}
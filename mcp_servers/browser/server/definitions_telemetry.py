@@ -0,0 +1,31 @@
+"""page(detail='diagnostics') Tier-0 telemetry schema fragments."""
+
+from __future__ import annotations
+
+from typing import Any
+
+PAGE_TELEMETRY_PROPERTIES: dict[str, Any] = {
+    "source": {
+        "type": "string",
+        "enum": ["live", "journal"],
+        "default": "live",
+        "description": (
+            "detail='diagnostics': 'journal' reads the persistent Tier-0 journal (MCP_TIER0_JOURNAL=1) "
+            "instead of in-memory buffers; survives clears, tab recreation and restarts."
+        ),
+    },
+    "since_seq": {
+        "type": "integer",
+        "description": (
+            "detail='diagnostics': return Tier-0 records after this seq (journal: nextSinceSeq; live: the "
+            "snapshot's seq). Live reads with since_seq come from Tier-0 buffers."
+        ),
+    },
+    "tab_id": {
+        "type": "string",
+        "description": (
+            "detail='diagnostics', source='journal': tab whose journal to read (default: current tab); "
+            "works for closed or recreated tabs."
+        ),
+    },
+}
@@ -12,8 +12,15 @@ from __future__ import annotations
 from typing import Any
 
 from .definitions_extract_retry import EXTRACT_RETRY_PROPERTIES
+from .definitions_extract_session import EXTRACT_SESSION_PROPERTIES
+from .definitions_frames import JS_FRAME_PROPERTIES
+from .definitions_net_trace import NET_TRACE_INDEX_PROPERTIES
+from .definitions_page_capture import PAGE_CAPTURE_DETAILS, PAGE_CAPTURE_PROPERTIES
+from .definitions_perf import FLOW_PERF_PROPERTIES
 from .definitions_policy import RELIABILITY_POLICY_PROPERTIES
 from .definitions_tabs import TABS_TOOL
+from .definitions_telemetry import PAGE_TELEMETRY_PROPERTIES
+from .definitions_watch import WAIT_EVENT_PROPERTIES
 # ═══════════════════════════════════════════════════════════════════════════════
 # NAVIGATION
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -563,10 +570,15 @@ USAGE:
 - Main content: page(detail="content")
 - Frontend issues: page(detail="diagnostics")
 - Delta frontend issues: page(detail="diagnostics", since=<cursor>)
+- Post-mortem history: page(detail="diagnostics", source="journal", since_seq=<seq>)
 - Accessibility query: page(detail="ax", role="button", name="Save")
 - Visual AX overlay: page(detail="ax", role="button", name="Save", with_screenshot=true)
 - Resource waterfall: page(detail="resources", sort="duration")
 - Performance vitals: page(detail="performance")
+- CPU profile (hot functions + .cpuprofile artifact): page(detail="profile", duration_ms=3000)
+- Perf trace (main-thread busy/long tasks/GC/frames + trace artifact): page(detail="trace", duration_ms=3000)
+- Heap (allocation sites + heap/nodes/listeners delta + .heapprofile): page(detail="memory", duration_ms=3000)
+- Unused JS/CSS bytes per resource (reloads): page(detail="audit", coverage=true)
 - Frames/iframes map: page(detail="frames")
 - Visual frames overlay: page(detail="frames", with_screenshot=true)
 - Stable selectors: page(detail="locators", kind="button")
@@ -575,6 +587,7 @@ USAGE:
 - Navigation graph (visited pages): page(detail="graph")
 - Super-report (one call): page(detail="audit")
 - Super-report + net trace: page(detail="audit", trace=true)
+- Bulk DOM capture (one CDP call): page(detail="snapshot", view="locators"|"text"|"links"|"hit")
 - Page info: page(info=true)
 - Store full payload off-context: page(detail="diagnostics", store=true)
 
@@ -608,9 +621,12 @@ RESPONSE FORMAT:
                     "map",
                     "graph",
                     "audit",
+                    *PAGE_CAPTURE_DETAILS,
                 ],
                 "description": "Section to get details for",
             },
+            **PAGE_CAPTURE_PROPERTIES,
+            **PAGE_TELEMETRY_PROPERTIES,
             "form_index": {
                 "type": "integer",
                 "description": "Specific form index when detail='forms'",
@@ -799,13 +815,7 @@ RESPONSE FORMAT:
                                     {"type": "array", "items": {"type": "string"}},
                                 ],
                             },
-                            "types": {
-                                "description": "Resource types (e.g., XHR, Fetch). Defaults to XHR/Fetch if no filters are set.",
-                                "oneOf": [
-                                    {"type": "string"},
-                                    {"type": "array", "items": {"type": "string"}},
-                                ],
-                            },
+                            **NET_TRACE_INDEX_PROPERTIES,
                             "capture": {
                                 "type": "string",
                                 "enum": ["meta", "request", "body", "full"],
@@ -892,6 +902,8 @@ DETAIL MODES with pagination:
 - content_type="links" + offset/limit: All links
 - content_type="headings": Document outline (h1-h6)
 - content_type="images" + offset/limit: Images with metadata
+
+LONG LISTS: cursor=true once, then cursor="<id>" + offset/limit (no re-walk); export=true → JSONL artifact.
 """,
     "inputSchema": {
         "$schema": "http://json-schema.org/draft-07/schema#",
@@ -1047,6 +1059,7 @@ DETAIL MODES with pagination:
                 ],
             },
             **EXTRACT_RETRY_PROPERTIES,
+            **EXTRACT_SESSION_PROPERTIES,
             "store": {
                 "type": "boolean",
                 "default": False,
@@ -1239,6 +1252,7 @@ OUTPUT:
                 "default": False,
                 "description": "Attach a final screenshot image to the result",
             },
+            **FLOW_PERF_PROPERTIES,
         },
         "required": ["steps"],
         "additionalProperties": False,
@@ -1270,6 +1284,7 @@ INTERNAL ACTIONS (v2):
 - fetch, storage, download
 - net(action="harLite")  # Tier-0 network slice
 - net(action="trace")    # Tier-0 deep trace (bounded, on-demand)
+- net(action="capture"|"har"|"rules"|"replay")  # body capture / HAR record / block+mock rules / offline replay
 These are not separate top-level tools in v2; they are actions inside `run`.
 
 INTERNAL ACTIONS (v3 additions; only inside `run(actions=[...])`, not top-level tools):
@@ -1277,10 +1292,12 @@ Schemas (shape):
 - assert: {"assert": {"timeout_s": 5, "url": "...", "title": "...", "selector": "...", "text": "...", "js": "..." }}
 - when: {"when": {"if": {"url": "...", "selector": "...", "text": "...", "js": "..."}, "then": [...], "else": [...]}}
 - macro: {"macro": {"name": "...", "args": {...}, "dry_run": true}}
+- assert_perf: {"assert_perf": {"budgets": ["lcp_ms<2500", "longtasks_total_ms<300", "failed_requests==0", "transfer_kb<1500"]}}
 
 Notes:
 - Server-side only (no LLM execution); deterministic and bounded by run limits.
 - assert is fail-closed: timeout or mismatch fails the run.
+- assert_perf reads buffered Tier-0 vitals/request counters (no page calls); metrics: lcp_ms, cls, longtasks_count/total_ms/max_ms, tbt_ms, requests, failed_requests, transfer_kb (requests since run start); a metric with no data fails as unmeasured (e.g. longtasks_* without long-task entries).
 - when executes a single branch (no loops); else is optional.
 - macro is for compact, deterministic expansions (e.g., include saved step lists).
 
@@ -1498,6 +1515,7 @@ OUTPUT:
                 "default": False,
                 "description": "Attach a final screenshot image to the result",
             },
+            **FLOW_PERF_PROPERTIES,
         },
         # NOTE: Some MCP clients (including OpenCode) reject top-level anyOf/oneOf/allOf.
         # We validate presence of actions/steps in the handler instead.
@@ -1665,6 +1683,7 @@ UTILITY_TOOLS: list[dict[str, Any]] = [
         "name": "js",
         "description": """Execute JavaScript in browser context.
 USAGE: js(code="document.title")
+FRAMES: js(code="location.href", frame="all") -> {"frames": [{"frameId", "url", "world", "result"}, ...]} (cross-process iframes run via an attached child session, world="oopif"; not in extension mode)
 RESPONSE EXAMPLE:
 {"result": "Page Title"}""",
         "inputSchema": {
@@ -1674,6 +1693,7 @@ RESPONSE EXAMPLE:
             "default": {},
             "properties": {
                 "code": {"type": "string", "description": "JavaScript code to execute"},
+                **JS_FRAME_PROPERTIES,
             },
             "required": ["code"],
             "additionalProperties": False,
@@ -1699,6 +1719,7 @@ Use for API calls. For page fetching, use navigate() instead.""",
         "name": "fetch",
         "description": """Make fetch request from browser context (with cookies/session).
 USAGE: fetch(url="/api/user", method="POST", body='{"name": "test"}')
+BATCH: fetch(requests=[{url, method?, headers?, body?, timeout_ms?, max_body_size?}, ...], concurrency=8)  # <=1000; per-status summary, results -> JSONL artifact
 
 Useful for authenticated API calls.""",
         "inputSchema": {
@@ -1713,13 +1734,14 @@ Useful for authenticated API calls.""",
                 },
                 "body": {"type": "string", "description": "Request body"},
                 "headers": {"type": "object", "description": "Request headers"},
+                "requests": {"type": "array", "items": {"type": "object"}, "description": "Batch requests"},
+                "concurrency": {"type": "integer", "default": 6, "description": "Batch parallelism (1-32)"},
                 "fallback_http": {
                     "type": "boolean",
                     "default": False,
                     "description": "Fallback to http() on CORS/opaque errors (GET only; allowlist enforced).",
                 },
             },
-            "required": ["url"],
             "additionalProperties": False,
         },
     },
@@ -1925,6 +1947,7 @@ USAGE:
 - Wait for DOMContentLoaded: wait(for="domcontentloaded")
 - Wait for navigation: wait(for="navigation")
 - Wait for network idle: wait(for="networkidle")
+- Watch Tier-0 events (long-poll): wait(for="event", events=["network"], status=["5xx"], since_seq=<cursor>)
 
 RESPONSE: {"waited_for": "element", "found": true, "duration_ms": 1500}""",
         "inputSchema": {
@@ -1933,11 +1956,12 @@ RESPONSE: {"waited_for": "element", "found": true, "duration_ms": 1500}""",
             "properties": {
                 "for": {
                     "type": "string",
-                    "enum": ["element", "text", "navigation", "domcontentloaded", "networkidle", "load"],
+                    "enum": ["element", "text", "navigation", "domcontentloaded", "networkidle", "load", "event"],
                     "description": "What to wait for",
                 },
                 "selector": {"type": "string", "description": "For element wait"},
                 "text": {"type": "string", "description": "For text wait"},
+                **WAIT_EVENT_PROPERTIES,
                 "timeout": {
                     "type": "number",
                     "default": 10,
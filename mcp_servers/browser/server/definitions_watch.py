@@ -0,0 +1,37 @@
+"""wait(for='event') long-poll watch schema fragments."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from ..telemetry_watch import STATUS_BUCKETS, WATCH_KINDS
+
+WAIT_EVENT_PROPERTIES: dict[str, Any] = {
+    "events": {
+        "type": "array",
+        "items": {"type": "string", "enum": list(WATCH_KINDS)},
+        "description": "for='event': Tier-0 event kinds to watch (default: all).",
+    },
+    "level": {
+        "type": "string",
+        "description": "for='event': console level / error type to match (e.g. 'error', 'warn').",
+    },
+    "url": {
+        "type": "string",
+        "description": "for='event': URL glob ('*/api/*') or substring to match.",
+    },
+    "status": {
+        "type": "array",
+        "items": {"type": "string", "enum": list(STATUS_BUCKETS)},
+        "description": "for='event': request status buckets to match (network/harLite).",
+    },
+    "since_seq": {
+        "type": "integer",
+        "description": "for='event': only events after this cursor (default: events after the call). Pass back `cursor`.",
+    },
+    "limit": {
+        "type": "integer",
+        "default": 50,
+        "description": "for='event': max events returned (hasMore=true when more matched).",
+    },
+}
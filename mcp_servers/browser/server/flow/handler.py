@@ -33,6 +33,8 @@ def make_flow_handler(registry: ToolRegistry) -> "HandlerFunc":
     from ...tools.base import SmartToolError as _SmartToolError
     from ..artifacts import artifact_store as _artifact_store
     from ..hints import artifact_get_hint
+    from .perf_budget import assert_perf, net_baseline
+    from .throttle import Throttle, measure_phases, parse_throttle, steps_signature, throttle_report
 
     def _extract_ctx_field(text: str, field: str) -> str | None:
         """Best-effort parse of render_ctx_markdown output for a single `key: value` field."""
@@ -218,6 +220,17 @@ def make_flow_handler(registry: ToolRegistry) -> "HandlerFunc":
         if proof_screenshot not in {"none", "artifact"}:
             proof_screenshot = "none"
         screenshot_on_ambiguity = bool(args.get("screenshot_on_ambiguity", False))
+        # Perf: per-step JS heap / DOM node / listener series with a growth (leak) check.
+        profile_memory = bool(args.get("profile_memory", False))
+        # Perf: network/CPU throttling for the whole flow (restored after the last step).
+        try:
+            throttle_net, throttle_cpu = parse_throttle(args.get("throttle"))
+        except ValueError as exc:
+            return ToolResult.error(
+                str(exc),
+                tool="flow",
+                suggestion='Use throttle="3g"|"slow-4g"|"fast-4g"|"offline", optionally "+cpu4x" (e.g. "slow-4g+cpu4x")',
+            )
 
         # Resume lever: start executing steps from this index (run(start_at=...) support).
         try:
@@ -338,6 +351,25 @@ def make_flow_handler(registry: ToolRegistry) -> "HandlerFunc":
             # - lets us fail-fast on blocking dialogs (prevents CDP hangs)
             with suppress(Exception):
                 _session_manager.ensure_telemetry(shared_sess)
+            # Request counters at flow start: assert_perf budgets cover only this run.
+            perf_baseline: dict[str, Any] | None = None
+            with suppress(Exception):
+                if isinstance(tab_id_for_auto, str) and tab_id_for_auto:
+                    perf_baseline = _session_manager.tier0_query(
+                        tab_id_for_auto, lambda t: net_baseline(t, tab_id_for_auto)
+                    ) or net_baseline(None, tab_id_for_auto)
+            throttle: Throttle | None = None
+            if throttle_net is not None or throttle_cpu is not None:
+                throttle = Throttle(shared_sess, throttle_net, throttle_cpu)
+                _flow_exit.callback(throttle.restore)
+                try:
+                    throttle.apply()
+                except Exception as exc:  # noqa: BLE001
+                    return ToolResult.error(
+                        f"Failed to apply throttle {throttle.label}: {exc}",
+                        tool="flow",
+                        suggestion="Retry without throttle, or check that the CDP session supports emulation",
+                    )
 
             # Async dialog handling (prevents long hangs when alerts open mid-step).
             if isinstance(tab_id_for_auto, str) and tab_id_for_auto:
@@ -357,8 +389,7 @@ def make_flow_handler(registry: ToolRegistry) -> "HandlerFunc":
                 # Prefer page-local time to match __mcpDiag timestamps.
                 try:
                     tab_id = _session_manager.tab_id
-                    t0 = _session_manager.get_telemetry(tab_id or "") if tab_id else None
-                    dialog_open = bool(getattr(t0, "dialog_open", False)) if t0 is not None else False
+                    dialog_open = _session_manager.tier0_dialog(tab_id or "")[0]
                 except Exception:
                     dialog_open = False
 
@@ -376,6 +407,10 @@ def make_flow_handler(registry: ToolRegistry) -> "HandlerFunc":
             steps_artifact: dict[str, Any] | None = None
             collected_next: list[str] = []
             flow_vars: dict[str, Any] = {}
+            memory_series: list[dict[str, Any]] = []
+            if profile_memory:
+                with suppress(Exception):
+                    memory_series.append({"at": "start", **_tools.sample_page_memory(config)})
 
             _FLOW_VAR_INLINE_RE = re.compile(r"\{\{\s*([A-Za-z0-9_.-]+)\s*\}\}|\$\{\s*([A-Za-z0-9_.-]+)\s*\}")
             _FLOW_VAR_EXACT_RE = re.compile(
@@ -574,8 +609,7 @@ def make_flow_handler(registry: ToolRegistry) -> "HandlerFunc":
                 # Avoid Runtime.evaluate when dialogs are open (it will hang).
                 try:
                     tab_id = _session_manager.tab_id
-                    t0 = _session_manager.get_telemetry(tab_id or "") if tab_id else None
-                    if t0 is not None and getattr(t0, "dialog_open", False):
+                    if _session_manager.tier0_dialog(tab_id or "")[0]:
                         return int(_now() * 1000)
                 except Exception:
                     pass
@@ -847,11 +881,19 @@ def make_flow_handler(registry: ToolRegistry) -> "HandlerFunc":
                     action = "harLite"
                 elif action_norm in {"trace", "nettrace", "networktrace", "deep"}:
                     action = "trace"
+                elif action_norm in {"capture", "bodies", "bodycapture"}:
+                    action = "capture"
+                elif action_norm in {"har", "harexport", "har_export"}:
+                    action = "har"
+                elif action_norm in {"rules", "intercept", "block"}:
+                    action = "rules"
+                elif action_norm in {"replay", "harreplay", "offline"}:
+                    action = "replay"
                 else:
                     return ToolResult.error(
                         f"Unknown net action: {action}",
                         tool="net",
-                        suggestion='Use net(action="harLite") or net(action="trace")',
+                        suggestion='Use net(action="harLite"|"trace"|"capture"|"har"|"rules"|"replay")',
                     )
 
                 # Ensure Tier-0 telemetry is enabled (best-effort).
@@ -871,6 +913,33 @@ def make_flow_handler(registry: ToolRegistry) -> "HandlerFunc":
                         suggestion="Call navigate(url=...) first, then retry",
                     )
 
+                if action == "capture":
+                    # Arm/disarm eager body capture before the actions whose bodies matter.
+                    from ...body_capture import body_capture_action
+
+                    return ToolResult.json(
+                        {"ok": True, "tool": "net", "action": action, **body_capture_action(config, tab_id, step_args)}
+                    )
+                if action == "har":
+                    # Streaming HAR 1.2 recorder: enable before the actions, enable=false finalizes.
+                    from ...har_export import har_action
+
+                    return ToolResult.json({"ok": True, "tool": "net", "action": action, **har_action(tab_id, step_args)})
+                if action == "rules":
+                    # Fetch-domain interception (block/continue/fulfill/delay); enable=false removes.
+                    from ...net_rules import net_rules_action
+
+                    return ToolResult.json(
+                        {"ok": True, "tool": "net", "action": action, **net_rules_action(config, tab_id, step_args)}
+                    )
+                if action == "replay":
+                    # Serve recorded responses (HAR / stored trace) via Fetch.fulfillRequest.
+                    from ...har_replay import replay_action
+
+                    return ToolResult.json(
+                        {"ok": True, "tool": "net", "action": action, **replay_action(config, tab_id, step_args)}
+                    )
+
                 def _to_int(x: Any) -> int | None:
                     try:
                         if x is None:
@@ -1049,6 +1118,8 @@ def make_flow_handler(registry: ToolRegistry) -> "HandlerFunc":
                     include=include,
                     exclude=exclude,
                     types_raw=types_raw,
+                    hosts_raw=step_args.get("hosts"),
+                    status_raw=step_args.get("status"),
                     capture=capture,
                     redact=bool(redact),
                     max_body_bytes=max_body_bytes,
@@ -1385,8 +1456,8 @@ def make_flow_handler(registry: ToolRegistry) -> "HandlerFunc":
 
                     # If the out-of-band handler closed the dialog while we were attempting, accept it.
                     try:
-                        t0 = _session_manager.get_telemetry(tab_id)
-                        if t0 is not None and not bool(getattr(t0, "dialog_open", False)):
+                        closed = _session_manager.tier0_query(tab_id, lambda t: not getattr(t, "dialog_open", False))
+                        if closed:
                             return True
                     except Exception:
                         pass
@@ -1506,9 +1577,8 @@ def make_flow_handler(registry: ToolRegistry) -> "HandlerFunc":
                         tab_id = _session_manager.tab_id
                         _drain_and_ingest_dialog_events()
 
-                        t0 = _session_manager.get_telemetry(tab_id or "") if tab_id else None
-                        if t0 is not None and getattr(t0, "dialog_open", False):
-                            meta_d = getattr(t0, "dialog_last", None)
+                        dialog_open_now, meta_d = _session_manager.tier0_dialog(tab_id or "")
+                        if dialog_open_now:
                             dialog = meta_d if isinstance(meta_d, dict) else {}
                             # Optional: auto-handle dialogs to keep flows cognitively-cheap.
                             handled_dialog = False
@@ -1564,6 +1634,28 @@ def make_flow_handler(registry: ToolRegistry) -> "HandlerFunc":
                         # If we can't read telemetry, proceed (best-effort).
                         pass
 
+                if tool_name == "assert_perf":
+                    # Budgets over already-buffered Tier-0 data (no page round trips).
+                    perf_tab = _session_manager.tab_id
+                    perf_spec = tool_args if isinstance(tool_args, dict) else {}
+
+                    def _assert_perf(
+                        t: Any, spec: dict[str, Any] = perf_spec, tab: str | None = perf_tab
+                    ) -> dict[str, Any]:
+                        return assert_perf(spec, telemetry=t, tab_id=tab, baseline=perf_baseline)
+
+                    # Under the shard lock: vitals/counters are live bus-thread state.
+                    perf = _session_manager.tier0_query(perf_tab, _assert_perf) if perf_tab else None
+                    entry = {"i": i, "tool": "assert_perf", **(perf or _assert_perf(None))}
+                    if not entry["ok"] and isinstance(meta, dict) and meta.get("optional"):
+                        entry["optional"] = True
+                    step_summaries.append(entry)
+                    if not entry["ok"] and not entry.get("optional"):
+                        first_error = first_error or {"i": i, "tool": "assert_perf", "error": entry["error"]}
+                        if stop_on_error:
+                            break
+                    continue
+
                 if tool_name in {"assert", "when", "repeat", "macro"}:
                     internal_res = internal_actions.handle_step(
                         i=i,
@@ -1896,7 +1988,7 @@ def make_flow_handler(registry: ToolRegistry) -> "HandlerFunc":
                     tool_args = dict(tool_args)
                     tool_args["wait_after"] = "none"
 
-                download_baseline: list[str] | None = None
+                download_since: dict[str, Any] = {}
                 if want_download:
                     try:
                         tab_id = _session_manager.tab_id or getattr(shared_sess, "tab_id", None)
@@ -1904,10 +1996,14 @@ def make_flow_handler(registry: ToolRegistry) -> "HandlerFunc":
                             # Configure per-tab downloads early (best-effort).
                             with suppress(Exception):
                                 _session_manager.ensure_downloads(shared_sess)
-                            dl_dir = _session_manager.get_download_dir(tab_id)
-                            download_baseline = [p.name for p in dl_dir.iterdir() if p.is_file()]
+                            # O(1) instead of a directory snapshot: the download-event cursor and the
+                            # click time (the wait only scans files modified after it).
+                            dl_events = _session_manager.tier0_downloads(tab_id)
+                            download_since = {"_since_ts": _time.time()}
+                            if isinstance(dl_events, dict):
+                                download_since["_since_seq"] = int(dl_events.get("cursor") or 0)
                     except Exception:
-                        download_baseline = None
+                        download_since = {}
 
                 step_cursor = _safe_js_now_ms() if step_proof else None
 
@@ -2030,8 +2126,7 @@ def make_flow_handler(registry: ToolRegistry) -> "HandlerFunc":
                                     _session_manager._ingest_tier0_event(
                                         tab_id, {"method": "Page.javascriptDialogOpening", "params": opened}
                                     )
-                        t0 = _session_manager.get_telemetry(tab_id or "") if tab_id else None
-                        dialog_open_now = bool(getattr(t0, "dialog_open", False)) if t0 is not None else False
+                        dialog_open_now = _session_manager.tier0_dialog(tab_id or "")[0]
                     except Exception:
                         dialog_open_now = False
 
@@ -2105,7 +2200,7 @@ def make_flow_handler(registry: ToolRegistry) -> "HandlerFunc":
                             "sha256_max_bytes": int(download_sha256_max_bytes),
                             "poll_interval": float(download_poll_interval),
                             "stable_ms": int(download_stable_ms),
-                            "_baseline": download_baseline or [],
+                            **download_since,
                         }
                         if isinstance(download_hint_url, str) and download_hint_url:
                             dl_args["url"] = download_hint_url
@@ -2332,8 +2427,7 @@ def make_flow_handler(registry: ToolRegistry) -> "HandlerFunc":
                             _drain_and_ingest_dialog_events()
                         try:
                             tab_id = _session_manager.tab_id
-                            t0 = _session_manager.get_telemetry(tab_id or "") if tab_id else None
-                            if t0 is not None and getattr(t0, "dialog_open", False):
+                            if _session_manager.tier0_dialog(tab_id or "")[0]:
                                 accept = auto_dialog == "accept"
                                 if auto_dialog in {"dismiss", "accept"} and _close_dialog_best_effort(
                                     accept=bool(accept),
@@ -2404,9 +2498,8 @@ def make_flow_handler(registry: ToolRegistry) -> "HandlerFunc":
                         tab_id = _session_manager.tab_id
                         _drain_and_ingest_dialog_events()
 
-                        t0 = _session_manager.get_telemetry(tab_id or "") if tab_id else None
-                        if t0 is not None and getattr(t0, "dialog_open", False):
-                            meta_d = getattr(t0, "dialog_last", None)
+                        dialog_open_now, meta_d = _session_manager.tier0_dialog(tab_id or "")
+                        if dialog_open_now:
                             dialog = meta_d if isinstance(meta_d, dict) else {}
 
                             handled_dialog = False
@@ -2460,7 +2553,13 @@ def make_flow_handler(registry: ToolRegistry) -> "HandlerFunc":
                     except Exception:
                         pass
 
+                if profile_memory:
+                    with suppress(Exception):
+                        memory_series.append({"i": i, "tool": display_tool, **_tools.sample_page_memory(config)})
+
             duration_ms = int((_now() - started) * 1000)
+            if throttle is not None:
+                throttle.restore()  # before final snapshots, which should not run throttled
             executed = len(step_summaries)
             succeeded = len([s for s in step_summaries if isinstance(s, dict) and s.get("ok") is True])
             planned_total = 0
@@ -2551,6 +2650,32 @@ def make_flow_handler(registry: ToolRegistry) -> "HandlerFunc":
             if overlays_auto_dismissed:
                 out["flow"]["overlaysAutoDismissed"] = overlays_auto_dismissed
 
+            if memory_series:
+                from ...tools.page.heap_profile import memory_trend
+
+                out["memory"] = {
+                    **memory_trend(memory_series),
+                    "series": memory_series if len(memory_series) <= 20 else [memory_series[0], *memory_series[-19:]],
+                }
+
+            with suppress(Exception):
+
+                def _phases(t: Any) -> dict[str, Any]:
+                    return measure_phases(t, tab_id=tab_id_for_auto, baseline=perf_baseline, duration_ms=duration_ms)
+
+                phases = (
+                    _session_manager.tier0_query(tab_id_for_auto, _phases) if tab_id_for_auto else None
+                ) or _phases(None)
+                throttle_info = throttle_report(
+                    throttle,
+                    tab_id=tab_id_for_auto,
+                    signature=steps_signature(steps_raw),
+                    phases=phases,
+                    completed=completed and not start_at,
+                )
+                if throttle_info is not None:
+                    out["throttle"] = throttle_info
+
             if first_error:
                 out["error"] = first_error.get("error")
                 out["failed_step"] = {"i": first_error.get("i"), "tool": first_error.get("tool")}
@@ -2633,15 +2758,13 @@ def make_flow_handler(registry: ToolRegistry) -> "HandlerFunc":
             try:
                 tab_id = _session_manager.tab_id
                 _drain_and_ingest_dialog_events()
-                t0 = _session_manager.get_telemetry(tab_id or "") if tab_id else None
-                if t0 is not None and getattr(t0, "dialog_open", False):
+                if _session_manager.tier0_dialog(tab_id or "")[0]:
                     if auto_dialog in {"dismiss", "accept"}:
                         accept = auto_dialog == "accept"
                         if _close_dialog_best_effort(accept=bool(accept), max_wait_s=min(2.0, action_timeout_s)):
                             dialogs_auto_handled += 1
                     # If still open, skip final CDP-based snapshots; they are unsafe under a dialog.
-                    t0b = _session_manager.get_telemetry(tab_id or "") if tab_id else None
-                    if t0b is not None and getattr(t0b, "dialog_open", False):
+                    if _session_manager.tier0_dialog(tab_id or "")[0]:
                         out.setdefault("final", {})["dialogOpen"] = True  # type: ignore[index]
             except Exception:
                 pass
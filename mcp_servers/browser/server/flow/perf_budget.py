@@ -0,0 +1,150 @@
+"""`assert_perf` flow step: performance budgets over already-buffered Tier-0 data.
+
+Budgets are compact comparisons, e.g. `lcp_ms<2500`, `longtasks_total_ms<300`,
+`failed_requests==0`, `transfer_kb<1500`. They are evaluated against:
+- vitals folded from PerformanceTimeline events (current top-level document), and
+- cumulative request counters, diffed against a baseline taken when the flow started.
+
+Nothing is sent to the page: a passing assertion costs a dict lookup per budget.
+A metric that was never observed fails closed (`actual: null`, `unmeasured: true`); e.g.
+long tasks stay unmeasured unless long-task entries were fed to the vitals tracker (no
+data is not "0 long tasks").
+
+Telemetry readers here run under the tab's shard lock (`session_manager.tier0_query`).
+"""
+
+from __future__ import annotations
+
+import operator
+import re
+from collections.abc import Callable
+from typing import Any
+
+PERF_METRICS: dict[str, str] = {
+    "lcp_ms": "Largest Contentful Paint (ms since navigation start)",
+    "cls": "Cumulative Layout Shift (max session window)",
+    "longtasks_count": "Long tasks (>50ms) on the current document (unmeasured without long-task entries)",
+    "longtasks_total_ms": "Total long-task time (ms)",
+    "longtasks_max_ms": "Longest task (ms)",
+    "tbt_ms": "Blocking time: sum of long-task time above 50ms",
+    "requests": "Completed requests since the flow started",
+    "failed_requests": "Failed requests (HTTP >= 400 or network error) since the flow started",
+    "transfer_kb": "Encoded bytes received since the flow started (KiB)",
+}
+
+_OPS: dict[str, Callable[[float, float], bool]] = {
+    "<=": operator.le,
+    ">=": operator.ge,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    ">": operator.gt,
+}
+_LONGTASK_METRICS = frozenset({"longtasks_count", "longtasks_total_ms", "longtasks_max_ms", "tbt_ms"})
+_BUDGET_RE = re.compile(r"^\s*([a-z_]+)\s*(<=|>=|==|!=|<|>)\s*(-?\d+(?:\.\d+)?)\s*$")
+
+
+def parse_budget(expr: Any) -> tuple[str, str, float]:
+    """Parse `metric<op>number`; raises ValueError with a readable reason."""
+    m = _BUDGET_RE.match(expr) if isinstance(expr, str) else None
+    if m is None:
+        raise ValueError(f"Invalid budget {expr!r} (expected e.g. 'lcp_ms<2500')")
+    metric, op, limit = m.group(1), m.group(2), float(m.group(3))
+    if metric not in PERF_METRICS:
+        raise ValueError(f"Unknown metric {metric!r}")
+    return metric, op, limit
+
+
+def net_baseline(telemetry: Any, tab_id: str | None) -> dict[str, Any]:
+    """Snapshot the request counters at flow start (so budgets cover only this run)."""
+    totals = getattr(telemetry, "net_totals", None)
+    return {"tabId": tab_id, **(dict(totals) if isinstance(totals, dict) else {})}
+
+
+def measure_perf(telemetry: Any, *, tab_id: str | None, baseline: dict[str, Any] | None) -> dict[str, Any]:
+    """Current metric values from buffered telemetry (None = not observed; call under the shard lock)."""
+    vitals = telemetry.vitals.summary() if telemetry is not None else None
+    lcp = vitals.get("lcp") if isinstance(vitals, dict) else None
+    lt = vitals.get("longTasks") if isinstance(vitals, dict) else None
+    out: dict[str, Any] = {
+        "lcp_ms": lcp.get("ms") if isinstance(lcp, dict) else None,
+        "cls": vitals.get("cls") if isinstance(vitals, dict) else None,
+        "longtasks_count": lt.get("count") if isinstance(lt, dict) else None,
+        "longtasks_total_ms": lt.get("totalMs") if isinstance(lt, dict) else None,
+        "longtasks_max_ms": lt.get("maxMs") if isinstance(lt, dict) else None,
+        "tbt_ms": lt.get("blockingMs") if isinstance(lt, dict) else None,
+    }
+
+    totals = getattr(telemetry, "net_totals", None) if telemetry is not None else None
+    if isinstance(totals, dict):
+        # A different tab than the one baselined: its whole history belongs to this run.
+        base = baseline if isinstance(baseline, dict) and baseline.get("tabId") == tab_id else {}
+        delta = {k: int(totals.get(k, 0)) - int(base.get(k, 0)) for k in ("requests", "failed", "bytes")}
+        out["requests"] = delta["requests"]
+        out["failed_requests"] = delta["failed"]
+        out["transfer_kb"] = round(delta["bytes"] / 1024.0, 1)
+    else:
+        out.update({"requests": None, "failed_requests": None, "transfer_kb": None})
+    return out
+
+
+def assert_perf(
+    spec: dict[str, Any],
+    *,
+    telemetry: Any,
+    tab_id: str | None,
+    baseline: dict[str, Any] | None,
+) -> dict[str, Any]:
+    """Evaluate `spec["budgets"]`; returns step-summary fields (`ok`, `budgets`, `measured`, error).
+
+    Reads `telemetry` directly: run it under the shard lock (`session_manager.tier0_query`).
+    """
+    raw = spec.get("budgets", spec.get("budget"))
+    exprs = [raw] if isinstance(raw, str) else raw
+    if not isinstance(exprs, list) or not exprs:
+        return {
+            "ok": False,
+            "error": "No budgets",
+            "suggestion": 'Use {"assert_perf": {"budgets": ["lcp_ms<2500", "failed_requests==0"]}}',
+        }
+    try:
+        parsed = [(str(e).strip(), *parse_budget(e)) for e in exprs]
+    except ValueError as exc:
+        return {"ok": False, "error": str(exc), "suggestion": f"Metrics: {', '.join(PERF_METRICS)}"}
+
+    measured = measure_perf(telemetry, tab_id=tab_id, baseline=baseline)
+    results: list[dict[str, Any]] = []
+    for expr, metric, op, limit in parsed:
+        actual = measured.get(metric)
+        if not isinstance(actual, (int, float)):
+            # No data is not a pass (e.g. `longtasks_count==0` with no long-task entries).
+            results.append({"budget": expr, "actual": None, "ok": False, "unmeasured": True})
+            continue
+        results.append({"budget": expr, "actual": actual, "ok": bool(_OPS[op](float(actual), limit))})
+
+    entry: dict[str, Any] = {
+        "ok": all(r["ok"] for r in results),
+        "budgets": results,
+        "measured": {m: measured[m] for _e, m, _o, _l in parsed},
+    }
+    failed = [r for r in results if not r["ok"]]
+    if failed:
+        entry["error"] = "Performance budget exceeded: " + ", ".join(
+            f"{r['budget']} (unmeasured)" if r.get("unmeasured") else f"{r['budget']} (actual {r['actual']})"
+            for r in failed
+        )
+        unmeasured = {m for (_e, m, _o, _l), r in zip(parsed, results, strict=True) if r.get("unmeasured")}
+        if unmeasured & _LONGTASK_METRICS:
+            entry["suggestion"] = (
+                "Long tasks were not collected for this document (Tier-0 vitals only see them when "
+                "long-task entries are fed in); drop the longtasks_*/tbt_ms budgets or check "
+                "page(detail='performance')"
+            )
+        elif unmeasured:
+            entry["suggestion"] = (
+                "Unmeasured vitals need Tier-0 telemetry and a navigation after it was enabled; "
+                "navigate/reload earlier in the flow"
+            )
+        else:
+            entry["suggestion"] = "Inspect page(detail='performance') / net(action='harLite') for the offending work"
+    return entry
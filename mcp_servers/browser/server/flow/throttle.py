@@ -0,0 +1,164 @@
+"""Network / CPU throttling profiles for flow/run (perf testing on slow devices).
+
+`run(..., throttle="slow-4g+cpu4x")` applies `Network.emulateNetworkConditions` and
+`Emulation.setCPUThrottlingRate` on the shared session before the first step and restores
+both right after the last one (and on any early exit). The report carries the profile,
+whether it was restored, and phase timings from Tier-0 (run wall time, LCP, blocking time,
+long tasks, average request time).
+
+Each completed unthrottled run stores its phases as the baseline for that tab and step
+list; a throttled run of the same steps reports `stretch` = throttled / baseline per phase.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+from collections import OrderedDict
+from typing import Any
+
+from .perf_budget import measure_perf
+
+# Chrome DevTools presets (throughput in bytes/s, latency in ms).
+NETWORK_PROFILES: dict[str, dict[str, Any]] = {
+    "3g": {"offline": False, "latency": 2000, "downloadThroughput": 50_000, "uploadThroughput": 50_000},
+    "slow-4g": {"offline": False, "latency": 563, "downloadThroughput": 180_000, "uploadThroughput": 84_375},
+    "fast-4g": {"offline": False, "latency": 165, "downloadThroughput": 1_012_500, "uploadThroughput": 168_750},
+    "offline": {"offline": True, "latency": 0, "downloadThroughput": 0, "uploadThroughput": 0},
+}
+_NETWORK_RESET = {"offline": False, "latency": 0, "downloadThroughput": -1, "uploadThroughput": -1}
+_CPU_RE = re.compile(r"^cpu(\d+(?:\.\d+)?)x$")
+_CPU_MAX_RATE = 20.0
+# Phases compared against the unthrottled baseline (lower is better, all in ms).
+_STRETCH_PHASES = ("run_ms", "lcp_ms", "tbt_ms", "longtasks_total_ms", "request_avg_ms")
+_MAX_BASELINES = 32
+_baselines: OrderedDict[tuple[str, str], dict[str, Any]] = OrderedDict()
+
+
+def parse_throttle(spec: Any) -> tuple[str | None, float | None]:
+    """`"slow-4g+cpu4x"` / `["3g", "cpu6x"]` -> (network profile, cpu rate); ValueError on bad input."""
+    parts = spec if isinstance(spec, list) else str(spec or "").replace(",", "+").split("+")
+    network: str | None = None
+    cpu: float | None = None
+    for raw in parts:
+        name = str(raw or "").strip().lower()
+        if not name or name == "none":
+            continue
+        m = _CPU_RE.match(name)
+        if m is not None:
+            rate = float(m.group(1))
+            if not 1.0 <= rate <= _CPU_MAX_RATE:
+                raise ValueError(f"CPU slowdown must be between 1x and {int(_CPU_MAX_RATE)}x: {name}")
+            cpu = rate
+        elif name in NETWORK_PROFILES:
+            network = name
+        else:
+            raise ValueError(f"Unknown throttle profile: {name}")
+    return network, cpu
+
+
+def steps_signature(steps: Any) -> str:
+    raw = json.dumps(steps, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha1(raw.encode("utf-8"), usedforsecurity=False).hexdigest()
+
+
+class Throttle:
+    """Applies a parsed profile to a session and restores it exactly once."""
+
+    def __init__(self, session: Any, network: str | None, cpu_rate: float | None) -> None:
+        self.session = session
+        self.network = network
+        self.cpu_rate = cpu_rate
+        self.applied: list[str] = []
+        self.restored = False
+        self.restore_error: str | None = None
+
+    @property
+    def label(self) -> str:
+        cpu = f"cpu{self.cpu_rate:g}x" if self.cpu_rate else None
+        return "+".join(p for p in (self.network, cpu) if p) or "none"
+
+    def apply(self) -> None:
+        """Send the emulation commands (raises on CDP errors; restore() undoes partial state)."""
+        if self.network is not None:
+            self.session.send("Network.emulateNetworkConditions", dict(NETWORK_PROFILES[self.network]))
+            self.applied.append("network")
+        if self.cpu_rate is not None:
+            self.session.send("Emulation.setCPUThrottlingRate", {"rate": self.cpu_rate})
+            self.applied.append("cpu")
+
+    def restore(self) -> None:
+        if self.restored:
+            return
+        self.restored = True
+        for kind in self.applied:
+            try:
+                if kind == "network":
+                    self.session.send("Network.emulateNetworkConditions", dict(_NETWORK_RESET))
+                else:
+                    self.session.send("Emulation.setCPUThrottlingRate", {"rate": 1})
+            except Exception as exc:  # noqa: BLE001
+                self.restore_error = str(exc) or "restore failed"
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "profile": self.label,
+            **({"network": dict(NETWORK_PROFILES[self.network])} if self.network else {}),
+            **({"cpuRate": self.cpu_rate} if self.cpu_rate else {}),
+            "restored": self.restored and self.restore_error is None,
+            **({"restoreError": self.restore_error} if self.restore_error else {}),
+        }
+
+
+def measure_phases(
+    telemetry: Any, *, tab_id: str | None, baseline: dict[str, Any] | None, duration_ms: int
+) -> dict[str, Any]:
+    """Phase timings for the run: wall time plus Tier-0 vitals and request timings."""
+    perf = measure_perf(telemetry, tab_id=tab_id, baseline=baseline)
+    phases: dict[str, Any] = {
+        "run_ms": duration_ms,
+        "lcp_ms": perf.get("lcp_ms"),
+        "tbt_ms": perf.get("tbt_ms"),
+        "longtasks_total_ms": perf.get("longtasks_total_ms"),
+        "requests": perf.get("requests"),
+        "transfer_kb": perf.get("transfer_kb"),
+    }
+    totals = getattr(telemetry, "net_totals", None) if telemetry is not None else None
+    if isinstance(totals, dict) and isinstance(phases["requests"], int) and phases["requests"] > 0:
+        base = baseline if isinstance(baseline, dict) and baseline.get("tabId") == tab_id else {}
+        spent = int(totals.get("ms", 0)) - int(base.get("ms", 0))
+        phases["request_avg_ms"] = round(spent / phases["requests"], 1)
+    return {k: v for k, v in phases.items() if v is not None}
+
+
+def _stretch(phases: dict[str, Any], base: dict[str, Any]) -> dict[str, float]:
+    out: dict[str, float] = {}
+    for k in _STRETCH_PHASES:
+        cur, ref = phases.get(k), base.get(k)
+        if isinstance(cur, (int, float)) and isinstance(ref, (int, float)) and ref > 0:
+            out[k] = round(float(cur) / float(ref), 2)
+    return out
+
+
+def throttle_report(
+    throttle: Throttle | None, *, tab_id: str | None, signature: str, phases: dict[str, Any], completed: bool
+) -> dict[str, Any] | None:
+    """Report block for a throttled run; unthrottled completed runs only refresh the baseline."""
+    key = (str(tab_id or ""), signature)
+    if throttle is None:
+        if completed:
+            _baselines[key] = phases
+            _baselines.move_to_end(key)
+            while len(_baselines) > _MAX_BASELINES:
+                _baselines.popitem(last=False)
+        return None
+    report = {**throttle.summary(), "phases": phases}
+    base = _baselines.get(key)
+    if base is None:
+        report["baseline"] = None
+        report["hint"] = "Run the same actions once without throttle to get per-phase stretch factors"
+    else:
+        report["baseline"] = base
+        report["stretch"] = _stretch(phases, base)
+    return report
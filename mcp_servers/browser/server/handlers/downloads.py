@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 from pathlib import Path
 from typing import Any
 
@@ -22,6 +23,27 @@ def handle_upload(config: BrowserConfig, launcher, args: dict[str, Any]) -> Tool
     return ToolResult.json(result)
 
 
+def _file_sha256(src_path: Path, max_bytes: int) -> tuple[str | None, bool]:
+    """Hash a stored file from scratch (digest, skipped) when it was not hashed during the wait."""
+    try:
+        size = int(src_path.stat().st_size)
+    except Exception:
+        size = 0
+    if max_bytes and size > max_bytes:
+        return None, True
+    try:
+        h = hashlib.sha256()
+        with src_path.open("rb") as f:
+            while True:
+                chunk = f.read(1024 * 1024)
+                if not chunk:
+                    break
+                h.update(chunk)
+        return h.hexdigest(), False
+    except Exception:
+        return None, False
+
+
 def handle_download(config: BrowserConfig, launcher, args: dict[str, Any]) -> ToolResult:  # noqa: ANN001
     """Wait for a download to complete and store it as an artifact (cognitive-cheap)."""
     try:
@@ -42,6 +64,9 @@ def handle_download(config: BrowserConfig, launcher, args: dict[str, Any]) -> To
         baseline = None
     else:
         baseline = [str(x) for x in baseline if isinstance(x, str) and x]
+    # Internal (run/flow): download event cursor + wall time recorded before the click.
+    since_seq = args.get("_since_seq") if isinstance(args.get("_since_seq"), int) else None
+    since_ts = args.get("_since_ts") if isinstance(args.get("_since_ts"), (int, float)) else None
 
     fallback_url = args.get("url") if isinstance(args.get("url"), str) else None
     fallback_name = None
@@ -64,6 +89,10 @@ def handle_download(config: BrowserConfig, launcher, args: dict[str, Any]) -> To
         url=fallback_url,
         file_name=fallback_name,
         max_bytes=max_bytes,
+        since_seq=since_seq,
+        since_ts=since_ts,
+        # Hash while the browser writes the file; only re-read below if that was not possible.
+        sha256_max_bytes=sha256_max_bytes if sha256_enabled and store else None,
     )
 
     if not store:
@@ -107,30 +136,10 @@ def handle_download(config: BrowserConfig, launcher, args: dict[str, Any]) -> To
         dl["note"] = "Download detected but could not resolve file path for artifact storage"
         return ToolResult.json(result)
 
-    sha256: str | None = None
-    sha256_skipped = False
-    if sha256_enabled:
-        try:
-            size = int(src_path.stat().st_size)
-        except Exception:
-            size = 0
-
-        if sha256_max_bytes and size > sha256_max_bytes:
-            sha256_skipped = True
-        else:
-            try:
-                import hashlib
-
-                h = hashlib.sha256()
-                with src_path.open("rb") as f:
-                    while True:
-                        chunk = f.read(1024 * 1024)
-                        if not chunk:
-                            break
-                        h.update(chunk)
-                sha256 = h.hexdigest()
-            except Exception:
-                sha256 = None
+    sha256: str | None = dl.pop("sha256", None) if sha256_enabled else None
+    sha256_skipped = bool(dl.pop("sha256Skipped", False)) and sha256_enabled
+    if sha256_enabled and not sha256 and not sha256_skipped:
+        sha256, sha256_skipped = _file_sha256(src_path, sha256_max_bytes)
 
     ext = src_path.suffix if src_path.suffix else None
     ref = artifact_store.put_file(
@@ -0,0 +1,54 @@
+"""Helpers for extract_content(export=true): stream a full extraction list into a JSONL artifact."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from ... import tools
+from ..artifacts import artifact_store
+from ..hints import artifact_export_hint, artifact_get_hint
+
+if TYPE_CHECKING:
+    from ...config import BrowserConfig
+
+
+def export_extract_jsonl(config: BrowserConfig, args: dict[str, Any]) -> dict[str, Any]:
+    """Run export_content() with an artifact stream as the sink (bounded memory on both sides)."""
+    content_type = str(args.get("content_type") or "main")
+    table_index = args.get("table_index")
+    selector = args.get("selector")
+
+    stream = artifact_store.open_stream(
+        kind="extract_export",
+        mime_type="application/x-ndjson",
+        ext=".jsonl",
+        metadata={
+            "tool": "extract_content",
+            "content_type": content_type,
+            **({"selector": selector} if isinstance(selector, str) and selector else {}),
+            **({"table_index": table_index} if isinstance(table_index, int) else {}),
+        },
+    )
+    with stream:
+        summary = tools.export_content(
+            config,
+            write_items=stream.write_jsonl,
+            content_type=content_type,
+            selector=selector,
+            table_index=table_index,
+        )
+        ref = stream.close(metadata={"items": summary.get("exported"), "complete": summary.get("complete")})
+
+    summary["stored"] = True
+    summary["artifact"] = {
+        "id": ref.id,
+        "kind": ref.kind,
+        "mimeType": ref.mime_type,
+        "bytes": ref.bytes,
+        "createdAt": ref.created_at,
+    }
+    summary["next"] = [
+        artifact_get_hint(artifact_id=ref.id, offset=0, max_chars=4000),
+        artifact_export_hint(artifact_id=ref.id, name=f"{content_type}.jsonl"),
+    ]
+    return summary
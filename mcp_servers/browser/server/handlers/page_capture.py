@@ -0,0 +1,109 @@
+"""page(detail=...) capture modes that are answered by dedicated CDP capture engines.
+
+Each entry maps a detail name to a callable (config, args) -> payload dict.
+Kept out of unified.handle_page so new capture modes do not grow the monolith.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable
+from contextlib import suppress
+from typing import TYPE_CHECKING, Any
+
+from ... import tools
+from ..artifacts import artifact_store
+from ..hints import artifact_export_hint
+
+if TYPE_CHECKING:
+    from ...config import BrowserConfig
+
+
+def _snapshot(config: BrowserConfig, args: dict[str, Any]) -> dict[str, Any]:
+    return tools.get_page_snapshot(
+        config,
+        view=str(args.get("view") or "summary"),
+        kind=str(args.get("kind") or "all"),
+        x=args.get("x"),
+        y=args.get("y"),
+        offset=args.get("offset", 0),
+        limit=args.get("limit", 50),
+        max_chars=args.get("max_chars", 8000),
+    )
+
+
+def store_capture_file(
+    result: dict[str, Any],
+    *,
+    path_key: str,
+    kind: str,
+    ext: str,
+    mime_type: str,
+    artifact_key: str = "artifact",
+) -> None:
+    """Move a capture file produced by a tool (temp path in `result[path_key]`) into the artifact store.
+
+    The ref lands in `result[artifact_key]`; the export hint is prepended to `result["next"]`.
+    """
+    path = result.pop(path_key, None)
+    if not isinstance(path, str) or not path:
+        return
+    try:
+        ref = artifact_store.put_file(kind=kind, src_path=path, mime_type=mime_type, ext=ext)
+    finally:
+        with suppress(OSError):
+            os.unlink(path)
+    result[artifact_key] = {"id": ref.id, "kind": ref.kind, "mimeType": ref.mime_type, "bytes": ref.bytes}
+    nxt = result.get("next")
+    result["next"] = [
+        artifact_export_hint(artifact_id=ref.id, overwrite=False),
+        *(nxt if isinstance(nxt, list) else []),
+    ]
+
+
+def _profile(config: BrowserConfig, args: dict[str, Any]) -> dict[str, Any]:
+    result = tools.get_page_profile(
+        config,
+        duration_ms=args.get("duration_ms", 3000),
+        sampling_interval_us=args.get("sampling_interval_us"),
+        coverage=bool(args.get("coverage", False)),
+        top=args.get("limit", 15),
+    )
+    store_capture_file(
+        result, path_key="profilePath", kind="cpu_profile", ext=".cpuprofile", mime_type="application/json"
+    )
+    return result
+
+
+def _trace(config: BrowserConfig, args: dict[str, Any]) -> dict[str, Any]:
+    categories = args.get("categories")
+    result = tools.get_page_trace(
+        config,
+        duration_ms=args.get("duration_ms", 3000),
+        categories=categories if isinstance(categories, list) else None,
+        top=args.get("limit", 10),
+    )
+    store_capture_file(result, path_key="tracePath", kind="trace", ext=".json.gz", mime_type="application/gzip")
+    return result
+
+
+def _memory(config: BrowserConfig, args: dict[str, Any]) -> dict[str, Any]:
+    result = tools.get_page_memory(
+        config,
+        duration_ms=args.get("duration_ms", 3000),
+        sampling_interval=args.get("heap_sampling_bytes"),
+        gc=bool(args.get("gc", False)),
+        top=args.get("limit", 15),
+    )
+    store_capture_file(
+        result, path_key="profilePath", kind="heap_profile", ext=".heapprofile", mime_type="application/json"
+    )
+    return result
+
+
+PAGE_CAPTURE_DETAILS: dict[str, Callable[[BrowserConfig, dict[str, Any]], dict[str, Any]]] = {
+    "snapshot": _snapshot,
+    "profile": _profile,
+    "trace": _trace,
+    "memory": _memory,
+}
@@ -26,7 +26,9 @@ from .extract_retry import (
     normalize_retry_scroll as _normalize_retry_scroll,
 )
 from .downloads import handle_download, handle_upload
+from .extract_export import export_extract_jsonl
 from .locators_overlay import build_locators_overlay_js
+from .page_capture import PAGE_CAPTURE_DETAILS, store_capture_file
 
 if TYPE_CHECKING:
     from ...config import BrowserConfig
@@ -1012,6 +1014,12 @@ def handle_page(config: BrowserConfig, launcher: BrowserLauncher, args: dict[str
         audit_kwargs: dict[str, Any] = {"limit": limit, "clear": bool(args.get("clear", False))}
         if "since" in args:
             audit_kwargs["since"] = args.get("since")
+        if args.get("coverage"):
+            audit_kwargs.update(
+                coverage=True,
+                coverage_reload=bool(args.get("coverage_reload", True)),
+                coverage_ms=args.get("duration_ms", 1000),
+            )
 
         trace_arg = args.get("trace")
 
@@ -1136,6 +1144,8 @@ def handle_page(config: BrowserConfig, launcher: BrowserLauncher, args: dict[str
                         include=include,
                         exclude=exclude,
                         types_raw=types_raw,
+                        hosts_raw=trace_cfg.get("hosts"),
+                        status_raw=trace_cfg.get("status"),
                         capture=str(capture or "meta"),
                         redact=bool(redact),
                         max_body_bytes=_to_int(max_body_bytes, default=80_000),
@@ -1176,6 +1186,15 @@ def handle_page(config: BrowserConfig, launcher: BrowserLauncher, args: dict[str
             _attach_auto_expand(audit)
             _attach_auto_scroll(audit)
 
+        if isinstance(audit.get("audit"), dict) and "coveragePath" in audit["audit"]:
+            store_capture_file(
+                audit["audit"],
+                path_key="coveragePath",
+                kind="coverage",
+                ext=".jsonl",
+                mime_type="application/x-ndjson",
+                artifact_key="coverageArtifact",
+            )
         if store:
             _attach_artifact_ref(config, audit, args, kind="page_audit")
         if args.get("with_screenshot"):
@@ -1197,8 +1216,9 @@ def handle_page(config: BrowserConfig, launcher: BrowserLauncher, args: dict[str
             "sort": sort,
             "clear": bool(args.get("clear", False)),
         }
-        if "since" in args:
-            diag_kwargs["since"] = args.get("since")
+        for key in ("since", "source", "since_seq", "tab_id"):
+            if key in args:
+                diag_kwargs[key] = args.get(key)
         result = tools.get_page_diagnostics(config, **diag_kwargs)
         _attach_auto_expand(result)
         _attach_auto_scroll(result)
@@ -1641,6 +1661,12 @@ def handle_page(config: BrowserConfig, launcher: BrowserLauncher, args: dict[str
         _attach_auto_scroll(result)
         if store:
             _attach_artifact_ref(config, result, args, kind="page_graph")
+    elif args.get("detail") in PAGE_CAPTURE_DETAILS:
+        result = PAGE_CAPTURE_DETAILS[args["detail"]](config, args)
+        _attach_auto_expand(result)
+        _attach_auto_scroll(result)
+        if store:
+            _attach_artifact_ref(config, result, args, kind=f"page_{args.get('detail')}")
     elif args.get("detail"):
         result = tools.analyze_page(
             config,
@@ -1916,15 +1942,19 @@ def handle_extract_content(config: BrowserConfig, launcher: BrowserLauncher, arg
             retry_info["errors"] = errors[:4]
 
     try:
-        result = tools.extract_content(
-            config,
-            content_type=args.get("content_type", "overview"),
-            selector=args.get("selector"),
-            offset=args.get("offset", 0),
-            limit=args.get("limit", 10),
-            table_index=args.get("table_index"),
-            content_root_debug=bool(args.get("content_root_debug", False)),
-        )
+        if bool(args.get("export", False)):
+            result = export_extract_jsonl(config, args)
+        else:
+            result = tools.extract_content(
+                config,
+                content_type=args.get("content_type", "overview"),
+                selector=args.get("selector"),
+                offset=args.get("offset", 0),
+                limit=args.get("limit", 10),
+                table_index=args.get("table_index"),
+                content_root_debug=bool(args.get("content_root_debug", False)),
+                cursor=args.get("cursor"),
+            )
     except SmartToolError as exc:
         return ToolResult.error(
             exc.reason or "extract_content failed",
@@ -1990,7 +2020,8 @@ def handle_screenshot(config: BrowserConfig, launcher: BrowserLauncher, args: di
 
 def handle_js(config: BrowserConfig, launcher: BrowserLauncher, args: dict[str, Any]) -> ToolResult:
     """Execute JavaScript."""
-    result = tools.eval_js(config, args["code"])
+    frame = args.get("frame")
+    result = tools.eval_js(config, args["code"], frame=frame) if frame else tools.eval_js(config, args["code"])
     return ToolResult.json(result)
 
 
@@ -2013,12 +2044,46 @@ def handle_http(config: BrowserConfig, launcher: BrowserLauncher, args: dict[str
     return ToolResult.json(result)
 
 
+def _handle_fetch_batch(config: BrowserConfig, args: dict[str, Any]) -> ToolResult:
+    requests = args["requests"]
+    stream = artifact_store.open_stream(
+        kind="fetch_batch",
+        mime_type="application/x-ndjson",
+        ext=".jsonl",
+        metadata={"tool": "fetch", "requests": len(requests)},
+    )
+    try:
+        with stream:
+            summary = tools.browser_fetch_batch(
+                config,
+                requests,
+                sink=stream.write_jsonl,
+                concurrency=int(args.get("concurrency") or 6),
+            )
+            ref = stream.close(metadata={"items": summary.get("total"), "byStatus": summary.get("byStatus")})
+    except SmartToolError as exc:
+        return ToolResult.error(
+            exc.reason or "fetch batch failed",
+            tool=exc.tool or "fetch",
+            suggestion=exc.suggestion,
+            details=exc.details if isinstance(exc.details, dict) else None,
+        )
+    summary["artifact"] = {"id": ref.id, "kind": ref.kind, "mimeType": ref.mime_type, "bytes": ref.bytes}
+    summary["next"] = [
+        artifact_get_hint(artifact_id=ref.id, offset=0, max_chars=4000),
+        artifact_export_hint(artifact_id=ref.id, name="fetch_batch.jsonl"),
+    ]
+    return ToolResult.json(summary)
+
+
 def handle_fetch(config: BrowserConfig, launcher: BrowserLauncher, args: dict[str, Any]) -> ToolResult:
-    """Fetch from browser context."""
+    """Fetch from browser context (batch mode: requests=[...] streamed to a JSONL artifact)."""
+    if isinstance(args.get("requests"), list):
+        return _handle_fetch_batch(config, args)
     try:
         result = tools.browser_fetch(
             config,
-            url=args["url"],
+            url=args.get("url"),
             method=args.get("method", "GET"),
             body=args.get("body"),
             headers=args.get("headers"),
@@ -2030,7 +2095,7 @@ def handle_fetch(config: BrowserConfig, launcher: BrowserLauncher, args: dict[st
             try:
                 from ...http_client import http_get
 
-                http_result = http_get(args["url"], config)
+                http_result = http_get(str(args.get("url") or ""), config)
                 http_result["fallback"] = "http"
                 http_result["fallbackReason"] = exc.reason
                 return ToolResult.json(http_result)
@@ -2277,6 +2342,17 @@ def handle_wait(config: BrowserConfig, launcher: BrowserLauncher, args: dict[str
         result = _wait_for_condition(config, wait_for, timeout)
     elif wait_for == "text":
         result = tools.wait_for(config, condition="text", text=args.get("text"), timeout=timeout)
+    elif wait_for == "event":
+        result = tools.watch_events(
+            config,
+            events=args.get("events"),
+            level=args.get("level"),
+            url=args.get("url"),
+            status=args.get("status"),
+            since_seq=args.get("since_seq"),
+            timeout=timeout,
+            limit=args.get("limit", 50),
+        )
     else:
         return ToolResult.error(f"Unknown wait type: {wait_for}")
 
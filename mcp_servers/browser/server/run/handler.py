@@ -103,6 +103,8 @@ def make_run_handler(flow_handler: "HandlerFunc") -> "HandlerFunc":
             "final": report,
             "final_limit": args.get("report_limit", 30),
             "with_screenshot": bool(args.get("with_screenshot", False)),
+            "profile_memory": bool(args.get("profile_memory", False)),
+            **({"throttle": args.get("throttle")} if args.get("throttle") is not None else {}),
             # Internal: per-action proof to avoid extra tool calls.
             "step_proof": proof,
             "proof_screenshot": proof_screenshot,
@@ -216,6 +218,10 @@ def make_run_handler(flow_handler: "HandlerFunc") -> "HandlerFunc":
 
         if "since" in raw:
             out["since"] = raw.get("since")
+        if isinstance(raw.get("memory"), dict):
+            out["memory"] = raw.get("memory")
+        if isinstance(raw.get("throttle"), dict):
+            out["throttle"] = raw.get("throttle")
 
         if raw.get("error"):
             out["error"] = raw.get("error")
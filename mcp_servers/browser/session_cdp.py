@@ -53,6 +53,9 @@ def _extension_rpc_timeout(base: float | None = None) -> float:
 class CdpConnection:
     """Low-level CDP WebSocket connection."""
 
+    # Commands may address flat child sessions (`sessionId`), e.g. out-of-process iframes.
+    flat_sessions = True
+
     def __init__(self, ws_url: str, timeout: float = 5.0):
         websocket = _import_websocket()
         self.ws = websocket.create_connection(ws_url, timeout=timeout)
@@ -226,6 +229,65 @@ class CdpConnection:
                 time.sleep(min(5.0, delay_ms / 1000.0))
         return out
 
+    def send_pipelined(self, commands: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Write several CDP commands back-to-back, then collect all responses.
+
+        One round-trip instead of N: Chrome processes the commands concurrently per
+        target (e.g. Runtime.evaluate fan-out across frames). Results are aligned with
+        `commands`; failures become `{"ok": False, "error": ...}` entries. A command may
+        carry a flat `sessionId` to address an attached child target (OOPIF).
+        """
+        ids: dict[int, int] = {}
+        out: list[dict[str, Any]] = [{"ok": False, "error": "not sent"} for _ in commands]
+        with suppress(Exception):
+            self.ws.settimeout(min(2.0, max(0.5, float(self.timeout))))
+        for i, cmd in enumerate(commands):
+            method = cmd.get("method") if isinstance(cmd, dict) else None
+            if not isinstance(method, str) or not method.strip():
+                out[i] = {"ok": False, "error": "missing method", "index": i}
+                continue
+            msg_id = self._next_id
+            self._next_id += 1
+            msg: dict[str, Any] = {"id": msg_id, "method": method}
+            if isinstance(cmd.get("params"), dict) and cmd["params"]:
+                msg["params"] = cmd["params"]
+            if isinstance(cmd.get("sessionId"), str):
+                # Flat child-target session (Target.setAutoAttach flatten=true).
+                msg["sessionId"] = cmd["sessionId"]
+            try:
+                self.ws.send(json.dumps(msg))
+            except Exception as exc:  # noqa: BLE001
+                raise HttpClientError(str(exc)) from exc
+            ids[msg_id] = i
+
+        deadline = time.time() + self.timeout
+        while ids:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                for i in ids.values():
+                    out[i] = {"ok": False, "error": "CDP response timed out"}
+                break
+            try:
+                self.ws.settimeout(min(0.5, remaining))
+                raw = self.ws.recv()
+            except Exception as exc:  # noqa: BLE001
+                msg_s = str(exc).lower()
+                if isinstance(exc, TimeoutError) or "timed out" in msg_s:
+                    continue
+                raise HttpClientError(str(exc)) from exc
+            try:
+                data = json.loads(raw)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(data, dict) and isinstance(data.get("method"), str) and "id" not in data:
+                self._push_event(data)
+                continue
+            idx = ids.pop(data.get("id"), None) if isinstance(data, dict) else None
+            if idx is None:
+                continue
+            out[idx] = {"ok": False, "error": str(data["error"])} if "error" in data else data.get("result", {})
+        return out
+
     def _recv_until(self, expected_id: int) -> dict[str, Any]:
         """Wait for response with specific ID."""
         deadline = time.time() + self.timeout
@@ -316,6 +378,9 @@ class ExtensionCdpConnection:
     (no separate Chrome instance, no --remote-debugging-port requirement).
     """
 
+    # The gateway addresses tabs only; child-target sessions are not forwarded.
+    flat_sessions = False
+
     def __init__(self, gateway: ExtensionGateway, tab_id: str, *, timeout: float = 5.0) -> None:
         self.gateway = gateway
         self.tab_id = str(tab_id or "").strip()
@@ -351,6 +416,10 @@ class ExtensionCdpConnection:
     def send_many(self, commands: list[dict[str, Any]], *, stop_on_error: bool = True) -> list[dict[str, Any]]:
         return self.gateway.cdp_send_many(self.tab_id, commands, timeout=self.timeout, stop_on_error=stop_on_error)
 
+    def send_pipelined(self, commands: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        # The gateway already batches commands into one transport round-trip.
+        return self.send_many(commands, stop_on_error=False)
+
     def wait_for_event(self, event_name: str, timeout: float = 10.0) -> dict | None:
         params = self.gateway.wait_for_event(self.tab_id, event_name, timeout=timeout)
         if params is None:
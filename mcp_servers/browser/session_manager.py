@@ -23,11 +23,15 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any
 from urllib.parse import urlsplit, urlunsplit
 
+from .ax_index import LabelIndex
 from .config import BrowserConfig
 from .diagnostics import DIAGNOSTICS_SCRIPT_SOURCE, DIAGNOSTICS_SCRIPT_VERSION
 from .http_client import HttpClientError
 from .sensitivity import is_sensitive_key
-from .telemetry import Tier0Telemetry
+from .telemetry import Tier0Telemetry, prepare_event
+from .telemetry_journal import TelemetryJournal, query_journal
+from .telemetry_shards import TelemetryShard
+from .telemetry_watch import WatchFilter
 from .session_helpers import _downloads_root, _http_get_json, _normalize_policy_mode, _repo_root
 
 if TYPE_CHECKING:
@@ -37,6 +41,21 @@ from .browser_session import BrowserSession
 from .session_cdp import CdpConnection, ExtensionCdpConnection, _extension_rpc_timeout
 from .session_tier0 import _Tier0EventBus
 
+def _affordance_label(meta: dict[str, Any] | None) -> str:
+    """Human label of an affordance (first non-empty of text/name/fillKey/id/placeholder/selector)."""
+    if not isinstance(meta, dict):
+        return ""
+    for k in ("text", "name", "fillKey", "id", "placeholder", "selector"):
+        v = meta.get(k)
+        if isinstance(v, str) and v.strip():
+            return " ".join(v.split()).strip()
+    return ""
+
+
+def _affordance_kind(meta: dict[str, Any] | None) -> str:
+    return str(meta.get("kind") or "").strip().lower() if isinstance(meta, dict) else ""
+
+
 class SessionManager:
     """
     Singleton manager for the MCP session's isolated browser tab.
@@ -58,6 +77,7 @@ class SessionManager:
             inst._tier0_buses = {}
             inst._affordances = {}
             inst._affordances_state = {}
+            inst._affordance_index = {}
             inst._affordances_lock = threading.Lock()
             inst._nav_graph = {}
             inst._nav_graph_lock = threading.Lock()
@@ -166,6 +186,8 @@ class SessionManager:
         with suppress(Exception):
             self._diagnostics_state.clear()
         with suppress(Exception):
+            for shard in list(self._telemetry.values()):
+                shard.close()
             self._telemetry.clear()
         with suppress(Exception):
             self._tier0_buses.clear()
@@ -181,6 +203,8 @@ class SessionManager:
             self._affordances.clear()
         with suppress(Exception):
             self._affordances_state.clear()
+        with suppress(Exception):
+            self._affordance_index.clear()
         with suppress(Exception):
             self._nav_graph.clear()
         with suppress(Exception):
@@ -521,16 +545,19 @@ class SessionManager:
 
         # Extension mode: events are pushed by the extension gateway; do not start a WS reader.
         if isinstance(getattr(session, "conn", None), ExtensionCdpConnection):
-            telemetry = self._telemetry.get(tab_id)
-            if not isinstance(telemetry, Tier0Telemetry):
-                telemetry = Tier0Telemetry()
-                self._telemetry[tab_id] = telemetry
+            shard = self._telemetry_shard(tab_id)
 
             # Enable domains that emit high-signal events. Best-effort; ignore failures.
             with suppress(Exception):
-                session.enable_domains(page=True, runtime=True, network=True, log=True, strict=False)
+                session.enable_domains(page=True, runtime=True, network=True, log=True, timeline=True, strict=False)
 
-            return {"enabled": True, "tabId": tab_id, "cursor": telemetry.cursor, "mode": "extension"}
+            return {
+                "enabled": True,
+                "tabId": tab_id,
+                "cursor": shard.telemetry.cursor,
+                "ingest": shard.stats(),
+                "mode": "extension",
+            }
 
         # Keep the latest WS URL for this tab (used for dialog auto-handling and recovery).
         try:
@@ -540,10 +567,7 @@ class SessionManager:
             pass
 
         # Ensure buffers exist.
-        telemetry = self._telemetry.get(tab_id)
-        if not isinstance(telemetry, Tier0Telemetry):
-            telemetry = Tier0Telemetry()
-            self._telemetry[tab_id] = telemetry
+        shard = self._telemetry_shard(tab_id)
 
         # Start a background event bus so Tier-0 works even between tool calls.
         with suppress(Exception):
@@ -579,19 +603,46 @@ class SessionManager:
                 session.conn.set_event_sink(_dialog_only_sink)
 
         # Enable domains that emit high-signal events. Best-effort; ignore failures.
+        # Vitals come from whichever connection ingests events (the bus enables its own).
         with suppress(Exception):
-            session.enable_domains(page=True, runtime=True, network=True, log=True, strict=False)
+            session.enable_domains(
+                page=True, runtime=True, network=True, log=True, timeline=not bus_active, strict=False
+            )
+
+        return {
+            "enabled": True,
+            "tabId": tab_id,
+            "cursor": shard.telemetry.cursor,
+            "bus": bus_active,
+            "ingest": shard.stats(),
+        }
 
-        return {"enabled": True, "tabId": tab_id, "cursor": telemetry.cursor}
+    def _telemetry_shard(self, tab_id: str, *, create: bool = True) -> TelemetryShard | None:
+        shard = self._telemetry.get(tab_id)
+        if isinstance(shard, TelemetryShard) or not create:
+            return shard if isinstance(shard, TelemetryShard) else None
+        # The global lock only guards shard creation; per-tab state has its own lock.
+        with self._telemetry_lock:
+            shard = self._telemetry.get(tab_id)
+            if not isinstance(shard, TelemetryShard):
+                shard = TelemetryShard(journal=TelemetryJournal.for_tab(tab_id))
+                self._telemetry[tab_id] = shard
+            return shard
+
+    def _drop_telemetry_shard(self, tab_id: str) -> None:
+        shard = self._telemetry.pop(tab_id, None)
+        if isinstance(shard, TelemetryShard):
+            # Flush the journal (if any); in-memory buffers go away with the shard.
+            shard.close()
 
     def _ingest_tier0_event(self, tab_id: str, event: dict[str, Any]) -> None:
         method = event.get("method") if isinstance(event, dict) else None
-        with self._telemetry_lock:
-            telemetry = self._telemetry.get(tab_id)
-            if not isinstance(telemetry, Tier0Telemetry):
-                telemetry = Tier0Telemetry()
-                self._telemetry[tab_id] = telemetry
-            telemetry.ingest(event)
+        # Parse/redact outside any lock; the shard's single writer applies the result.
+        prepared = prepare_event(event)
+        if prepared is not None:
+            shard = self._telemetry_shard(tab_id)
+            if shard is not None:
+                shard.submit(prepared)
 
         # Async dialog auto-handling: if a dialog opens while a tool call is waiting on CDP,
         # handle it out-of-band to avoid long timeouts/hangs. This is used by run/flow.
@@ -625,10 +676,11 @@ class SessionManager:
         bus.start()
 
     def clear_telemetry(self, tab_id: str) -> None:
-        with self._telemetry_lock:
-            telemetry = self._telemetry.get(tab_id)
-            if not isinstance(telemetry, Tier0Telemetry):
-                return
+        shard = self._telemetry_shard(tab_id, create=False)
+        if shard is None:
+            return
+        shard.drain()
+        with shard.locked() as telemetry:
             telemetry.console.clear()
             telemetry.errors.clear()
             telemetry.network.clear()
@@ -638,23 +690,25 @@ class SessionManager:
             telemetry.dialog_last = None
             telemetry.navigation.clear()
             telemetry._req.clear()  # type: ignore[attr-defined]
-            telemetry._req_done.clear()  # type: ignore[attr-defined]
+            telemetry.clear_done_requests()
 
     def clear_har_lite(self, tab_id: str) -> None:
         """Clear only HAR-lite buffer (Tier-0), leaving other buffers intact."""
-        with self._telemetry_lock:
-            telemetry = self._telemetry.get(tab_id)
-            if not isinstance(telemetry, Tier0Telemetry):
-                return
+        shard = self._telemetry_shard(tab_id, create=False)
+        if shard is None:
+            return
+        shard.drain()
+        with shard.locked() as telemetry:
             telemetry.harLite.clear()
 
     def clear_net_trace(self, tab_id: str) -> None:
         """Clear Tier-0 net trace buffer (recent completed request cache)."""
-        with self._telemetry_lock:
-            telemetry = self._telemetry.get(tab_id)
-            if not isinstance(telemetry, Tier0Telemetry):
-                return
-            telemetry._req_done.clear()  # type: ignore[attr-defined]
+        shard = self._telemetry_shard(tab_id, create=False)
+        if shard is None:
+            return
+        shard.drain()
+        with shard.locked() as telemetry:
+            telemetry.clear_done_requests()
 
     def note_dialog_closed(
         self,
@@ -680,36 +734,121 @@ class SessionManager:
 
         ev: dict[str, Any] = {"method": "Page.javascriptDialogClosed", "params": params}
 
-        with self._telemetry_lock:
-            telemetry = self._telemetry.get(tab_id)
-            if not isinstance(telemetry, Tier0Telemetry):
-                telemetry = Tier0Telemetry()
-                self._telemetry[tab_id] = telemetry
-            telemetry.ingest(ev)
-
-    def get_telemetry(self, tab_id: str) -> Tier0Telemetry | None:
-        with self._telemetry_lock:
-            telemetry = self._telemetry.get(tab_id)
-            return telemetry if isinstance(telemetry, Tier0Telemetry) else None
+        shard = self._telemetry_shard(tab_id)
+        if shard is not None:
+            shard.submit(prepare_event(ev))
 
     def tier0_snapshot(self, tab_id: str, **kwargs: Any) -> dict[str, Any] | None:
-        """Thread-safe Tier-0 snapshot helper."""
-        with self._telemetry_lock:
-            telemetry = self._telemetry.get(tab_id)
-            if not isinstance(telemetry, Tier0Telemetry):
-                return None
+        """Thread-safe Tier-0 snapshot helper (locks only this tab's shard)."""
+        shard = self._telemetry_shard(tab_id, create=False)
+        if shard is None:
+            return None
+        shard.drain()
+        with shard.locked() as telemetry:
             return telemetry.snapshot(**kwargs)
 
+    def tier0_vitals(self, tab_id: str) -> dict[str, Any] | None:
+        """Event-driven LCP/CLS/long-task summary for this tab (in-memory; no CDP round trip)."""
+        shard = self._telemetry_shard(tab_id, create=False)
+        if shard is None:
+            return None
+        shard.drain()
+        with shard.locked() as telemetry:
+            return telemetry.vitals.summary()
+
+    def tier0_query(self, tab_id: str, query: Callable[[Tier0Telemetry], Any]) -> Any:
+        """Run `query` on this tab's telemetry under the shard lock (None: no telemetry)."""
+        shard = self._telemetry_shard(tab_id, create=False)
+        if shard is None:
+            return None
+        shard.drain()
+        with shard.locked() as telemetry:
+            return query(telemetry)
+
+    def tier0_dialog(self, tab_id: str | None) -> tuple[bool, dict[str, Any] | None]:
+        """(JS dialog open?, copy of the last dialog record) per Tier-0; (False, None) without telemetry."""
+
+        def _read(telemetry: Any) -> tuple[bool, dict[str, Any] | None]:
+            last = getattr(telemetry, "dialog_last", None)
+            return bool(getattr(telemetry, "dialog_open", False)), dict(last) if isinstance(last, dict) else None
+
+        state = self.tier0_query(tab_id, _read) if isinstance(tab_id, str) and tab_id else None
+        return state if isinstance(state, tuple) else (False, None)
+
+    def tier0_downloads(
+        self, tab_id: str, *, since_seq: int = 0, version: int | None = None, timeout_s: float = 0.0
+    ) -> dict[str, Any] | None:
+        """Downloads begun after `since_seq`; with `version`, block until the tracker moves past it."""
+        shard = self._telemetry_shard(tab_id, create=False)
+        if shard is None:
+            return None
+
+        def _probe(telemetry: Tier0Telemetry, *, changed_only: bool) -> dict[str, Any] | None:
+            dl = telemetry.downloads
+            if changed_only and version is not None and dl.version == version:
+                return None
+            return {"cursor": dl.seq, "version": dl.version, "items": dl.after(since_seq)}
+
+        found = shard.wait_until(lambda t: _probe(t, changed_only=True), timeout_s=timeout_s)
+        return found if found is not None else shard.wait_until(lambda t: _probe(t, changed_only=False), timeout_s=0)
+
+    def set_tier0_net_sink(self, tab_id: str, sink: Callable[[str, dict[str, Any]], None] | None) -> bool:
+        """Attach/detach a raw Network.* event sink on this tab's telemetry (False: no telemetry)."""
+        shard = self._telemetry_shard(tab_id, create=False)
+        if shard is None:
+            return False
+        shard.drain()
+        with shard.locked() as telemetry:
+            telemetry.net_sink = sink
+            telemetry.net_sink_error = None
+        return True
+
+    def watch_tier0(
+        self,
+        tab_id: str,
+        match: WatchFilter,
+        *,
+        since_seq: int | None = None,
+        timeout_s: float = 10.0,
+        limit: int = 50,
+    ) -> dict[str, Any] | None:
+        """Long-poll this tab's Tier-0 buffers (blocks on the shard condition, not the global lock)."""
+        shard = self._telemetry_shard(tab_id)
+        if shard is None:
+            return None
+        return shard.watch(match, since_seq=since_seq, timeout_s=timeout_s, limit=limit)
+
+    def tier0_journal(
+        self,
+        tab_id: str,
+        *,
+        since_seq: int | None = None,
+        since: int | None = None,
+        limit: int = 200,
+    ) -> dict[str, Any]:
+        """Query a tab's persistent Tier-0 journal (live or left on disk by a previous run)."""
+        shard = self._telemetry_shard(tab_id, create=False)
+        journal = shard.journal if shard is not None else None
+        if shard is not None:
+            shard.drain()
+        return query_journal(tab_id, journal=journal, since_seq=since_seq, since_ts=since, limit=limit)
+
+    def telemetry_ingest_stats(self, tab_id: str | None = None) -> dict[str, Any]:
+        """Per-tab ingestion/lock wait metrics (all tabs when tab_id is None)."""
+        shards = dict(self._telemetry)
+        if tab_id is not None:
+            shards = {tab_id: shards[tab_id]} if tab_id in shards else {}
+        return {tid: shard.stats() for tid, shard in shards.items() if isinstance(shard, TelemetryShard)}
+
     def get_recent_download_candidate(self, tab_id: str, *, max_age_ms: int = 5000) -> dict[str, Any] | None:
         """Return a recent download candidate from Tier-0 telemetry (best-effort)."""
         if not isinstance(tab_id, str) or not tab_id:
             return None
-        with self._telemetry_lock:
-            telemetry = self._telemetry.get(tab_id)
-            if not isinstance(telemetry, Tier0Telemetry):
-                return None
-            if not hasattr(telemetry, "recent_downloads"):
-                return None
+        shard = self._telemetry_shard(tab_id, create=False)
+        if shard is None:
+            return None
+        shard.drain()
+        with shard.locked() as telemetry:
             try:
                 items = telemetry.recent_downloads(max_age_ms=max_age_ms, limit=1)
             except Exception:
@@ -925,8 +1064,14 @@ class SessionManager:
                 **({"meta": it.get("meta")} if isinstance(it.get("meta"), dict) else {}),
             }
 
+        refs = list(mapping)
+        label_index = LabelIndex(
+            (_affordance_kind(mapping[r].get("meta")), _affordance_label(mapping[r].get("meta"))) for r in refs
+        )
+
         with self._affordances_lock:
             self._affordances[tab_id] = mapping
+            self._affordance_index[tab_id] = (mapping, refs, label_index)
             self._affordances_state[tab_id] = {
                 "url": url if isinstance(url, str) and url else None,
                 "cursor": int(cursor) if isinstance(cursor, int) else None,
@@ -987,44 +1132,35 @@ class SessionManager:
         with self._affordances_lock:
             mapping = self._affordances.get(tab_id)
             state = self._affordances_state.get(tab_id)
+            indexed = self._affordance_index.get(tab_id)
 
         state_out = state if isinstance(state, dict) else None
         if not isinstance(mapping, dict) or not mapping:
             return None, state_out, []
+        if not (isinstance(indexed, tuple) and indexed[0] is mapping):
+            refs = list(mapping)
+            label_index = LabelIndex(
+                (_affordance_kind(mapping[r].get("meta")), _affordance_label(mapping[r].get("meta"))) for r in refs
+            )
+        else:
+            _mapping, refs, label_index = indexed
 
-        def _cand_label(meta: dict[str, Any] | None) -> str:
-            if not isinstance(meta, dict):
-                return ""
-            for k in ("text", "name", "fillKey", "id", "placeholder", "selector"):
-                v = meta.get(k)
-                if isinstance(v, str) and v.strip():
-                    return " ".join(v.split()).strip()
-            return ""
-
+        # Exact label lookup via the shared label index (no scan over the whole mapping).
         matches: list[dict[str, Any]] = []
-        for ref, spec in mapping.items():
-            if not (isinstance(ref, str) and ref.startswith("aff:")):
+        for i in label_index.exact(q):
+            if kind_norm and label_index.role(i) != kind_norm:
                 continue
+            ref = refs[i]
+            spec = mapping.get(ref)
             if not isinstance(spec, dict):
                 continue
             meta = spec.get("meta") if isinstance(spec.get("meta"), dict) else None
 
-            if kind_norm:
-                mk = str(meta.get("kind") or "").strip().lower() if isinstance(meta, dict) else ""
-                if mk != kind_norm:
-                    continue
-
-            lbl = _cand_label(meta)
-            if not lbl:
-                continue
-            if " ".join(lbl.split()).strip().lower() != q:
-                continue
-
             matches.append(
                 {
                     "ref": ref,
                     **({"kind": meta.get("kind")} if isinstance(meta, dict) and meta.get("kind") else {}),
-                    "label": lbl,
+                    "label": _affordance_label(meta),
                     **({"tool": spec.get("tool")} if isinstance(spec.get("tool"), str) else {}),
                 }
             )
@@ -1972,7 +2108,7 @@ class SessionManager:
             with suppress(Exception):
                 self._diagnostics_state.pop(str(target_id), None)
             with suppress(Exception):
-                self._telemetry.pop(str(target_id), None)
+                self._drop_telemetry_shard(str(target_id))
             with suppress(Exception):
                 self._tab_ws_urls.pop(str(target_id), None)
             with suppress(Exception):
@@ -2003,7 +2139,7 @@ class SessionManager:
             with suppress(Exception):
                 self._diagnostics_state.pop(target_id, None)
             with suppress(Exception):
-                self._telemetry.pop(target_id, None)
+                self._drop_telemetry_shard(target_id)
             with suppress(Exception):
                 self._tab_ws_urls.pop(target_id, None)
             with suppress(Exception):
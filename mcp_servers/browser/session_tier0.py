@@ -25,9 +25,11 @@ from urllib.parse import urlsplit, urlunsplit
 
 from .config import BrowserConfig
 from .diagnostics import DIAGNOSTICS_SCRIPT_SOURCE, DIAGNOSTICS_SCRIPT_VERSION
+from .frame_contexts import FRAME_EVENTS
 from .http_client import HttpClientError
 from .sensitivity import is_sensitive_key
 from .telemetry import Tier0Telemetry
+from .telemetry_vitals import TIMELINE_EVENT, timeline_enable_params
 
 if TYPE_CHECKING:
     from .extension_gateway import ExtensionGateway
@@ -61,6 +63,10 @@ class _Tier0EventBus:
         except Exception:
             pass
 
+    def _forward_frame_event(self, event: dict[str, Any]) -> None:
+        if event.get("method") in FRAME_EVENTS or event.get("method") == TIMELINE_EVENT:
+            self._on_event(event)
+
     def _run(self) -> None:
         backoff = 0.2
         while not self._stop.is_set():
@@ -69,6 +75,13 @@ class _Tier0EventBus:
                 conn = CdpConnection(self.ws_url, timeout=5.0)
                 self._conn = conn
 
+                # Frames are not replayed on Page.enable: let the frame registry re-seed.
+                with suppress(Exception):
+                    self._on_event({"method": "Tier0.busConnected", "params": {}})
+                # Runtime.enable replays existing execution contexts (and PerformanceTimeline.enable
+                # buffered vitals) before the read loop starts; forward only those.
+                conn.set_event_sink(self._forward_frame_event)
+
                 # Enable high-signal domains (best-effort).
                 with suppress(Exception):
                     conn.send_many(
@@ -79,6 +92,9 @@ class _Tier0EventBus:
                             {"method": "Log.enable", "params": {}},
                         ]
                     )
+                # Separate call: a build without PerformanceTimeline must not fail the batch above.
+                with suppress(Exception):
+                    conn.send("PerformanceTimeline.enable", timeline_enable_params())
 
                 backoff = 0.2
 
@@ -11,13 +11,23 @@ This is intentionally minimal and best-effort:
 
 from __future__ import annotations
 
+import logging
 import time
+from collections import OrderedDict
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import Any
 import re
 
+from .frame_contexts import FRAME_EVENTS, FrameContextRegistry
+from .telemetry_downloads import DOWNLOAD_EVENTS, DownloadTracker, parse_download_event
+from .telemetry_net_index import DoneRequestIndex
+from .telemetry_ring import EventRing
+from .telemetry_vitals import TIMELINE_EVENT, VitalsTracker, parse_timeline_event
 from .server.redaction import redact_url_brief as redact_url
 
+_LOGGER = logging.getLogger("mcp.browser.telemetry")
+
 
 def _sha256_hex(text: str) -> str:
     try:
@@ -232,34 +242,208 @@ def _filename_from_cd(header: str | None) -> str | None:
     return None
 
 
+_RESP_HEADER_TYPES = frozenset({"XHR", "Fetch"})
+
+
+def prepare_event(event: Any) -> tuple[str, dict[str, Any], dict[str, Any]] | None:
+    """Parse/redact one raw CDP event without touching telemetry state.
+
+    Returns `(method, params, prep)` for `Tier0Telemetry.apply`, or None for junk.
+    Pure function of the event: safe to run outside any lock.
+    """
+    if not isinstance(event, dict):
+        return None
+    method = event.get("method")
+    if not isinstance(method, str) or not method:
+        return None
+    params = event.get("params")
+    if not isinstance(params, dict):
+        params = {}
+
+    prep: dict[str, Any] = {}
+    if method == "Runtime.consoleAPICalled":
+        level = params.get("type")
+        if level == "warning":
+            level = "warn"
+        prep["level"] = level if isinstance(level, str) else "log"
+        args = params.get("args")
+        prep["msg"] = " ".join(_remote_obj_to_str(a) for a in args[:8]) if isinstance(args, list) else ""
+        prep["stackTop"] = _stack_top(params)
+
+    elif method == "Runtime.exceptionThrown":
+        details = params.get("exceptionDetails")
+        if not isinstance(details, dict):
+            details = {}
+        msg = details.get("text") or "Uncaught exception"
+        exception = details.get("exception")
+        if isinstance(exception, dict):
+            msg = exception.get("description") or exception.get("value") or msg
+        prep["message"] = _str(msg, max_len=1200)
+        url = details.get("url")
+        if isinstance(url, str) and url:
+            prep["filename"] = redact_url(url)
+        if isinstance(details.get("lineNumber"), int):
+            prep["lineno"] = details["lineNumber"]
+        if isinstance(details.get("columnNumber"), int):
+            prep["colno"] = details["columnNumber"]
+        # exceptionDetails sometimes contains stackTrace
+        prep["stackTop"] = _stack_top(details)
+
+    elif method == "Network.requestWillBeSent":
+        req = params.get("request")
+        if isinstance(req, dict):
+            url = req.get("url")
+            if isinstance(url, str) and url:
+                prep["url"] = redact_url(url)
+                prep["urlFull"] = _str(url, max_len=2000)
+            rtype = params.get("type")
+            # Keep a small header preview for XHR/Fetch (helps debug pricing/auth bugs).
+            # Never store full cookies/authorization values (redacted+hashed only).
+            if isinstance(rtype, str) and rtype in _RESP_HEADER_TYPES:
+                prep["reqHeaders"] = _select_headers(req.get("headers"))
+            prep["initiator"] = _initiator_top(params)
+
+    elif method == "Network.responseReceived":
+        resp = params.get("response")
+        if not isinstance(resp, dict):
+            resp = {}
+        status = resp.get("status")
+        try:
+            prep["status"] = int(status) if status is not None else None
+        except Exception:
+            prep["status"] = None
+        url = resp.get("url")
+        if isinstance(url, str):
+            prep["url"] = redact_url(url)
+        mime = resp.get("mimeType")
+        if isinstance(mime, str) and mime:
+            prep["mimeType"] = _str(mime, max_len=120)
+        headers = resp.get("headers")
+        if isinstance(headers, dict):
+            ct = _header_value(headers, "content-type")
+            if isinstance(ct, str) and ct:
+                prep["contentType"] = _str(ct, max_len=200)
+            cd = _header_value(headers, "content-disposition")
+            if isinstance(cd, str) and cd:
+                prep["contentDisposition"] = _str(cd, max_len=240)
+                fname = _filename_from_cd(cd)
+                if isinstance(fname, str) and fname:
+                    prep["downloadFileName"] = _str(fname, max_len=180)
+            if params.get("type") in _RESP_HEADER_TYPES:
+                prep["respHeaders"] = _select_headers(headers)
+
+    elif method == "Network.loadingFailed":
+        prep["errorText"] = _str(params.get("errorText"))
+
+    elif method == "Page.javascriptDialogOpening":
+        msg = params.get("message")
+        url = params.get("url")
+        if isinstance(msg, str) and msg:
+            prep["message"] = _str(msg, max_len=800)
+        if isinstance(url, str) and url:
+            prep["url"] = redact_url(url)
+
+    elif method == "Page.javascriptDialogClosed":
+        if isinstance(params.get("userInput"), str) and params.get("userInput"):
+            prep["userInput"] = _str(params.get("userInput"), max_len=200)
+
+    elif method == "Page.navigatedWithinDocument":
+        url = params.get("url")
+        if isinstance(url, str) and url:
+            prep["url"] = redact_url(url)
+
+    elif method == "Page.frameNavigated":
+        frame = params.get("frame")
+        if isinstance(frame, dict):
+            url = frame.get("url")
+            # Prefer top-level frame only (reduces noise).
+            if isinstance(url, str) and url and not frame.get("parentId"):
+                prep["url"] = redact_url(url)
+
+    elif method == TIMELINE_EVENT:
+        prep = parse_timeline_event(params)
+
+    elif method in DOWNLOAD_EVENTS:
+        prep = parse_download_event(method, params)
+
+    return method, params, prep
+
+
 @dataclass(slots=True)
 class Tier0Telemetry:
-    """Bounded, high-signal CDP event buffers for one tab."""
+    """Bounded, high-signal CDP event buffers for one tab.
+
+    Buffers are fixed-capacity rings (`max_events`); every stored record gets the next
+    per-tab sequence id (`seq`), so deltas are a bisect (`since_seq`, or `since` in ms).
+    """
 
     max_events: int = 200
     max_request_map: int = 800
+    # Completed requests kept for net(action="trace"); queries go through `done_index`.
+    max_done_requests: int = 2000
 
-    console: list[dict[str, Any]] = field(default_factory=list)
-    errors: list[dict[str, Any]] = field(default_factory=list)
-    network: list[dict[str, Any]] = field(default_factory=list)
-    harLite: list[dict[str, Any]] = field(default_factory=list)
-    dialogs: list[dict[str, Any]] = field(default_factory=list)
-    navigation: list[dict[str, Any]] = field(default_factory=list)
+    console: EventRing = field(init=False, repr=False)
+    errors: EventRing = field(init=False, repr=False)
+    network: EventRing = field(init=False, repr=False)
+    harLite: EventRing = field(init=False, repr=False)
+    dialogs: EventRing = field(init=False, repr=False)
+    navigation: EventRing = field(init=False, repr=False)
 
     # Dialog state (for fail-fast waits and robust cross-call handling).
     dialog_open: bool = False
     dialog_last: dict[str, Any] | None = None
 
     # requestId -> request metadata (for attaching URL/method to failures)
-    _req: dict[str, dict[str, Any]] = field(default_factory=dict, repr=False)
+    _req: OrderedDict[str, dict[str, Any]] = field(default_factory=OrderedDict, repr=False)
     # requestId -> *recently completed* request metadata (for deep, on-demand tracing)
-    _req_done: dict[str, dict[str, Any]] = field(default_factory=dict, repr=False)
+    _req_done: OrderedDict[str, dict[str, Any]] = field(default_factory=OrderedDict, repr=False)
+    # type / host / status-bucket -> ids over `_req_done` (see telemetry_net_index.py)
+    done_index: DoneRequestIndex = field(default_factory=DoneRequestIndex, repr=False)
+    # frameId -> default execution context (event-driven; see frame_contexts.py)
+    frames: FrameContextRegistry = field(default_factory=FrameContextRegistry, repr=False)
+    # LCP / CLS / long tasks from PerformanceTimeline (see telemetry_vitals.py)
+    vitals: VitalsTracker = field(default_factory=VitalsTracker, repr=False)
+    # guid -> download progress/path from download events (see telemetry_downloads.py)
+    downloads: DownloadTracker = field(default_factory=DownloadTracker, repr=False)
+    # Cumulative completed-request counters (never reset; callers diff against a baseline).
+    # `ms` sums request durations (requestWillBeSent -> loadingFinished/Failed).
+    net_totals: dict[str, int] = field(
+        default_factory=lambda: {"requests": 0, "failed": 0, "bytes": 0, "ms": 0}, repr=False
+    )
     cursor: int = 0
-
-    def _push(self, buf: list[dict[str, Any]], item: dict[str, Any]) -> None:
-        buf.append(item)
-        if len(buf) > self.max_events:
-            del buf[: len(buf) - self.max_events]
+    # Last sequence id handed out (strictly increasing per tab).
+    seq: int = 0
+    # Optional record sink (kind, seq, ts, item), e.g. TelemetryJournal.append.
+    sink: Callable[[str, int, int, dict[str, Any]], None] | None = field(default=None, repr=False)
+    # Why `sink` was detached (it raised); records are no longer journaled.
+    sink_error: str | None = None
+    # Optional raw Network.* event sink (method, params), e.g. HarRecorder.feed.
+    net_sink: Callable[[str, dict[str, Any]], None] | None = field(default=None, repr=False)
+    # Why `net_sink` was detached (it raised); cleared when a new sink is attached.
+    net_sink_error: str | None = None
+
+    def __post_init__(self) -> None:
+        cap = max(1, int(self.max_events))
+        self.console = EventRing(cap, "console")
+        self.errors = EventRing(cap, "errors")
+        self.network = EventRing(cap, "network")
+        self.harLite = EventRing(cap, "harLite")
+        self.dialogs = EventRing(cap, "dialogs")
+        self.navigation = EventRing(cap, "navigation")
+
+    def _push(self, buf: EventRing, item: dict[str, Any]) -> None:
+        self.seq += 1
+        ts = item.get("ts")
+        ts_i = ts if isinstance(ts, int) else self.cursor
+        buf.push(self.seq, ts_i, item)
+        if self.sink is not None:
+            try:
+                self.sink(buf.name, self.seq, ts_i, item)
+            except Exception as exc:
+                # Telemetry must never break.
+                self.sink = None
+                self.sink_error = f"{type(exc).__name__}: {exc}"
+                _LOGGER.warning("Tier-0 record sink detached after error", exc_info=True)
 
     def recent_downloads(self, *, max_age_ms: int = 5000, limit: int = 3) -> list[dict[str, Any]]:
         """Return recent download-like responses (content-disposition) from the trace buffer."""
@@ -278,7 +462,7 @@ class Tier0Telemetry:
         now = _now_ms()
         out: list[dict[str, Any]] = []
         # _req_done preserves insertion order: newest at end.
-        for meta in reversed(list(self._req_done.values())):
+        for meta in reversed(self._req_done.values()):
             if not isinstance(meta, dict):
                 continue
             ts = meta.get("endTs") if isinstance(meta.get("endTs"), int) else meta.get("ts")
@@ -309,54 +493,58 @@ class Tier0Telemetry:
         if not request_id:
             return
         self._req[request_id] = meta
-        if len(self._req) > self.max_request_map:
-            # Drop oldest-ish entries deterministically: by insertion order (Py3.7+ preserves order).
-            drop = len(self._req) - self.max_request_map
-            for k in list(self._req.keys())[:drop]:
-                self._req.pop(k, None)
+        # Drop oldest entries by insertion order (O(1) per eviction).
+        while len(self._req) > self.max_request_map:
+            self._req.popitem(last=False)
 
     def _remember_done_request(self, request_id: str, meta: dict[str, Any]) -> None:
         if not request_id:
             return
+        # Re-completions move to the end: insertion order stays completion order.
+        if self._req_done.pop(request_id, None) is not None:
+            self.done_index.remove(request_id)
         self._req_done[request_id] = meta
-        if len(self._req_done) > self.max_request_map:
-            drop = len(self._req_done) - self.max_request_map
-            for k in list(self._req_done.keys())[:drop]:
-                self._req_done.pop(k, None)
+        self.done_index.add(request_id, meta)
+        while len(self._req_done) > self.max_done_requests:
+            evicted_id, _evicted = self._req_done.popitem(last=False)
+            self.done_index.remove(evicted_id)
+
+    def clear_done_requests(self) -> None:
+        self._req_done.clear()
+        self.done_index.clear()
 
     def ingest(self, event: dict[str, Any]) -> None:
         """Ingest a raw CDP event dict (best-effort, bounded)."""
-        if not isinstance(event, dict):
-            return
-
-        method = event.get("method")
-        if not isinstance(method, str) or not method:
-            return
-
-        params = event.get("params")
-        if not isinstance(params, dict):
-            params = {}
+        prepared = prepare_event(event)
+        if prepared is not None:
+            self.apply(*prepared)
+
+    def apply(self, method: str, params: dict[str, Any], prep: dict[str, Any]) -> None:
+        """Apply one `prepare_event` result to the buffers (state mutation only)."""
+        if method in FRAME_EVENTS:
+            self.frames.ingest(method, params)
+        if self.net_sink is not None and method.startswith("Network."):
+            try:
+                self.net_sink(method, params)
+            except Exception as exc:
+                # Telemetry must never break.
+                self.net_sink = None
+                self.net_sink_error = f"{type(exc).__name__}: {exc}"
+                _LOGGER.warning("Tier-0 Network.* sink detached after error", exc_info=True)
 
-        ts = _now_ms()
-        self.cursor = max(self.cursor, ts)
+        # Non-decreasing per tab (wall-clock steps backwards must not break bisect deltas).
+        ts = max(_now_ms(), self.cursor)
+        self.cursor = ts
 
         # ──────────────────────────────────────────────────────────────────
         # Console
         # ──────────────────────────────────────────────────────────────────
         if method == "Runtime.consoleAPICalled":
-            level = params.get("type")
-            if level == "warning":
-                level = "warn"
-            level = level if isinstance(level, str) else "log"
-            args = params.get("args")
-            if isinstance(args, list):
-                msg = " ".join(_remote_obj_to_str(a) for a in args[:8])
-            else:
-                msg = ""
+            level = prep["level"]
+            msg = prep["msg"]
             entry: dict[str, Any] = {"ts": ts, "level": level, "args": [msg] if msg else []}
-            top = _stack_top(params)
-            if top:
-                entry["stackTop"] = top
+            if prep.get("stackTop"):
+                entry["stackTop"] = prep["stackTop"]
             # High-signal only: keep warn/error always; keep a small amount of info/debug.
             if level in {"error", "warn"}:
                 self._push(self.console, entry)
@@ -370,33 +558,14 @@ class Tier0Telemetry:
         # Exceptions
         # ──────────────────────────────────────────────────────────────────
         if method == "Runtime.exceptionThrown":
-            details = params.get("exceptionDetails")
-            if not isinstance(details, dict):
-                details = {}
-            msg = details.get("text") or "Uncaught exception"
-            url = details.get("url")
-            lineno = details.get("lineNumber")
-            colno = details.get("columnNumber")
-
-            exception = details.get("exception")
-            if isinstance(exception, dict):
-                msg = exception.get("description") or exception.get("value") or msg
-
             err: dict[str, Any] = {
                 "ts": ts,
                 "type": "error",
-                "message": _str(msg, max_len=1200),
+                "message": prep["message"],
             }
-            if isinstance(url, str) and url:
-                err["filename"] = redact_url(url)
-            if isinstance(lineno, int):
-                err["lineno"] = lineno
-            if isinstance(colno, int):
-                err["colno"] = colno
-
-            top = _stack_top(details)  # exceptionDetails sometimes contains stackTrace
-            if top:
-                err["stackTop"] = top
+            for key in ("filename", "lineno", "colno", "stackTop"):
+                if prep.get(key) is not None:
+                    err[key] = prep[key]
 
             self._push(self.errors, err)
             return
@@ -408,42 +577,32 @@ class Tier0Telemetry:
             request_id = params.get("requestId")
             req = params.get("request")
             if isinstance(request_id, str) and isinstance(req, dict):
-                url = req.get("url")
                 meta: dict[str, Any] = {
                     "ts": ts,
                     "method": req.get("method") if isinstance(req.get("method"), str) else None,
                 }
-                if isinstance(url, str) and url:
-                    meta["url"] = redact_url(url)
+                if "url" in prep:
+                    meta["url"] = prep["url"]
                     # Keep the full URL (incl. query) for deep, on-demand tracing only.
                     # This is NOT exposed in Tier-0 snapshots by default.
-                    meta["urlFull"] = _str(url, max_len=2000)
+                    meta["urlFull"] = prep["urlFull"]
                 if isinstance(params.get("type"), str):
                     meta["type"] = params.get("type")
+                    sel = prep.get("reqHeaders")
+                    if isinstance(sel, dict) and sel:
+                        meta["reqHeaders"] = sel
 
-                    # Keep a small header preview for XHR/Fetch (helps debug pricing/auth bugs).
-                    # Never store full cookies/authorization values (redacted+hashed only).
-                    if meta.get("type") in {"XHR", "Fetch"}:
-                        hdrs = req.get("headers")
-                        sel = _select_headers(hdrs)
-                        if isinstance(sel, dict) and sel:
-                            meta["reqHeaders"] = sel
-
-                init = _initiator_top(params)
+                init = prep.get("initiator")
                 if isinstance(init, dict) and init:
                     meta["initiator"] = init
                 self._remember_request(request_id, meta)
+                # Navigation requests (requestId == loaderId) mark a candidate navigation start.
+                if meta.get("type") == "Document" and request_id == params.get("loaderId"):
+                    self.vitals.note_document_request(request_id, params.get("wallTime"))
             return
 
         if method == "Network.responseReceived":
-            resp = params.get("response")
-            if not isinstance(resp, dict):
-                resp = {}
-            status = resp.get("status")
-            try:
-                status_i = int(status) if status is not None else None
-            except Exception:
-                status_i = None
+            status_i = prep.get("status")
 
             # Track status for HAR-lite correlation.
             req_id = params.get("requestId") if isinstance(params.get("requestId"), str) else ""
@@ -453,35 +612,23 @@ class Tier0Telemetry:
                     meta["status"] = status_i
 
                     # Best-effort: store MIME / content-type for trace UX (tiny, bounded).
-                    mime = resp.get("mimeType")
-                    if isinstance(mime, str) and mime:
-                        meta["mimeType"] = _str(mime, max_len=120)
-                    headers = resp.get("headers")
-                    if isinstance(headers, dict):
-                        ct = _header_value(headers, "content-type")
-                        if isinstance(ct, str) and ct:
-                            meta["contentType"] = _str(ct, max_len=200)
-                        cd = _header_value(headers, "content-disposition")
-                        if isinstance(cd, str) and cd:
-                            meta["contentDisposition"] = _str(cd, max_len=240)
-                            fname = _filename_from_cd(cd)
-                            if isinstance(fname, str) and fname:
-                                meta["downloadFileName"] = _str(fname, max_len=180)
-
-                        # Keep a small response header preview for XHR/Fetch.
-                        if meta.get("type") in {"XHR", "Fetch"}:
-                            sel = _select_headers(headers)
-                            if isinstance(sel, dict) and sel:
-                                meta["respHeaders"] = sel
+                    for key in ("mimeType", "contentType", "contentDisposition", "downloadFileName"):
+                        if key in prep:
+                            meta[key] = prep[key]
+
+                    # Keep a small response header preview for XHR/Fetch.
+                    if meta.get("type") in _RESP_HEADER_TYPES:
+                        sel = prep.get("respHeaders")
+                        if isinstance(sel, dict) and sel:
+                            meta["respHeaders"] = sel
 
             # Keep only error-ish statuses to avoid noise.
             if status_i is not None and status_i >= 400:
-                url = resp.get("url")
                 meta = self._req.get(req_id, {}) if req_id else {}
                 method = meta.get("method")
                 item: dict[str, Any] = {
                     "ts": ts,
-                    "url": redact_url(url) if isinstance(url, str) else meta.get("url", ""),
+                    "url": prep["url"] if "url" in prep else meta.get("url", ""),
                     "status": status_i,
                     **({"method": method} if isinstance(method, str) and method else {}),
                 }
@@ -499,12 +646,18 @@ class Tier0Telemetry:
                 "url": meta.get("url", ""),
                 **({"method": meta.get("method")} if isinstance(meta.get("method"), str) else {}),
                 "status": None,
-                "errorText": _str(params.get("errorText")),
+                "errorText": prep["errorText"],
             }
             blocked = params.get("blockedReason")
             if isinstance(blocked, str) and blocked:
                 item["blockedReason"] = blocked
             self._push(self.network, item)
+            self.net_totals["requests"] += 1
+            # Cancelled requests (navigation away, AbortController) are not failures.
+            if not params.get("canceled"):
+                self.net_totals["failed"] += 1
+            if isinstance(meta.get("ts"), int) and 0 < meta["ts"] <= ts:
+                self.net_totals["ms"] += ts - meta["ts"]
 
             # HAR-lite: failed request summary (duration best-effort).
             try:
@@ -516,7 +669,7 @@ class Tier0Telemetry:
                     **({"method": meta.get("method")} if isinstance(meta.get("method"), str) else {}),
                     "status": None,
                     "ok": False,
-                    "errorText": _str(params.get("errorText")),
+                    "errorText": prep["errorText"],
                     **({"durationMs": duration_ms} if isinstance(duration_ms, int) and duration_ms >= 0 else {}),
                 }
                 self._push(self.harLite, har_item)
@@ -535,7 +688,7 @@ class Tier0Telemetry:
                     "endTs": ts,
                     **({"durationMs": duration_ms} if isinstance(duration_ms, int) and duration_ms >= 0 else {}),
                     "ok": False,
-                    "errorText": _str(params.get("errorText")),
+                    "errorText": prep["errorText"],
                 }
                 blocked = params.get("blockedReason")
                 if isinstance(blocked, str) and blocked:
@@ -571,6 +724,11 @@ class Tier0Telemetry:
             ok = True
             if isinstance(status_i, int) and status_i >= 400:
                 ok = False
+            self.net_totals["requests"] += 1
+            self.net_totals["failed"] += 0 if ok else 1
+            self.net_totals["bytes"] += int(encoded_len or 0)
+            if isinstance(duration_ms, int) and duration_ms >= 0:
+                self.net_totals["ms"] += duration_ms
 
             # Keep signal without dumping full waterfall noise:
             # - Always keep failures.
@@ -620,16 +778,13 @@ class Tier0Telemetry:
         # Dialogs
         # ──────────────────────────────────────────────────────────────────
         if method == "Page.javascriptDialogOpening":
-            msg = params.get("message")
             dtype = params.get("type")
-            url = params.get("url")
             entry: dict[str, Any] = {"ts": ts, "event": "open"}
             if isinstance(dtype, str) and dtype:
                 entry["type"] = dtype
-            if isinstance(msg, str) and msg:
-                entry["message"] = _str(msg, max_len=800)
-            if isinstance(url, str) and url:
-                entry["url"] = redact_url(url)
+            for key in ("message", "url"):
+                if key in prep:
+                    entry[key] = prep[key]
             self.dialog_open = True
             self.dialog_last = entry
             self._push(self.dialogs, entry)
@@ -642,8 +797,8 @@ class Tier0Telemetry:
             entry: dict[str, Any] = {"ts": ts, "event": "closed"}
             if isinstance(params.get("result"), bool):
                 entry["accepted"] = bool(params.get("result"))
-            if isinstance(params.get("userInput"), str) and params.get("userInput"):
-                entry["userInput"] = _str(params.get("userInput"), max_len=200)
+            if "userInput" in prep:
+                entry["userInput"] = prep["userInput"]
             self.dialog_open = False
             # Keep dialog_last for context (useful for triage), but do not mutate it.
             self._push(self.dialogs, entry)
@@ -653,54 +808,70 @@ class Tier0Telemetry:
         # Navigation (keep small)
         # ──────────────────────────────────────────────────────────────────
         if method == "Page.navigatedWithinDocument":
-            url = params.get("url")
-            if isinstance(url, str) and url:
-                self._push(self.navigation, {"ts": ts, "url": redact_url(url), "kind": "spa"})
+            if "url" in prep:
+                self._push(self.navigation, {"ts": ts, "url": prep["url"], "kind": "spa"})
             return
 
         if method == "Page.frameNavigated":
-            frame = params.get("frame")
-            if isinstance(frame, dict):
-                url = frame.get("url")
-                parent_id = frame.get("parentId")
-                # Prefer top-level frame only (reduces noise).
-                if isinstance(url, str) and url and not parent_id:
-                    self._push(self.navigation, {"ts": ts, "url": redact_url(url), "kind": "frame"})
+            # Top-level frames only (prepare_event drops child frame URLs).
+            if "url" in prep:
+                self._push(self.navigation, {"ts": ts, "url": prep["url"], "kind": "frame"})
+                self.vitals = self.vitals.navigated(params["frame"].get("loaderId"))
+            return
+
+        # ──────────────────────────────────────────────────────────────────
+        # Vitals (PerformanceTimeline; folded into state, no ring)
+        # ──────────────────────────────────────────────────────────────────
+        if method == TIMELINE_EVENT:
+            if prep:
+                self.vitals.add(prep)
+            return
+
+        if method in DOWNLOAD_EVENTS:
+            if prep:
+                self.downloads.add(prep, ts)
             return
 
     def snapshot(
         self,
         *,
         since: int | None = None,
+        since_seq: int | None = None,
         offset: int = 0,
         limit: int = 50,
         url: str | None = None,
         title: str | None = None,
         ready_state: str | None = None,
     ) -> dict[str, Any]:
-        """Return a diagnostics-like snapshot (shape-compatible with Tier-1 injection)."""
+        """Return a diagnostics-like snapshot (shape-compatible with Tier-1 injection).
+
+        `since` is a millisecond cursor (shared with Tier-1); `since_seq` is the exact,
+        collision-free form (records with seq > since_seq). Both are binary searches.
+        """
         since_i = None
         if since is not None:
             try:
                 since_i = int(since)
             except Exception:
                 since_i = None
+        seq_i = None
+        if since_seq is not None:
+            try:
+                seq_i = int(since_seq)
+            except Exception:
+                seq_i = None
 
         offset = _clamp_int(offset, default=0, min_v=0, max_v=1000000)
         limit = _clamp_int(limit, default=50, min_v=0, max_v=self.max_events)
 
-        def filt(items: list[dict[str, Any]]) -> list[dict[str, Any]]:
-            if since_i is None:
-                out = items
-            else:
-                out = [e for e in items if isinstance(e, dict) and isinstance(e.get("ts"), int) and e["ts"] > since_i]
+        def filt(items: EventRing) -> list[dict[str, Any]]:
+            out = items.after(seq=seq_i, ts=since_i)
             if offset:
                 out = out[offset:]
             if limit:
                 out = out[:limit]
             return out
 
-
         console = filt(self.console)
         errors = filt(self.errors)
         network = filt(self.network)
@@ -721,6 +892,7 @@ class Tier0Telemetry:
         snap: dict[str, Any] = {
             "tier": "tier0",
             "cursor": self.cursor or _now_ms(),
+            "seq": self.seq,
             "summary": summary,
             "console": console,
             "errors": errors,
@@ -740,6 +912,9 @@ class Tier0Telemetry:
                 "url": d.get("url"),
                 "ts": d.get("ts"),
             }
+        vitals = self.vitals.summary()
+        if vitals is not None:
+            snap["vitals"] = vitals
         if isinstance(url, str) and url:
             snap["url"] = url
         if isinstance(title, str) and title:
@@ -749,5 +924,7 @@ class Tier0Telemetry:
 
         if since_i is not None:
             snap["since"] = since_i
+        if seq_i is not None:
+            snap["sinceSeq"] = seq_i
 
         return snap
@@ -0,0 +1,101 @@
+"""Event-driven download tracking for Tier-0 telemetry (no directory polling).
+
+With downloads routed to the per-tab directory (`ensure_downloads`), Chrome pushes
+`downloadWillBegin` (guid, url, suggested file name) and `downloadProgress` (received /
+total bytes, state, and - for `Browser.*` on recent Chrome - the final `filePath`) for
+every download. `DownloadTracker` keeps one small record per guid, in begin order:
+
+- `seq` counts downloads seen, so a caller takes a cursor *before* a click and later asks
+  for downloads after it (replaces the directory snapshot taken before clicks);
+- `version` bumps on every update, so waiters block on the shard condition until the
+  tracker changes instead of re-listing directories.
+
+Both the `Page.*` (deprecated, delivered to every page session) and `Browser.*` spellings
+are accepted; duplicates for the same guid merge into one record.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import PurePath
+from typing import Any
+
+from .server.redaction import redact_url_brief
+
+DOWNLOAD_EVENTS = frozenset(
+    {"Page.downloadWillBegin", "Page.downloadProgress", "Browser.downloadWillBegin", "Browser.downloadProgress"}
+)
+DOWNLOAD_STATES = ("inProgress", "completed", "canceled")
+
+_MAX_DOWNLOADS = 32
+
+
+def _int(x: Any) -> int | None:
+    if isinstance(x, bool) or not isinstance(x, (int, float)):
+        return None
+    return int(x)
+
+
+def parse_download_event(method: str, params: dict[str, Any]) -> dict[str, Any]:
+    """Extract the fields `DownloadTracker.add` needs (pure; {} without a guid)."""
+    guid = params.get("guid")
+    if not isinstance(guid, str) or not guid:
+        return {}
+    out: dict[str, Any] = {"guid": guid[:80]}
+    if method.endswith("WillBegin"):
+        name = params.get("suggestedFilename")
+        if isinstance(name, str) and name:
+            # Only the base name: the suggestion comes from the page.
+            out["fileName"] = PurePath(name.replace("\\", "/")).name[:180]
+        url = params.get("url")
+        if isinstance(url, str) and url:
+            out["url"] = redact_url_brief(url)
+        return out
+
+    state = params.get("state")
+    if state in DOWNLOAD_STATES:
+        out["state"] = state
+    for key, src in (("receivedBytes", "receivedBytes"), ("totalBytes", "totalBytes")):
+        n = _int(params.get(src))
+        if n is not None and n >= 0:
+            out[key] = n
+    path = params.get("filePath")
+    if isinstance(path, str) and path:
+        out["filePath"] = path[:1000]
+    return out
+
+
+@dataclass(slots=True)
+class DownloadTracker:
+    """guid -> download record (bounded, begin order)."""
+
+    seq: int = 0
+    version: int = 0
+    _items: OrderedDict[str, dict[str, Any]] = field(default_factory=OrderedDict, repr=False)
+
+    def add(self, prep: dict[str, Any], ts: int) -> None:
+        guid = prep.get("guid")
+        if not isinstance(guid, str):
+            return
+        rec = self._items.get(guid)
+        if rec is None:
+            # Progress without a begin (bus reconnect mid-download) still starts a record.
+            self.seq += 1
+            rec = {"seq": self.seq, "guid": guid, "state": "inProgress", "ts": ts}
+            self._items[guid] = rec
+            while len(self._items) > _MAX_DOWNLOADS:
+                self._items.popitem(last=False)
+        elif rec.get("state") != "inProgress" and prep.get("state") == "inProgress":
+            return  # late progress after completion/cancel
+        rec.update({k: v for k, v in prep.items() if k != "guid"})
+        rec["updatedTs"] = ts
+        self.version += 1
+
+    def after(self, since_seq: int) -> list[dict[str, Any]]:
+        """Copies of the downloads that began after `since_seq` (oldest first)."""
+        return [dict(rec) for rec in self._items.values() if rec["seq"] > since_seq]
+
+    def clear(self) -> None:
+        self._items.clear()
+        self.version += 1
@@ -0,0 +1,490 @@
+"""Persistent Tier-0 event journal (optional, disk-backed, post-mortem friendly).
+
+In-memory Tier-0 rings stay bounded; when the journal is enabled every stored record
+is also appended to disk so history survives `clear_telemetry`, tab recreation and
+server restarts.
+
+Layout (per tab): `data/telemetry/<tab>/<firstSeq>.seg` + `<firstSeq>.idx`
+
+- Segment: magic `T0J1`, then append-only blocks:
+  `>IQQQQ` header (payload length, firstSeq, lastSeq, firstTs, lastTs) + zlib(JSONL).
+- Index: one `>QQQQQ` entry per block (firstSeq, lastSeq, firstTs, lastTs, offset).
+  This is the sparse index: queries bisect segments, then blocks, then decompress
+  only the blocks that can contain matches. A missing/short index is rebuilt by
+  walking block headers; a torn tail block (crash mid-write) is ignored.
+
+Records are the already-redacted ring entries (`{"seq","ts","kind","data"}`).
+Writes happen on a background thread per journal; producers only enqueue.
+
+Env:
+- MCP_TIER0_JOURNAL=1 enables the journal (default: off)
+- MCP_TIER0_JOURNAL_DIR (default: <repo>/data/telemetry)
+- MCP_TIER0_JOURNAL_SEGMENT_KB (default: 4096) / MCP_TIER0_JOURNAL_SEGMENT_S (default: 900)
+- MCP_TIER0_JOURNAL_MAX_SEGMENTS (default: 64; 0 = keep everything)
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import os
+import re
+import struct
+import threading
+import time
+import zlib
+from collections import deque
+from contextlib import suppress
+from pathlib import Path
+from typing import Any
+
+MAGIC = b"T0J1"
+_BLOCK = struct.Struct(">IQQQQ")
+_INDEX = struct.Struct(">QQQQQ")
+
+_BLOCK_MAX_RECORDS = 256
+_FLUSH_INTERVAL_S = 0.5
+_MAX_PENDING = 20_000
+_MAX_BLOCK_PAYLOAD = 32 * 1024 * 1024
+
+KINDS = ("console", "errors", "network", "harLite", "dialogs", "navigation")
+
+
+def _repo_root() -> Path:
+    # mcp_servers/browser/telemetry_journal.py -> repo root is parents[2]
+    return Path(__file__).resolve().parents[2]
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, "") or default)
+    except ValueError:
+        return default
+
+
+def journal_enabled() -> bool:
+    return os.environ.get("MCP_TIER0_JOURNAL", "0") == "1"
+
+
+def journal_root() -> Path:
+    raw = os.environ.get("MCP_TIER0_JOURNAL_DIR")
+    if isinstance(raw, str) and raw.strip():
+        return Path(raw.strip()).expanduser()
+    return _repo_root() / "data" / "telemetry"
+
+
+def tab_dir(tab_id: str, *, root: Path | None = None) -> Path:
+    safe = re.sub(r"[^A-Za-z0-9._-]", "_", str(tab_id))[:128]
+    if not safe.strip("."):
+        safe = "_"  # "", "." and ".." must not resolve outside the journal root
+    return (root or journal_root()) / safe
+
+
+class _Segment:
+    __slots__ = ("path", "first_seq", "entries", "size", "opened_at")
+
+    def __init__(self, path: Path, first_seq: int) -> None:
+        self.path = path
+        self.first_seq = first_seq
+        # (firstSeq, lastSeq, firstTs, lastTs, offset) per block
+        self.entries: list[tuple[int, int, int, int, int]] = []
+        self.size = 0
+        self.opened_at = time.monotonic()
+
+    @property
+    def index_path(self) -> Path:
+        return self.path.with_suffix(".idx")
+
+    @property
+    def last_seq(self) -> int:
+        return self.entries[-1][1] if self.entries else self.first_seq - 1
+
+
+def _scan_blocks(path: Path) -> tuple[list[tuple[int, int, int, int, int]], int]:
+    """Rebuild a segment index from block headers; returns (entries, valid_size)."""
+    entries: list[tuple[int, int, int, int, int]] = []
+    try:
+        size = path.stat().st_size
+        with path.open("rb") as fh:
+            if fh.read(len(MAGIC)) != MAGIC:
+                return [], 0
+            offset = len(MAGIC)
+            while offset + _BLOCK.size <= size:
+                fh.seek(offset)
+                length, s0, s1, t0, t1 = _BLOCK.unpack(fh.read(_BLOCK.size))
+                end = offset + _BLOCK.size + length
+                if length > _MAX_BLOCK_PAYLOAD or end > size:
+                    break
+                entries.append((s0, s1, t0, t1, offset))
+                offset = end
+            return entries, offset
+    except OSError:
+        return entries, 0
+
+
+def _load_segment(path: Path) -> _Segment | None:
+    try:
+        first_seq = int(path.stem)
+    except ValueError:
+        return None
+    seg = _Segment(path, first_seq)
+    entries: list[tuple[int, int, int, int, int]] = []
+    with suppress(OSError):
+        raw = seg.index_path.read_bytes()
+        n = len(raw) // _INDEX.size
+        entries = [_INDEX.unpack_from(raw, i * _INDEX.size) for i in range(n)]
+    try:
+        size = path.stat().st_size
+    except OSError:
+        return None
+    expected_end = 0
+    if entries:
+        last_off = entries[-1][4]
+        with suppress(OSError), path.open("rb") as fh:
+            fh.seek(last_off)
+            header = fh.read(_BLOCK.size)
+            if len(header) == _BLOCK.size:
+                expected_end = last_off + _BLOCK.size + _BLOCK.unpack(header)[0]
+    if not entries or expected_end != size:
+        # Missing, stale or torn index: rebuild from block headers.
+        entries, size = _scan_blocks(path)
+    seg.entries = list(entries)
+    seg.size = size
+    return seg
+
+
+def _decode_block(fh: Any, offset: int) -> list[dict[str, Any]]:
+    fh.seek(offset)
+    header = fh.read(_BLOCK.size)
+    if len(header) != _BLOCK.size:
+        return []
+    length = _BLOCK.unpack(header)[0]
+    payload = fh.read(length)
+    if len(payload) != length:
+        return []
+    try:
+        lines = zlib.decompress(payload).split(b"\n")
+    except zlib.error:
+        return []
+    out: list[dict[str, Any]] = []
+    for line in lines:
+        if not line:
+            continue
+        with suppress(ValueError):
+            rec = json.loads(line)
+            if isinstance(rec, dict):
+                out.append(rec)
+    return out
+
+
+class TelemetryJournal:
+    """Append-only segmented journal for one tab.
+
+    Read-only until the first `append()`; the writer thread starts lazily.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        segment_bytes: int | None = None,
+        segment_age_s: float | None = None,
+        max_segments: int | None = None,
+    ) -> None:
+        self.directory = Path(directory)
+        self.segment_bytes = max(
+            1, segment_bytes if segment_bytes is not None else _env_int("MCP_TIER0_JOURNAL_SEGMENT_KB", 4096) * 1024
+        )
+        self.segment_age_s = max(
+            1.0, segment_age_s if segment_age_s is not None else float(_env_int("MCP_TIER0_JOURNAL_SEGMENT_S", 900))
+        )
+        self.max_segments = max(
+            0, max_segments if max_segments is not None else _env_int("MCP_TIER0_JOURNAL_MAX_SEGMENTS", 64)
+        )
+
+        self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
+        self._pending: deque[tuple[int, int, str, dict[str, Any]]] = deque()
+        self._segments: list[_Segment] = []
+        self._active: _Segment | None = None
+        self._fh: Any = None
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        self._inflight = 0
+        self.dropped = 0
+        self.written = 0
+        self._load()
+
+    @classmethod
+    def for_tab(cls, tab_id: str) -> TelemetryJournal | None:
+        """Return a journal for `tab_id` when MCP_TIER0_JOURNAL=1, else None."""
+        if not journal_enabled() or not tab_id:
+            return None
+        return cls(tab_dir(tab_id))
+
+    # ── state ───────────────────────────────────────────────────────────────
+
+    def _load(self) -> None:
+        if not self.directory.is_dir():
+            return
+        segs = [_load_segment(p) for p in self.directory.glob("*.seg")]
+        self._segments = sorted((s for s in segs if s is not None), key=lambda s: s.first_seq)
+
+    @property
+    def last_seq(self) -> int:
+        with self._lock:
+            if self._pending:
+                return self._pending[-1][0]
+            for seg in reversed(self._segments):
+                if seg.entries:
+                    return seg.last_seq
+            return 0
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "dir": str(self.directory),
+                "segments": len(self._segments),
+                "bytes": sum(s.size for s in self._segments),
+                "blocks": sum(len(s.entries) for s in self._segments),
+                "pending": len(self._pending),
+                "written": self.written,
+                "dropped": self.dropped,
+            }
+
+    # ── write path ──────────────────────────────────────────────────────────
+
+    def append(self, kind: str, seq: int, ts: int, data: dict[str, Any]) -> None:
+        """Enqueue one ring record (called under the telemetry shard lock; never blocks on I/O)."""
+        with self._lock:
+            if self._closed:
+                return
+            if len(self._pending) >= _MAX_PENDING:
+                self._pending.popleft()
+                self.dropped += 1
+            self._pending.append((int(seq), int(ts), kind, data))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name=f"mcp-t0j-{self.directory.name[:6]}", daemon=True
+                )
+                self._thread.start()
+            if len(self._pending) >= _BLOCK_MAX_RECORDS:
+                self._cond.notify_all()
+
+    def flush(self, timeout: float = 2.0) -> bool:
+        """Wait until everything appended so far is on disk (best-effort)."""
+        deadline = time.monotonic() + max(0.0, timeout)
+        with self._lock:
+            self._cond.notify_all()
+            while self._pending or self._inflight:
+                left = deadline - time.monotonic()
+                if left <= 0 or self._thread is None or not self._thread.is_alive():
+                    return False
+                self._cond.wait(left)
+            return True
+
+    def close(self, timeout: float = 2.0) -> None:
+        self.flush(timeout)
+        with self._lock:
+            self._closed = True
+            self._cond.notify_all()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if not self._pending and not self._closed:
+                    self._cond.wait(_FLUSH_INTERVAL_S)
+                if not self._pending:
+                    if self._closed:
+                        self._close_file()
+                        return
+                    self._maybe_rotate_locked()
+                    continue
+                batch = []
+                while self._pending and len(batch) < _BLOCK_MAX_RECORDS:
+                    batch.append(self._pending.popleft())
+                self._inflight = len(batch)
+            try:
+                payload = self._encode(batch)
+                self._write_block(batch, payload)
+            except Exception:  # noqa: BLE001
+                # Disk trouble must never break telemetry; count and move on.
+                with self._lock:
+                    self.dropped += len(batch)
+            finally:
+                with self._lock:
+                    self._inflight = 0
+                    self._cond.notify_all()
+
+    @staticmethod
+    def _encode(batch: list[tuple[int, int, str, dict[str, Any]]]) -> bytes:
+        lines = [
+            json.dumps(
+                {"seq": seq, "ts": ts, "kind": kind, "data": data},
+                ensure_ascii=False,
+                separators=(",", ":"),
+                default=str,
+            ).encode("utf-8")
+            for seq, ts, kind, data in batch
+        ]
+        return zlib.compress(b"\n".join(lines), 6)
+
+    def _write_block(self, batch: list[tuple[int, int, str, dict[str, Any]]], payload: bytes) -> None:
+        first_seq, first_ts = batch[0][0], batch[0][1]
+        last_seq, last_ts = batch[-1][0], batch[-1][1]
+        with self._lock:
+            self._maybe_rotate_locked()
+            if self._active is None:
+                self._open_segment_locked(first_seq)
+            seg = self._active
+            assert seg is not None
+            offset = seg.size
+        header = _BLOCK.pack(len(payload), first_seq, last_seq, first_ts, last_ts)
+        self._fh.write(header + payload)
+        self._fh.flush()
+        entry = (first_seq, last_seq, first_ts, last_ts, offset)
+        with seg.index_path.open("ab") as idx:
+            idx.write(_INDEX.pack(*entry))
+        with self._lock:
+            seg.entries.append(entry)
+            seg.size = offset + len(header) + len(payload)
+            self.written += len(batch)
+
+    def _open_segment_locked(self, first_seq: int) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{first_seq:016d}.seg"
+        self._segments = [s for s in self._segments if s.path != path]
+        self._fh = path.open("wb")
+        self._fh.write(MAGIC)
+        self._fh.flush()
+        seg = _Segment(path, first_seq)
+        seg.size = len(MAGIC)
+        with suppress(OSError):
+            seg.index_path.unlink()
+        self._active = seg
+        self._segments.append(seg)
+        self._enforce_retention_locked()
+
+    def _maybe_rotate_locked(self) -> None:
+        seg = self._active
+        if seg is None:
+            return
+        if seg.size >= self.segment_bytes or time.monotonic() - seg.opened_at >= self.segment_age_s:
+            self._close_file()
+
+    def _close_file(self) -> None:
+        if self._fh is not None:
+            with suppress(Exception):
+                self._fh.close()
+        self._fh = None
+        self._active = None
+
+    def _enforce_retention_locked(self) -> None:
+        if not self.max_segments:
+            return
+        while len(self._segments) > self.max_segments:
+            old = self._segments.pop(0)
+            for p in (old.path, old.index_path):
+                with suppress(OSError):
+                    p.unlink()
+
+    # ── read path ───────────────────────────────────────────────────────────
+
+    def read(
+        self,
+        *,
+        since_seq: int | None = None,
+        since_ts: int | None = None,
+        limit: int = 200,
+        kinds: set[str] | None = None,
+    ) -> dict[str, Any]:
+        """Return records newer than `since_seq` (preferred) or `since_ts`, oldest first."""
+        self.flush()
+        limit = max(1, min(int(limit), 5000))
+        with self._lock:
+            plan = [(s.path, list(s.entries)) for s in self._segments if s.entries]
+
+        by_seq = since_seq is not None
+        cursor = int(since_seq if by_seq else (since_ts or 0))
+        key = 1 if by_seq else 3  # lastSeq / lastTs
+
+        # Sparse index: skip whole segments, then whole blocks, whose last key <= cursor.
+        seg_last = [entries[-1][key] for _p, entries in plan]
+        start_seg = bisect.bisect_right(seg_last, cursor)
+
+        records: list[dict[str, Any]] = []
+        blocks_read = 0
+        has_more = False
+        for path, entries in plan[start_seg:]:
+            start_block = bisect.bisect_right([e[key] for e in entries], cursor)
+            try:
+                fh = path.open("rb")
+            except OSError:
+                continue
+            with fh:
+                for entry in entries[start_block:]:
+                    blocks_read += 1
+                    for rec in _decode_block(fh, entry[4]):
+                        value = rec.get("seq" if by_seq else "ts")
+                        if not isinstance(value, int) or value <= cursor:
+                            continue
+                        if kinds and rec.get("kind") not in kinds:
+                            continue
+                        if len(records) >= limit:
+                            has_more = True
+                            break
+                        records.append(rec)
+                    if has_more:
+                        break
+            if has_more:
+                break
+
+        return {
+            "records": records,
+            "hasMore": has_more,
+            "nextSinceSeq": records[-1]["seq"] if records else since_seq,
+            "blocksRead": blocks_read,
+            "blocksTotal": sum(len(e) for _p, e in plan),
+        }
+
+
+def query_journal(
+    tab_id: str,
+    *,
+    journal: TelemetryJournal | None = None,
+    since_seq: int | None = None,
+    since_ts: int | None = None,
+    limit: int = 200,
+) -> dict[str, Any]:
+    """Diagnostics-shaped view over a tab's journal (live journal or on-disk only)."""
+    jr = journal if isinstance(journal, TelemetryJournal) else TelemetryJournal(tab_dir(tab_id))
+    page = jr.read(since_seq=since_seq, since_ts=since_ts, limit=limit)
+    grouped: dict[str, list[dict[str, Any]]] = {k: [] for k in KINDS}
+    for rec in page["records"]:
+        data = rec.get("data") if isinstance(rec.get("data"), dict) else {}
+        bucket = grouped.get(str(rec.get("kind")))
+        if bucket is not None:
+            bucket.append({**data, "seq": rec.get("seq")})
+
+    console = grouped["console"]
+    errors = grouped["errors"]
+    return {
+        "tier": "journal",
+        "tabId": tab_id,
+        "sinceSeq": since_seq,
+        **({"since": since_ts} if since_seq is None and since_ts is not None else {}),
+        "nextSinceSeq": page["nextSinceSeq"],
+        "hasMore": page["hasMore"],
+        "summary": {
+            "consoleErrors": len([e for e in console if e.get("level") == "error"]),
+            "consoleWarnings": len([e for e in console if e.get("level") == "warn"]),
+            "jsErrors": len([e for e in errors if e.get("type") == "error"]),
+            "failedRequests": len(grouped["network"]),
+            "lastError": (errors[-1].get("message") if errors else None),
+        },
+        **grouped,
+        "journal": {**jr.stats(), "blocksRead": page["blocksRead"], "blocksTotal": page["blocksTotal"]},
+    }
@@ -0,0 +1,207 @@
+"""Secondary indexes over Tier-0 completed requests (`Tier0Telemetry._req_done`).
+
+`net(action="trace")` filters the done-request buffer by resource type, host and status.
+Scanning the whole buffer per call made every query O(buffer) and capped how large the
+buffer could usefully be. `DoneRequestIndex` is updated on every insert / eviction:
+
+- `by_type` / `by_host` / `by_status`: key -> ids (insertion-ordered dicts used as sets,
+  so each key's ids are already time-ordered, oldest first);
+- an ordinal per id, so several keys merge newest-first with `heapq.merge`;
+- incremental counters (`failed`, `bytes`, per-key sizes) for a whole-buffer summary
+  without a pass over the records.
+
+The indexed fields are copied at insert: records are shared dicts, so removal undoes
+exactly what was added even if a record was modified in place since.
+
+Records enter in completion order and completion timestamps never decrease, so
+`select_done` stops at the first record at or before `since` instead of skipping on.
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import urlsplit
+
+DIMENSIONS = ("type", "host", "status")
+
+
+def url_host(url: str) -> str:
+    try:
+        return (urlsplit(url).hostname or "").lower()
+    except Exception:
+        return ""
+
+
+def status_bucket(status: Any) -> str:
+    try:
+        s = int(status)
+    except Exception:
+        return "unknown"
+    if 100 <= s < 600:
+        return f"{s // 100}xx"
+    return "other"
+
+
+def _record_keys(meta: dict[str, Any]) -> tuple[str, str, str]:
+    url = meta.get("urlFull") if isinstance(meta.get("urlFull"), str) else meta.get("url")
+    rtype = meta.get("type")
+    return (
+        rtype if isinstance(rtype, str) else "",
+        url_host(url) if isinstance(url, str) else "",
+        status_bucket(meta.get("status")),
+    )
+
+
+@dataclass(slots=True)
+class DoneRequestIndex:
+    """type / host / status-bucket -> request ids, plus running totals."""
+
+    by_type: dict[str, dict[str, None]] = field(default_factory=dict)
+    by_host: dict[str, dict[str, None]] = field(default_factory=dict)
+    by_status: dict[str, dict[str, None]] = field(default_factory=dict)
+    failed: int = 0
+    bytes: int = 0
+    _keys: dict[str, tuple[str, str, str]] = field(default_factory=dict, repr=False)
+    # id -> (failed, bytes) as counted at insert
+    _counted: dict[str, tuple[int, int]] = field(default_factory=dict, repr=False)
+    _order: dict[str, int] = field(default_factory=dict, repr=False)
+    _next: int = 0
+
+    def _maps(self) -> tuple[dict[str, dict[str, None]], ...]:
+        return self.by_type, self.by_host, self.by_status
+
+    def add(self, request_id: str, meta: dict[str, Any]) -> None:
+        keys = _record_keys(meta)
+        self._keys[request_id] = keys
+        self._next += 1
+        self._order[request_id] = self._next
+        for index, key in zip(self._maps(), keys, strict=True):
+            index.setdefault(key, {})[request_id] = None
+        size = meta.get("encodedDataLength")
+        counted = (1 if meta.get("ok") is False else 0, int(size) if isinstance(size, (int, float)) else 0)
+        self._counted[request_id] = counted
+        self.failed += counted[0]
+        self.bytes += counted[1]
+
+    def remove(self, request_id: str) -> None:
+        keys = self._keys.pop(request_id, None)
+        if keys is None:
+            return
+        self._order.pop(request_id, None)
+        failed, size = self._counted.pop(request_id, (0, 0))
+        self.failed -= failed
+        self.bytes -= size
+        for index, key in zip(self._maps(), keys, strict=True):
+            ids = index.get(key)
+            if ids is not None:
+                ids.pop(request_id, None)
+                if not ids:
+                    del index[key]
+
+    def clear(self) -> None:
+        for index in self._maps():
+            index.clear()
+        self._keys.clear()
+        self._counted.clear()
+        self._order.clear()
+        self.failed = 0
+        self.bytes = 0
+
+    def keys_of(self, request_id: str) -> tuple[str, str, str] | None:
+        return self._keys.get(request_id)
+
+    def count(self, dim: str, keys: Iterable[str]) -> int:
+        index = self._maps()[DIMENSIONS.index(dim)]
+        return sum(len(index.get(k, ())) for k in set(keys))
+
+    def newest(self, dim: str, keys: Iterable[str]) -> Iterator[str]:
+        """Ids under any of `keys` in dimension `dim`, newest first."""
+        index = self._maps()[DIMENSIONS.index(dim)]
+        streams = [reversed(index[k]) for k in set(keys) if k in index]
+        if len(streams) == 1:
+            return streams[0]
+        order = self._order
+        return heapq.merge(*streams, key=lambda rid: -order[rid])
+
+    def counters(self, *, top: int = 6) -> dict[str, Any]:
+        """Whole-buffer totals from the running counters (no pass over records)."""
+        hosts = sorted(self.by_host.items(), key=lambda kv: len(kv[1]), reverse=True)
+        return {
+            "requests": len(self._keys),
+            "failed": self.failed,
+            "bytes": self.bytes,
+            "status": {k: len(v) for k, v in self.by_status.items()},
+            "types": {k: len(v) for k, v in self.by_type.items() if k},
+            "topHosts": [{"key": k, "count": len(v)} for k, v in hosts[:top] if k],
+        }
+
+
+def select_done(
+    done: dict[str, dict[str, Any]],
+    index: DoneRequestIndex | None,
+    *,
+    types: set[str],
+    hosts: set[str],
+    statuses: set[str],
+    include: list[str],
+    exclude: list[str],
+    since: int | None,
+    offset: int,
+    limit: int,
+) -> tuple[list[tuple[str, dict[str, Any]]], int]:
+    """Newest-first page of done requests matching the filters, plus the match count.
+
+    With an index, candidates come from the most selective indexed filter (type / host /
+    status bucket) and the walk stops at `since`; without one (plain dicts) every record is
+    checked, as before. The count is exact when only one indexed filter is active, otherwise
+    it covers the records walked until the page filled up.
+    """
+    codes = {int(s) for s in statuses if s.isdigit()}
+    buckets = {status_bucket(s) if s.isdigit() else s.lower() for s in statuses}
+    active = [(dim, keys) for dim, keys in zip(DIMENSIONS, (types, hosts, buckets), strict=True) if keys]
+    exact_total: int | None = None
+    if index is not None and active:
+        dim, keys = min(active, key=lambda a: index.count(*a))
+        source: Iterable[str] = index.newest(dim, keys)
+        if len(active) == 1 and not (include or exclude or codes or since is not None):
+            exact_total = index.count(dim, keys)
+    else:
+        source = reversed(done)
+        if not (active or include or exclude or since is not None):
+            exact_total = len(done)
+
+    page: list[tuple[str, dict[str, Any]]] = []
+    total = 0
+    skip = max(0, int(offset))
+    for req_id in source:
+        meta = done.get(req_id)
+        if not isinstance(req_id, str) or not req_id or not isinstance(meta, dict):
+            continue
+        end_ts = meta.get("endTs") if isinstance(meta.get("endTs"), int) else meta.get("ts")
+        if since is not None and isinstance(end_ts, int) and end_ts <= since:
+            if index is not None:
+                break  # completion order: everything older is also before `since`
+            continue
+        keys = (index.keys_of(req_id) if index is not None else None) or _record_keys(meta)
+        if (types and keys[0] not in types) or (hosts and keys[1] not in hosts) or (buckets and keys[2] not in buckets):
+            continue
+        if codes and meta.get("status") not in codes:
+            continue
+        if include or exclude:
+            url = meta.get("urlFull") if isinstance(meta.get("urlFull"), str) else meta.get("url")
+            u_l = url.lower() if isinstance(url, str) else ""
+            if include and not any(p in u_l for p in include):
+                continue
+            if exclude and any(p in u_l for p in exclude):
+                continue
+        total += 1
+        if skip > 0:
+            skip -= 1
+            continue
+        page.append((req_id, meta))
+        if limit and len(page) >= limit:
+            break
+    return page, (exact_total if exact_total is not None else total)
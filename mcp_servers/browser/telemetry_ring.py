@@ -0,0 +1,101 @@
+"""Fixed-capacity ring buffers for Tier-0 telemetry.
+
+Each record carries a per-tab sequence id (strictly increasing) and a millisecond
+timestamp (non-decreasing), so delta reads are a binary search instead of a scan:
+- `after(seq=...)`: exact, collision-free deltas
+- `after(ts=...)`: time-based deltas (compatible with Tier-1 `since` cursors)
+
+Eviction overwrites the oldest slot in O(1); nothing is copied on insert.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Any
+
+
+class RingRecord:
+    __slots__ = ("seq", "ts", "data")
+
+    def __init__(self, seq: int, ts: int, data: dict[str, Any]) -> None:
+        self.seq = seq
+        self.ts = ts
+        self.data = data
+
+
+class EventRing:
+    """Ring of `RingRecord`s; iterates/indexes as the stored `data` dicts (oldest first)."""
+
+    __slots__ = ("name", "_buf", "_cap", "_start", "_len")
+
+    def __init__(self, capacity: int, name: str = "") -> None:
+        self.name = name
+        self._cap = max(1, int(capacity))
+        self._buf: list[RingRecord | None] = [None] * self._cap
+        self._start = 0
+        self._len = 0
+
+    def push(self, seq: int, ts: int, data: dict[str, Any]) -> None:
+        rec = RingRecord(seq, ts, data)
+        if self._len < self._cap:
+            self._buf[(self._start + self._len) % self._cap] = rec
+            self._len += 1
+        else:
+            self._buf[self._start] = rec
+            self._start = (self._start + 1) % self._cap
+
+    def clear(self) -> None:
+        self._buf = [None] * self._cap
+        self._start = 0
+        self._len = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def _rec(self, i: int) -> RingRecord:
+        rec = self._buf[(self._start + i) % self._cap]
+        assert rec is not None
+        return rec
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        for i in range(self._len):
+            yield self._rec(i).data
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return [self._rec(i).data for i in range(*index.indices(self._len))]
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("ring index out of range")
+        return self._rec(index).data
+
+    def _first_after(self, value: int, *, by_seq: bool) -> int:
+        lo, hi = 0, self._len
+        while lo < hi:
+            mid = (lo + hi) // 2
+            rec = self._rec(mid)
+            if (rec.seq if by_seq else rec.ts) <= value:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def after(self, *, seq: int | None = None, ts: int | None = None) -> list[dict[str, Any]]:
+        """Return records newer than `seq` (preferred) or `ts`; all records when both are None."""
+        if seq is not None:
+            start = self._first_after(int(seq), by_seq=True)
+        elif ts is not None:
+            start = self._first_after(int(ts), by_seq=False)
+        else:
+            start = 0
+        return [self._rec(i).data for i in range(start, self._len)]
+
+    def records_after(self, seq: int) -> list[RingRecord]:
+        """Like `after(seq=...)`, but returns the records (seq/ts/data)."""
+        start = self._first_after(int(seq), by_seq=True)
+        return [self._rec(i) for i in range(start, self._len)]
+
+    @property
+    def last_seq(self) -> int | None:
+        return self._rec(self._len - 1).seq if self._len else None
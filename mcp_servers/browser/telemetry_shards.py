@@ -0,0 +1,201 @@
+"""Per-tab Tier-0 telemetry shards (own lock + single-writer ingestion queue).
+
+Event producers (Tier-0 bus threads, extension gateway, dialog sinks) never wait on
+another tab, and never hold a lock while parsing/redacting:
+
+    prepared = prepare_event(ev)   # pure, lock-free
+    shard.submit(prepared)         # enqueue; whoever holds the writer token applies
+
+Exactly one thread applies a shard's queue at a time (the writer token). Readers take
+the shard lock only for the duration of a snapshot, so they see whole events and
+producers keep enqueueing meanwhile. Lock wait time is tracked per shard (`stats()`).
+
+Every applied batch notifies the shard condition, so `watch()` long-polls block until
+a matching record arrives instead of re-snapshotting in a loop.
+
+With a `TelemetryJournal` attached, every stored ring record is also journaled to disk
+and the shard's sequence ids continue from the journal (monotonic across restarts).
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from .telemetry import Tier0Telemetry
+from .telemetry_journal import TelemetryJournal
+from .telemetry_watch import WatchFilter
+
+_APPLY_BATCH = 64
+
+
+class TelemetryShard:
+    """One tab's Tier-0 state."""
+
+    __slots__ = (
+        "telemetry",
+        "journal",
+        "_lock",
+        "_changed",
+        "_writer",
+        "_queue",
+        "_applied",
+        "_acquired",
+        "_contended",
+        "_wait_ns_total",
+        "_wait_ns_max",
+    )
+
+    def __init__(self, telemetry: Tier0Telemetry | None = None, *, journal: TelemetryJournal | None = None) -> None:
+        self.telemetry = telemetry if isinstance(telemetry, Tier0Telemetry) else Tier0Telemetry()
+        self.journal = journal
+        if journal is not None:
+            self.telemetry.seq = max(self.telemetry.seq, journal.last_seq)
+            self.telemetry.sink = journal.append
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._writer = threading.Lock()
+        self._queue: deque[tuple[str, dict[str, Any], dict[str, Any]]] = deque()
+        self._applied = 0
+        self._acquired = 0
+        self._contended = 0
+        self._wait_ns_total = 0
+        self._wait_ns_max = 0
+
+    @contextmanager
+    def locked(self) -> Iterator[Tier0Telemetry]:
+        """Hold the shard lock (recording wait time) and yield the telemetry state."""
+        if self._lock.acquire(blocking=False):
+            waited = 0
+        else:
+            started = time.perf_counter_ns()
+            self._lock.acquire()
+            waited = time.perf_counter_ns() - started
+            self._contended += 1
+        try:
+            self._acquired += 1
+            self._wait_ns_total += waited
+            if waited > self._wait_ns_max:
+                self._wait_ns_max = waited
+            yield self.telemetry
+        finally:
+            self._lock.release()
+
+    def submit(self, prepared: tuple[str, dict[str, Any], dict[str, Any]] | None) -> None:
+        if prepared is None:
+            return
+        self._queue.append(prepared)
+        self.drain()
+
+    def drain(self) -> None:
+        """Apply queued events unless another thread already holds the writer token."""
+        while self._queue:
+            if not self._writer.acquire(blocking=False):
+                # The active writer re-checks the queue after releasing the token.
+                return
+            try:
+                while self._queue:
+                    batch = []
+                    while self._queue and len(batch) < _APPLY_BATCH:
+                        batch.append(self._queue.popleft())
+                    with self.locked() as telemetry:
+                        for item in batch:
+                            try:
+                                telemetry.apply(*item)
+                            except Exception:  # noqa: BLE001
+                                # Telemetry must never break.
+                                continue
+                        self._applied += len(batch)
+                        self._changed.notify_all()
+            finally:
+                self._writer.release()
+
+    def watch(
+        self,
+        match: WatchFilter,
+        *,
+        since_seq: int | None = None,
+        timeout_s: float = 10.0,
+        limit: int = 50,
+    ) -> dict[str, Any]:
+        """Block until a record newer than `since_seq` matches `match` (or the timeout passes).
+
+        `since_seq=None` watches only records stored after the call. Returns the matching
+        records (oldest first, each with its ring as `kind` plus `seq`; a record's own `kind`
+        moves to `recordKind`) and the cursor for the next call.
+        """
+        deadline = time.monotonic() + max(0.0, float(timeout_s))
+        limit = max(1, min(int(limit), 500))
+        self.drain()
+        with self.locked() as telemetry:
+            cursor = telemetry.seq if since_seq is None else max(0, int(since_seq))
+            while True:
+                hits: list[dict[str, Any]] = []
+                for ring in (
+                    telemetry.console,
+                    telemetry.errors,
+                    telemetry.network,
+                    telemetry.harLite,
+                    telemetry.dialogs,
+                    telemetry.navigation,
+                ):
+                    if ring.name not in match.kinds:
+                        continue
+                    for rec in ring.records_after(cursor):
+                        if match.matches(ring.name, rec.data):
+                            hit = {**rec.data, "kind": ring.name, "seq": rec.seq}
+                            if "kind" in rec.data:
+                                hit["recordKind"] = rec.data["kind"]  # navigation: "spa" / "frame"
+                            hits.append(hit)
+                left = deadline - time.monotonic()
+                if hits or left <= 0:
+                    hits.sort(key=lambda h: h["seq"])
+                    more = len(hits) > limit
+                    hits = hits[:limit]
+                    return {
+                        "events": hits,
+                        "cursor": hits[-1]["seq"] if more else telemetry.seq,
+                        "hasMore": more,
+                        "timedOut": not hits,
+                    }
+                # Nothing yet: everything up to now has been checked.
+                cursor = telemetry.seq
+                self._changed.wait(left)
+
+    def wait_until(self, probe: Callable[[Tier0Telemetry], Any], *, timeout_s: float) -> Any:
+        """Block until `probe(telemetry)` returns non-None (checked under the lock after each batch)."""
+        deadline = time.monotonic() + max(0.0, float(timeout_s))
+        self.drain()
+        with self.locked() as telemetry:
+            while True:
+                found = probe(telemetry)
+                left = deadline - time.monotonic()
+                if found is not None or left <= 0:
+                    return found
+                self._changed.wait(left)
+
+    def close(self) -> None:
+        self.drain()
+        if self.journal is not None:
+            self.journal.close()
+
+    def stats(self) -> dict[str, Any]:
+        sink_errors = {
+            name: err
+            for name, err in (("journal", self.telemetry.sink_error), ("net", self.telemetry.net_sink_error))
+            if err
+        }
+        return {
+            "applied": self._applied,
+            "queued": len(self._queue),
+            "lockAcquired": self._acquired,
+            "lockContended": self._contended,
+            "lockWaitMsTotal": round(self._wait_ns_total / 1e6, 3),
+            "lockWaitMsMax": round(self._wait_ns_max / 1e6, 3),
+            **({"journal": self.journal.stats()} if self.journal is not None else {}),
+            **({"sinkErrors": sink_errors} if sink_errors else {}),
+        }
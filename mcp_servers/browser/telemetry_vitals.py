@@ -0,0 +1,190 @@
+"""Event-driven web vitals for Tier-0 telemetry (CDP PerformanceTimeline, no page injection).
+
+`PerformanceTimeline.enable` makes the browser push `timelineEventAdded` for
+largest-contentful-paint / layout-shift entries (buffered entries are replayed on
+enable). Chromium rejects any other entry type (InvalidParams for the whole call), so
+long tasks are not requested here; they come from the page's
+`performance.getEntriesByType('longtask')` probe. `VitalsTracker` folds entries into
+O(1) state per tab:
+- LCP: latest candidate (render time, falling back to load time for non-TAO images)
+- CLS: max session-window sum (gap <= 1s, window <= 5s), shifts after input excluded
+- long tasks: count / total / max / blocking time (> 50ms part) + a few recent ones, only
+  when longtask entries are fed in; otherwise `longTasks` is absent (not measured, not 0)
+
+Times in CDP timeline events are epoch seconds. Millisecond values are relative to the
+top-level document request (`Network.requestWillBeSent.wallTime`), which is how
+navigation start is observed without evaluating anything in the page.
+State resets on top-level navigation; replays after a bus reconnect are de-duplicated
+by entry time.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any
+
+from .server.redaction import redact_url_brief
+
+TIMELINE_EVENT = "PerformanceTimeline.timelineEventAdded"
+# The only types Chromium's PerformanceTimeline accepts.
+TIMELINE_EVENT_TYPES = ("largest-contentful-paint", "layout-shift")
+
+_SHIFT_GAP_S = 1.0
+_SHIFT_WINDOW_S = 5.0
+_BLOCKING_MS = 50.0
+_RECENT_TASKS = 10
+_PENDING_NAVS = 8
+
+
+def timeline_enable_params() -> dict[str, Any]:
+    return {"eventTypes": list(TIMELINE_EVENT_TYPES)}
+
+
+def _num(x: Any) -> float | None:
+    if isinstance(x, bool) or not isinstance(x, (int, float)):
+        return None
+    return float(x)
+
+
+def parse_timeline_event(params: dict[str, Any]) -> dict[str, Any]:
+    """Extract the fields `VitalsTracker.add` needs (pure; {} for unsupported entries)."""
+    ev = params.get("event")
+    if not isinstance(ev, dict):
+        return {}
+    etype = ev.get("type")
+    t = _num(ev.get("time"))
+
+    if etype == "largest-contentful-paint":
+        details = ev.get("lcpDetails") if isinstance(ev.get("lcpDetails"), dict) else {}
+        at = _num(details.get("renderTime")) or _num(details.get("loadTime")) or t
+        if at is None:
+            return {}
+        out: dict[str, Any] = {"kind": "lcp", "time": at, "size": int(_num(details.get("size")) or 0)}
+        url = details.get("url")
+        if isinstance(url, str) and url:
+            out["url"] = redact_url_brief(url)
+        if isinstance(details.get("elementId"), str) and details["elementId"]:
+            out["elementId"] = details["elementId"][:120]
+        return out
+
+    if etype == "layout-shift":
+        details = ev.get("layoutShiftDetails") if isinstance(ev.get("layoutShiftDetails"), dict) else {}
+        value = _num(details.get("value"))
+        if t is None or value is None:
+            return {}
+        return {"kind": "shift", "time": t, "value": value, "hadRecentInput": bool(details.get("hadRecentInput"))}
+
+    if etype == "longtask":
+        duration = _num(ev.get("duration"))
+        if t is None or duration is None:
+            return {}
+        return {"kind": "longtask", "time": t, "durationMs": duration * 1000.0}
+
+    return {}
+
+
+@dataclass(slots=True)
+class VitalsTracker:
+    """Incremental LCP / CLS / long-task state for the current top-level document."""
+
+    nav_start: float | None = None
+    lcp: dict[str, Any] | None = None
+    lcp_candidates: int = 0
+
+    cls: float = 0.0
+    shifts: int = 0
+    _win_start: float = 0.0
+    _win_last: float = 0.0
+    _win_value: float = 0.0
+    _last_shift: float = 0.0
+
+    tasks: int = 0
+    tasks_total_ms: float = 0.0
+    tasks_max_ms: float = 0.0
+    tasks_blocking_ms: float = 0.0
+    _last_task: float = 0.0
+    _recent: deque[dict[str, Any]] = field(default_factory=lambda: deque(maxlen=_RECENT_TASKS), repr=False)
+
+    # loaderId -> wallTime of top-level document requests awaiting Page.frameNavigated.
+    _pending: OrderedDict[str, float] = field(default_factory=OrderedDict, repr=False)
+
+    def note_document_request(self, loader_id: Any, wall_time: Any) -> None:
+        wt = _num(wall_time)
+        if not isinstance(loader_id, str) or not loader_id or wt is None:
+            return
+        self._pending[loader_id] = wt
+        while len(self._pending) > _PENDING_NAVS:
+            self._pending.popitem(last=False)
+
+    def navigated(self, loader_id: Any) -> VitalsTracker:
+        """Top-level document committed: return a fresh tracker for the new document."""
+        nav_start = self._pending.pop(loader_id, None) if isinstance(loader_id, str) else None
+        return VitalsTracker(nav_start=nav_start, _pending=self._pending)
+
+    def _rel_ms(self, t: float) -> int | None:
+        if self.nav_start is None or t < self.nav_start:
+            return None
+        return int(round((t - self.nav_start) * 1000.0))
+
+    def add(self, prep: dict[str, Any]) -> None:
+        kind = prep.get("kind")
+        t = prep.get("time")
+        if not isinstance(t, float):
+            return
+
+        if kind == "lcp":
+            self.lcp_candidates += 1
+            self.lcp = {k: v for k, v in prep.items() if k != "kind"}
+            return
+
+        if kind == "shift":
+            if t <= self._last_shift:
+                return  # replayed entry
+            self._last_shift = t
+            if prep.get("hadRecentInput"):
+                return
+            self.shifts += 1
+            value = float(prep.get("value") or 0.0)
+            if self._win_value and t - self._win_last <= _SHIFT_GAP_S and t - self._win_start <= _SHIFT_WINDOW_S:
+                self._win_value += value
+            else:
+                self._win_start, self._win_value = t, value
+            self._win_last = t
+            self.cls = max(self.cls, self._win_value)
+            return
+
+        if kind == "longtask":
+            if t <= self._last_task:
+                return  # replayed entry
+            self._last_task = t
+            duration = float(prep.get("durationMs") or 0.0)
+            self.tasks += 1
+            self.tasks_total_ms += duration
+            self.tasks_max_ms = max(self.tasks_max_ms, duration)
+            self.tasks_blocking_ms += max(0.0, duration - _BLOCKING_MS)
+            start = self._rel_ms(t)
+            self._recent.append(
+                {**({"startMs": start} if start is not None else {}), "durationMs": int(round(duration))}
+            )
+
+    def summary(self) -> dict[str, Any] | None:
+        """Compact vitals dict, or None before any timeline entry was seen."""
+        if self.lcp is None and not self.shifts and not self.tasks:
+            return None
+        out: dict[str, Any] = {"source": "PerformanceTimeline"}
+        if self.lcp is not None:
+            lcp = {k: v for k, v in self.lcp.items() if k != "time"}
+            ms = self._rel_ms(self.lcp["time"])
+            out["lcp"] = {**({"ms": ms} if ms is not None else {}), **lcp, "candidates": self.lcp_candidates}
+        out["cls"] = round(self.cls, 4)
+        out["layoutShifts"] = self.shifts
+        if self.tasks:
+            out["longTasks"] = {
+                "count": self.tasks,
+                "totalMs": int(round(self.tasks_total_ms)),
+                "maxMs": int(round(self.tasks_max_ms)),
+                "blockingMs": int(round(self.tasks_blocking_ms)),
+                "recent": list(self._recent),
+            }
+        return out
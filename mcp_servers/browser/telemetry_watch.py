@@ -0,0 +1,95 @@
+"""Predicates for long-poll Tier-0 watches (`wait(for="event")`).
+
+A watch blocks on the tab's telemetry shard condition until a ring record newer than
+the cursor matches, so agents replace snapshot polling loops with one blocking call.
+
+Filters (all optional, AND-ed):
+- kinds: ring names (console/errors/network/harLite/dialogs/navigation)
+- level: console level or error type ("error", "warn", ...)
+- url: glob (`*`/`?`) or case-insensitive substring
+- status: bucket ("2xx".."5xx", "failed" = no status / errorText)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from typing import Any
+
+WATCH_KINDS = ("console", "errors", "network", "harLite", "dialogs", "navigation")
+STATUS_BUCKETS = ("2xx", "3xx", "4xx", "5xx", "failed")
+
+
+def status_bucket(item: dict[str, Any]) -> str | None:
+    status = item.get("status")
+    if isinstance(status, int) and 100 <= status <= 599:
+        return f"{status // 100}xx"
+    if status is None and ("errorText" in item or item.get("ok") is False):
+        return "failed"
+    return None
+
+
+@dataclass(frozen=True, slots=True)
+class WatchFilter:
+    kinds: frozenset[str] = frozenset(WATCH_KINDS)
+    level: str | None = None
+    url: str | None = None
+    status: frozenset[str] | None = None
+
+    @classmethod
+    def build(
+        cls,
+        *,
+        kinds: Any = None,
+        level: Any = None,
+        url: Any = None,
+        status: Any = None,
+    ) -> WatchFilter:
+        """Validate loose tool args; raises ValueError with a user-facing message."""
+
+        def _names(value: Any) -> list[str]:
+            if value is None or value == "":
+                return []
+            items = [value] if isinstance(value, str) else list(value) if isinstance(value, (list, tuple)) else None
+            if items is None or not all(isinstance(v, str) and v.strip() for v in items):
+                raise ValueError("expected a string or a list of strings")
+            return [v.strip() for v in items]
+
+        kind_set = frozenset(_names(kinds)) or frozenset(WATCH_KINDS)
+        bad = sorted(kind_set - set(WATCH_KINDS))
+        if bad:
+            raise ValueError(f"unknown event kind(s) {bad}; use {list(WATCH_KINDS)}")
+        status_set = frozenset(s.lower() for s in _names(status)) or None
+        if status_set:
+            bad = sorted(status_set - set(STATUS_BUCKETS))
+            if bad:
+                raise ValueError(f"unknown status bucket(s) {bad}; use {list(STATUS_BUCKETS)}")
+        level_s = str(level).strip().lower() if isinstance(level, str) and level.strip() else None
+        url_s = str(url).strip() if isinstance(url, str) and url.strip() else None
+        return cls(kinds=kind_set, level=level_s, url=url_s, status=status_set)
+
+    def matches(self, kind: str, item: dict[str, Any]) -> bool:
+        if kind not in self.kinds:
+            return False
+        if self.level is not None:
+            value = item.get("level") if kind == "console" else item.get("type")
+            if not isinstance(value, str) or value.lower() != self.level:
+                return False
+        if self.url is not None:
+            u = item.get("url")
+            if not isinstance(u, str) or not u:
+                return False
+            if "*" in self.url or "?" in self.url:
+                if not fnmatchcase(u, self.url):
+                    return False
+            elif self.url.lower() not in u.lower():
+                return False
+        return self.status is None or (kind in {"network", "harLite"} and status_bucket(item) in self.status)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "events": sorted(self.kinds),
+            **({"level": self.level} if self.level else {}),
+            **({"url": self.url} if self.url else {}),
+            **({"status": sorted(self.status)} if self.status else {}),
+        }
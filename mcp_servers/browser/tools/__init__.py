@@ -56,25 +56,33 @@ from .input import (
     type_text,
 )
 from .navigation import go_back, go_forward, navigate_to, reload_page
-from .network import browser_fetch, dump_dom_html, eval_js
+from .network import browser_fetch, browser_fetch_batch, dump_dom_html, eval_js
 from .page import (
     analyze_page,
     auto_expand_page,
     auto_scroll_page,
+    export_content,
     extract_content,
     get_page_audit,
     get_page_ax,
     get_page_context,
+    get_page_coverage,
     get_page_diagnostics,
     get_page_frames,
     get_page_graph,
     get_page_info,
     get_page_locators,
     get_page_map,
+    get_page_memory,
     get_page_performance,
+    get_page_profile,
     get_page_resources,
+    get_page_snapshot,
+    get_page_trace,
     get_page_triage,
+    sample_page_memory,
     wait_for,
+    watch_events,
 )
 from .smart import (
     click_accessibility,
@@ -121,8 +129,11 @@ __all__ = [
     "auto_expand_page",
     "auto_scroll_page",
     "get_page_ax",
+    "get_page_coverage",
     "extract_content",
+    "export_content",
     "wait_for",
+    "watch_events",
     "get_page_context",
     "get_page_info",
     "get_page_audit",
@@ -130,9 +141,14 @@ __all__ = [
     "get_page_frames",
     "get_page_graph",
     "get_page_resources",
+    "get_page_snapshot",
+    "get_page_trace",
     "get_page_performance",
+    "get_page_profile",
     "get_page_locators",
     "get_page_map",
+    "get_page_memory",
+    "sample_page_memory",
     "get_page_triage",
     # Smart interactions
     "click_accessibility",
@@ -184,6 +200,7 @@ __all__ = [
     "submit_captcha",
     # Network
     "browser_fetch",
+    "browser_fetch_batch",
     "eval_js",
     "dump_dom_html",
     # Viewport
@@ -61,8 +61,7 @@ def handle_dialog(
         if not isinstance(tab_id, str) or not tab_id:
             return None
         try:
-            t0 = session_manager.get_telemetry(tab_id)
-            meta = getattr(t0, "dialog_last", None) if t0 is not None else None
+            meta = session_manager.tier0_dialog(tab_id)[1]
             if isinstance(meta, dict) and meta:
                 return meta
         except Exception:
@@ -101,8 +100,7 @@ def handle_dialog(
                 # dialogOpen=true snapshots.
                 expected_open = False
                 try:
-                    t0 = session_manager.get_telemetry(tab_id)
-                    expected_open = bool(getattr(t0, "dialog_open", False)) if t0 is not None else False
+                    expected_open = session_manager.tier0_dialog(tab_id)[0]
                 except Exception:
                     expected_open = False
 
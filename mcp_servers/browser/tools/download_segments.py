@@ -0,0 +1,325 @@
+"""Segmented, resumable direct-URL downloads (the `download(url=...)` fetch path).
+
+One `Range: bytes=0-0` probe decides the mode:
+- `206` + `Content-Range: bytes 0-0/<total>`: the file is preallocated and split into up
+  to `MCP_DOWNLOAD_SEGMENTS` (default 4) ranged segments of at least `SEGMENT_MIN_BYTES`,
+  fetched concurrently and written at their offsets. Progress is checkpointed next to the
+  partial file, so a failed download resumes from the bytes already on disk on the next
+  call for the same URL (guarded by `If-Range` with the ETag / Last-Modified validator);
+- anything else (`200`, no usable Content-Range): the probe response itself is the body
+  and is streamed to disk in one pass, as before.
+
+SHA-256 is computed incrementally over the contiguous downloaded prefix while segments
+are still running (no second full read), and checked against a `Repr-Digest` / `Digest`
+sha-256 header when the server sends one. Every request goes through the caller's
+opener, so the allowlist-checking redirect handler applies to probes and segments alike.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import os
+import re
+import threading
+from collections.abc import Callable
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from contextlib import suppress
+from pathlib import Path
+from typing import Any
+from urllib.request import Request
+
+from .base import SmartToolError
+
+SEGMENT_MIN_BYTES = 8 * 1024 * 1024
+_DEFAULT_SEGMENTS = 4
+_MAX_SEGMENTS = 16
+_SEGMENT_RETRIES = 2
+_CHUNK = 1024 * 1024
+_CHECKPOINT_S = 1.0
+_CONTENT_RANGE_RE = re.compile(r"^\s*bytes\s+(\d+)-(\d+)/(\d+)\s*$", re.IGNORECASE)
+_DIGEST_RE = re.compile(r"sha-256=:?([A-Za-z0-9+/=]+):?", re.IGNORECASE)
+
+OpenUrl = Callable[[Request], Any]
+
+
+class _RangeLost(Exception):
+    """The server answered a segment request without a matching 206 (file changed / no ranges)."""
+
+
+def _segments_setting() -> int:
+    raw = os.environ.get("MCP_DOWNLOAD_SEGMENTS", "")
+    try:
+        n = int(raw) if raw.strip() else _DEFAULT_SEGMENTS
+    except ValueError:
+        n = _DEFAULT_SEGMENTS
+    return max(1, min(n, _MAX_SEGMENTS))
+
+
+def _status(resp: Any) -> int:
+    status = getattr(resp, "status", None)
+    return int(status) if isinstance(status, int) else int(resp.getcode() or 0)
+
+
+def _server_sha256(headers: Any) -> str | None:
+    for name in ("Repr-Digest", "Digest"):
+        m = _DIGEST_RE.search(str(headers.get(name) or ""))
+        if m is not None:
+            with suppress(ValueError):
+                return base64.b64decode(m.group(1), validate=True).hex()
+    return None
+
+
+def _too_big(max_bytes: int) -> SmartToolError:
+    return SmartToolError(
+        tool="download",
+        action="fetch",
+        reason="Download exceeded max_bytes limit",
+        suggestion="Increase MCP_DOWNLOAD_MAX_BYTES or use CDP download capture",
+        details={"maxBytes": int(max_bytes)},
+    )
+
+
+def _plan(total: int, parts: int) -> list[list[int]]:
+    """[[start, end_inclusive, done], ...] covering `total` bytes."""
+    n = max(1, min(parts, -(-total // max(1, SEGMENT_MIN_BYTES))))
+    size = -(-total // n)
+    return [[s, min(s + size, total) - 1, 0] for s in range(0, total, size)]
+
+
+class _Hasher:
+    """SHA-256 over the contiguous downloaded prefix, read back while segments still run."""
+
+    def __init__(self, path: Path) -> None:
+        self._h = hashlib.sha256()
+        self._fh = path.open("rb")
+        self.offset = 0
+
+    def advance(self, segments: list[list[int]]) -> None:
+        prefix = 0
+        for start, end, done in segments:  # sorted by start
+            prefix = start + done
+            if start + done <= end:
+                break
+        while self.offset < prefix:
+            self._fh.seek(self.offset)
+            chunk = self._fh.read(min(_CHUNK, prefix - self.offset))
+            if not chunk:
+                break
+            self._h.update(chunk)
+            self.offset += len(chunk)
+
+    def hexdigest(self) -> str:
+        self._fh.close()
+        return self._h.hexdigest()
+
+
+def _stream_whole(resp: Any, part: Path, max_bytes: int) -> tuple[int, str]:
+    h = hashlib.sha256()
+    total = 0
+    try:
+        with part.open("wb") as f:
+            while chunk := resp.read(_CHUNK):
+                total += len(chunk)
+                if max_bytes and total > max_bytes:
+                    raise _too_big(max_bytes)
+                h.update(chunk)
+                f.write(chunk)
+    except BaseException:
+        with suppress(OSError):
+            part.unlink()
+        raise
+    return total, h.hexdigest()
+
+
+def _load_state(state_path: Path, *, url: str, total: int, validator: str | None) -> list[list[int]] | None:
+    try:
+        state = json.loads(state_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(state, dict) or state.get("url") != url or state.get("total") != total:
+        return None
+    if not validator or state.get("validator") != validator:
+        return None  # without a validator a resumed file could mix two versions
+    segs = state.get("segments")
+    if not isinstance(segs, list) or not all(isinstance(s, list) and len(s) == 3 for s in segs):
+        return None
+    return [[int(a), int(b), int(c)] for a, b, c in segs]
+
+
+def fetch_to_file(
+    open_url: OpenUrl,
+    url: str,
+    *,
+    part_dir: Path,
+    max_bytes: int,
+    headers: dict[str, str] | None = None,
+) -> dict[str, Any]:
+    """Download `url` into a partial file under `part_dir`; the caller renames it.
+
+    Returns {path, headers, bytes, sha256, ranged, segments, resumedBytes, url}.
+    """
+    base_headers = dict(headers or {})
+    key = hashlib.sha1(url.encode("utf-8"), usedforsecurity=False).hexdigest()[:20]
+    part = part_dir / f".{key}.part"
+    state_path = part_dir / f".{key}.part.json"
+
+    probe = open_url(Request(url, headers={**base_headers, "Range": "bytes=0-0"}))
+    with probe:
+        resp_headers = probe.headers
+        final_url = probe.geturl() or url
+        m = _CONTENT_RANGE_RE.match(str(resp_headers.get("Content-Range") or ""))
+        if _status(probe) != 206 or m is None or int(m.group(1)) != 0:
+            # No ranges: this response is the whole body.
+            total, digest = _stream_whole(probe, part, max_bytes)
+            _check_digest(resp_headers, digest, part)
+            with suppress(OSError):
+                state_path.unlink()
+            return {
+                "path": part,
+                "headers": resp_headers,
+                "bytes": total,
+                "sha256": digest,
+                "ranged": False,
+                "segments": 1,
+                "resumedBytes": 0,
+                "url": final_url,
+            }
+        total = int(m.group(3))
+    if max_bytes and total > max_bytes:
+        raise _too_big(max_bytes)
+
+    validator = resp_headers.get("ETag") or resp_headers.get("Last-Modified")
+    segments = None
+    if part.exists() and part.stat().st_size == total:
+        segments = _load_state(state_path, url=url, total=total, validator=validator)
+    if segments is None:
+        segments = _plan(total, _segments_setting())
+        with part.open("wb") as f:
+            try:
+                if not (hasattr(os, "posix_fallocate") and total):
+                    raise OSError("posix_fallocate unavailable")
+                os.posix_fallocate(f.fileno(), 0, total)
+            except OSError:
+                f.truncate(total)  # e.g. EOPNOTSUPP: sparse file instead
+    resumed = sum(s[2] for s in segments)
+    lock = threading.Lock()
+    cancel = threading.Event()
+
+    def _checkpoint() -> None:
+        with lock:
+            snap = [list(s) for s in segments]
+        with suppress(OSError):
+            tmp = state_path.with_suffix(".tmp")
+            tmp.write_text(json.dumps({"url": url, "total": total, "validator": validator, "segments": snap}))
+            os.replace(tmp, state_path)
+
+    def _fetch_segment(seg: list[int]) -> None:
+        attempts = 0
+        # Unbuffered: `seg[2]` only counts bytes already in the file, which the hasher
+        # (separate handle) and the checkpoint rely on.
+        with part.open("r+b", buffering=0) as out:
+            while seg[0] + seg[2] <= seg[1] and not cancel.is_set():
+                pos = seg[0] + seg[2]
+                req_headers = {**base_headers, "Range": f"bytes={pos}-{seg[1]}"}
+                if validator:
+                    req_headers["If-Range"] = validator
+                try:
+                    with open_url(Request(final_url, headers=req_headers)) as resp:
+                        got = _CONTENT_RANGE_RE.match(str(resp.headers.get("Content-Range") or ""))
+                        if _status(resp) != 206 or got is None or int(got.group(1)) != pos:
+                            raise _RangeLost(f"HTTP {_status(resp)} for bytes={pos}-{seg[1]}")
+                        out.seek(pos)
+                        while seg[0] + seg[2] <= seg[1] and (chunk := resp.read(min(_CHUNK, seg[1] + 1 - pos))):
+                            if cancel.is_set():
+                                return
+                            view = memoryview(chunk)
+                            while view:
+                                view = view[out.write(view) :]
+                            pos += len(chunk)
+                            with lock:
+                                seg[2] += len(chunk)
+                        if seg[0] + seg[2] <= seg[1]:
+                            raise ConnectionError(f"Connection closed at byte {pos} of segment ending {seg[1]}")
+                except (_RangeLost, SmartToolError):
+                    raise
+                except OSError:
+                    attempts += 1
+                    if attempts > _SEGMENT_RETRIES:
+                        raise
+
+    hasher = _Hasher(part)
+    ex = ThreadPoolExecutor(max_workers=len(segments))
+    try:
+        pending = {ex.submit(_fetch_segment, seg) for seg in segments if seg[0] + seg[2] <= seg[1]}
+        while pending:
+            done, pending = wait(pending, timeout=_CHECKPOINT_S, return_when=FIRST_EXCEPTION)
+            for fut in done:
+                fut.result()  # re-raise the first failure
+            with lock:
+                snap = [list(s) for s in segments]
+            hasher.advance(snap)
+            _checkpoint()
+    except BaseException as exc:
+        # Stop the other segments at their next chunk instead of letting them finish.
+        cancel.set()
+        ex.shutdown(wait=False, cancel_futures=True)
+        hasher.hexdigest()
+        if isinstance(exc, _RangeLost):
+            # The file changed under us (or ranges stopped working): start over next time.
+            with suppress(OSError):
+                part.unlink()
+            with suppress(OSError):
+                state_path.unlink()
+        else:
+            _checkpoint()
+        if isinstance(exc, SmartToolError):
+            raise
+        if not isinstance(exc, Exception):
+            raise
+        downloaded = sum(s[2] for s in segments)
+        resumable = not isinstance(exc, _RangeLost)
+        raise SmartToolError(
+            tool="download",
+            action="fetch",
+            reason=str(exc) or "Segmented download failed",
+            suggestion=(
+                "Retry the same download: finished segments are kept and the fetch resumes"
+                if resumable
+                else "Retry the download: the server file changed or stopped honouring ranges, so it restarts"
+            ),
+            details={"bytes": downloaded, "total": total, "resumable": resumable},
+        ) from exc
+    ex.shutdown(wait=True)
+
+    hasher.advance(segments)
+    digest = hasher.hexdigest()
+    _check_digest(resp_headers, digest, part)
+    with suppress(OSError):
+        state_path.unlink()
+    return {
+        "path": part,
+        "headers": resp_headers,
+        "bytes": total,
+        "sha256": digest,
+        "ranged": True,
+        "segments": len(segments),
+        "resumedBytes": resumed,
+        "url": final_url,
+    }
+
+
+def _check_digest(headers: Any, digest: str, part: Path) -> None:
+    expected = _server_sha256(headers)
+    if expected is None or expected == digest:
+        return
+    with suppress(OSError):
+        part.unlink()
+    raise SmartToolError(
+        tool="download",
+        action="verify",
+        reason="Downloaded file does not match the server's sha-256 digest",
+        suggestion="Retry the download; if it keeps failing the server copy is inconsistent",
+        details={"expected": expected, "actual": digest},
+    )
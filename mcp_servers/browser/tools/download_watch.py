@@ -0,0 +1,155 @@
+"""Download wait helpers: directory change notification + streaming SHA-256.
+
+- `DirWatcher` blocks until one of the watched directories changes (Linux inotify via
+  ctypes; no extra dependency). Where inotify is unavailable it degrades to a plain sleep,
+  i.e. the previous polling behaviour. Used for directories CDP does not manage (XDG /
+  ~/Downloads fallbacks) and for the managed one when download events are missing.
+- `StreamingSha256` follows a file while the browser writes it and hashes only the bytes
+  appended since the previous tick, so the digest is ready when the download completes
+  and multi-GB files are never read a second time. The open descriptor survives Chrome's
+  `.crdownload` -> final-name rename; `finish()` returns None (caller re-hashes) when the
+  final file is not the one that was followed or its size differs from what was hashed.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import hashlib
+import os
+import select
+import sys
+import time
+from contextlib import suppress
+from pathlib import Path
+
+_IN_MODIFY = 0x002
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_WATCH_MASK = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE
+_READ_CHUNK = 1024 * 1024
+
+
+def _inotify_libc() -> ctypes.CDLL | None:
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        _ = libc.inotify_init1, libc.inotify_add_watch
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+class DirWatcher:
+    """Wait for changes in a set of directories (inotify when available, else sleep)."""
+
+    def __init__(self, dirs: list[Path]) -> None:
+        self.fd: int | None = None
+        libc = _inotify_libc() if dirs else None
+        if libc is None:
+            return
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            return
+        watched = 0
+        for directory in dirs:
+            if libc.inotify_add_watch(fd, os.fsencode(str(directory)), _WATCH_MASK) >= 0:
+                watched += 1
+        if watched:
+            self.fd = fd
+        else:
+            os.close(fd)
+
+    @property
+    def native(self) -> bool:
+        return self.fd is not None
+
+    def wait(self, timeout_s: float) -> None:
+        """Return after a change in a watched directory or after `timeout_s`."""
+        timeout_s = max(0.0, float(timeout_s))
+        if self.fd is None:
+            time.sleep(timeout_s)
+            return
+        ready, _w, _x = select.select([self.fd], [], [], timeout_s)
+        if ready:
+            with suppress(BlockingIOError, OSError):
+                while os.read(self.fd, 64 * 1024):
+                    pass
+
+    def close(self) -> None:
+        if self.fd is not None:
+            with suppress(OSError):
+                os.close(self.fd)
+            self.fd = None
+
+    def __enter__(self) -> DirWatcher:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+
+class StreamingSha256:
+    """Incrementally hash a file that is still being written (bounded by `max_bytes`)."""
+
+    def __init__(self, max_bytes: int = 0) -> None:
+        self.max_bytes = max(0, int(max_bytes))
+        self.offset = 0
+        self.skipped = False
+        self._hash = hashlib.sha256()
+        self._fh = None
+        self._ino: int | None = None
+
+    def follow(self, path: Path) -> None:
+        """Start (or keep) following `path`; a different file restarts the digest."""
+        try:
+            ino = os.stat(path).st_ino
+        except OSError:
+            return
+        if self._fh is not None and ino == self._ino:
+            return
+        self.close()
+        try:
+            self._fh = open(path, "rb")  # noqa: SIM115 - kept open across ticks
+        except OSError:
+            return
+        self._ino = ino
+        self._hash = hashlib.sha256()
+        self.offset = 0
+        self.skipped = False
+
+    def advance(self) -> None:
+        """Hash whatever was appended since the last call."""
+        if self._fh is None or self.skipped:
+            return
+        try:
+            while chunk := self._fh.read(_READ_CHUNK):
+                self._hash.update(chunk)
+                self.offset += len(chunk)
+                if self.max_bytes and self.offset > self.max_bytes:
+                    self.skipped = True
+                    self.close()
+                    return
+        except OSError:
+            self.close()
+
+    def finish(self, path: Path) -> str | None:
+        """Digest of the completed file at `path`, or None if it must be hashed from scratch."""
+        self.follow(path)
+        self.advance()
+        try:
+            st = os.stat(path)
+            ok = self._fh is not None and st.st_ino == self._ino and st.st_size == self.offset
+        except OSError:
+            ok = False
+        digest = self._hash.hexdigest() if ok else None
+        self.close()
+        return digest
+
+    def close(self) -> None:
+        if self._fh is not None:
+            with suppress(OSError):
+                self._fh.close()
+            self._fh = None
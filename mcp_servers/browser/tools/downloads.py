@@ -6,7 +6,8 @@ Goal:
 
 Design:
 - Configure a per-tab download directory via CDP (best-effort).
-- Wait for a new file to appear and stabilize.
+- Follow the download via Tier-0 download events (guid -> file, completion state);
+  otherwise wait for a new file to appear and stabilize (inotify-woken when possible).
 """
 
 from __future__ import annotations
@@ -14,27 +15,32 @@ from __future__ import annotations
 import mimetypes
 import os
 import re
+import shutil
 import ssl
 import time
 import urllib.parse
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
-from urllib.request import HTTPRedirectHandler, HTTPSHandler, Request, build_opener
-from contextlib import suppress
-import shutil
+from urllib.request import HTTPRedirectHandler, HTTPSHandler, build_opener
 
 from ..config import BrowserConfig
 from ..http_client import HttpClientError
 from ..session import session_manager
 from ..session_helpers import _downloads_root, _repo_root
 from .base import SmartToolError, ensure_allowed, get_session
+from .download_segments import fetch_to_file
+from .download_watch import DirWatcher, StreamingSha256
+
+_MTIME_SLACK_S = 0.05
 
 
 @dataclass(frozen=True)
 class _DownloadCandidate:
     path: Path
     started_from_temp: bool = False
+    # Name to report when the file on disk is named by guid (behavior=allowAndName).
+    file_name: str | None = None
 
 
 def _read_xdg_download_dir() -> Path | None:
@@ -252,55 +258,41 @@ def _download_via_url(
     dest = dest_dir or _downloads_root()
     dest.mkdir(parents=True, exist_ok=True)
 
-    req = Request(url, headers={"User-Agent": "mcp-browser/1.0"})
     ctx = ssl.create_default_context()
     opener = build_opener(_SafeRedirectHandler(config), HTTPSHandler(context=ctx))
 
     try:
-        with opener.open(req, timeout=timeout) as resp:
-            cd = resp.headers.get("Content-Disposition")
-            name = file_name or _filename_from_cd(cd) or _filename_from_url(url) or "download"
-            name = _safe_filename(name)
-            candidate = dest / name
-            if candidate.exists():
-                suffix = 1
-                while (dest / f"{candidate.stem}-{suffix}{candidate.suffix}").exists():
-                    suffix += 1
-                candidate = dest / f"{candidate.stem}-{suffix}{candidate.suffix}"
-
-            total = 0
-            try:
-                with candidate.open("wb") as f:
-                    while True:
-                        chunk = resp.read(1024 * 1024)
-                        if not chunk:
-                            break
-                        total += len(chunk)
-                        if max_bytes and total > max_bytes:
-                            raise SmartToolError(
-                                tool="download",
-                                action="fetch",
-                                reason="Download exceeded max_bytes limit",
-                                suggestion="Increase MCP_DOWNLOAD_MAX_BYTES or use CDP download capture",
-                                details={"maxBytes": int(max_bytes)},
-                            )
-                        f.write(chunk)
-            except SmartToolError:
-                with suppress(Exception):
-                    if candidate.exists():
-                        candidate.unlink()
-                raise
-
-            mime = resp.headers.get("Content-Type")
-            if not isinstance(mime, str) or not mime:
-                mime, _enc = mimetypes.guess_type(str(candidate))
-            return {
-                "path": candidate,
-                "fileName": candidate.name,
-                "mimeType": mime or "application/octet-stream",
-                "bytes": int(total),
-                "fallback": True,
-            }
+        fetched = fetch_to_file(
+            lambda req: opener.open(req, timeout=timeout),
+            url,
+            part_dir=dest,
+            max_bytes=max_bytes,
+            headers={"User-Agent": "mcp-browser/1.0"},
+        )
+        headers = fetched["headers"]
+        name = file_name or _filename_from_cd(headers.get("Content-Disposition")) or _filename_from_url(url)
+        name = _safe_filename(name or "download")
+        candidate = dest / name
+        if candidate.exists():
+            suffix = 1
+            while (dest / f"{candidate.stem}-{suffix}{candidate.suffix}").exists():
+                suffix += 1
+            candidate = dest / f"{candidate.stem}-{suffix}{candidate.suffix}"
+        os.replace(fetched["path"], candidate)
+
+        mime = headers.get("Content-Type")
+        if not isinstance(mime, str) or not mime:
+            mime, _enc = mimetypes.guess_type(str(candidate))
+        return {
+            "path": candidate,
+            "fileName": candidate.name,
+            "mimeType": mime or "application/octet-stream",
+            "bytes": int(fetched["bytes"]),
+            "sha256": fetched["sha256"],
+            **({"segments": fetched["segments"]} if fetched["ranged"] else {}),
+            **({"resumedBytes": fetched["resumedBytes"]} if fetched["resumedBytes"] else {}),
+            "fallback": True,
+        }
     except SmartToolError:
         raise
     except Exception as exc:  # noqa: BLE001
@@ -312,6 +304,40 @@ def _download_via_url(
         ) from exc
 
 
+def _dir_baseline(directory: Path, *, before: float | None = None) -> set[str]:
+    """Names already in `directory` (with `before`: only files last modified before that time)."""
+    names: set[str] = set()
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                try:
+                    if not entry.is_file():
+                        continue
+                    if before is not None and entry.stat().st_mtime >= before:
+                        continue
+                except OSError:
+                    continue
+                names.add(entry.name)
+    except OSError:
+        pass
+    return names
+
+
+def _event_candidate(rec: dict[str, Any], dl_dir: Path, baseline: set[str]) -> _DownloadCandidate | None:
+    """Map a download event record (guid) to its file: reported path, guid name, or suggested name."""
+    file_name = rec.get("fileName") if isinstance(rec.get("fileName"), str) else None
+    reported = rec.get("filePath")
+    if isinstance(reported, str) and reported:
+        return _DownloadCandidate(path=Path(reported), file_name=file_name)
+    by_guid = dl_dir / str(rec.get("guid") or "")
+    if by_guid.is_file():  # behavior=allowAndName
+        return _DownloadCandidate(path=by_guid, file_name=file_name)
+    if file_name and file_name not in baseline:
+        path = dl_dir / file_name
+        return _DownloadCandidate(path=path, started_from_temp=not path.exists(), file_name=file_name)
+    return None  # name collision (Chrome uniquifies): let the directory scan find the new file
+
+
 def wait_for_download(
     config: BrowserConfig,
     *,
@@ -320,14 +346,22 @@ def wait_for_download(
     stable_ms: int = 500,
     baseline: list[str] | None = None,
     allow_fallback_dirs: bool = True,
+    since_seq: int | None = None,
+    since_ts: float | None = None,
+    sha256_max_bytes: int | None = None,
 ) -> dict[str, Any]:
     """Wait for a new download to complete and return metadata (no artifact storage here).
 
     Notes:
-    - This function is binary-safe (does not read file contents).
+    - Event-driven when Tier-0 telemetry is active: `downloadWillBegin/Progress` map the
+      download guid to its file and report completion; the directory scan (inotify-woken
+      where available) is the fallback for unmanaged dirs and browsers without events.
+    - `since_seq`/`since_ts` are what run/flow record *before* a click (a download event
+      cursor and a wall-clock time) so instant downloads are not missed; `baseline` (file
+      names) is the older escape hatch and still wins when given.
+    - With `sha256_max_bytes` set, the file is hashed while it is being written and the
+      digest is returned as `download.sha256` (no second read of the file).
     - It returns a repo-relative path when possible (no absolute paths by default).
-    - `baseline` is an internal escape hatch used by run/flow auto-capture to avoid
-      missing instant downloads (baseline taken *before* a click).
     """
     try:
         timeout_f = float(timeout)
@@ -365,21 +399,26 @@ def wait_for_download(
                 suggestion="Navigate to a page first, then retry download wait",
             )
 
-        dl_dir = session_manager.get_download_dir(session.tab_id)
+        tab_id = session.tab_id
+        dl_dir = session_manager.get_download_dir(tab_id)
         fallback_dirs = _default_download_dirs(dl_dir)
+        # File mtimes come from a coarse kernel clock: allow a little slack before `since_ts`.
+        before = float(since_ts) - _MTIME_SLACK_S if isinstance(since_ts, (int, float)) else None
         if isinstance(baseline, list) and baseline:
             baseline_set = {str(n) for n in baseline if isinstance(n, str) and n}
         else:
-            baseline_set = {p.name for p in dl_dir.iterdir() if p.is_file()}
-        fallback_baselines: dict[Path, set[str]] = {}
-        for directory in fallback_dirs:
-            try:
-                fallback_baselines[directory] = {p.name for p in directory.iterdir() if p.is_file()}
-            except Exception:
-                fallback_baselines[directory] = set()
+            baseline_set = _dir_baseline(dl_dir, before=before)
+        fallback_baselines = {d: _dir_baseline(d, before=before) for d in fallback_dirs}
+
+        events = session_manager.tier0_downloads(tab_id)
+        cursor = int(since_seq) if isinstance(since_seq, int) else int((events or {}).get("cursor") or 0)
+        if events is not None:
+            events["items"] = [rec for rec in events.get("items") or [] if rec.get("seq", 0) > cursor]
+        hasher = StreamingSha256(sha256_max_bytes) if sha256_max_bytes is not None else None
 
         deadline = time.time() + timeout_f
         candidate: _DownloadCandidate | None = None
+        completed_by_event = False
         last_size: int | None = None
         stable_since: float | None = None
 
@@ -406,31 +445,65 @@ def wait_for_download(
                 return _DownloadCandidate(path=finals[0], started_from_temp=False)
             return None
 
-        while time.time() < deadline:
-            candidate = _pick_candidate(_list_files(dl_dir), baseline_set)
-            if candidate is None:
-                for directory in fallback_dirs:
-                    base = fallback_baselines.get(directory, set())
-                    candidate = _pick_candidate(_list_files(directory), base)
-                    if candidate is not None:
-                        break
+        with DirWatcher([dl_dir, *fallback_dirs]) as watcher:
+            while time.time() < deadline:
+                record = None
+                if events is not None:
+                    items = events.get("items") or []
+                    record = items[-1] if items else None
+                if record is not None and record.get("state") == "canceled":
+                    raise SmartToolError(
+                        tool="download",
+                        action="wait",
+                        reason="Download was canceled by the browser",
+                        suggestion="Check the page for an error or a blocked download, then retry",
+                        details={"fileName": record.get("fileName"), "url": record.get("url")},
+                    )
+
+                candidate = _event_candidate(record, dl_dir, baseline_set) if record is not None else None
+                if candidate is None:
+                    candidate = _pick_candidate(_list_files(dl_dir), baseline_set)
+                if candidate is None:
+                    for directory in fallback_dirs:
+                        base = fallback_baselines.get(directory, set())
+                        candidate = _pick_candidate(_list_files(directory), base)
+                        if candidate is not None:
+                            break
 
-            if candidate is not None and candidate.path.exists():
-                try:
-                    size = int(candidate.path.stat().st_size)
-                except Exception:
-                    size = 0
-
-                if last_size is not None and size == last_size:
-                    if stable_since is None:
-                        stable_since = time.time()
-                    if stable_s <= 0.0 or (time.time() - stable_since) >= stable_s:
+                if candidate is not None and hasher is not None:
+                    temp = candidate.path.with_name(candidate.path.name + ".crdownload")
+                    hasher.follow(candidate.path if candidate.path.exists() else temp)
+                    hasher.advance()
+
+                if record is not None and record.get("state") == "completed" and candidate is not None:
+                    if candidate.path.exists():
+                        completed_by_event = True
                         break
+                elif (record is None or record.get("state") != "inProgress") and (
+                    candidate is not None and candidate.path.exists()
+                ):
+                    try:
+                        size = int(candidate.path.stat().st_size)
+                    except Exception:
+                        size = 0
+
+                    if last_size is not None and size == last_size:
+                        if stable_since is None:
+                            stable_since = time.time()
+                        if stable_s <= 0.0 or (time.time() - stable_since) >= stable_s:
+                            break
+                    else:
+                        last_size = size
+                        stable_since = None
+
+                left = max(0.0, min(poll_f, deadline - time.time()))
+                if events is not None:
+                    # Wake on the next download event (progress/complete) instead of sleeping.
+                    events = session_manager.tier0_downloads(
+                        tab_id, since_seq=cursor, version=events.get("version"), timeout_s=left
+                    )
                 else:
-                    last_size = size
-                    stable_since = None
-
-            time.sleep(poll_f)
+                    watcher.wait(left)
 
         if candidate is None or not candidate.path.exists():
             suggestion = "Trigger the download (click) then call download wait with a longer timeout"
@@ -456,10 +529,12 @@ def wait_for_download(
             size = int(path.stat().st_size)
         except Exception:
             size = 0
+        sha256 = hasher.finish(path) if hasher is not None else None
 
-        mime, _enc = mimetypes.guess_type(str(path))
+        file_name = candidate.file_name or path.name
+        mime, _enc = mimetypes.guess_type(file_name)
         mime = mime or "application/octet-stream"
-        ext = path.suffix if path.suffix else ""
+        ext = Path(file_name).suffix
 
         # Repo-relative path (no absolute paths by default).
         try:
@@ -470,12 +545,15 @@ def wait_for_download(
 
         return {
             "download": {
-                "fileName": path.name,
+                "fileName": file_name,
                 "bytes": size,
                 "mimeType": mime,
                 **({"ext": ext} if ext else {}),
                 "path": rel_path,
                 **({"startedFromTemp": True} if candidate.started_from_temp else {}),
+                **({"completedByEvent": True} if completed_by_event else {}),
+                **({"sha256": sha256} if sha256 else {}),
+                **({"sha256Skipped": True} if hasher is not None and hasher.skipped else {}),
                 **({"unmanaged": True} if not downloads_available else {}),
             },
             "target": target["id"],
@@ -494,6 +572,9 @@ def wait_for_download_or_fetch(
     url: str | None = None,
     file_name: str | None = None,
     max_bytes: int | None = None,
+    since_seq: int | None = None,
+    since_ts: float | None = None,
+    sha256_max_bytes: int | None = None,
 ) -> dict[str, Any]:
     """Wait for a download; fall back to direct URL/file fetch if provided."""
     try:
@@ -504,6 +585,9 @@ def wait_for_download_or_fetch(
             stable_ms=stable_ms,
             baseline=baseline,
             allow_fallback_dirs=allow_fallback_dirs,
+            since_seq=since_seq,
+            since_ts=since_ts,
+            sha256_max_bytes=sha256_max_bytes,
         )
     except SmartToolError as exc:
         if not (isinstance(url, str) and url.strip()):
@@ -534,6 +618,8 @@ def wait_for_download_or_fetch(
                 "bytes": fetched.get("bytes"),
                 "mimeType": fetched.get("mimeType"),
                 "path": rel_path,
+                **({"sha256": fetched["sha256"]} if fetched.get("sha256") else {}),
+                **({k: fetched[k] for k in ("segments", "resumedBytes") if k in fetched}),
                 "fallback": True,
                 "unmanaged": True,
             },
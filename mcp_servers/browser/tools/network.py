@@ -3,6 +3,7 @@ Network operations for browser automation.
 
 Provides:
 - browser_fetch: Fetch URL from page context (subject to CORS)
+- browser_fetch_batch: Many fetches through one in-page Promise pool (results streamed to a sink)
 - eval_js: Evaluate JavaScript expression in page context
 - dump_dom_html: Navigate to URL and return full DOM HTML
 """
@@ -10,11 +11,17 @@ Provides:
 from __future__ import annotations
 
 import json
+import time
 import urllib.parse
+import uuid
+from collections import Counter
+from collections.abc import Callable
 from typing import Any
 
 from ..config import BrowserConfig
+from ..http_client import HttpClientError
 from .base import SmartToolError, ensure_allowed, ensure_allowed_navigation, get_session
+from .page.frames import eval_in_frames
 
 
 def browser_fetch(
@@ -268,13 +275,253 @@ def browser_fetch(
             ) from e
 
 
-def eval_js(config: BrowserConfig, expression: str) -> dict[str, Any]:
+_BATCH_METHODS = {"GET", "POST", "PUT", "DELETE", "PATCH"}
+_BATCH_MAX_REQUESTS = 1000
+# Max body chars handed back per drain round trip (results stream in several rounds).
+_BATCH_DRAIN_CHARS = 2_000_000
+
+_BATCH_START_JS = """
+(() => {
+  const reqs = %(reqs)s;
+  const st = { done: [], finished: 0, total: reqs.length, wake: null };
+  (window.__mcpFetchBatch = window.__mcpFetchBatch || {})[%(key)s] = st;
+  let next = 0;
+  const one = async (i) => {
+    const r = reqs[i];
+    const t0 = performance.now();
+    const ctl = new AbortController();
+    const timer = setTimeout(() => { try { ctl.abort(); } catch (_e) {} }, r.timeoutMs);
+    let out;
+    try {
+      const opts = { method: r.method, credentials: %(credentials)s, mode: 'cors', signal: ctl.signal };
+      if (r.headers) opts.headers = r.headers;
+      if (r.body !== null) opts.body = r.body;
+      const resp = await fetch(r.url, opts);
+      let text = '', bytes = 0, truncated = false;
+      if (resp.body) {
+        const reader = resp.body.getReader();
+        const dec = new TextDecoder();
+        for (;;) {
+          const { done, value } = await reader.read();
+          if (done) break;
+          bytes += value.length;
+          if (text.length >= r.maxBody) { truncated = true; try { await reader.cancel(); } catch (_e) {} break; }
+          text += dec.decode(value, { stream: true });
+        }
+      }
+      if (text.length > r.maxBody) { text = text.slice(0, r.maxBody); truncated = true; }
+      out = { i, ok: resp.ok, status: resp.status, contentType: resp.headers.get('content-type') || '',
+              bodyBytes: bytes, truncated, body: text };
+    } catch (e) {
+      out = { i, ok: false, status: 0, error: String((e && e.message) || e || 'fetch_failed'),
+              errorType: String((e && e.name) || 'Error') };
+    } finally {
+      clearTimeout(timer);
+    }
+    out.ms = Math.round(performance.now() - t0);
+    st.done.push(out);
+    st.finished++;
+    if (st.wake) { const w = st.wake; st.wake = null; w(); }
+  };
+  const worker = async () => { while (next < reqs.length) { const i = next++; await one(i); } };
+  for (let w = 0; w < Math.min(%(concurrency)d, reqs.length); w++) worker();
+  return reqs.length;
+})()
+"""
+
+_BATCH_DRAIN_JS = """
+(async () => {
+  const all = window.__mcpFetchBatch || {};
+  const st = all[%(key)s];
+  if (!st) return null;
+  if (!st.done.length && st.finished < st.total) {
+    await new Promise((res) => { st.wake = res; setTimeout(res, 250); });
+  }
+  const items = [];
+  let chars = 0;
+  while (st.done.length && (!items.length || chars < %(max_chars)d)) {
+    const it = st.done.shift();
+    chars += (it.body || '').length;
+    items.push(it);
+  }
+  const complete = st.finished >= st.total && !st.done.length;
+  if (complete) delete all[%(key)s];
+  return { items, complete };
+})()
+"""
+
+
+def browser_fetch_batch(
+    config: BrowserConfig,
+    requests: list[Any],
+    *,
+    sink: Callable[[list[dict[str, Any]]], Any],
+    concurrency: int = 6,
+    credentials: str = "include",
+    max_body_size: int = 200_000,
+) -> dict[str, Any]:
+    """
+    Run many fetches from page context through a single in-page Promise pool.
+
+    Each request is `{url, method?, headers?, body?, timeout_ms?, max_body_size?}`. Results
+    (`{i, url, method, ok, status, ms, contentType, bodyBytes, truncated, body | error}`)
+    are pulled back in bounded rounds and handed to `sink` as they complete, so neither
+    the page nor this process holds the whole batch. Allowlist checks apply per URL;
+    rejected or malformed requests are reported as failed items without being fetched.
+
+    Returns:
+        Compact summary: total/ok/failed counts, per-status counts, wall time, first errors
+    """
+    if not isinstance(requests, list) or not requests:
+        raise SmartToolError(
+            tool="browser_fetch",
+            action="batch",
+            reason="requests must be a non-empty list",
+            suggestion='Provide requests=[{"url": "/api/items?page=1"}, ...]',
+        )
+    if len(requests) > _BATCH_MAX_REQUESTS:
+        raise SmartToolError(
+            tool="browser_fetch",
+            action="batch",
+            reason=f"Too many requests ({len(requests)} > {_BATCH_MAX_REQUESTS})",
+            suggestion="Split the batch into several fetch(requests=[...]) calls",
+        )
+    credentials = str(credentials or "include").lower()
+    if credentials not in {"include", "same-origin", "omit"}:
+        credentials = "include"
+    concurrency_i = max(1, min(int(concurrency or 6), 32))
+    try:
+        default_timeout_ms = int(max(1.0, float(getattr(config, "http_timeout", 10.0))) * 1000)
+    except Exception:
+        default_timeout_ms = 10_000
+
+    status_counts: Counter[str] = Counter()
+    errors: list[dict[str, Any]] = []
+    meta_by_index: dict[int, dict[str, Any]] = {}
+
+    def _emit(items: list[dict[str, Any]]) -> None:
+        for it in items:
+            meta = meta_by_index.get(int(it.get("i", -1)), {})
+            it["url"], it["method"] = meta.get("url", it.get("url")), meta.get("method", it.get("method"))
+            status_counts[str(it.get("status") or "error")] += 1
+            if not it.get("ok") and len(errors) < 5:
+                errors.append({k: it[k] for k in ("i", "url", "status", "error") if it.get(k) not in (None, "")})
+        sink(items)
+
+    started = time.monotonic()
+    with get_session(config) as (session, target):
+        urls = [r.get("url") if isinstance(r, dict) else None for r in requests]
+        try:
+            resolved = session.eval_js(
+                f"{json.dumps(urls)}.map((u) => {{ try {{ return typeof u === 'string' && u.trim() "
+                "? new URL(u, window.location.href).toString() : null; } catch (_e) { return null; } })"
+            )
+        except Exception as exc:  # noqa: BLE001
+            raise SmartToolError(
+                tool="browser_fetch",
+                action="resolve_url",
+                reason=str(exc),
+                suggestion="Navigate to a http(s) page first, then retry",
+            ) from exc
+        resolved = resolved if isinstance(resolved, list) and len(resolved) == len(requests) else [None] * len(urls)
+
+        jobs: list[dict[str, Any]] = []
+        rejected: list[dict[str, Any]] = []
+        for i, (raw, url) in enumerate(zip(requests, resolved, strict=True)):
+            r = raw if isinstance(raw, dict) else {}
+            method = str(r.get("method") or "GET").upper()
+            meta_by_index[i] = {"url": url or r.get("url"), "method": method}
+            reason = None
+            if not isinstance(url, str) or urllib.parse.urlparse(url).scheme not in ("http", "https"):
+                reason = "url must resolve to http(s)"
+            elif method not in _BATCH_METHODS:
+                reason = f"Unsupported method: {method}"
+            else:
+                try:
+                    ensure_allowed(url, config)
+                except HttpClientError as exc:
+                    reason = str(exc)
+            if reason is not None:
+                rejected.append({"i": i, "ok": False, "status": 0, "error": reason, "errorType": "Rejected", "ms": 0})
+                continue
+            body = r.get("body")
+            if body is not None and not isinstance(body, str):
+                body = json.dumps(body)
+            headers = r.get("headers") if isinstance(r.get("headers"), dict) else None
+            jobs.append(
+                {
+                    "i": i,
+                    "url": url,
+                    "method": method,
+                    "headers": {str(k): str(v) for k, v in list(headers.items())[:50]} if headers else None,
+                    "body": body if method != "GET" else None,
+                    "timeoutMs": max(250, min(int(r.get("timeout_ms") or default_timeout_ms), 120_000)),
+                    "maxBody": max(0, min(int(r.get("max_body_size") or max_body_size), 5_000_000)),
+                }
+            )
+        if rejected:
+            _emit(rejected)
+
+        if jobs:
+            key = json.dumps(uuid.uuid4().hex)
+            session.eval_js(
+                _BATCH_START_JS
+                % {
+                    "reqs": json.dumps(jobs),
+                    "key": key,
+                    "credentials": json.dumps(credentials),
+                    "concurrency": concurrency_i,
+                }
+            )
+            # Upper bound: every wave hits its timeout, plus slack for the drain round trips.
+            waves = -(-len(jobs) // concurrency_i)
+            deadline = started + waves * max(j["timeoutMs"] for j in jobs) / 1000.0 + 10.0
+            drain = _BATCH_DRAIN_JS % {"key": key, "max_chars": _BATCH_DRAIN_CHARS}
+            while True:
+                res = session.eval_js(drain, timeout=5.0)
+                if not isinstance(res, dict):
+                    raise SmartToolError(
+                        tool="browser_fetch",
+                        action="batch",
+                        reason="Batch state lost (page navigated or reloaded during the batch)",
+                        suggestion="Keep the page stable while fetch(requests=[...]) runs, then retry",
+                    )
+                items = res.get("items")
+                if isinstance(items, list) and items:
+                    _emit([it for it in items if isinstance(it, dict)])
+                if res.get("complete"):
+                    break
+                if time.monotonic() > deadline:
+                    raise SmartToolError(
+                        tool="browser_fetch",
+                        action="batch",
+                        reason="Batch did not finish in time",
+                        suggestion="Lower the batch size or per-request timeout_ms",
+                    )
+
+    total = sum(status_counts.values())
+    ok = sum(n for st, n in status_counts.items() if st.isdigit() and 200 <= int(st) < 400)
+    return {
+        "total": total,
+        "ok": ok,
+        "failed": total - ok,
+        "byStatus": dict(sorted(status_counts.items())),
+        "concurrency": concurrency_i,
+        "ms": int((time.monotonic() - started) * 1000),
+        **({"errors": errors} if errors else {}),
+        "target": target["id"],
+    }
+
+
+def eval_js(config: BrowserConfig, expression: str, *, frame: str | None = None) -> dict[str, Any]:
     """
     Evaluate JavaScript expression in the active page context.
 
     Args:
         config: Browser configuration
         expression: JavaScript expression to evaluate
+        frame: Optional frame selector ("all", "main", frameId, or URL/name substring).
+            When set, evaluates in each matching frame and returns per-frame results.
 
     Returns:
         Dict with result and target ID
@@ -292,8 +539,12 @@ def eval_js(config: BrowserConfig, expression: str) -> dict[str, Any]:
 
     with get_session(config) as (session, target):
         try:
+            if frame:
+                return {"frames": eval_in_frames(session, expression, frame=str(frame)), "target": target["id"]}
             result = session.eval_js(expression)
             return {"result": result, "target": target["id"]}
+        except SmartToolError:
+            raise
         except Exception as e:
             raise SmartToolError(
                 tool="eval_js",
@@ -4,9 +4,16 @@ Page analysis and content extraction tools.
 Provides:
 - analyze_page: Primary tool for understanding page structure
 - extract_content: Extract structured content with pagination
+- export_content: Stream a full extraction list in chunks (JSONL exports)
 - wait_for: Wait for various conditions
+- watch_events: Long-poll Tier-0 events matching a predicate
 - get_page_context: Quick access to cached page state
 - get_page_info: Current page metadata
+- get_page_snapshot: DOMSnapshot bulk capture (text/links/locators/hit-test)
+- get_page_profile: CPU profile capture with a hot-function summary
+- get_page_trace: streamed performance trace capture with a main-thread summary
+- get_page_memory / sample_page_memory: heap sampling profile and memory metrics
+- get_page_coverage: unused JS/CSS bytes per resource (audit coverage phase)
 """
 
 from .analyze import analyze_page
@@ -14,17 +21,23 @@ from .auto_expand import auto_expand_page
 from .auto_scroll import auto_scroll_page
 from .audit import get_page_audit
 from .ax import get_page_ax
+from .coverage import get_page_coverage
 from .diagnostics import get_page_diagnostics
-from .extract import extract_content
+from .extract import export_content, extract_content
 from .frames import get_page_frames
 from .graph import get_page_graph
 from .info import get_page_context, get_page_info
 from .locators import get_page_locators
 from .map import get_page_map
+from .memory import get_page_memory, sample_page_memory
 from .performance import get_page_performance
+from .profile import get_page_profile
 from .resources import get_page_resources
+from .snapshot import get_page_snapshot
+from .trace import get_page_trace
 from .triage import get_page_triage
 from .wait import wait_for
+from .watch import watch_events
 
 __all__ = [
     "analyze_page",
@@ -32,16 +45,24 @@ __all__ = [
     "auto_scroll_page",
     "get_page_audit",
     "get_page_ax",
+    "get_page_coverage",
     "get_page_diagnostics",
     "get_page_frames",
     "get_page_graph",
     "get_page_locators",
     "get_page_map",
+    "get_page_memory",
     "get_page_performance",
+    "get_page_profile",
     "get_page_resources",
+    "get_page_snapshot",
+    "get_page_trace",
     "get_page_triage",
     "extract_content",
+    "export_content",
+    "sample_page_memory",
     "wait_for",
+    "watch_events",
     "get_page_context",
     "get_page_info",
 ]
@@ -9,6 +9,7 @@ from typing import Any
 from ...config import BrowserConfig
 from ...session import session_manager
 from ..base import SmartToolError
+from .coverage import get_page_coverage
 from .diagnostics import get_page_diagnostics
 from .info import get_page_info
 from .locators import get_page_locators
@@ -263,9 +264,16 @@ def get_page_audit(
     since: int | None = None,
     limit: int = 30,
     clear: bool = False,
+    coverage: bool = False,
+    coverage_reload: bool = True,
+    coverage_ms: int = 1000,
 ) -> dict[str, Any]:
     """Return a compact super-report for agents (errors + perf + network + next actions).
 
+    With `coverage=True` a final phase measures unused JS/CSS bytes per resource (see
+    `get_page_coverage`; reloads the page by default) and returns `audit.coveragePath`
+    (JSONL of used ranges, caller owns it).
+
     Design:
     - Best-effort: partial results are better than failure.
     - Bounded: never dumps huge arrays; prefers summaries + top items.
@@ -311,6 +319,15 @@ def get_page_audit(
         except Exception:
             locators = None
 
+        # Last: a coverage reload must not change what the phases above observed.
+        coverage_out = None
+        coverage_error = None
+        if coverage:
+            try:
+                coverage_out = get_page_coverage(config, reload=coverage_reload, window_ms=coverage_ms)
+            except Exception as exc:
+                coverage_error = str(exc)
+
     page_info = info.get("pageInfo") if isinstance(info, dict) else None
     diag_snapshot = diagnostics.get("diagnostics") if isinstance(diagnostics, dict) else None
 
@@ -381,6 +398,12 @@ def get_page_audit(
                 if isinstance(_compact_locators(locators, max_items=10), dict)
                 else {}
             ),
+            **(
+                {"coverage": coverage_out["coverage"], "coveragePath": coverage_out["coveragePath"]}
+                if coverage_out
+                else {}
+            ),
+            **({"coverageError": coverage_error} if coverage_error else {}),
             "next": [
                 "page(detail='locators', with_screenshot=true) for numbered UI map",
                 "page(detail='resources', sort='duration') for slow assets",
@@ -0,0 +1,268 @@
+"""JS/CSS code coverage for the current page (precise JS coverage + CSS rule usage).
+
+Byte accounting (DevTools Coverage semantics):
+- JS: `Profiler.takePreciseCoverage` block ranges nest (function ⊃ block ⊃ block); a
+  stack sweep flattens them into disjoint segments where the innermost count wins, and
+  the executed segments are interval-merged into used bytes.
+- CSS: `CSS.stopRuleUsageTracking` rule ranges flagged `used` are interval-merged.
+- unused = resource length - used; resources sharing a URL and length (same source
+  loaded twice) are unioned, other same-URL entries (inline blocks) are summed.
+
+Per-resource used ranges are streamed to a JSONL temp file while aggregating (the
+handler moves it into the artifact store); the response stays a ranked summary.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import time
+from collections.abc import Iterable
+from contextlib import suppress
+from typing import Any
+
+from ...config import BrowserConfig
+from ...server.redaction import redact_url_brief
+from ..base import SmartToolError, get_session
+
+Range = tuple[int, int]
+
+_MAX_WINDOW_MS = 30_000
+
+
+def merge_ranges(ranges: Iterable[Range]) -> list[Range]:
+    """Sort and merge overlapping/adjacent [start, end) ranges."""
+    out: list[Range] = []
+    for start, end in sorted(r for r in ranges if r[1] > r[0]):
+        if out and start <= out[-1][1]:
+            if end > out[-1][1]:
+                out[-1] = (out[-1][0], end)
+        else:
+            out.append((start, end))
+    return out
+
+
+def ranges_bytes(ranges: Iterable[Range]) -> int:
+    return sum(end - start for start, end in ranges)
+
+
+def js_used_ranges(functions: list[dict[str, Any]]) -> tuple[list[Range], int]:
+    """Flatten nested block-coverage ranges; returns (merged executed ranges, script length)."""
+    raw: list[tuple[int, int, int]] = []
+    for fn in functions:
+        for r in fn.get("ranges") or ():
+            s, e, c = r.get("startOffset"), r.get("endOffset"), r.get("count")
+            if isinstance(s, int) and isinstance(e, int) and e > s:
+                raw.append((s, e, int(c or 0)))
+    if not raw:
+        return [], 0
+    # Outer ranges first at equal starts so inner ones land on top of the stack.
+    raw.sort(key=lambda r: (r[0], -r[1]))
+    used: list[Range] = []
+    stack: list[tuple[int, int]] = []  # (end, count)
+    pos = 0
+
+    def _emit(a: int, b: int, count: int) -> None:
+        if b > a and count > 0:
+            used.append((a, b))
+
+    for start, end, count in raw:
+        while stack and stack[-1][0] <= start:
+            top_end, top_count = stack.pop()
+            _emit(pos, top_end, top_count)
+            pos = max(pos, top_end)
+        if stack:
+            _emit(pos, start, stack[-1][1])
+        pos = start
+        stack.append((end, count))
+    while stack:
+        top_end, top_count = stack.pop()
+        _emit(pos, top_end, top_count)
+        pos = max(pos, top_end)
+    return merge_ranges(used), max(e for _s, e, _c in raw)
+
+
+class _Resources:
+    """Per-URL aggregation: union same-length copies, sum distinct sources."""
+
+    def __init__(self, kind: str) -> None:
+        self.kind = kind
+        self.by_source: dict[tuple[str, int], list[Range]] = {}
+
+    def add(self, url: str, length: int, used: list[Range]) -> None:
+        key = (url, length)
+        prev = self.by_source.get(key)
+        self.by_source[key] = merge_ranges([*prev, *used]) if prev else used
+
+    def rows(self) -> list[dict[str, Any]]:
+        per_url: dict[str, list[int]] = {}
+        for (url, length), used in self.by_source.items():
+            acc = per_url.setdefault(url, [0, 0])
+            acc[0] += length
+            acc[1] += min(length, ranges_bytes(used))
+        return [
+            {
+                "type": self.kind,
+                "url": redact_url_brief(url),
+                "totalBytes": total,
+                "unusedBytes": total - used,
+                "unusedPct": round(100.0 * (total - used) / total, 1) if total else 0.0,
+            }
+            for url, (total, used) in per_url.items()
+        ]
+
+
+def _totals(rows: list[dict[str, Any]]) -> dict[str, Any]:
+    total = sum(r["totalBytes"] for r in rows)
+    unused = sum(r["unusedBytes"] for r in rows)
+    return {
+        "resources": len(rows),
+        "totalBytes": total,
+        "usedBytes": total - unused,
+        "unusedBytes": unused,
+        "unusedPct": round(100.0 * unused / total, 1) if total else 0.0,
+    }
+
+
+def summarize_page_coverage(
+    js_result: list[dict[str, Any]],
+    rule_usage: list[dict[str, Any]],
+    sheets: dict[str, dict[str, Any]],
+    *,
+    page_url: str = "",
+    top: int = 10,
+    sink: Any = None,
+) -> dict[str, Any]:
+    """Aggregate raw coverage into per-resource unused bytes (ranked).
+
+    `sheets` maps styleSheetId -> CSSStyleSheetHeader (sourceURL, length, isInline).
+    `sink`, when given, receives one JSON line per script/stylesheet with its used ranges.
+    """
+    js = _Resources("js")
+    for script in js_result:
+        url = script.get("url") if isinstance(script, dict) else None
+        if not isinstance(url, str) or not url:
+            continue  # eval / anonymous code
+        used, length = js_used_ranges(script.get("functions") or [])
+        if length:
+            js.add(url, length, used)
+            if sink is not None:
+                sink.write(json.dumps({"type": "js", "url": url, "bytes": length, "used": used}) + "\n")
+
+    css = _Resources("css")
+    rules: dict[str, list[tuple[Range, bool]]] = {}
+    for rule in rule_usage:
+        sid, s, e = rule.get("styleSheetId"), rule.get("startOffset"), rule.get("endOffset")
+        if isinstance(sid, str) and isinstance(s, (int, float)) and isinstance(e, (int, float)):
+            rules.setdefault(sid, []).append(((int(s), int(e)), bool(rule.get("used"))))
+    for sid, items in rules.items():
+        header = sheets.get(sid) or {}
+        url = header.get("sourceURL") or (page_url if header.get("isInline") else "") or f"(stylesheet {sid})"
+        length = header.get("length")
+        length = int(length) if isinstance(length, (int, float)) else max(e for (_s, e), _u in items)
+        used = merge_ranges(r for r, flag in items if flag)
+        css.add(str(url), length, used)
+        if sink is not None:
+            sink.write(json.dumps({"type": "css", "url": url, "bytes": length, "used": used}) + "\n")
+
+    js_rows, css_rows = js.rows(), css.rows()
+    ranked = sorted([*js_rows, *css_rows], key=lambda r: r["unusedBytes"], reverse=True)
+    return {
+        "js": _totals(js_rows),
+        "css": _totals(css_rows),
+        "topUnused": ranked[: max(1, min(int(top), 50))],
+    }
+
+
+def _drain_sheet_headers(session: Any, sheets: dict[str, dict[str, Any]]) -> None:
+    while True:
+        ev = session.wait_for_event("CSS.styleSheetAdded", timeout=0.0)
+        header = ev.get("header") if isinstance(ev, dict) else None
+        if not isinstance(header, dict):
+            return
+        if isinstance(header.get("styleSheetId"), str):
+            sheets[header["styleSheetId"]] = header
+
+
+def get_page_coverage(
+    config: BrowserConfig,
+    *,
+    reload: bool = True,
+    window_ms: int = 1000,
+    top: int = 10,
+) -> dict[str, Any]:
+    """Measure shipped-but-unused JS/CSS bytes of the current page.
+
+    Args:
+        config: Browser configuration
+        reload: Reload under instrumentation so load-time code counts as used (recommended)
+        window_ms: Extra recording time after load (clamped to [0..30000])
+        top: Resources in the ranked `topUnused` list (clamped to [1..50])
+
+    Returns:
+        Dictionary with `coverage` summary plus `coveragePath` pointing at a JSONL file of
+        per-resource used ranges (caller owns and removes it)
+    """
+    try:
+        window_ms = max(0, min(int(window_ms), _MAX_WINDOW_MS))
+    except (TypeError, ValueError) as exc:
+        raise SmartToolError(
+            tool="page",
+            action="coverage",
+            reason=f"Invalid coverage options: {exc}",
+            suggestion="Use page(detail='audit', coverage=true)",
+        ) from exc
+
+    started = time.perf_counter()
+    sheets: dict[str, dict[str, Any]] = {}
+    with get_session(config, timeout=20.0 + window_ms / 1000.0, ensure_diagnostics=False) as (session, target):
+        try:
+            session.send("Profiler.enable")
+            session.send("Profiler.startPreciseCoverage", {"callCount": False, "detailed": True})
+            session.send("DOM.enable")
+            session.send("CSS.enable")
+            session.send("CSS.startRuleUsageTracking")
+            if reload:
+                session.send("Page.reload", {"ignoreCache": False})
+                session.wait_load(timeout=15.0)
+            if window_ms:
+                time.sleep(window_ms / 1000.0)
+            js_raw = session.send("Profiler.takePreciseCoverage")
+            css_raw = session.send("CSS.stopRuleUsageTracking")
+            _drain_sheet_headers(session, sheets)
+            page_url = str(session.eval_js("location.href") or "")
+        except Exception as exc:  # noqa: BLE001
+            raise SmartToolError(
+                tool="page",
+                action="coverage",
+                reason=str(exc),
+                suggestion="Ensure the page is responsive (no open dialog) and retry",
+            ) from exc
+        finally:
+            with suppress(Exception):
+                session.send("Profiler.stopPreciseCoverage")
+            with suppress(Exception):
+                session.send("Profiler.disable")
+            with suppress(Exception):
+                session.send("CSS.disable")
+
+    fd, path = tempfile.mkstemp(prefix="mcp-coverage-", suffix=".jsonl")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as sink:
+            summary = summarize_page_coverage(
+                js_raw.get("result") or [],
+                css_raw.get("ruleUsage") or [],
+                sheets,
+                page_url=page_url,
+                top=top,
+                sink=sink,
+            )
+    except Exception:
+        with suppress(OSError):
+            os.unlink(path)
+        raise
+
+    summary["reloaded"] = bool(reload)
+    summary["durationMs"] = int((time.perf_counter() - started) * 1000)
+    return {"coverage": summary, "coveragePath": path, "target": target["id"]}
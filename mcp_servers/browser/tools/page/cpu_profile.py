@@ -0,0 +1,243 @@
+"""CPU profile (`Profiler.stop` / .cpuprofile) summarizer.
+
+A profile is a flat node table (call tree) plus a sample stream (node id per sample,
+µs deltas between samples). Everything here is O(nodes + samples) with the per-sample
+work kept to C-level builtins where possible:
+- sample timestamps via `itertools.accumulate`, durations via slicing
+- node ids mapped to dense indices once; per-sample time accumulated by index
+- inclusive time in one reverse-BFS pass; function totals count each function once
+  per stack (recursion-safe)
+- long tasks: contiguous runs of non-idle samples >= 50 ms, attributed to the
+  functions/URLs with the most self time inside the run
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from itertools import accumulate
+from typing import Any
+
+from ...server.redaction import redact_url_brief
+
+LONG_TASK_MS = 50.0
+_IDLE = {"(idle)", "(root)"}
+_CATEGORIES = {"(idle)", "(program)", "(garbage collector)", "(root)"}
+
+FnKey = tuple[str, str, int, int]
+
+
+def _fn_key(call_frame: dict[str, Any]) -> FnKey:
+    name = call_frame.get("functionName") or "(anonymous)"
+    url = call_frame.get("url") or ""
+    line = call_frame.get("lineNumber")
+    col = call_frame.get("columnNumber")
+    return (
+        str(name),
+        str(url),
+        int(line) if isinstance(line, int) else -1,
+        int(col) if isinstance(col, int) else -1,
+    )
+
+
+def _fn_item(key: FnKey, self_us: float, total_us: float, span_us: float) -> dict[str, Any]:
+    name, url, line, col = key
+    return {
+        "function": name,
+        **({"url": redact_url_brief(url)} if url else {}),
+        # CDP positions are 0-based; report 1-based like DevTools.
+        **({"line": line + 1} if line >= 0 else {}),
+        **({"column": col + 1} if col >= 0 else {}),
+        "selfMs": round(self_us / 1000.0, 2),
+        "totalMs": round(total_us / 1000.0, 2),
+        "selfPct": round(100.0 * self_us / span_us, 1) if span_us else 0.0,
+    }
+
+
+def summarize_cpu_profile(
+    profile: dict[str, Any], *, top: int = 15, long_task_ms: float = LONG_TASK_MS
+) -> dict[str, Any]:
+    """Return a bounded hot-spot summary of a CDP CPU profile."""
+    top = max(1, min(int(top), 100))
+    nodes = profile.get("nodes") if isinstance(profile.get("nodes"), list) else []
+    samples = profile.get("samples") if isinstance(profile.get("samples"), list) else []
+    deltas = profile.get("timeDeltas") if isinstance(profile.get("timeDeltas"), list) else []
+    start = profile.get("startTime") if isinstance(profile.get("startTime"), (int, float)) else 0
+    end = profile.get("endTime") if isinstance(profile.get("endTime"), (int, float)) else start
+
+    # ── call tree ────────────────────────────────────────────────────────────
+    n = len(nodes)
+    dense: dict[int, int] = {}
+    keys: list[FnKey] = []
+    for i, node in enumerate(nodes):
+        dense[node.get("id")] = i
+        cf = node.get("callFrame")
+        keys.append(_fn_key(cf if isinstance(cf, dict) else {}))
+    children: list[list[int]] = [[] for _ in range(n)]
+    has_parent = [False] * n
+    for i, node in enumerate(nodes):
+        for cid in node.get("children") or ():
+            j = dense.get(cid)
+            if j is not None:
+                children[i].append(j)
+                has_parent[j] = True
+    roots = [i for i in range(n) if not has_parent[i]]
+
+    # ── samples → per-node self time ─────────────────────────────────────────
+    m = min(len(samples), len(deltas))
+    self_us = [0.0] * n
+    long_tasks: list[dict[str, Any]] = []
+    if m and n:
+        stamps = list(accumulate(deltas[:m], initial=start))[1:]
+        durations = [max(0, d) for d in deltas[1:m]]
+        durations.append(max(0, end - stamps[-1]))
+        idle_idx = {i for i in range(n) if keys[i][0] in _IDLE}
+        fallback = roots[0] if roots else 0
+        idx = [dense.get(s, fallback) for s in samples[:m]]
+        for i, d in zip(idx, durations, strict=True):
+            self_us[i] += d
+        long_tasks = _long_tasks(idx, stamps, durations, idle_idx, keys, start, long_task_ms)
+
+    # ── inclusive time (children before parents) ─────────────────────────────
+    order: list[int] = []
+    queue = list(roots)
+    while queue:
+        i = queue.pop()
+        order.append(i)
+        queue.extend(children[i])
+    incl = list(self_us)
+    parent_of = [-1] * n
+    for i in range(n):
+        for j in children[i]:
+            parent_of[j] = i
+    for i in reversed(order):
+        p = parent_of[i]
+        if p >= 0:
+            incl[p] += incl[i]
+
+    # ── function aggregation ─────────────────────────────────────────────────
+    fn_self: dict[FnKey, float] = defaultdict(float)
+    fn_total: dict[FnKey, float] = defaultdict(float)
+    url_self: dict[str, float] = defaultdict(float)
+    for i in range(n):
+        if self_us[i]:
+            fn_self[keys[i]] += self_us[i]
+            if keys[i][1]:
+                url_self[keys[i][1]] += self_us[i]
+    # Total time: a function counts once per stack (skip nodes with the same key above them).
+    active: dict[FnKey, int] = defaultdict(int)
+    stack: list[tuple[int, bool]] = [(r, False) for r in roots]
+    while stack:
+        i, leaving = stack.pop()
+        k = keys[i]
+        if leaving:
+            active[k] -= 1
+            continue
+        if not active[k]:
+            fn_total[k] += incl[i]
+        active[k] += 1
+        stack.append((i, True))
+        stack.extend((c, False) for c in children[i])
+
+    span_us = float(max(0, end - start)) or float(sum(self_us))
+    categories = {
+        name.strip("()"): round(sum(v for k, v in fn_self.items() if k[0] == name) / 1000.0, 2)
+        for name in _CATEGORIES
+        if name != "(root)"
+    }
+    js_keys = [k for k in fn_self if k[0] not in _CATEGORIES]
+    by_self = sorted(js_keys, key=lambda k: fn_self[k], reverse=True)[:top]
+    by_total = sorted((k for k in fn_total if k[0] not in _CATEGORIES), key=lambda k: fn_total[k], reverse=True)[:top]
+    urls = sorted(url_self.items(), key=lambda kv: kv[1], reverse=True)[:top]
+    busy_us = sum(fn_self[k] for k in js_keys) + sum(
+        v for k, v in fn_self.items() if k[0] in {"(program)", "(garbage collector)"}
+    )
+
+    return {
+        "durationMs": round(span_us / 1000.0, 2),
+        "samples": m,
+        "nodes": n,
+        "busyMs": round(busy_us / 1000.0, 2),
+        "categoriesMs": categories,
+        "topSelf": [_fn_item(k, fn_self[k], fn_total.get(k, fn_self[k]), span_us) for k in by_self],
+        "topTotal": [_fn_item(k, fn_self.get(k, 0.0), fn_total[k], span_us) for k in by_total],
+        "topUrls": [
+            {"url": redact_url_brief(u), "selfMs": round(v / 1000.0, 2), "selfPct": round(100.0 * v / span_us, 1)}
+            for u, v in urls
+        ],
+        "longTasks": long_tasks,
+    }
+
+
+def _long_tasks(
+    idx: list[int],
+    stamps: list[float],
+    durations: list[float],
+    idle_idx: set[int],
+    keys: list[FnKey],
+    start: float,
+    long_task_ms: float,
+    *,
+    max_tasks: int = 10,
+) -> list[dict[str, Any]]:
+    """Contiguous non-idle sample runs >= long_task_ms, with their top self-time functions."""
+    threshold_us = long_task_ms * 1000.0
+    runs: list[tuple[int, int, float]] = []
+    run_start = -1
+    run_us = 0.0
+    for pos, i in enumerate(idx):
+        if i in idle_idx:
+            if run_start >= 0 and run_us >= threshold_us:
+                runs.append((run_start, pos, run_us))
+            run_start, run_us = -1, 0.0
+            continue
+        if run_start < 0:
+            run_start = pos
+        run_us += durations[pos]
+    if run_start >= 0 and run_us >= threshold_us:
+        runs.append((run_start, len(idx), run_us))
+
+    runs.sort(key=lambda r: r[2], reverse=True)
+    out: list[dict[str, Any]] = []
+    for lo, hi, total in runs[:max_tasks]:
+        acc: dict[FnKey, float] = defaultdict(float)
+        for pos in range(lo, hi):
+            acc[keys[idx[pos]]] += durations[pos]
+        hot = sorted(acc.items(), key=lambda kv: kv[1], reverse=True)[:3]
+        out.append(
+            {
+                "startMs": round((stamps[lo] - start) / 1000.0, 2),
+                "durationMs": round(total / 1000.0, 2),
+                "top": [
+                    {
+                        "function": k[0],
+                        **({"url": redact_url_brief(k[1])} if k[1] else {}),
+                        "selfMs": round(v / 1000.0, 2),
+                    }
+                    for k, v in hot
+                ],
+            }
+        )
+    out.sort(key=lambda t: t["startMs"])
+    return out
+
+
+def summarize_coverage(result: Any, *, top: int = 10) -> dict[str, Any]:
+    """Summarize `Profiler.getBestEffortCoverage` (functions executed per script)."""
+    scripts = result.get("result") if isinstance(result, dict) else None
+    if not isinstance(scripts, list):
+        return {"available": False}
+    rows = []
+    for script in scripts:
+        fns = script.get("functions") if isinstance(script, dict) else None
+        if not isinstance(fns, list) or not script.get("url"):
+            continue
+        executed = sum(1 for f in fns if any((r.get("count") or 0) > 0 for r in f.get("ranges") or ()))
+        rows.append({"url": redact_url_brief(str(script["url"])), "functions": len(fns), "executed": executed})
+    rows.sort(key=lambda r: r["functions"] - r["executed"], reverse=True)
+    return {
+        "available": True,
+        "scripts": len(rows),
+        "functions": sum(r["functions"] for r in rows),
+        "executed": sum(r["executed"] for r in rows),
+        "leastUsed": rows[: max(1, min(int(top), 50))],
+    }
@@ -29,6 +29,9 @@ def get_page_diagnostics(
     limit: int = 50,
     sort: str = "start",
     clear: bool = False,
+    source: str = "live",
+    since_seq: int | None = None,
+    tab_id: str | None = None,
 ) -> dict[str, Any]:
     """Return a diagnostics snapshot for the current page.
 
@@ -36,8 +39,16 @@ def get_page_diagnostics(
         config: Browser configuration
         limit: Max events per category (console/errors/network). Clamped to [0..200].
         clear: Clear buffers after returning the snapshot.
+        source: "live" (Tier-1/Tier-0 buffers) or "journal" (persistent Tier-0 journal).
+        since_seq: Tier-0 `seq` cursor; preferred over `since`. Live reads with a seq cursor
+            come from the Tier-0 buffers (Tier-1 records carry no seq).
+        tab_id: Journal to read (default: current tab); may name a closed/recreated tab.
     """
 
+    if str(source or "live") == "journal":
+        return _journal_diagnostics(since=since, since_seq=since_seq, limit=limit, tab_id=tab_id)
+    seq_cursor = _seq_cursor(since_seq)
+
     offset = max(0, int(offset))
     limit = max(0, min(int(limit), 200))
     sort = str(sort or "start")
@@ -86,7 +97,7 @@ def get_page_diagnostics(
                 "})()"
             )
             snapshot = None
-            if not dialog_blocking:
+            if not dialog_blocking and seq_cursor is None:
                 try:
                     snapshot = session.eval_js(js)
                 except Exception:
@@ -125,6 +136,7 @@ def get_page_diagnostics(
                 snapshot = session_manager.tier0_snapshot(
                     session.tab_id,
                     since=since,
+                    since_seq=seq_cursor,
                     offset=offset,
                     limit=limit,
                     url=url if isinstance(url, str) else None,
@@ -189,6 +201,49 @@ def get_page_diagnostics(
             ) from exc
 
 
+def _seq_cursor(since_seq: Any) -> int | None:
+    if since_seq is None:
+        return None
+    try:
+        return max(0, int(since_seq))
+    except (TypeError, ValueError) as exc:
+        raise SmartToolError(
+            tool="page",
+            action="diagnostics",
+            reason=f"Invalid since_seq: {exc}",
+            suggestion="Pass since_seq=<seq> from a previous response (snapshot `seq` / journal `nextSinceSeq`)",
+        ) from exc
+
+
+def _journal_diagnostics(
+    *, since: int | None, since_seq: int | None, limit: int, tab_id: str | None = None
+) -> dict[str, Any]:
+    """Read a tab's Tier-0 journal (works after the tab's buffers, or the tab, are gone)."""
+    tab_id = str(tab_id) if tab_id else session_manager.tab_id
+    if not tab_id:
+        raise SmartToolError(
+            tool="page",
+            action="diagnostics",
+            reason="No current tab to read a journal for",
+            suggestion="Pass tab_id=<id>, or navigate / switch to the tab first, then retry with source='journal'",
+        )
+    try:
+        seq_i = int(since_seq) if since_seq is not None else None
+        since_i = int(since) if since is not None and seq_i is None else None
+        limit_i = max(1, min(int(limit), 1000))
+    except (TypeError, ValueError) as exc:
+        raise SmartToolError(
+            tool="page",
+            action="diagnostics",
+            reason=f"Invalid journal cursor: {exc}",
+            suggestion="Pass since_seq=<seq> from a previous response (or since=<ms cursor>)",
+        ) from exc
+    out = session_manager.tier0_journal(tab_id, since_seq=seq_i, since=since_i, limit=limit_i)
+    if not out.get("journal", {}).get("segments") and os.environ.get("MCP_TIER0_JOURNAL", "0") != "1":
+        out["note"] = "Journal is disabled; set MCP_TIER0_JOURNAL=1 to persist Tier-0 events"
+    return {"diagnostics": out, "target": tab_id, "cursor": out.get("nextSinceSeq"), "source": "journal"}
+
+
 _HYDRATION_PATTERNS = [
     re.compile(r"hydration", re.IGNORECASE),
     re.compile(r"did not match", re.IGNORECASE),
@@ -0,0 +1,510 @@
+"""DOMSnapshot-based bulk page capture engine.
+
+Why this exists:
+- In-page perception walks call getComputedStyle/getBoundingClientRect per element and force layout repeatedly.
+- `DOMSnapshot.captureSnapshot` returns the flattened DOM, layout boxes, computed styles and text in ONE CDP call.
+
+Design:
+- Decode the string table + columnar arrays once into compact typed arrays (`array.array`), not per-node dicts.
+- Derived indexes are linear (pre-order parent indices let us propagate ownership in one pass).
+- All queries (visible text, links, locators, hit-testing) are answered from the decoded snapshot
+  without further page round trips.
+"""
+
+from __future__ import annotations
+
+import time
+from array import array
+from typing import Any
+
+# Computed styles requested from Chrome (column order matters: styles[i] follow this list).
+# Border/padding place an iframe's content box (child document origin) inside its owner.
+SNAPSHOT_STYLES: tuple[str, ...] = (
+    "display",
+    "visibility",
+    "opacity",
+    "cursor",
+    "border-left-width",
+    "border-top-width",
+    "padding-left",
+    "padding-top",
+)
+
+_ELEMENT_NODE = 1
+_TEXT_NODE = 3
+
+_INTERACTIVE_TAGS = {"A", "BUTTON", "INPUT", "SELECT", "TEXTAREA", "SUMMARY"}
+_INTERACTIVE_ROLES = {
+    "button",
+    "link",
+    "checkbox",
+    "radio",
+    "switch",
+    "tab",
+    "menuitem",
+    "option",
+    "textbox",
+    "searchbox",
+    "combobox",
+}
+
+
+def capture_snapshot(session: Any) -> DomSnapshot:
+    """Capture and decode a DOMSnapshot of the current page (one CDP call)."""
+    t0 = time.perf_counter()
+    raw = session.send(
+        "DOMSnapshot.captureSnapshot",
+        {"computedStyles": list(SNAPSHOT_STYLES), "includePaintOrder": True, "includeDOMRects": False},
+    )
+    capture_ms = (time.perf_counter() - t0) * 1000.0
+    snap = DomSnapshot.decode(raw if isinstance(raw, dict) else {})
+    snap.capture_ms = capture_ms
+    return snap
+
+
+def _ints(values: Any) -> array:
+    out = array("i")
+    if isinstance(values, list):
+        out.extend(int(v) if isinstance(v, (int, float)) else -1 for v in values)
+    return out
+
+
+class SnapshotDocument:
+    """One decoded DocumentSnapshot (main document or iframe document)."""
+
+    __slots__ = (
+        "url",
+        "title",
+        "frame_id",
+        "scroll_x",
+        "scroll_y",
+        "offset_x",
+        "offset_y",
+        "content_doc",
+        "parent",
+        "node_type",
+        "node_name",
+        "node_value",
+        "backend_id",
+        "attr_offsets",
+        "attr_flat",
+        "clickable",
+        "input_value",
+        "layout_node",
+        "layout_bounds",
+        "layout_text",
+        "layout_paint",
+        "layout_styles",
+        "node_layout",
+    )
+
+    def __init__(self, doc: dict[str, Any], strings: list[str]) -> None:
+        def _s(idx: Any) -> str:
+            return strings[idx] if isinstance(idx, int) and 0 <= idx < len(strings) else ""
+
+        self.url = _s(doc.get("documentURL"))
+        self.title = _s(doc.get("title"))
+        self.frame_id = _s(doc.get("frameId"))
+        self.scroll_x = float(doc.get("scrollOffsetX") or 0.0)
+        self.scroll_y = float(doc.get("scrollOffsetY") or 0.0)
+        # Viewport position of this document's origin (set by DomSnapshot for iframe documents).
+        self.offset_x = 0.0
+        self.offset_y = 0.0
+
+        nodes = doc.get("nodes") if isinstance(doc.get("nodes"), dict) else {}
+        self.parent = _ints(nodes.get("parentIndex"))
+        self.node_type = _ints(nodes.get("nodeType"))
+        self.node_name = _ints(nodes.get("nodeName"))
+        self.node_value = _ints(nodes.get("nodeValue"))
+        self.backend_id = _ints(nodes.get("backendNodeId"))
+        n = len(self.parent)
+
+        # Attributes: flat [name, value, name, value, ...] string indices + per-node offsets.
+        self.attr_offsets = array("i", [0])
+        self.attr_flat = array("i")
+        attrs = nodes.get("attributes") if isinstance(nodes.get("attributes"), list) else []
+        for i in range(n):
+            row = attrs[i] if i < len(attrs) and isinstance(attrs[i], list) else ()
+            self.attr_flat.extend(int(v) for v in row)
+            self.attr_offsets.append(len(self.attr_flat))
+
+        self.clickable = bytearray(n)
+        rare_click = nodes.get("isClickable") if isinstance(nodes.get("isClickable"), dict) else {}
+        for i in rare_click.get("index") or ():
+            if isinstance(i, int) and 0 <= i < n:
+                self.clickable[i] = 1
+
+        # (i)frame owner node -> index of its content document in `documents`.
+        self.content_doc: dict[int, int] = {}
+        rare_doc = nodes.get("contentDocumentIndex") if isinstance(nodes.get("contentDocumentIndex"), dict) else {}
+        for i, v in zip(rare_doc.get("index") or (), rare_doc.get("value") or (), strict=False):
+            if isinstance(i, int) and isinstance(v, int):
+                self.content_doc[i] = v
+
+        self.input_value: dict[int, int] = {}
+        rare_input = nodes.get("inputValue") if isinstance(nodes.get("inputValue"), dict) else {}
+        for i, v in zip(rare_input.get("index") or (), rare_input.get("value") or (), strict=False):
+            if isinstance(i, int) and isinstance(v, int):
+                self.input_value[i] = v
+
+        layout = doc.get("layout") if isinstance(doc.get("layout"), dict) else {}
+        self.layout_node = _ints(layout.get("nodeIndex"))
+        self.layout_text = _ints(layout.get("text"))
+        self.layout_paint = _ints(layout.get("paintOrders"))
+        self.layout_bounds = array("d")
+        for rect in layout.get("bounds") or ():
+            if isinstance(rect, list) and len(rect) >= 4:
+                self.layout_bounds.extend(float(v) for v in rect[:4])
+            else:
+                self.layout_bounds.extend((0.0, 0.0, 0.0, 0.0))
+
+        # Columnar computed styles: one int array per requested property.
+        styles = layout.get("styles") if isinstance(layout.get("styles"), list) else []
+        self.layout_styles: dict[str, array] = {}
+        for col, prop in enumerate(SNAPSHOT_STYLES):
+            column = array("i")
+            column.extend(
+                int(row[col]) if isinstance(row, list) and col < len(row) and isinstance(row[col], int) else -1
+                for row in styles
+            )
+            self.layout_styles[prop] = column
+
+        self.node_layout = array("i", [-1]) * n
+        for li, ni in enumerate(self.layout_node):
+            if 0 <= ni < n and self.node_layout[ni] < 0:
+                self.node_layout[ni] = li
+
+    def __len__(self) -> int:
+        return len(self.parent)
+
+    # ── primitive accessors ────────────────────────────────────────────────────
+
+    def tag(self, i: int, strings: list[str]) -> str:
+        idx = self.node_name[i]
+        return strings[idx].upper() if 0 <= idx < len(strings) else ""
+
+    def attrs(self, i: int, strings: list[str]) -> dict[str, str]:
+        out: dict[str, str] = {}
+        a, b = self.attr_offsets[i], self.attr_offsets[i + 1]
+        for k in range(a, b - 1, 2):
+            ni, vi = self.attr_flat[k], self.attr_flat[k + 1]
+            if 0 <= ni < len(strings):
+                out[strings[ni].lower()] = strings[vi] if 0 <= vi < len(strings) else ""
+        return out
+
+    def bounds(self, li: int) -> tuple[float, float, float, float]:
+        b = self.layout_bounds
+        k = li * 4
+        return b[k], b[k + 1], b[k + 2], b[k + 3]
+
+    def style(self, li: int, prop: str, strings: list[str]) -> str:
+        column = self.layout_styles.get(prop)
+        if column is None or li >= len(column):
+            return ""
+        idx = column[li]
+        return strings[idx] if 0 <= idx < len(strings) else ""
+
+    def is_rendered(self, li: int, strings: list[str]) -> bool:
+        _x, _y, w, h = self.bounds(li)
+        if w <= 0 or h <= 0:
+            return False
+        if self.style(li, "visibility", strings) in {"hidden", "collapse"}:
+            return False
+        return self.style(li, "opacity", strings) not in {"0"}
+
+    def px(self, li: int, prop: str, strings: list[str]) -> float:
+        value = self.style(li, prop, strings)
+        try:
+            return float(value[:-2]) if value.endswith("px") else 0.0
+        except ValueError:
+            return 0.0
+
+
+class DomSnapshot:
+    """Decoded DOMSnapshot: string table + per-document typed arrays."""
+
+    __slots__ = ("strings", "documents", "capture_ms", "decode_ms")
+
+    def __init__(self, strings: list[str], documents: list[SnapshotDocument]) -> None:
+        self.strings = strings
+        self.documents = documents
+        self.capture_ms = 0.0
+        self.decode_ms = 0.0
+
+    @classmethod
+    def decode(cls, raw: dict[str, Any]) -> DomSnapshot:
+        t0 = time.perf_counter()
+        strings_raw = raw.get("strings") if isinstance(raw.get("strings"), list) else []
+        strings = [s if isinstance(s, str) else "" for s in strings_raw]
+        docs_raw = raw.get("documents") if isinstance(raw.get("documents"), list) else []
+        documents = [SnapshotDocument(d, strings) for d in docs_raw if isinstance(d, dict)]
+        snap = cls(strings, documents)
+        snap._place_frames()
+        snap.decode_ms = (time.perf_counter() - t0) * 1000.0
+        return snap
+
+    def summary(self) -> dict[str, Any]:
+        main = self.documents[0] if self.documents else None
+        return {
+            "documents": len(self.documents),
+            "nodes": sum(len(d) for d in self.documents),
+            "layoutNodes": sum(len(d.layout_node) for d in self.documents),
+            "strings": len(self.strings),
+            **({"url": main.url, "title": main.title} if main else {}),
+            "captureMs": round(self.capture_ms, 1),
+            "decodeMs": round(self.decode_ms, 1),
+        }
+
+    def _place_frames(self) -> None:
+        """Viewport offsets of iframe documents: owner box + border + padding, nested (parents first)."""
+        docs = self.documents
+        strings = self.strings
+        queue = [0] if docs else []
+        placed = {0}
+        for di in queue:
+            doc = docs[di]
+            for ni, child in doc.content_doc.items():
+                li = doc.node_layout[ni] if 0 <= ni < len(doc) else -1
+                if li < 0 or not (0 <= child < len(docs)) or child in placed:
+                    continue
+                x, y, _w, _h = doc.bounds(li)
+                inner = docs[child]
+                inner.offset_x = (
+                    doc.offset_x
+                    + x
+                    - doc.scroll_x
+                    + doc.px(li, "border-left-width", strings)
+                    + doc.px(li, "padding-left", strings)
+                )
+                inner.offset_y = (
+                    doc.offset_y
+                    + y
+                    - doc.scroll_y
+                    + doc.px(li, "border-top-width", strings)
+                    + doc.px(li, "padding-top", strings)
+                )
+                placed.add(child)
+                queue.append(child)
+
+    # ── derived views ──────────────────────────────────────────────────────────
+
+    def _owner_text(self, doc: SnapshotDocument, is_owner: bytearray) -> dict[int, list[str]]:
+        """Collect rendered text per nearest owner ancestor (single pre-order pass)."""
+        strings = self.strings
+        owner = array("i", [-1]) * len(doc)
+        texts: dict[int, list[str]] = {}
+        for i in range(len(doc)):
+            p = doc.parent[i]
+            owner[i] = i if is_owner[i] else (owner[p] if 0 <= p < i else -1)
+            if doc.node_type[i] != _TEXT_NODE or owner[i] < 0:
+                continue
+            li = doc.node_layout[i]
+            if li < 0:
+                continue
+            ti = doc.layout_text[li] if li < len(doc.layout_text) else -1
+            vi = ti if ti >= 0 else doc.node_value[i]
+            text = strings[vi] if 0 <= vi < len(strings) else ""
+            if text.strip():
+                texts.setdefault(owner[i], []).append(text)
+        return texts
+
+    def visible_text(self, *, max_chars: int = 20_000) -> dict[str, Any]:
+        """Rendered text of the main document in layout order (bounded)."""
+        if not self.documents:
+            return {"text": "", "chars": 0, "truncated": False}
+        doc = self.documents[0]
+        strings = self.strings
+        parts: list[str] = []
+        size = 0
+        truncated = False
+        for li, ni in enumerate(doc.layout_node):
+            if not (0 <= ni < len(doc)) or doc.node_type[ni] != _TEXT_NODE:
+                continue
+            ti = doc.layout_text[li] if li < len(doc.layout_text) else -1
+            text = " ".join((strings[ti] if 0 <= ti < len(strings) else "").split())
+            if not text or not doc.is_rendered(li, strings):
+                continue
+            parts.append(text)
+            size += len(text) + 1
+            if size >= max_chars:
+                truncated = True
+                break
+        out = " ".join(parts)
+        return {"text": out[:max_chars], "chars": len(out[:max_chars]), "truncated": truncated}
+
+    def links(self) -> list[dict[str, Any]]:
+        """Rendered anchors with href across all documents (deduped by href, document order)."""
+        out: list[dict[str, Any]] = []
+        seen: set[str] = set()
+        strings = self.strings
+        for di, doc in enumerate(self.documents):
+            is_link = bytearray(len(doc))
+            hrefs: dict[int, str] = {}
+            for i in range(len(doc)):
+                if doc.node_type[i] == _ELEMENT_NODE and doc.tag(i, strings) == "A":
+                    href = doc.attrs(i, strings).get("href")
+                    if href and not href.lower().startswith("javascript:"):
+                        is_link[i] = 1
+                        hrefs[i] = href
+            texts = self._owner_text(doc, is_link)
+            for i, href in hrefs.items():
+                li = doc.node_layout[i]
+                if li < 0 or not doc.is_rendered(li, strings) or href in seen:
+                    continue
+                seen.add(href)
+                text = " ".join(" ".join(texts.get(i, [])).split())
+                out.append(
+                    {
+                        "text": text[:80],
+                        "href": href,
+                        "backendDOMNodeId": doc.backend_id[i],
+                        **({"document": di} if di else {}),
+                    }
+                )
+        return out
+
+    def locators(self, *, kind: str = "all") -> list[dict[str, Any]]:
+        """Interactive, rendered elements with names and centers (main + child documents)."""
+        kind_norm = str(kind or "all").strip().lower()
+        strings = self.strings
+        out: list[dict[str, Any]] = []
+        for di, doc in enumerate(self.documents):
+            n = len(doc)
+            is_inter = bytearray(n)
+            meta: dict[int, tuple[str, str | None, dict[str, str]]] = {}
+            for i in range(n):
+                if doc.node_type[i] != _ELEMENT_NODE:
+                    continue
+                tag = doc.tag(i, strings)
+                attrs = doc.attrs(i, strings)
+                role = attrs.get("role", "").strip().lower()
+                if tag == "A" and "href" not in attrs and role not in _INTERACTIVE_ROLES:
+                    continue
+                if tag in _INTERACTIVE_TAGS or role in _INTERACTIVE_ROLES or doc.clickable[i]:
+                    if tag == "INPUT" and attrs.get("type", "").lower() == "hidden":
+                        continue
+                    k, input_type = _locator_kind(tag, role, attrs)
+                    if kind_norm != "all" and k != kind_norm:
+                        continue
+                    is_inter[i] = 1
+                    meta[i] = (k, input_type, attrs)
+            texts = self._owner_text(doc, is_inter)
+            for i, (k, input_type, attrs) in meta.items():
+                li = doc.node_layout[i]
+                if li < 0 or not doc.is_rendered(li, strings):
+                    continue
+                x, y, w, h = doc.bounds(li)
+                text = " ".join(" ".join(texts.get(i, [])).split())
+                vi = doc.input_value.get(i, -1)
+                name = (
+                    attrs.get("aria-label")
+                    or text
+                    or attrs.get("placeholder")
+                    or attrs.get("title")
+                    or attrs.get("alt")
+                    or (strings[vi] if k == "button" and 0 <= vi < len(strings) else "")
+                    or attrs.get("name")
+                    or ""
+                )
+                backend_id = doc.backend_id[i]
+                out.append(
+                    {
+                        "kind": k,
+                        "name": " ".join(name.split())[:120],
+                        "backendDOMNodeId": backend_id,
+                        "domRef": f"dom:{backend_id}",
+                        "center": {
+                            "x": round(doc.offset_x + x + w / 2 - doc.scroll_x, 1),
+                            "y": round(doc.offset_y + y + h / 2 - doc.scroll_y, 1),
+                        },
+                        **({"inputType": input_type} if input_type else {}),
+                        **({"id": attrs["id"]} if attrs.get("id") else {}),
+                        **({"document": di} if di else {}),
+                    }
+                )
+        return out
+
+    def _topmost(self, doc: SnapshotDocument, x: float, y: float) -> int:
+        """Layout index of the topmost element of `doc` at viewport point (x, y), or -1."""
+        strings = self.strings
+        px = float(x) - doc.offset_x + doc.scroll_x
+        py = float(y) - doc.offset_y + doc.scroll_y
+        best_li = -1
+        best_key: tuple[int, int] = (-1, -1)
+        has_paint = len(doc.layout_paint) == len(doc.layout_node)
+        for li, ni in enumerate(doc.layout_node):
+            if not (0 <= ni < len(doc)) or doc.node_type[ni] != _ELEMENT_NODE:
+                continue
+            bx, by, bw, bh = doc.bounds(li)
+            if not (bx <= px < bx + bw and by <= py < by + bh):
+                continue
+            if doc.style(li, "visibility", strings) == "hidden":
+                continue
+            key = (doc.layout_paint[li] if has_paint else 0, li)
+            if key > best_key:
+                best_key = key
+                best_li = li
+        return best_li
+
+    def hit_test(self, x: float, y: float) -> dict[str, Any] | None:
+        """Topmost element at viewport point (x, y) (max paint order wins), descending into iframes."""
+        if not self.documents:
+            return None
+        di = 0
+        doc = self.documents[0]
+        best_li = self._topmost(doc, x, y)
+        if best_li < 0:
+            return None
+        seen = {0}
+        while True:
+            child = doc.content_doc.get(doc.layout_node[best_li], -1)
+            if not (0 <= child < len(self.documents)) or child in seen:
+                break
+            seen.add(child)
+            inner_li = self._topmost(self.documents[child], x, y)
+            if inner_li < 0:
+                break
+            di, doc, best_li = child, self.documents[child], inner_li
+        strings = self.strings
+        ni = doc.layout_node[best_li]
+        attrs = doc.attrs(ni, strings)
+        bx, by, bw, bh = doc.bounds(best_li)
+        chain: list[str] = []
+        p = ni
+        while 0 <= p < len(doc) and len(chain) < 6:
+            if doc.node_type[p] == _ELEMENT_NODE:
+                chain.append(doc.tag(p, strings).lower())
+            p = doc.parent[p]
+        return {
+            "tag": doc.tag(ni, strings).lower(),
+            "backendDOMNodeId": doc.backend_id[ni],
+            "domRef": f"dom:{doc.backend_id[ni]}",
+            "bounds": {
+                "x": round(doc.offset_x + bx - doc.scroll_x, 1),
+                "y": round(doc.offset_y + by - doc.scroll_y, 1),
+                "w": bw,
+                "h": bh,
+            },
+            "path": chain,
+            **({"document": di} if di else {}),
+            **({"id": attrs["id"]} if attrs.get("id") else {}),
+            **({"role": attrs["role"]} if attrs.get("role") else {}),
+            **({"cursor": doc.style(best_li, "cursor", strings)} if doc.style(best_li, "cursor", strings) else {}),
+        }
+
+
+def _locator_kind(tag: str, role: str, attrs: dict[str, str]) -> tuple[str, str | None]:
+    if tag == "A" or role == "link":
+        return "link", None
+    if tag in {"INPUT", "TEXTAREA", "SELECT"} or role in {"textbox", "searchbox", "combobox"}:
+        input_type = attrs.get("type", "").lower() or ("text" if tag != "SELECT" else "select")
+        if tag == "INPUT" and input_type in {"button", "submit", "reset", "image"}:
+            return "button", None
+        if tag == "TEXTAREA":
+            input_type = "text"
+        if role and tag not in {"INPUT", "TEXTAREA", "SELECT"}:
+            input_type = role
+        return "input", input_type
+    if role in {"checkbox", "radio", "switch"}:
+        return "input", role
+    return "button", None
@@ -6,16 +6,110 @@ Extract structured content like paragraphs, tables, links, headings, images.
 
 from __future__ import annotations
 
+import contextlib
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
 from typing import Any
 
 from ...config import BrowserConfig
 from ..base import SmartToolError, get_session
-from .js_extract import build_extract_js
+from .js_extract import (
+    SESSION_CONTENT_TYPES,
+    build_extract_js,
+    build_extract_page_js,
+    build_extract_release_js,
+    build_extract_session_js,
+)
 
 # Default pagination limits
 DEFAULT_LIMIT = 10
 MAX_LIMIT = 50
 
+# Export chunking (items per Runtime.evaluate while streaming a cursor to disk)
+EXPORT_CHUNK = 500
+
+# Server-side cursor registry: cursor id -> extraction params (used to rebuild after mutation/navigation).
+_CURSORS: OrderedDict[str, dict[str, Any]] = OrderedDict()
+_CURSORS_LOCK = threading.Lock()
+_CURSORS_MAX = 32
+_CURSOR_SEQ = itertools.count(1)
+
+
+def _new_cursor(params: dict[str, Any]) -> str:
+    cursor = f"ex_{int(time.time() * 1000) % 10_000_000}_{next(_CURSOR_SEQ)}"
+    with _CURSORS_LOCK:
+        _CURSORS[cursor] = params
+        while len(_CURSORS) > _CURSORS_MAX:
+            _CURSORS.popitem(last=False)
+    return cursor
+
+
+def _cursor_params(cursor: str) -> dict[str, Any] | None:
+    with _CURSORS_LOCK:
+        params = _CURSORS.get(cursor)
+        if params is not None:
+            _CURSORS.move_to_end(cursor)
+        return dict(params) if params is not None else None
+
+
+def _check_result(result: Any) -> dict[str, Any]:
+    if not result:
+        raise SmartToolError(
+            tool="extract_content",
+            action="evaluate",
+            reason="Extraction returned null",
+            suggestion="Check page has loaded completely",
+        )
+
+    if result.get("error"):
+        raise SmartToolError(
+            tool="extract_content",
+            action="extract",
+            reason=result.get("reason", "Unknown error"),
+            suggestion=result.get("suggestion", "Check parameters"),
+        )
+    return result
+
+
+def _validate_session_type(content_type: str, table_index: int | None) -> None:
+    if content_type not in SESSION_CONTENT_TYPES or (content_type == "table" and table_index is None):
+        raise SmartToolError(
+            tool="extract_content",
+            action="validate",
+            reason=f"cursor/export is not supported for content_type={content_type!r}",
+            suggestion="Use content_type in {main, links, images} or content_type='table' with table_index=N",
+        )
+
+
+def _session_page(session: Any, cursor: str, offset: int, limit: int, *, pinned: bool = False) -> dict[str, Any]:
+    """Read one page from an in-page cursor; rebuild the session once if it was dropped."""
+    result = session.eval_js(build_extract_page_js(cursor, offset, limit))
+    if isinstance(result, dict) and result.get("expired"):
+        params = _cursor_params(cursor)
+        if params is None:
+            raise SmartToolError(
+                tool="extract_content",
+                action="cursor",
+                reason=f"Unknown or expired cursor: {cursor}",
+                suggestion="Start a new extraction session with cursor=true",
+            )
+        js = build_extract_session_js(
+            params["content_type"],
+            params.get("selector"),
+            params.get("table_index"),
+            cursor,
+            offset,
+            limit,
+            content_root_debug=bool(params.get("content_root_debug")),
+            pinned=pinned,
+        )
+        result = _check_result(session.eval_js(js))
+        result["cursorRebuilt"] = True
+    return _check_result(result)
+
 
 def extract_content(
     config: BrowserConfig,
@@ -25,6 +119,7 @@ def extract_content(
     limit: int = DEFAULT_LIMIT,
     table_index: int | None = None,
     content_root_debug: bool = False,
+    cursor: bool | str | None = None,
 ) -> dict[str, Any]:
     """
     Extract structured content from the page with pagination.
@@ -43,6 +138,12 @@ def extract_content(
     - content_type="headings": Document outline
     - content_type="images": Images with metadata (offset/limit)
 
+    CURSOR MODE (main/links/images/table+table_index):
+    - cursor=True: materialize the full item list once in-page and return a `cursor` id
+    - cursor="<id>": read the next page from the cached list (O(limit), no DOM walk)
+    - The in-page cache is dropped on navigation or DOM mutation; a stale cursor
+      is rebuilt transparently (`cursorRebuilt: true`).
+
     Args:
         config: Browser configuration
         content_type: What to extract
@@ -50,6 +151,7 @@ def extract_content(
         offset: Starting index for paginated results
         limit: Maximum items (default 10, max 50)
         table_index: Specific table when content_type="table"
+        cursor: True to open an extraction session, or a cursor id to continue one
 
     Returns:
         Dictionary with content data and navigation hints
@@ -75,25 +177,88 @@ def extract_content(
 
     limit = min(limit, MAX_LIMIT)
 
-    with get_session(config) as (session, target):
-        js = build_extract_js(content_type, selector, offset, limit, table_index, content_root_debug)
-        result = session.eval_js(js)
-
-        if not result:
-            raise SmartToolError(
-                tool="extract_content",
-                action="evaluate",
-                reason="Extraction returned null",
-                suggestion="Check page has loaded completely",
-            )
+    if isinstance(cursor, str) and cursor.strip():
+        with get_session(config) as (session, target):
+            result = _session_page(session, cursor.strip(), max(0, int(offset)), limit)
+            result["target"] = target["id"]
+            return result
 
-        if result.get("error"):
-            raise SmartToolError(
-                tool="extract_content",
-                action="extract",
-                reason=result.get("reason", "Unknown error"),
-                suggestion=result.get("suggestion", "Check parameters"),
+    with get_session(config) as (session, target):
+        if cursor is True:
+            _validate_session_type(content_type, table_index)
+            params = {
+                "content_type": content_type,
+                "selector": selector,
+                "table_index": table_index,
+                "content_root_debug": content_root_debug,
+            }
+            new_id = _new_cursor(params)
+            js = build_extract_session_js(
+                content_type,
+                selector,
+                table_index,
+                new_id,
+                max(0, int(offset)),
+                limit,
+                content_root_debug=content_root_debug,
             )
-
+        else:
+            js = build_extract_js(content_type, selector, offset, limit, table_index, content_root_debug)
+        result = _check_result(session.eval_js(js))
         result["target"] = target["id"]
         return result
+
+
+def export_content(
+    config: BrowserConfig,
+    *,
+    write_items: Callable[[list[Any]], Any],
+    content_type: str = "main",
+    selector: str | None = None,
+    table_index: int | None = None,
+    chunk_size: int = EXPORT_CHUNK,
+) -> dict[str, Any]:
+    """Stream every item of a list-type extraction to `write_items` in chunks.
+
+    The list is materialized once into a pinned in-page session (a consistent snapshot even if the
+    page mutates mid-export), read back in `chunk_size` slices and released at the end.
+    """
+    _validate_session_type(content_type, table_index)
+    chunk_size = max(1, min(int(chunk_size), 2000))
+    params = {"content_type": content_type, "selector": selector, "table_index": table_index}
+    cursor = _new_cursor(params)
+
+    with get_session(config) as (session, target):
+        js = build_extract_session_js(content_type, selector, table_index, cursor, 0, chunk_size, pinned=True)
+        page = _check_result(session.eval_js(js))
+        total = int(page.get("total") or 0)
+        key = "rows" if content_type == "table" else "items"
+        written = 0
+        chunks = 0
+        try:
+            while True:
+                items = page.get(key) if isinstance(page.get(key), list) else []
+                if items:
+                    write_items(items)
+                    written += len(items)
+                    chunks += 1
+                if not page.get("hasMore") or not items:
+                    break
+                page = _session_page(session, cursor, written, chunk_size, pinned=True)
+        finally:
+            with contextlib.suppress(Exception):
+                session.eval_js(build_extract_release_js(cursor))
+
+        summary: dict[str, Any] = {
+            "contentType": content_type,
+            "total": total,
+            "exported": written,
+            "chunks": chunks,
+            "complete": written >= total,
+            "target": target["id"],
+        }
+        if content_type == "table":
+            summary["tableIndex"] = table_index
+            if isinstance(page.get("headers"), list):
+                summary["headers"] = page.get("headers")
+        return summary
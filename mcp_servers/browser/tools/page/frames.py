@@ -5,7 +5,8 @@ Goal:
 - Provide a visual overlay path for "where is that iframe / captcha / SSO box?" debugging.
 
 Design:
-- Prefer CDP Page.getFrameTree (works even when in-page JS is blocked).
+- Prefer the Tier-0 frame registry (event-driven frame → contextId → origin); seed it from
+  CDP Page.getFrameTree once (works even when in-page JS is blocked).
 - Optionally compute viewport bounds for frame owners via DOM.getFrameOwner + DOM.getBoxModel
   (best-effort, bounded scan).
 """
@@ -17,6 +18,7 @@ from contextlib import suppress
 from typing import Any
 
 from ...config import BrowserConfig
+from ...frame_contexts import FrameContextRegistry
 from ...server.redaction import redact_url
 from ...session import session_manager
 from ..base import SmartToolError, get_session
@@ -54,8 +56,8 @@ def get_page_frames(
             with suppress(Exception):
                 session.enable_dom()
 
-            tree = session.send("Page.getFrameTree")
-            frame_tree = tree.get("frameTree") if isinstance(tree, dict) else None
+            registry = frame_registry(session)
+            frame_tree = registry.frame_tree()
             if not isinstance(frame_tree, dict):
                 raise SmartToolError(
                     tool="page",
@@ -90,6 +92,11 @@ def get_page_frames(
                     **({"origin": origin} if isinstance(origin, str) and origin else {}),
                     **({"name": name} if isinstance(name, str) and name else {}),
                     **({"mimeType": mime} if isinstance(mime, str) and mime else {}),
+                    **(
+                        {"contextId": context_id}
+                        if isinstance(frame_id, str) and (context_id := registry.context_id(frame_id)) is not None
+                        else {}
+                    ),
                     **(
                         {"unreachableUrl": redact_url(unreachable)}
                         if isinstance(unreachable, str) and unreachable
@@ -138,7 +145,7 @@ def get_page_frames(
                     **({"offset": offset} if offset else {}),
                     **({"limit": limit} if limit else {}),
                     "items": paged,
-                    "note": "Same-origin iframes are already included in locators/click search; cross-origin frames require CDP/coordinate-based interactions.",
+                    "note": "Same-origin iframes are already included in locators/click search; cross-origin frames require CDP/coordinate-based interactions. js(code=..., frame=<frameId|url part|'all'>) evaluates inside frames directly.",
                     "next": [
                         "page(detail='frames', with_screenshot=true) to see visible iframe boxes",
                         "page(detail='locators') to find interactive elements (includes same-origin iframes + open shadow DOM)",
@@ -168,6 +175,157 @@ def get_page_frames(
             ) from exc
 
 
+def frame_registry(session: Any) -> FrameContextRegistry:
+    """Return the tab's frame registry, seeding it from Page.getFrameTree when needed.
+
+    Falls back to a call-local registry when Tier-0 telemetry is disabled (no contexts;
+    callers then use isolated worlds).
+    """
+    # The registry has its own lock; only the lookup needs the shard's.
+    registry = session_manager.tier0_query(session.tab_id, lambda t: getattr(t, "frames", None))
+    if not isinstance(registry, FrameContextRegistry):
+        registry = FrameContextRegistry()
+    if not registry.seeded or registry.frame_tree() is None:
+        tree = session.send("Page.getFrameTree")
+        frame_tree = tree.get("frameTree") if isinstance(tree, dict) else None
+        if isinstance(frame_tree, dict):
+            registry.seed(frame_tree)
+    return registry
+
+
+def _remote_value(result: Any) -> dict[str, Any]:
+    if not isinstance(result, dict) or result.get("ok") is False:
+        return {"error": str(result.get("error") if isinstance(result, dict) else "no response")}
+    exc = result.get("exceptionDetails")
+    if isinstance(exc, dict):
+        detail = exc.get("exception") if isinstance(exc.get("exception"), dict) else {}
+        return {"error": str(detail.get("description") or exc.get("text") or "exception")[:500]}
+    remote = result.get("result") if isinstance(result.get("result"), dict) else {}
+    return {"result": remote.get("value")}
+
+
+def _attach_oopifs(conn: Any, frame_ids: set[str], *, timeout_s: float = 1.0) -> dict[str, str]:
+    """frameId -> flat sessionId for out-of-process iframes (`Target.setAutoAttach`, flatten).
+
+    An OOPIF's target id is its frame id. Chrome announces already-existing child targets
+    with `Target.attachedToTarget` right after auto-attach is switched on.
+    """
+    while conn.pop_event("Target.attachedToTarget") is not None:
+        pass  # stale announcements from an earlier call (those sessions are gone)
+    conn.send("Target.setAutoAttach", {"autoAttach": True, "waitForDebuggerOnStart": False, "flatten": True})
+    sessions: dict[str, str] = {}
+    deadline = time.monotonic() + timeout_s
+    while len(sessions) < len(frame_ids):
+        left = deadline - time.monotonic()
+        ev = conn.wait_for_event("Target.attachedToTarget", timeout=left) if left > 0 else None
+        if ev is None:
+            break
+        info = ev.get("targetInfo") if isinstance(ev.get("targetInfo"), dict) else {}
+        if info.get("targetId") in frame_ids and isinstance(ev.get("sessionId"), str):
+            sessions[str(info["targetId"])] = ev["sessionId"]
+    return sessions
+
+
+def eval_in_frames(session: Any, expression: str, *, frame: str = "all") -> list[dict[str, Any]]:
+    """Evaluate `expression` in every frame matching `frame`, pipelined over one connection.
+
+    Frames with a known main-world context use it directly (cross-origin included when it
+    shares the page's renderer). Others get a `Page.createIsolatedWorld` context (DOM access,
+    no page globals). Site-isolated frames (OOPIFs) are evaluated in their own target via a
+    flat auto-attach session, detached again afterwards; connections without flat sessions
+    (extension mode) report them with an error.
+    """
+    registry = frame_registry(session)
+    targets = registry.resolve(frame)
+    if not targets:
+        raise SmartToolError(
+            tool="js",
+            action="frame",
+            reason=f"No frame matches {frame!r}",
+            suggestion="Use page(detail='frames') to list frameIds and URLs",
+        )
+
+    conn = session.conn
+    pipelined = getattr(conn, "send_pipelined", None)
+
+    def _send_all(commands: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        if not commands:
+            return []
+        if callable(pipelined):
+            return pipelined(commands)
+        return conn.send_many(commands, stop_on_error=False)
+
+    with suppress(Exception):
+        session.enable_runtime()
+
+    missing = [f for f in targets if not isinstance(f.get("contextId"), int)]
+    isolated = _send_all(
+        [
+            {"method": "Page.createIsolatedWorld", "params": {"frameId": f["frameId"], "worldName": "__mcp_frames"}}
+            for f in missing
+        ]
+    )
+    worlds: dict[str, int] = {}
+    for f, res in zip(missing, isolated, strict=False):
+        cid = res.get("executionContextId") if isinstance(res, dict) else None
+        if isinstance(cid, int):
+            worlds[f["frameId"]] = cid
+
+    oop_ids = {f["frameId"] for f in missing if f["frameId"] not in worlds}
+    oopifs: dict[str, str] = {}
+    if oop_ids and getattr(conn, "flat_sessions", False):
+        with suppress(Exception):
+            oopifs = _attach_oopifs(conn, oop_ids)
+
+    plan: list[tuple[dict[str, Any], int | None, str]] = []
+    commands: list[dict[str, Any]] = []
+    for f in targets:
+        params = {"expression": expression, "returnByValue": True, "awaitPromise": True}
+        cid = f.get("contextId")
+        world = "main"
+        if not isinstance(cid, int):
+            cid = worlds.get(f["frameId"])
+            world = "isolated"
+        if isinstance(cid, int):
+            commands.append({"method": "Runtime.evaluate", "params": {**params, "contextId": cid}})
+        elif f["frameId"] in oopifs:
+            # The OOPIF target's default context is the frame's main world.
+            commands.append({"method": "Runtime.evaluate", "params": params, "sessionId": oopifs[f["frameId"]]})
+            world = "oopif"
+        else:
+            plan.append((f, None, world))
+            continue
+        plan.append((f, len(commands) - 1, world))
+    results = _send_all(commands)
+    if oop_ids and getattr(conn, "flat_sessions", False):
+        # Detach the sessions used; switching auto-attach off releases any other children.
+        cleanup = [{"method": "Target.detachFromTarget", "params": {"sessionId": sid}} for sid in oopifs.values()]
+        cleanup.append(
+            {"method": "Target.setAutoAttach", "params": {"autoAttach": False, "waitForDebuggerOnStart": False}}
+        )
+        with suppress(Exception):
+            _send_all(cleanup)
+
+    out: list[dict[str, Any]] = []
+    for f, idx, world in plan:
+        item: dict[str, Any] = {
+            "frameId": f["frameId"],
+            **({"url": redact_url(f["url"])} if f.get("url") else {}),
+            **({"origin": f["origin"]} if f.get("origin") else {}),
+        }
+        if idx is None:
+            item["error"] = (
+                "Out-of-process frame did not attach"
+                if getattr(conn, "flat_sessions", False)
+                else "No execution context (out-of-process frame; not reachable over the extension connection)"
+            )
+        else:
+            item["world"] = world
+            item.update(_remote_value(results[idx] if idx < len(results) else None))
+        out.append(item)
+    return out
+
+
 def _build_visible_frame_overlay(session: Any, flat: list[dict[str, Any]], *, max_items: int) -> dict[str, Any] | None:
     """Best-effort: compute viewport boxes for some frame owners and return a small overlay pack."""
 
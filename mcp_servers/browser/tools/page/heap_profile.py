@@ -0,0 +1,137 @@
+"""Heap sampling profile summarizer and memory-series trend check.
+
+`HeapProfiler.stopSampling` returns an allocation call tree (`head`) where every node
+carries the bytes still live that were allocated at exactly that frame (`selfSize`).
+`summarize_heap_profile` folds it into top allocation sites (self bytes, and inclusive
+bytes counted once per stack) and top script URLs in a single iterative walk.
+
+`memory_trend` fits a least-squares line through a per-step series (JS heap, DOM nodes,
+listeners) and flags monotonic growth: a positive slope that explains most of the
+variance (r² ≥ 0.8) and a material total growth.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Any
+
+from ...server.redaction import redact_url_brief
+from .cpu_profile import FnKey, _fn_key
+
+# Growth thresholds for the leak flag (absolute floor, relative to the first point).
+_MIN_POINTS = 4
+_MIN_R2 = 0.8
+_GROWTH = {
+    "jsHeapUsed": (1_000_000, 0.10),
+    "nodes": (200, 0.10),
+    "listeners": (50, 0.10),
+}
+
+
+def _site(key: FnKey, self_b: float, total_b: float, all_b: float) -> dict[str, Any]:
+    name, url, line, _col = key
+    return {
+        "function": name,
+        **({"url": redact_url_brief(url)} if url else {}),
+        **({"line": line + 1} if line >= 0 else {}),
+        "selfBytes": int(self_b),
+        "totalBytes": int(total_b),
+        "selfPct": round(100.0 * self_b / all_b, 1) if all_b else 0.0,
+    }
+
+
+def summarize_heap_profile(profile: dict[str, Any], *, top: int = 15) -> dict[str, Any]:
+    """Return top allocation sites / URLs of a `SamplingHeapProfile`."""
+    top = max(1, min(int(top), 100))
+    head = profile.get("head") if isinstance(profile.get("head"), dict) else None
+    samples = profile.get("samples") if isinstance(profile.get("samples"), list) else []
+
+    fn_self: dict[FnKey, float] = defaultdict(float)
+    fn_total: dict[FnKey, float] = defaultdict(float)
+    url_self: dict[str, float] = defaultdict(float)
+    nodes = 0
+    if head is not None:
+        # Post-order walk: inclusive size = self + children; a function counts once per stack.
+        active: dict[FnKey, int] = defaultdict(int)
+        stack: list[tuple[dict[str, Any], list[float], list[float] | None]] = [(head, [0.0], None)]
+        while stack:
+            node, acc, mine = stack.pop()
+            cf = node.get("callFrame")
+            key = _fn_key(cf if isinstance(cf, dict) else {})
+            if mine is not None:
+                # Leaving: all children have added their inclusive size into `mine`.
+                active[key] -= 1
+                if not active[key]:
+                    fn_total[key] += mine[0]
+                acc[0] += mine[0]
+                continue
+            nodes += 1
+            size = node.get("selfSize")
+            self_b = float(size) if isinstance(size, (int, float)) else 0.0
+            if self_b:
+                fn_self[key] += self_b
+                if key[1]:
+                    url_self[key[1]] += self_b
+            mine = [self_b]
+            active[key] += 1
+            stack.append((node, acc, mine))
+            for child in node.get("children") or ():
+                if isinstance(child, dict):
+                    stack.append((child, mine, None))
+
+    all_b = float(sum(fn_self.values()))
+    js_keys = [k for k in fn_self if not k[0].startswith("(")]
+    by_self = sorted(js_keys, key=lambda k: fn_self[k], reverse=True)[:top]
+    urls = sorted(url_self.items(), key=lambda kv: kv[1], reverse=True)[:top]
+    return {
+        "liveBytes": int(all_b),
+        "samples": len(samples),
+        "nodes": nodes,
+        "topSites": [_site(k, fn_self[k], fn_total.get(k, fn_self[k]), all_b) for k in by_self],
+        "topUrls": [
+            {"url": redact_url_brief(u), "selfBytes": int(v), "selfPct": round(100.0 * v / all_b, 1) if all_b else 0.0}
+            for u, v in urls
+        ],
+    }
+
+
+def _fit(values: list[float]) -> tuple[float, float]:
+    """Least-squares slope (per point) and r² for y over x = 0..n-1."""
+    n = len(values)
+    mean_x = (n - 1) / 2.0
+    mean_y = sum(values) / n
+    sxx = sum((x - mean_x) ** 2 for x in range(n))
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in enumerate(values))
+    syy = sum((y - mean_y) ** 2 for y in values)
+    slope = sxy / sxx if sxx else 0.0
+    r2 = (sxy * sxy) / (sxx * syy) if sxx and syy else 0.0
+    return slope, r2
+
+
+def memory_trend(series: list[dict[str, Any]]) -> dict[str, Any]:
+    """Fit each metric of a per-step memory series and flag monotonic growth."""
+    out: dict[str, Any] = {"points": len(series)}
+    suspects: list[str] = []
+    for metric, (floor, ratio) in _GROWTH.items():
+        values = [float(p[metric]) for p in series if isinstance(p.get(metric), (int, float))]
+        if len(values) < 2:
+            continue
+        slope, r2 = _fit(values)
+        growth = values[-1] - values[0]
+        rising = sum(1 for a, b in zip(values, values[1:], strict=False) if b >= a)
+        leak = len(values) >= _MIN_POINTS and slope > 0 and r2 >= _MIN_R2 and growth >= max(floor, ratio * values[0])
+        out[metric] = {
+            "first": int(values[0]),
+            "last": int(values[-1]),
+            "growth": int(growth),
+            "slopePerStep": round(slope, 1),
+            "r2": round(r2, 3),
+            "risingSteps": f"{rising}/{len(values) - 1}",
+            "growing": leak,
+        }
+        if leak:
+            suspects.append(metric)
+    out["leakSuspected"] = bool(suspects)
+    if suspects:
+        out["suspects"] = suspects
+    return out
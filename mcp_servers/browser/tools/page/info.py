@@ -70,8 +70,7 @@ def get_page_info(config: BrowserConfig) -> dict[str, Any]:
         # Fail over to the CDP-only path immediately to avoid timeouts.
         try:
             tab_id = session.tab_id
-            t0 = session_manager.get_telemetry(tab_id) if isinstance(tab_id, str) and tab_id else None
-            dialog_open = bool(getattr(t0, "dialog_open", False)) if t0 is not None else False
+            dialog_open = session_manager.tier0_dialog(tab_id)[0]
         except Exception:
             dialog_open = False
 
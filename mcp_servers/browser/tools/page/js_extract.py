@@ -170,16 +170,150 @@ const pickContentRoot = (scope, wantDebug) => {
 """
 
 
-def build_extract_js(
-    content_type: str,
-    selector: str | None,
-    offset: int,
-    limit: int,
-    table_index: int | None,
-    content_root_debug: bool = False,
-) -> str:
-    """Build JavaScript for content extraction."""
-    scope_js = f"""
+# Collectors: JS statements that materialize the full item list for a list-type content_type.
+# They expect `contentRoot` in scope and define `__mcpItems` (+ `__mcpExtra` for per-type fields).
+_COLLECT_MAIN_JS = """
+        const __mcpItems = [];
+        contentRoot.querySelectorAll('p, h1, h2, h3, h4, h5, h6, li').forEach(el => {
+            if (!isVisible(el)) return;
+            const text = getCleanText(el);
+            if (text.length > 15 && !text.match(/^[.#{}:;]|function|const |var /)) {
+                __mcpItems.push({
+                    tag: el.tagName.toLowerCase(),
+                    text: text.substring(0, 500)
+                });
+            }
+        });
+        const __mcpExtra = {};
+"""
+
+_COLLECT_LINKS_JS = """
+        const allLinks = [];
+        contentRoot.querySelectorAll('a[href]').forEach(a => {
+            if (!isVisible(a)) return;
+            const text = getCleanText(a);
+            const href = a.href;
+            if (!text || text.length < 2 || href.startsWith('javascript:')) return;
+            allLinks.push({
+                text: text.substring(0, 80),
+                href: href,
+                isExternal: a.hostname !== window.location.hostname
+            });
+        });
+        const __mcpItems = dedupe(allLinks, l => l.href);
+        const __mcpExtra = {};
+"""
+
+_COLLECT_IMAGES_JS = """
+        const allImages = [];
+        contentRoot.querySelectorAll('img[src]').forEach(img => {
+            if (!isVisible(img)) return;
+            const src = img.src;
+            if (src.startsWith('data:') || src.includes('pixel') || src.includes('tracking')) return;
+            allImages.push({
+                src: src,
+                alt: img.alt || '',
+                width: img.naturalWidth || img.width,
+                height: img.naturalHeight || img.height
+            });
+        });
+        const __mcpItems = dedupe(allImages, i => i.src);
+        const __mcpExtra = {};
+"""
+
+
+def _collect_table_rows_js(table_index: int) -> str:
+    return f"""
+        const tableIndex = {int(table_index)};
+        const tables = contentRoot.querySelectorAll('table');
+        if (tableIndex >= tables.length) {{
+            return {{ error: true, reason: 'Table index ' + tableIndex + ' not found. Available: 0-' + (tables.length - 1) }};
+        }}
+
+        const table = tables[tableIndex];
+
+        const headers = Array.from(table.querySelectorAll('thead th, tr:first-child th'))
+            .map(th => getCleanText(th))
+            .filter(t => t);
+
+        const __mcpItems = [];
+        table.querySelectorAll('tbody tr, tr').forEach((tr, rowIdx) => {{
+            if (rowIdx === 0 && headers.length > 0) return;
+            const cells = Array.from(tr.querySelectorAll('td, th'))
+                .map(td => getCleanText(td).substring(0, 150));
+            if (cells.some(c => c)) {{
+                __mcpItems.push(cells);
+            }}
+        }});
+        const __mcpExtra = {{ tableIndex: tableIndex, headers: headers }};
+"""
+
+
+# Pager: slice a materialized list into the public page shape (`items`, or `rows` for tables).
+# `__mcpCursor` (string|null) switches navigation hints to cursor form.
+_PAGE_JS = """
+        const __mcpPage = (contentType, all, extra, offset, limit, cursor) => {
+            const total = all.length;
+            const result = Object.assign({ contentType: contentType }, extra || {}, {
+                total: total,
+                offset: offset,
+                limit: limit,
+                hasMore: offset + limit < total
+            });
+            result[contentType === 'table' ? 'rows' : 'items'] = all.slice(offset, offset + limit);
+            if (cursor) result.cursor = cursor;
+            if (offset > 0 || offset + limit < total) {
+                const pre = cursor ? `cursor=${cursor} ` : '';
+                result.navigation = {};
+                if (offset > 0) {
+                    result.navigation.prev = `${pre}offset=${Math.max(0, offset - limit)} limit=${limit}`;
+                }
+                if (offset + limit < total) {
+                    result.navigation.next = `${pre}offset=${offset + limit} limit=${limit}`;
+                }
+            }
+            return result;
+        };
+"""
+
+# In-page extraction sessions (cursor mode).
+# - Sessions are keyed by cursor id and stamped with the document version + href.
+# - Any childList/characterData mutation or URL change drops non-pinned sessions.
+# - The MutationObserver is connected only while at least one session exists.
+# - Pinned sessions (exports) keep their snapshot until released explicitly.
+_SESSION_STORE_JS = """
+        const __mcpX = globalThis.__mcpExtract || (globalThis.__mcpExtract = (() => {
+            const st = { version: 0, href: location.href, sessions: new Map(), observer: null };
+            st.drop = () => {
+                for (const [k, v] of st.sessions) { if (!v.pinned) st.sessions.delete(k); }
+                if (!st.sessions.size && st.observer) { try { st.observer.disconnect(); } catch (e) {} }
+            };
+            st.watch = () => {
+                if (!st.observer) {
+                    try { st.observer = new MutationObserver(() => { st.version += 1; st.drop(); }); } catch (e) { return; }
+                }
+                try {
+                    st.observer.observe(document.documentElement || document, { childList: true, subtree: true, characterData: true });
+                } catch (e) {}
+            };
+            return st;
+        })());
+        if (__mcpX.href !== location.href) {
+            __mcpX.href = location.href;
+            __mcpX.version += 1;
+            __mcpX.drop();
+        }
+"""
+
+_MAX_PAGE_SESSIONS = 8
+
+_COLLECTORS = {"main": _COLLECT_MAIN_JS, "links": _COLLECT_LINKS_JS, "images": _COLLECT_IMAGES_JS}
+
+SESSION_CONTENT_TYPES = frozenset({"main", "links", "images", "table"})
+
+
+def _build_scope_js(selector: str | None) -> str:
+    return f"""
     {DEEP_QUERY_JS}
     const customSelector = {json.dumps(selector)};
     const scope = customSelector ? (() => {{
@@ -192,18 +326,140 @@ def build_extract_js(
     }}
     """
 
+
+def _collector_js(content_type: str, table_index: int | None) -> str:
+    if content_type == "table":
+        return _collect_table_rows_js(int(table_index or 0))
+    return _COLLECTORS[content_type]
+
+
+def _build_list_js(
+    scope_js: str,
+    content_type: str,
+    collect_js: str,
+    offset: int,
+    limit: int,
+    content_root_debug: bool,
+) -> str:
+    """Build JavaScript for a one-shot paginated list (materialize, then slice)."""
+    debug_js = "true" if content_root_debug else "false"
+    return f"""
+    (() => {{
+        {scope_js}
+        {JS_HELPERS}
+        {_PAGE_JS}
+        const __mcpWantDebug = {debug_js};
+
+        const contentPick = pickContentRoot(scope, __mcpWantDebug);
+        const contentRoot = contentPick.node;
+        {collect_js}
+
+        const result = __mcpPage({json.dumps(content_type)}, __mcpItems, __mcpExtra, {int(offset)}, {int(limit)}, null);
+        if (__mcpWantDebug && contentPick.debug) {{
+            result.contentRootDebug = contentPick.debug;
+        }}
+        return result;
+    }})()
+    """
+
+
+def build_extract_session_js(
+    content_type: str,
+    selector: str | None,
+    table_index: int | None,
+    cursor: str,
+    offset: int,
+    limit: int,
+    *,
+    content_root_debug: bool = False,
+    pinned: bool = False,
+) -> str:
+    """Build JavaScript that materializes a list once into the in-page session cache and returns a page."""
+    debug_js = "true" if content_root_debug else "false"
+    return f"""
+    (() => {{
+        {_build_scope_js(selector)}
+        {JS_HELPERS}
+        {_PAGE_JS}
+        {_SESSION_STORE_JS}
+        const __mcpWantDebug = {debug_js};
+        const __mcpCursor = {json.dumps(cursor)};
+
+        const contentPick = pickContentRoot(scope, __mcpWantDebug);
+        const contentRoot = contentPick.node;
+        {_collector_js(content_type, table_index)}
+
+        __mcpX.sessions.delete(__mcpCursor);
+        __mcpX.sessions.set(__mcpCursor, {{
+            type: {json.dumps(content_type)},
+            items: __mcpItems,
+            extra: __mcpExtra,
+            version: __mcpX.version,
+            pinned: {"true" if pinned else "false"},
+            createdAt: Date.now()
+        }});
+        while (__mcpX.sessions.size > {_MAX_PAGE_SESSIONS}) {{
+            __mcpX.sessions.delete(__mcpX.sessions.keys().next().value);
+        }}
+        __mcpX.watch();
+
+        const result = __mcpPage({json.dumps(content_type)}, __mcpItems, __mcpExtra, {int(offset)}, {int(limit)}, __mcpCursor);
+        result.session = {{ version: __mcpX.version, materialized: true }};
+        if (__mcpWantDebug && contentPick.debug) {{
+            result.contentRootDebug = contentPick.debug;
+        }}
+        return result;
+    }})()
+    """
+
+
+def build_extract_page_js(cursor: str, offset: int, limit: int) -> str:
+    """Build JavaScript that reads one page from a cached extraction session (O(limit), no DOM walk)."""
+    return f"""
+    (() => {{
+        {_PAGE_JS}
+        const __mcpCursor = {json.dumps(cursor)};
+        const st = globalThis.__mcpExtract;
+        const s = (st && st.href === location.href) ? st.sessions.get(__mcpCursor) : null;
+        if (!s || (!s.pinned && s.version !== st.version)) {{
+            return {{ expired: true, cursor: __mcpCursor }};
+        }}
+        const result = __mcpPage(s.type, s.items, s.extra, {int(offset)}, {int(limit)}, __mcpCursor);
+        result.session = {{ version: s.version, materialized: false }};
+        return result;
+    }})()
+    """
+
+
+def build_extract_release_js(cursor: str) -> str:
+    """Build JavaScript that drops one cached extraction session."""
+    return (
+        "(() => {"
+        "  const st = globalThis.__mcpExtract;"
+        f"  return !!(st && st.sessions.delete({json.dumps(cursor)}));"
+        "})()"
+    )
+
+
+def build_extract_js(
+    content_type: str,
+    selector: str | None,
+    offset: int,
+    limit: int,
+    table_index: int | None,
+    content_root_debug: bool = False,
+) -> str:
+    """Build JavaScript for content extraction."""
+    scope_js = _build_scope_js(selector)
+
     if content_type == "overview":
         return _build_overview_js(scope_js, content_root_debug)
-    elif content_type == "main":
-        return _build_main_js(scope_js, offset, limit, content_root_debug)
+    elif content_type in _COLLECTORS:
+        return _build_list_js(scope_js, content_type, _COLLECTORS[content_type], offset, limit, content_root_debug)
     elif content_type == "table":
         return _build_table_js(scope_js, offset, limit, table_index, content_root_debug)
-    elif content_type == "links":
-        return _build_links_js(scope_js, offset, limit, content_root_debug)
     elif content_type == "headings":
         return _build_headings_js(scope_js, content_root_debug)
-    elif content_type == "images":
-        return _build_images_js(scope_js, offset, limit, content_root_debug)
 
     return '(() => ({ error: true, reason: "Unknown content type" }))()'
 
@@ -280,62 +536,6 @@ def _build_overview_js(scope_js: str, content_root_debug: bool) -> str:
     """
 
 
-def _build_main_js(scope_js: str, offset: int, limit: int, content_root_debug: bool) -> str:
-    """Build JavaScript for main content extraction."""
-    debug_js = "true" if content_root_debug else "false"
-    return f"""
-    (() => {{
-        {scope_js}
-        {JS_HELPERS}
-        const __mcpWantDebug = {debug_js};
-        const offset = {offset};
-        const limit = {limit};
-
-        const contentPick = pickContentRoot(scope, __mcpWantDebug);
-        const contentRoot = contentPick.node;
-
-        const paragraphs = [];
-        contentRoot.querySelectorAll('p, h1, h2, h3, h4, h5, h6, li').forEach(el => {{
-            if (!isVisible(el)) return;
-            const text = getCleanText(el);
-            if (text.length > 15 && !text.match(/^[.#{{}}:;]|function|const |var /)) {{
-                paragraphs.push({{
-                    tag: el.tagName.toLowerCase(),
-                    text: text.substring(0, 500)
-                }});
-            }}
-        }});
-
-        const total = paragraphs.length;
-        const items = paragraphs.slice(offset, offset + limit);
-
-        const result = {{
-            contentType: 'main',
-            total: total,
-            offset: offset,
-            limit: limit,
-            hasMore: offset + limit < total,
-            items: items
-        }};
-        if (__mcpWantDebug && contentPick.debug) {{
-            result.contentRootDebug = contentPick.debug;
-        }}
-
-        if (offset > 0 || offset + limit < total) {{
-            result.navigation = {{}};
-            if (offset > 0) {{
-                result.navigation.prev = `offset=${{Math.max(0, offset - limit)}} limit=${{limit}}`;
-            }}
-            if (offset + limit < total) {{
-                result.navigation.next = `offset=${{offset + limit}} limit=${{limit}}`;
-            }}
-        }}
-
-        return result;
-    }})()
-    """
-
-
 def _build_table_js(
     scope_js: str,
     offset: int,
@@ -346,68 +546,7 @@ def _build_table_js(
     """Build JavaScript for table extraction."""
     debug_js = "true" if content_root_debug else "false"
     if table_index is not None:
-        return f"""
-        (() => {{
-            {scope_js}
-            {JS_HELPERS}
-            const __mcpWantDebug = {debug_js};
-            const tableIndex = {table_index};
-            const offset = {offset};
-            const limit = {limit};
-
-            const contentPick = pickContentRoot(scope, __mcpWantDebug);
-            const contentRoot = contentPick.node;
-            const tables = contentRoot.querySelectorAll('table');
-            if (tableIndex >= tables.length) {{
-                return {{ error: true, reason: 'Table index ' + tableIndex + ' not found. Available: 0-' + (tables.length - 1) }};
-            }}
-
-            const table = tables[tableIndex];
-
-            const headers = Array.from(table.querySelectorAll('thead th, tr:first-child th'))
-                .map(th => getCleanText(th))
-                .filter(t => t);
-
-            const allRows = [];
-            table.querySelectorAll('tbody tr, tr').forEach((tr, rowIdx) => {{
-                if (rowIdx === 0 && headers.length > 0) return;
-                const cells = Array.from(tr.querySelectorAll('td, th'))
-                    .map(td => getCleanText(td).substring(0, 150));
-                if (cells.some(c => c)) {{
-                    allRows.push(cells);
-                }}
-            }});
-
-            const total = allRows.length;
-            const rows = allRows.slice(offset, offset + limit);
-
-            const result = {{
-                contentType: 'table',
-                tableIndex: tableIndex,
-                headers: headers,
-                total: total,
-                offset: offset,
-                limit: limit,
-                hasMore: offset + limit < total,
-                rows: rows
-            }};
-            if (__mcpWantDebug && contentPick.debug) {{
-                result.contentRootDebug = contentPick.debug;
-            }}
-
-            if (offset > 0 || offset + limit < total) {{
-                result.navigation = {{}};
-                if (offset > 0) {{
-                    result.navigation.prev = `offset=${{Math.max(0, offset - limit)}} limit=${{limit}}`;
-                }}
-                if (offset + limit < total) {{
-                    result.navigation.next = `offset=${{offset + limit}} limit=${{limit}}`;
-                }}
-            }}
-
-            return result;
-        }})()
-        """
+        return _build_list_js(scope_js, "table", _collect_table_rows_js(table_index), offset, limit, content_root_debug)
     else:
         return f"""
         (() => {{
@@ -451,63 +590,6 @@ def _build_table_js(
         """
 
 
-def _build_links_js(scope_js: str, offset: int, limit: int, content_root_debug: bool) -> str:
-    """Build JavaScript for links extraction."""
-    debug_js = "true" if content_root_debug else "false"
-    return f"""
-    (() => {{
-        {scope_js}
-        {JS_HELPERS}
-        const __mcpWantDebug = {debug_js};
-        const offset = {offset};
-        const limit = {limit};
-
-        const allLinks = [];
-        const contentPick = pickContentRoot(scope, __mcpWantDebug);
-        const contentRoot = contentPick.node;
-        contentRoot.querySelectorAll('a[href]').forEach(a => {{
-            if (!isVisible(a)) return;
-            const text = getCleanText(a);
-            const href = a.href;
-            if (!text || text.length < 2 || href.startsWith('javascript:')) return;
-            allLinks.push({{
-                text: text.substring(0, 80),
-                href: href,
-                isExternal: a.hostname !== window.location.hostname
-            }});
-        }});
-
-        const unique = dedupe(allLinks, l => l.href);
-        const total = unique.length;
-        const items = unique.slice(offset, offset + limit);
-
-        const result = {{
-            contentType: 'links',
-            total: total,
-            offset: offset,
-            limit: limit,
-            hasMore: offset + limit < total,
-            items: items
-        }};
-        if (__mcpWantDebug && contentPick.debug) {{
-            result.contentRootDebug = contentPick.debug;
-        }}
-
-        if (offset > 0 || offset + limit < total) {{
-            result.navigation = {{}};
-            if (offset > 0) {{
-                result.navigation.prev = `offset=${{Math.max(0, offset - limit)}} limit=${{limit}}`;
-            }}
-            if (offset + limit < total) {{
-                result.navigation.next = `offset=${{offset + limit}} limit=${{limit}}`;
-            }}
-        }}
-
-        return result;
-    }})()
-    """
-
-
 def _build_headings_js(scope_js: str, content_root_debug: bool) -> str:
     """Build JavaScript for headings extraction."""
     debug_js = "true" if content_root_debug else "false"
@@ -542,60 +624,3 @@ def _build_headings_js(scope_js: str, content_root_debug: bool) -> str:
         return result;
     }})()
     """
-
-
-def _build_images_js(scope_js: str, offset: int, limit: int, content_root_debug: bool) -> str:
-    """Build JavaScript for images extraction."""
-    debug_js = "true" if content_root_debug else "false"
-    return f"""
-    (() => {{
-        {scope_js}
-        {JS_HELPERS}
-        const __mcpWantDebug = {debug_js};
-        const offset = {offset};
-        const limit = {limit};
-
-        const allImages = [];
-        const contentPick = pickContentRoot(scope, __mcpWantDebug);
-        const contentRoot = contentPick.node;
-        contentRoot.querySelectorAll('img[src]').forEach(img => {{
-            if (!isVisible(img)) return;
-            const src = img.src;
-            if (src.startsWith('data:') || src.includes('pixel') || src.includes('tracking')) return;
-            allImages.push({{
-                src: src,
-                alt: img.alt || '',
-                width: img.naturalWidth || img.width,
-                height: img.naturalHeight || img.height
-            }});
-        }});
-
-        const unique = dedupe(allImages, i => i.src);
-        const total = unique.length;
-        const items = unique.slice(offset, offset + limit);
-
-        const result = {{
-            contentType: 'images',
-            total: total,
-            offset: offset,
-            limit: limit,
-            hasMore: offset + limit < total,
-            items: items
-        }};
-        if (__mcpWantDebug && contentPick.debug) {{
-            result.contentRootDebug = contentPick.debug;
-        }}
-
-        if (offset > 0 || offset + limit < total) {{
-            result.navigation = {{}};
-            if (offset > 0) {{
-                result.navigation.prev = `offset=${{Math.max(0, offset - limit)}} limit=${{limit}}`;
-            }}
-            if (offset + limit < total) {{
-                result.navigation.next = `offset=${{offset + limit}} limit=${{limit}}`;
-            }}
-        }}
-
-        return result;
-    }})()
-    """
@@ -8,6 +8,7 @@ import os
 import time
 from typing import Any
 
+from ...ax_index import AxIndex
 from ...config import BrowserConfig
 from ...session import session_manager
 from ..base import SmartToolError, get_session
@@ -27,29 +28,6 @@ def _stable_aff_ref(*, tool: str, args: dict[str, Any], meta: dict[str, Any]) ->
     return f"aff:{digest}"
 
 
-def _ax_value(value: Any) -> Any:
-    if isinstance(value, dict) and "value" in value:
-        return value.get("value")
-    return value
-
-
-def _ax_bool_prop(node: dict[str, Any], prop_name: str) -> bool | None:
-    props = node.get("properties")
-    if not isinstance(props, list):
-        return None
-    for p in props:
-        if not isinstance(p, dict):
-            continue
-        if p.get("name") != prop_name:
-            continue
-        v = _ax_value(p.get("value"))
-        if isinstance(v, bool):
-            return v
-        if isinstance(v, str) and v.lower() in {"true", "false"}:
-            return v.lower() == "true"
-    return None
-
-
 def _tier0_locators_from_ax(*, session: Any, kind: str, offset: int, limit: int) -> dict[str, Any]:
     """Tier-0 locators from CDP Accessibility tree (no page injection)."""
     try:
@@ -100,26 +78,17 @@ def _tier0_locators_from_ax(*, session: Any, kind: str, offset: int, limit: int)
         "tab": ("button", None),
     }
 
+    # Indexed lookup: interactive roles + focusable nodes only, in document order (no scan cap).
     items_all: list[dict[str, Any]] = []
-    scanned = 0
-    for n in nodes:
-        if not isinstance(n, dict):
-            continue
-        scanned += 1
-        if scanned > 5000:
-            break
-        if n.get("ignored") is True:
-            continue
-
-        role = str(_ax_value(n.get("role")) or "").strip()
+    for rec in AxIndex(nodes).interactive(interactive_roles):
+        role = rec["role"].strip()
         if not role:
             continue
-        role_norm = role.lower()
-        mapped = interactive_roles.get(role_norm)
+        mapped = interactive_roles.get(role.lower())
 
-        focusable = _ax_bool_prop(n, "focusable")
-        disabled = _ax_bool_prop(n, "disabled")
-        editable = _ax_bool_prop(n, "editable")
+        focusable = rec["focusable"]
+        disabled = rec["disabled"]
+        editable = rec["editable"]
 
         if mapped is None:
             if focusable is not True:
@@ -136,14 +105,11 @@ def _tier0_locators_from_ax(*, session: Any, kind: str, offset: int, limit: int)
         if kind_norm != "all" and kind_name != kind_norm:
             continue
 
-        backend_id = n.get("backendDOMNodeId") or n.get("backendDomNodeId") or 0
-        backend_dom_node_id: int | None = None
-        if isinstance(backend_id, (int, float)):
-            backend_dom_node_id = int(backend_id)
+        backend_dom_node_id = rec["backendDOMNodeId"]
         if not isinstance(backend_dom_node_id, int) or backend_dom_node_id <= 0:
             continue
 
-        name = str(_ax_value(n.get("name")) or "").strip()
+        name = rec["name"].strip()
 
         it: dict[str, Any] = {
             "kind": kind_name,
@@ -0,0 +1,138 @@
+"""Memory capture for the current page (CDP HeapProfiler / Runtime / Performance).
+
+- `read_memory_metrics`: one cheap sample (JS heap used/total, DOM nodes, listeners,
+  documents) from `Runtime.getHeapUsage` + `Performance.getMetrics`.
+- `sample_page_memory`: the same over a short-lived session (flow `profile_memory=true`).
+- `get_page_memory`: sampled allocation profile over a window with before/after metrics;
+  the raw `.heapprofile` goes to a temp file (the handler moves it into the artifact store).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import time
+from contextlib import suppress
+from typing import Any
+
+from ...config import BrowserConfig
+from ..base import SmartToolError, get_session
+from .heap_profile import summarize_heap_profile
+
+_MAX_DURATION_MS = 60_000
+_METRICS = {
+    "JSHeapUsedSize": "jsHeapUsed",
+    "JSHeapTotalSize": "jsHeapTotal",
+    "Nodes": "nodes",
+    "JSEventListeners": "listeners",
+    "Documents": "documents",
+}
+
+
+def read_memory_metrics(session: Any, *, gc: bool = False) -> dict[str, Any]:
+    """Return one memory sample; `gc=True` forces a major GC first (stabler series)."""
+    if gc:
+        with suppress(Exception):
+            session.send("HeapProfiler.collectGarbage")
+    out: dict[str, Any] = {}
+    with suppress(Exception):
+        usage = session.send("Runtime.getHeapUsage")
+        if isinstance(usage.get("usedSize"), (int, float)):
+            out["jsHeapUsed"] = int(usage["usedSize"])
+            out["jsHeapTotal"] = int(usage.get("totalSize") or 0)
+    with suppress(Exception):
+        session.enable_performance()
+        metrics = session.send("Performance.getMetrics")
+        for item in metrics.get("metrics") or ():
+            key = _METRICS.get(item.get("name")) if isinstance(item, dict) else None
+            if key and isinstance(item.get("value"), (int, float)):
+                out.setdefault(key, int(item["value"]))
+    return out
+
+
+def sample_page_memory(config: BrowserConfig, *, gc: bool = True) -> dict[str, Any]:
+    """One memory sample of the current page (best-effort; empty dict when unavailable)."""
+    with get_session(config, ensure_diagnostics=False) as (session, _target):
+        return read_memory_metrics(session, gc=gc)
+
+
+def get_page_memory(
+    config: BrowserConfig,
+    *,
+    duration_ms: int = 3000,
+    sampling_interval: int | None = None,
+    gc: bool = False,
+    top: int = 15,
+) -> dict[str, Any]:
+    """Record a sampled allocation profile of the current page and summarize it.
+
+    Args:
+        config: Browser configuration
+        duration_ms: Recording window (clamped to [100..60000])
+        sampling_interval: Average bytes between samples (Chrome default: 32768)
+        gc: Force a GC before each metrics sample (live sizes instead of garbage)
+        top: Max allocation sites/URLs per list (clamped to [1..100])
+
+    Returns:
+        Dictionary with `before`/`after`/`delta` metrics and `summary`, plus `profilePath`
+        pointing at the raw `.heapprofile` JSON (caller owns and removes it)
+    """
+    try:
+        duration_ms = max(100, min(int(duration_ms), _MAX_DURATION_MS))
+        interval = int(sampling_interval) if sampling_interval is not None else None
+    except (TypeError, ValueError) as exc:
+        raise SmartToolError(
+            tool="page",
+            action="memory",
+            reason=f"Invalid memory options: {exc}",
+            suggestion="Use page(detail='memory', duration_ms=3000)",
+        ) from exc
+
+    with get_session(config, timeout=10.0 + duration_ms / 1000.0, ensure_diagnostics=False) as (session, target):
+        before = read_memory_metrics(session, gc=gc)
+        try:
+            session.send("HeapProfiler.enable")
+            params = {"samplingInterval": max(1024, min(interval, 1 << 24))} if interval is not None else {}
+            session.send("HeapProfiler.startSampling", params)
+            time.sleep(duration_ms / 1000.0)
+            stopped = session.send("HeapProfiler.stopSampling")
+        except Exception as exc:  # noqa: BLE001
+            raise SmartToolError(
+                tool="page",
+                action="memory",
+                reason=str(exc),
+                suggestion="Ensure the page is responsive (no open dialog) and retry with a shorter duration_ms",
+            ) from exc
+        finally:
+            with suppress(Exception):
+                session.send("HeapProfiler.disable")
+        after = read_memory_metrics(session, gc=gc)
+
+    profile = stopped.get("profile") if isinstance(stopped, dict) else None
+    if not isinstance(profile, dict):
+        raise SmartToolError(
+            tool="page",
+            action="memory",
+            reason="HeapProfiler.stopSampling returned no profile",
+            suggestion="Retry; if it persists the target may not support the HeapProfiler domain",
+        )
+
+    summary = summarize_heap_profile(profile, top=top)
+    fd, path = tempfile.mkstemp(prefix="mcp-heap-", suffix=".heapprofile")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(profile, fh, separators=(",", ":"))
+    except Exception:
+        with suppress(OSError):
+            os.unlink(path)
+        raise
+
+    return {
+        "before": before,
+        "after": after,
+        "delta": {k: after[k] - before[k] for k in after if k in before},
+        "summary": summary,
+        "profilePath": path,
+        "target": target["id"],
+    }
@@ -28,8 +28,12 @@ def _safe_ms(x: Any) -> int | None:
         return None
 
 
-def _tier0_perf_snapshot(session) -> dict[str, Any] | None:
-    """Tier-0 performance snapshot without relying on injected diagnostics."""
+def _tier0_perf_snapshot(session, vitals: dict[str, Any] | None = None) -> dict[str, Any] | None:
+    """Tier-0 performance snapshot without relying on injected diagnostics.
+
+    `vitals` is the event-driven PerformanceTimeline summary (`session_manager.tier0_vitals`);
+    when it has seen long tasks it wins over the `performance.getEntriesByType` probe.
+    """
     out: dict[str, Any] = {"tier": "tier0", "available": True}
 
     # Navigation timings via Runtime (best-effort; may be blocked by dialogs).
@@ -164,6 +168,18 @@ def _tier0_perf_snapshot(session) -> dict[str, Any] | None:
         if mem:
             out["memory"] = mem
 
+    if isinstance(vitals, dict):
+        out["vitals"] = vitals
+        lt = vitals.get("longTasks") if isinstance(vitals.get("longTasks"), dict) else {}
+        if lt.get("count"):
+            out["longTasks"] = {
+                "count": lt["count"],
+                "total_ms": lt.get("totalMs"),
+                "max_ms": lt.get("maxMs"),
+                "blocking_ms": lt.get("blockingMs"),
+                "source": "PerformanceTimeline",
+            }
+
     return out if len(out) > 2 else None
 
 
@@ -182,7 +198,8 @@ def get_page_performance(config: BrowserConfig) -> dict[str, Any]:
             tier0 = session_manager.ensure_telemetry(session)
             tier0_perf = None
             try:
-                tier0_perf = _tier0_perf_snapshot(session)
+                vitals = session_manager.tier0_vitals(session.tab_id) if session.tab_id else None
+                tier0_perf = _tier0_perf_snapshot(session, vitals)
             except Exception:
                 tier0_perf = None
 
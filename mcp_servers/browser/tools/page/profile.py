@@ -0,0 +1,109 @@
+"""CPU profile capture for the current page (CDP Profiler domain).
+
+Records a sampling profile for `duration_ms`, writes the raw `.cpuprofile` to a temp
+file (the handler moves it into the artifact store) and returns a bounded hot-spot
+summary: top self/total functions, top script URLs and long-task attribution.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import time
+from contextlib import suppress
+from typing import Any
+
+from ...config import BrowserConfig
+from ..base import SmartToolError, get_session
+from .cpu_profile import summarize_coverage, summarize_cpu_profile
+
+_MAX_DURATION_MS = 60_000
+
+
+def get_page_profile(
+    config: BrowserConfig,
+    *,
+    duration_ms: int = 3000,
+    sampling_interval_us: int | None = None,
+    coverage: bool = False,
+    top: int = 15,
+) -> dict[str, Any]:
+    """Record a CPU profile of the current page and summarize it.
+
+    Args:
+        config: Browser configuration
+        duration_ms: Recording window (clamped to [100..60000])
+        sampling_interval_us: Profiler sampling interval (Chrome default: ~100us)
+        coverage: Also collect best-effort function coverage while recording
+        top: Max functions/URLs per summary list (clamped to [1..100])
+
+    Returns:
+        Dictionary with `summary` (and `coverage`), plus `profilePath` pointing at the raw
+        `.cpuprofile` JSON (caller owns and removes it)
+    """
+    try:
+        duration_ms = max(100, min(int(duration_ms), _MAX_DURATION_MS))
+        interval = int(sampling_interval_us) if sampling_interval_us is not None else None
+    except (TypeError, ValueError) as exc:
+        raise SmartToolError(
+            tool="page",
+            action="profile",
+            reason=f"Invalid profile options: {exc}",
+            suggestion="Use page(detail='profile', duration_ms=3000)",
+        ) from exc
+
+    # Allow for the recording window on top of the usual CDP timeout.
+    with get_session(config, timeout=5.0 + duration_ms / 1000.0, ensure_diagnostics=False) as (session, target):
+        try:
+            session.send("Profiler.enable")
+            if interval is not None:
+                session.send("Profiler.setSamplingInterval", {"interval": max(10, min(interval, 100_000))})
+            if coverage:
+                session.send("Profiler.startPreciseCoverage", {"callCount": True, "detailed": False})
+            session.send("Profiler.start")
+            time.sleep(duration_ms / 1000.0)
+            stopped = session.send("Profiler.stop")
+            cov_raw = session.send("Profiler.getBestEffortCoverage") if coverage else None
+        except Exception as exc:  # noqa: BLE001
+            raise SmartToolError(
+                tool="page",
+                action="profile",
+                reason=str(exc),
+                suggestion="Ensure the page is responsive (no open dialog) and retry with a shorter duration_ms",
+            ) from exc
+        finally:
+            if coverage:
+                with suppress(Exception):
+                    session.send("Profiler.stopPreciseCoverage")
+            with suppress(Exception):
+                session.send("Profiler.disable")
+
+        profile = stopped.get("profile") if isinstance(stopped, dict) else None
+        if not isinstance(profile, dict):
+            raise SmartToolError(
+                tool="page",
+                action="profile",
+                reason="Profiler.stop returned no profile",
+                suggestion="Retry; if it persists the target may not support the Profiler domain",
+            )
+
+        started = time.perf_counter()
+        summary = summarize_cpu_profile(profile, top=top)
+        summary["summarizeMs"] = round((time.perf_counter() - started) * 1000.0, 1)
+
+        fd, path = tempfile.mkstemp(prefix="mcp-profile-", suffix=".cpuprofile")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(profile, fh, separators=(",", ":"))
+        except Exception:
+            with suppress(OSError):
+                os.unlink(path)
+            raise
+
+        return {
+            "summary": summary,
+            **({"coverage": summarize_coverage(cov_raw)} if coverage else {}),
+            "profilePath": path,
+            "target": target["id"],
+        }
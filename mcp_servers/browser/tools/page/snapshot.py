@@ -0,0 +1,100 @@
+"""Bulk page capture via DOMSnapshot (one CDP call, no page injection).
+
+Views answered from a single decoded snapshot:
+- summary: document/node/layout counts + capture/decode timings
+- text: rendered text in layout order (bounded)
+- links: rendered anchors (deduped by href)
+- locators: interactive rendered elements with names + centers (dom:<backendNodeId> refs)
+- hit: topmost element at a viewport point (x, y)
+"""
+
+from __future__ import annotations
+
+from contextlib import suppress
+from typing import Any
+
+from ...config import BrowserConfig
+from ...session import session_manager
+from ..base import SmartToolError, get_session
+from .dom_snapshot import capture_snapshot
+
+SNAPSHOT_VIEWS = ("summary", "text", "links", "locators", "hit")
+
+
+def get_page_snapshot(
+    config: BrowserConfig,
+    *,
+    view: str = "summary",
+    kind: str = "all",
+    x: float | None = None,
+    y: float | None = None,
+    offset: int = 0,
+    limit: int = 50,
+    max_chars: int = 8000,
+) -> dict[str, Any]:
+    """Capture a DOMSnapshot and answer one view from it.
+
+    Args:
+        config: Browser configuration
+        view: summary|text|links|locators|hit
+        kind: all|button|link|input (view="locators")
+        x, y: Viewport point (view="hit")
+        offset, limit: Pagination for links/locators (limit clamped to [0..200])
+        max_chars: Text budget for view="text" (clamped to [200..100000])
+    """
+    view_norm = str(view or "summary").strip().lower()
+    if view_norm not in SNAPSHOT_VIEWS:
+        raise SmartToolError(
+            tool="page",
+            action="snapshot",
+            reason=f"Invalid view: {view}",
+            suggestion=f"Use one of: {', '.join(SNAPSHOT_VIEWS)}",
+        )
+    if view_norm == "hit" and (x is None or y is None):
+        raise SmartToolError(
+            tool="page",
+            action="snapshot",
+            reason="view='hit' requires x and y",
+            suggestion="Use page(detail='snapshot', view='hit', x=100, y=200)",
+        )
+
+    offset = max(0, int(offset))
+    limit = max(0, min(int(limit), 200))
+    max_chars = max(200, min(int(max_chars), 100_000))
+
+    with get_session(config, ensure_diagnostics=False) as (session, target):
+        with suppress(Exception):
+            session.send("DOMSnapshot.enable")
+        try:
+            snap = capture_snapshot(session)
+        except Exception as exc:  # noqa: BLE001
+            raise SmartToolError(
+                tool="page",
+                action="snapshot",
+                reason=str(exc),
+                suggestion="DOMSnapshot may be unavailable on this target; use page(detail='locators') instead",
+            ) from exc
+
+        out: dict[str, Any] = {"view": view_norm, "summary": snap.summary()}
+        if view_norm == "text":
+            out["text"] = snap.visible_text(max_chars=max_chars)
+        elif view_norm in {"links", "locators"}:
+            items = snap.links() if view_norm == "links" else snap.locators(kind=kind)
+            total = len(items)
+            out.update(
+                {
+                    "total": total,
+                    "offset": offset,
+                    "limit": limit,
+                    "hasMore": offset + limit < total,
+                    "items": items[offset : offset + limit],
+                }
+            )
+        elif view_norm == "hit":
+            out["hit"] = snap.hit_test(float(x or 0), float(y or 0))
+
+        return {
+            "snapshot": out,
+            "target": target["id"],
+            "sessionTabId": session_manager.tab_id,
+        }
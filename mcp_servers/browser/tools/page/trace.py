@@ -0,0 +1,143 @@
+"""Performance trace capture for the current page (CDP Tracing domain).
+
+Records a trace for `duration_ms` with `transferMode: "ReturnAsStream"` and copies the
+gzip-compressed stream chunk by chunk (`IO.read`) into a temp file, so the trace is never
+held in memory (the handler moves the file into the artifact store). The file is then
+streamed once through `summarize_trace_file` for a bounded main-thread summary.
+"""
+
+from __future__ import annotations
+
+import base64
+import os
+import tempfile
+import time
+from contextlib import suppress
+from typing import Any
+
+from ...config import BrowserConfig
+from ..base import SmartToolError, get_session
+from .trace_summary import summarize_trace_file
+
+_MAX_DURATION_MS = 60_000
+_READ_CHUNK = 1 << 20
+
+# Roughly what the DevTools Performance panel records (without screenshots).
+DEFAULT_TRACE_CATEGORIES = (
+    "devtools.timeline",
+    "disabled-by-default-devtools.timeline",
+    "disabled-by-default-devtools.timeline.frame",
+    "toplevel",
+    "v8.execute",
+    "disabled-by-default-v8.gc",
+    "blink.user_timing",
+    "loading",
+)
+
+
+def _copy_stream(session: Any, handle: str, path: str) -> int:
+    """Drain a CDP IO stream into `path`; returns bytes written."""
+    written = 0
+    with open(path, "wb") as fh:
+        while True:
+            chunk = session.send("IO.read", {"handle": handle, "size": _READ_CHUNK})
+            data = chunk.get("data") or ""
+            if data:
+                raw = base64.b64decode(data) if chunk.get("base64Encoded") else data.encode("utf-8")
+                fh.write(raw)
+                written += len(raw)
+            if chunk.get("eof"):
+                return written
+
+
+def get_page_trace(
+    config: BrowserConfig,
+    *,
+    duration_ms: int = 3000,
+    categories: list[str] | None = None,
+    top: int = 10,
+) -> dict[str, Any]:
+    """Record a performance trace of the current page and summarize it.
+
+    Args:
+        config: Browser configuration
+        duration_ms: Recording window (clamped to [100..60000])
+        categories: Trace categories (default: DevTools timeline set)
+        top: Max long tasks reported (clamped to [1..50])
+
+    Returns:
+        Dictionary with `summary` plus `tracePath` pointing at the raw gzip JSON trace
+        (caller owns and removes it)
+    """
+    try:
+        duration_ms = max(100, min(int(duration_ms), _MAX_DURATION_MS))
+    except (TypeError, ValueError) as exc:
+        raise SmartToolError(
+            tool="page",
+            action="trace",
+            reason=f"Invalid trace options: {exc}",
+            suggestion="Use page(detail='trace', duration_ms=3000)",
+        ) from exc
+    cats = [str(c).strip() for c in categories or () if str(c).strip()] or list(DEFAULT_TRACE_CATEGORIES)
+
+    fd, path = tempfile.mkstemp(prefix="mcp-trace-", suffix=".json.gz")
+    os.close(fd)
+    timeout = 30.0 + duration_ms / 1000.0
+    try:
+        with get_session(config, timeout=timeout, ensure_diagnostics=False) as (session, target):
+            handle = None
+            recording = False
+            try:
+                session.send(
+                    "Tracing.start",
+                    {
+                        "transferMode": "ReturnAsStream",
+                        "streamFormat": "json",
+                        "streamCompression": "gzip",
+                        "traceConfig": {"recordMode": "recordAsMuchAsPossible", "includedCategories": cats},
+                    },
+                )
+                recording = True
+                time.sleep(duration_ms / 1000.0)
+                session.send("Tracing.end")
+                recording = False
+                done = session.wait_for_event("Tracing.tracingComplete", timeout=timeout)
+                handle = done.get("stream") if isinstance(done, dict) else None
+                if not isinstance(handle, str) or not handle:
+                    raise SmartToolError(
+                        tool="page",
+                        action="trace",
+                        reason="Tracing finished without a stream handle",
+                        suggestion="Retry; if it persists the target may not support ReturnAsStream tracing",
+                    )
+                started = time.perf_counter()
+                size = _copy_stream(session, handle, path)
+                read_ms = (time.perf_counter() - started) * 1000.0
+            except SmartToolError:
+                raise
+            except Exception as exc:  # noqa: BLE001
+                raise SmartToolError(
+                    tool="page",
+                    action="trace",
+                    reason=str(exc),
+                    suggestion="Ensure no other trace is running for this browser and retry with a shorter duration_ms",
+                ) from exc
+            finally:
+                if recording:
+                    with suppress(Exception):
+                        session.send("Tracing.end")
+                if handle:
+                    with suppress(Exception):
+                        session.send("IO.close", {"handle": handle})
+
+        started = time.perf_counter()
+        summary = summarize_trace_file(path, top=top)
+        summary["readMs"] = round(read_ms, 1)
+        summary["summarizeMs"] = round((time.perf_counter() - started) * 1000.0, 1)
+        summary["compressedBytes"] = size
+    except Exception:
+        with suppress(OSError):
+            os.unlink(path)
+        raise
+
+    return {"summary": summary, "categories": cats, "tracePath": path, "target": target["id"]}
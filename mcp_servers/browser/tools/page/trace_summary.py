@@ -0,0 +1,266 @@
+"""Streaming Chrome trace summarizer (Trace Event Format, plain or gzip JSON).
+
+The trace is never loaded whole: `iter_trace_events` walks the `traceEvents` array
+with `json.JSONDecoder.raw_decode` over a sliding text buffer (one event in memory at a
+time), and `TraceSummary` folds events into bounded per-thread counters.
+
+Reported for the renderer main thread (`CrRendererMain`; busiest one if several):
+- busy time (top-level RunTask) and the longest tasks (>= 50 ms)
+- layout / style recalculation counts and time
+- GC pauses (MinorGC / MajorGC): count, total, max
+- dropped frames (DroppedFrame, PipelineReporter STATE_DROPPED) vs presented frames
+"""
+
+from __future__ import annotations
+
+import gzip
+import heapq
+import json
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, TextIO
+
+LONG_TASK_US = 50_000
+_CHUNK_CHARS = 1 << 16
+_WS = " \t\r\n,"
+
+_TASKS = {"RunTask", "ThreadControllerImpl::RunTask"}
+_LAYOUT = {"Layout"}
+_STYLE = {"UpdateLayoutTree", "RecalculateStyles", "ScheduleStyleRecalculation"}
+_GC = {"MinorGC", "MajorGC"}
+
+
+def _open_text(path: str | Path) -> TextIO:
+    p = Path(path)
+    with p.open("rb") as fh:
+        gz = fh.read(2) == b"\x1f\x8b"
+    if gz:
+        return gzip.open(p, "rt", encoding="utf-8", errors="replace")
+    return p.open("r", encoding="utf-8", errors="replace")
+
+
+def iter_trace_events(fh: TextIO, *, chunk_chars: int = _CHUNK_CHARS) -> Iterator[dict[str, Any]]:
+    """Yield events from a JSON trace (`{"traceEvents": [...]}` or a bare array) incrementally."""
+    decoder = json.JSONDecoder()
+    buf = ""
+    pos = 0
+    eof = False
+
+    def _more() -> bool:
+        nonlocal buf, pos, eof
+        if eof:
+            return False
+        chunk = fh.read(chunk_chars)
+        if not chunk:
+            eof = True
+            return False
+        buf = buf[pos:] + chunk
+        pos = 0
+        return True
+
+    # Locate the start of the event array.
+    while True:
+        stripped = buf.lstrip()
+        if stripped[:1] == "[":
+            pos = len(buf) - len(stripped) + 1
+            break
+        key = buf.find('"traceEvents"')
+        if key >= 0:
+            bracket = buf.find("[", key)
+            if bracket >= 0:
+                pos = bracket + 1
+                break
+        if not _more():
+            return
+
+    while True:
+        while True:
+            while pos < len(buf) and buf[pos] in _WS:
+                pos += 1
+            if pos < len(buf) or not _more():
+                break
+        if pos >= len(buf) or buf[pos] == "]":
+            return
+        try:
+            event, end = decoder.raw_decode(buf, pos)
+        except json.JSONDecodeError:
+            if not _more():
+                # Truncated trace: stop at the last complete event.
+                return
+            continue
+        pos = end
+        if pos > chunk_chars:
+            buf = buf[pos:]
+            pos = 0
+        if isinstance(event, dict):
+            yield event
+
+
+class _Thread:
+    __slots__ = (
+        "events",
+        "busy_us",
+        "tasks",
+        "long_tasks",
+        "layout",
+        "layout_us",
+        "style",
+        "style_us",
+        "gc",
+        "gc_us",
+        "gc_max_us",
+        "open",
+    )
+
+    def __init__(self) -> None:
+        self.events = 0
+        self.busy_us = 0.0
+        self.tasks = 0
+        self.long_tasks: list[tuple[float, float]] = []  # min-heap of (dur, ts)
+        self.layout = 0
+        self.layout_us = 0.0
+        self.style = 0
+        self.style_us = 0.0
+        self.gc = 0
+        self.gc_us = 0.0
+        self.gc_max_us = 0.0
+        # name -> stack of begin timestamps for B/E pairs
+        self.open: dict[str, list[float]] = {}
+
+
+class TraceSummary:
+    """Fold trace events into bounded counters (feed with `add`, read with `result`)."""
+
+    def __init__(self, *, top: int = 10, long_task_us: int = LONG_TASK_US) -> None:
+        self.top = max(1, min(int(top), 50))
+        self.long_task_us = long_task_us
+        self.threads: dict[tuple[Any, Any], _Thread] = {}
+        self.names: dict[tuple[Any, Any], str] = {}
+        self.events = 0
+        self.ts_min: float | None = None
+        self.ts_max: float | None = None
+        self.dropped_frames = 0
+        self.presented_frames = 0
+
+    def add(self, ev: dict[str, Any]) -> None:
+        self.events += 1
+        ph = ev.get("ph")
+        name = ev.get("name")
+        key = (ev.get("pid"), ev.get("tid"))
+        if ph == "M":
+            if name == "thread_name":
+                args = ev.get("args")
+                if isinstance(args, dict) and isinstance(args.get("name"), str):
+                    self.names[key] = args["name"]
+            return
+        ts = ev.get("ts")
+        if isinstance(ts, (int, float)) and ts > 0:
+            self.ts_min = ts if self.ts_min is None else min(self.ts_min, ts)
+            self.ts_max = ts if self.ts_max is None else max(self.ts_max, ts)
+
+        if name == "DroppedFrame":
+            self.dropped_frames += 1
+            return
+        if name == "PipelineReporter" and ph in {"X", "b"}:
+            state = ((ev.get("args") or {}).get("chrome_frame_reporter") or {}).get("state")
+            if state == "STATE_DROPPED":
+                self.dropped_frames += 1
+            elif isinstance(state, str) and state.startswith("STATE_PRESENTED"):
+                self.presented_frames += 1
+            return
+
+        if name not in _TASKS and name not in _LAYOUT and name not in _STYLE and name not in _GC:
+            return
+        th = self.threads.get(key)
+        if th is None:
+            th = self.threads[key] = _Thread()
+        th.events += 1
+        if ph == "X":
+            dur = ev.get("dur")
+            if isinstance(dur, (int, float)) and isinstance(ts, (int, float)):
+                self._complete(th, name, float(ts), float(dur))
+        elif ph == "B" and isinstance(ts, (int, float)):
+            th.open.setdefault(name, []).append(float(ts))
+        elif ph == "E" and isinstance(ts, (int, float)):
+            starts = th.open.get(name)
+            if starts:
+                begin = starts.pop()
+                self._complete(th, name, begin, float(ts) - begin)
+
+    def _complete(self, th: _Thread, name: str, ts: float, dur: float) -> None:
+        if dur < 0:
+            return
+        if name in _TASKS:
+            th.tasks += 1
+            th.busy_us += dur
+            if dur >= self.long_task_us:
+                item = (dur, ts)
+                if len(th.long_tasks) < self.top:
+                    heapq.heappush(th.long_tasks, item)
+                elif item > th.long_tasks[0]:
+                    heapq.heapreplace(th.long_tasks, item)
+        elif name in _LAYOUT:
+            th.layout += 1
+            th.layout_us += dur
+        elif name in _STYLE:
+            th.style += 1
+            th.style_us += dur
+        else:
+            th.gc += 1
+            th.gc_us += dur
+            th.gc_max_us = max(th.gc_max_us, dur)
+
+    def _main_thread(self) -> tuple[tuple[Any, Any], _Thread] | None:
+        mains = [(k, t) for k, t in self.threads.items() if self.names.get(k) == "CrRendererMain"]
+        pool = mains or list(self.threads.items())
+        if not pool:
+            return None
+        return max(pool, key=lambda kv: kv[1].busy_us)
+
+    def result(self) -> dict[str, Any]:
+        origin = self.ts_min or 0.0
+        span_us = (self.ts_max - self.ts_min) if self.ts_min is not None and self.ts_max is not None else 0.0
+        out: dict[str, Any] = {
+            "events": self.events,
+            "durationMs": round(span_us / 1000.0, 1),
+            "threads": len(self.threads),
+            "frames": {
+                "dropped": self.dropped_frames,
+                "presented": self.presented_frames,
+                **(
+                    {"dropRate": round(self.dropped_frames / (self.dropped_frames + self.presented_frames), 3)}
+                    if self.dropped_frames + self.presented_frames
+                    else {}
+                ),
+            },
+        }
+        main = self._main_thread()
+        if main is None:
+            out["mainThread"] = None
+            return out
+        key, th = main
+        out["mainThread"] = {
+            "pid": key[0],
+            "tid": key[1],
+            "name": self.names.get(key),
+            "busyMs": round(th.busy_us / 1000.0, 1),
+            **({"busyPct": round(100.0 * th.busy_us / span_us, 1)} if span_us else {}),
+            "tasks": th.tasks,
+            "longTasks": [
+                {"startMs": round((ts - origin) / 1000.0, 1), "durationMs": round(dur / 1000.0, 1)}
+                for dur, ts in sorted(th.long_tasks, reverse=True)
+            ],
+            "layout": {"count": th.layout, "ms": round(th.layout_us / 1000.0, 1)},
+            "styleRecalc": {"count": th.style, "ms": round(th.style_us / 1000.0, 1)},
+            "gc": {"count": th.gc, "ms": round(th.gc_us / 1000.0, 1), "maxMs": round(th.gc_max_us / 1000.0, 1)},
+        }
+        return out
+
+
+def summarize_trace_file(path: str | Path, *, top: int = 10) -> dict[str, Any]:
+    """Stream a trace file (plain or gzip JSON) through `TraceSummary`."""
+    summary = TraceSummary(top=top)
+    with _open_text(path) as fh:
+        for ev in iter_trace_events(fh):
+            summary.add(ev)
+    return summary.result()
@@ -79,9 +79,8 @@ def wait_for(
     try:
         tab_id = session_manager.tab_id
         if isinstance(tab_id, str) and tab_id:
-            t0 = session_manager.get_telemetry(tab_id)
-            if t0 is not None and getattr(t0, "dialog_open", False):
-                meta = getattr(t0, "dialog_last", None)
+            dialog_open, meta = session_manager.tier0_dialog(tab_id)
+            if dialog_open:
                 dialog = meta if isinstance(meta, dict) else {}
                 return {
                     "success": False,
@@ -0,0 +1,105 @@
+"""
+Long-poll watch over Tier-0 event streams.
+
+Provides watch_events: block until a console/error/network/dialog/navigation record
+matching a predicate arrives after a cursor (or the timeout passes).
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import suppress
+from typing import Any
+
+from ...config import BrowserConfig
+from ...session import session_manager
+from ...telemetry_watch import STATUS_BUCKETS, WATCH_KINDS, WatchFilter
+from ..base import SmartToolError, get_session
+
+_MAX_WATCH_S = 300.0
+_PUMP_SLICE_S = 0.25
+
+
+def watch_events(
+    config: BrowserConfig,
+    *,
+    events: Any = None,
+    level: str | None = None,
+    url: str | None = None,
+    status: Any = None,
+    since_seq: int | None = None,
+    timeout: float = 10.0,
+    limit: int = 50,
+) -> dict[str, Any]:
+    """
+    Block until a Tier-0 record newer than `since_seq` matches, or `timeout` seconds pass.
+
+    Args:
+        config: Browser configuration
+        events: Event kinds to watch (default: all Tier-0 kinds)
+        level: Console level / error type filter ("error", "warn", ...)
+        url: URL glob or substring filter
+        status: Status bucket(s) for requests ("4xx", "5xx", "failed", ...)
+        since_seq: Cursor from a previous watch (default: only events after this call)
+        timeout: Maximum wait time in seconds
+        limit: Max events returned (the cursor resumes after the last returned one)
+
+    Returns:
+        Dictionary with matching events (oldest first), cursor, hasMore and timedOut
+    """
+    try:
+        match = WatchFilter.build(kinds=events, level=level, url=url, status=status)
+        cursor = int(since_seq) if since_seq is not None else None
+        timeout_s = max(0.0, min(float(timeout), _MAX_WATCH_S))
+    except (TypeError, ValueError) as exc:
+        raise SmartToolError(
+            tool="wait",
+            action="event",
+            reason=f"Invalid watch filter: {exc}",
+            suggestion=f"events ⊆ {list(WATCH_KINDS)}, status ⊆ {list(STATUS_BUCKETS)}, since_seq=<cursor>",
+        ) from exc
+
+    with get_session(config, ensure_diagnostics=False) as (session, target):
+        tier0 = session_manager.ensure_telemetry(session)
+        tab_id = session.tab_id
+        if not tier0.get("enabled") or not tab_id:
+            raise SmartToolError(
+                tool="wait",
+                action="event",
+                reason="Tier-0 telemetry is not available for this tab",
+                suggestion="Ensure MCP_TIER0=1 (default), then retry",
+            )
+
+        started = time.time()
+        deadline = started + timeout_s
+        # With a background bus (or extension push) events land in the shard on their own:
+        # block on its condition. Otherwise this connection's sink feeds it, so pump it.
+        pump = not tier0.get("bus") and tier0.get("mode") != "extension"
+        while True:
+            remaining = max(0.0, deadline - time.time())
+            out = session_manager.watch_tier0(
+                tab_id,
+                match,
+                since_seq=cursor,
+                timeout_s=0.0 if pump else remaining,
+                limit=limit,
+            )
+            if out is None:
+                raise SmartToolError(
+                    tool="wait",
+                    action="event",
+                    reason="Tier-0 telemetry store is missing for this tab",
+                    suggestion="Retry the call; if it persists, navigate() to reload the tab",
+                )
+            if not out["timedOut"] or remaining <= 0:
+                break
+            cursor = out["cursor"]
+            with suppress(Exception):
+                session.conn.wait_for_event("Tier0.watchPump", timeout=min(_PUMP_SLICE_S, remaining))
+
+        return {
+            **out,
+            "filter": match.to_dict(),
+            "elapsed": round(time.time() - started, 2),
+            "target": target["id"],
+        }
@@ -5,11 +5,14 @@ These helpers traverse:
 - same-origin iframes (via `iframe.contentDocument`)
 
 Cross-origin iframes are intentionally skipped (access throws).
+Root discovery lives in `dom_roots.py` (shared with the diagnostics script).
 """
 
 from __future__ import annotations
 
-DEEP_QUERY_JS = r"""
+from ..dom_roots import COLLECT_ROOTS_JS
+
+_CSS_ESCAPE_JS = r"""
 const __mcpCssEscape = (value) => {
   try {
     if (globalThis.CSS && typeof globalThis.CSS.escape === 'function') return globalThis.CSS.escape(String(value));
@@ -18,49 +21,9 @@ const __mcpCssEscape = (value) => {
   }
   return String(value).replace(/[^a-zA-Z0-9_-]/g, (c) => `\\${c}`);
 };
+"""
 
-const __mcpCollectRoots = (start) => {
-  const roots = [];
-  const queue = [{ root: start, depth: 0 }];
-  const MAX_ROOTS = 60;
-  const MAX_DEPTH = 6;
-  const MAX_SCAN = 4000;
-
-  while (queue.length && roots.length < MAX_ROOTS) {
-    const item = queue.shift();
-    const root = item && item.root;
-    const depth = item && typeof item.depth === 'number' ? item.depth : 0;
-    if (!root) continue;
-    if (roots.includes(root)) continue;
-    roots.push(root);
-    if (depth >= MAX_DEPTH) continue;
-    if (!root.querySelectorAll) continue;
-
-    let scanned = 0;
-    for (const el of root.querySelectorAll('*')) {
-      scanned += 1;
-      if (scanned > MAX_SCAN) break;
-      if (el && el.shadowRoot) {
-        queue.push({ root: el.shadowRoot, depth: depth + 1 });
-        if (roots.length + queue.length >= MAX_ROOTS) break;
-      }
-      if (el && (el.tagName === 'IFRAME' || el.tagName === 'FRAME')) {
-        try {
-          const doc = el.contentDocument || (el.contentWindow && el.contentWindow.document);
-          if (doc) {
-            queue.push({ root: doc, depth: depth + 1 });
-            if (roots.length + queue.length >= MAX_ROOTS) break;
-          }
-        } catch (e) {
-          // Cross-origin frame; ignore.
-        }
-      }
-    }
-  }
-
-  return roots;
-};
-
+_QUERY_JS = r"""
 const __mcpIsVisible = (el) => {
   try {
     if (!el || !el.getBoundingClientRect) return false;
@@ -83,14 +46,15 @@ const __mcpQueryAllDeep = (selector, maxTotal) => {
 
   for (const r of roots) {
     try {
-      out.push(...Array.from(r.querySelectorAll(selector)));
+      const found = r.querySelectorAll(selector);
+      for (let i = 0; i < found.length && out.length < cap; i++) out.push(found[i]);
       if (out.length >= cap) break;
     } catch (e) {
       // ignore
     }
   }
 
-  return out.slice(0, cap);
+  return out;
 };
 
 const __mcpPickIndex = (length, index) => {
@@ -102,3 +66,5 @@ const __mcpPickIndex = (length, index) => {
   return idx;
 };
 """
+
+DEEP_QUERY_JS = _CSS_ESCAPE_JS + COLLECT_ROOTS_JS + _QUERY_JS
@@ -11,22 +11,12 @@ from __future__ import annotations
 import contextlib
 from typing import Any
 
+from ...ax_index import AxIndex
+from ...ax_index import norm_text as _norm_text
 from ...config import BrowserConfig
 from ...session import session_manager
 from ..base import SmartToolError, get_session, with_retry
 
-
-def _ax_value(value: Any) -> Any:
-    """CDP AXValue is usually a dict with {type,value}. Return the underlying value."""
-    if isinstance(value, dict) and "value" in value:
-        return value.get("value")
-    return value
-
-
-def _norm_text(text: str) -> str:
-    return " ".join((text or "").split()).casefold()
-
-
 _AX_ROLE_ALIASES: dict[str, set[str]] = {
     "input": {"textbox", "searchbox", "combobox", "listbox", "textfield", "text"},
     "text": {"textbox", "textfield", "text"},
@@ -106,92 +96,38 @@ def _query_ax_tree(session, *, role: str | None, name: str | None) -> list[dict[
     return out
 
 
-def _ax_bool_prop(node: dict[str, Any], prop_name: str) -> bool | None:
-    props = node.get("properties")
-    if not isinstance(props, list):
-        return None
-    for p in props:
-        if not isinstance(p, dict):
-            continue
-        if p.get("name") != prop_name:
-            continue
-        v = _ax_value(p.get("value"))
-        if isinstance(v, bool):
-            return v
-        if isinstance(v, str) and v.lower() in {"true", "false"}:
-            return v.lower() == "true"
-    return None
-
-
 def _search_ax_items(
     nodes: list[dict[str, Any]],
     *,
     role: str | None,
     name: str | None,
     allowed_roles: set[str] | None = None,
-    hard_limit: int = 2000,
 ) -> list[dict[str, Any]]:
+    """Rank AX nodes by role/name via the per-snapshot inverted index (no scan cap)."""
     if allowed_roles:
         role_set = {_norm_text(r) for r in allowed_roles if isinstance(r, str) and r.strip()}
     else:
         role_set = {_norm_text(role)} if isinstance(role, str) and role.strip() else set()
     q_name = _norm_text(name) if isinstance(name, str) and name.strip() else ""
 
-    scored: list[tuple[int, dict[str, Any]]] = []
-    scanned = 0
-    for node in nodes:
-        scanned += 1
-        if scanned > hard_limit:
-            break
-        if node.get("ignored") is True:
-            continue
-
-        node_role = _norm_text(str(_ax_value(node.get("role")) or ""))
-        node_name = _norm_text(str(_ax_value(node.get("name")) or ""))
-
-        if role_set and node_role not in role_set:
-            continue
-
-        score = _score_match(query_name=q_name, node_name=node_name)
-        if q_name and score < 0:
-            continue
-
-        backend_id = node.get("backendDOMNodeId") or node.get("backendDomNodeId") or 0
-        backend_dom_node_id: int | None = None
-        if isinstance(backend_id, (int, float)):
-            backend_dom_node_id = int(backend_id)
-        focusable = _ax_bool_prop(node, "focusable")
-        disabled = _ax_bool_prop(node, "disabled")
+    out: list[dict[str, Any]] = []
+    for _score, rec in AxIndex(nodes).search(name=q_name, roles=role_set):
+        backend_id = rec.get("backendDOMNodeId") or 0
+        backend_dom_node_id = backend_id if isinstance(backend_id, int) else None
+        focusable = rec.get("focusable")
+        disabled = rec.get("disabled")
 
         item: dict[str, Any] = {
-            "role": str(_ax_value(node.get("role")) or ""),
-            "name": str(_ax_value(node.get("name")) or ""),
-            "backendDOMNodeId": backend_dom_node_id if backend_dom_node_id is not None else backend_id,
+            "role": rec.get("role") or "",
+            "name": rec.get("name") or "",
+            "backendDOMNodeId": backend_id,
             **({"focusable": focusable} if focusable is not None else {}),
             **({"disabled": disabled} if disabled is not None else {}),
         }
         if backend_dom_node_id:
             item["ref"] = f"dom:{backend_dom_node_id}"
-
-        scored.append((score + (10 if focusable else 0) + (-20 if disabled else 0), item))
-
-    scored.sort(key=lambda t: t[0], reverse=True)
-    return [it for _score, it in scored]
-
-
-def _score_match(*, query_name: str, node_name: str) -> int:
-    """Higher is better."""
-    if not query_name:
-        return 0
-    if not node_name:
-        return -10
-    if node_name == query_name:
-        return 100
-    if node_name.startswith(query_name):
-        return 80
-    if query_name in node_name:
-        return 50
-    return -1
+        out.append(item)
+    return out
 
 
 def _pick_index(n: int, index: int) -> int | None:
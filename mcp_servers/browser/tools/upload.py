@@ -62,8 +62,7 @@ def upload_file(config: BrowserConfig, file_paths: list[str], selector: str | No
             # If a JS dialog is open, Runtime.evaluate can hang indefinitely.
             try:
                 tab_id = session.tab_id
-                t0 = session_manager.get_telemetry(tab_id) if isinstance(tab_id, str) and tab_id else None
-                if t0 is not None and bool(getattr(t0, "dialog_open", False)):
+                if session_manager.tier0_dialog(tab_id)[0]:
                     raise SmartToolError(
                         tool="upload_file",
                         action="blocked",
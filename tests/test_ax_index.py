@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from mcp_servers.browser.ax_index import AxIndex, LabelIndex
+
+
+def _node(i: int, role: str, name: str, *, focusable: bool | None = None) -> dict:
+    props = [{"name": "focusable", "value": {"value": focusable}}] if focusable is not None else []
+    return {
+        "ignored": False,
+        "role": {"value": role},
+        "name": {"value": name},
+        "backendDOMNodeId": i,
+        "properties": props,
+    }
+
+
+def test_label_index_ranks_exact_prefix_substring() -> None:
+    idx = LabelIndex(
+        [
+            ("button", "Save draft"),
+            ("button", "Autosave"),
+            ("link", "Save"),
+            ("button", "  SAVE  "),
+            ("button", ""),
+            ("button", "Cancel"),
+        ]
+    )
+    assert idx.search(name="save") == [(100, 2), (100, 3), (80, 0), (50, 1)]
+    assert idx.search(name="save", roles={"button"}) == [(100, 3), (80, 0), (50, 1)]
+    assert idx.search(name="ve dr") == [(50, 0)]
+    assert idx.search(roles={"link"}) == [(0, 2)]
+    assert idx.exact(" save ") == [2, 3]
+
+
+def test_label_index_substring_matches_linear_scan() -> None:
+    import random
+
+    rng = random.Random(7)
+    alphabet = "abcde "
+    names = ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12))) for _ in range(400)]
+    idx = LabelIndex(("button", n) for n in names)
+    queries = ["a", "e", "ab", "b c", "abc", "cab", "dede", "a b", "zz", "x", "abcdea"]
+    queries += [n.strip()[1:5] for n in names[:40] if len(n.strip()) > 4]
+
+    for q in queries:
+        qn = " ".join(q.split())
+        if not qn:
+            continue
+        expected = sorted(i for i, n in enumerate(names) if qn in " ".join(n.split()))
+        assert sorted(i for _s, i in idx.search(name=q)) == expected, q
+
+
+def test_ax_index_has_no_scan_cap() -> None:
+    nodes = [_node(i + 1, "generic", f"row {i}") for i in range(20_000)]
+    nodes.append(_node(99_999, "button", "Export report", focusable=True))
+
+    hits = AxIndex(nodes).search(name="export", roles={"button"})
+    assert len(hits) == 1
+    score, rec = hits[0]
+    assert score == 90
+    assert rec["backendDOMNodeId"] == 99_999
+
+
+def test_ax_index_interactive_includes_focusable_in_document_order() -> None:
+    nodes = [
+        _node(1, "generic", "card", focusable=True),
+        _node(2, "button", "Go"),
+        {**_node(3, "button", "Hidden"), "ignored": True},
+        _node(4, "link", "Home"),
+    ]
+    recs = AxIndex(nodes).interactive({"button", "link"})
+    assert [r["backendDOMNodeId"] for r in recs] == [1, 2, 4]
+
+
+def test_resolve_affordance_by_label_uses_kind_filter() -> None:
+    from mcp_servers.browser.session import session_manager
+
+    session_manager.recover_reset()
+    session_manager.set_affordances(
+        "tab1",
+        items=[
+            {"ref": "aff:1", "tool": "click", "args": {}, "meta": {"kind": "link", "text": "Save"}},
+            {"ref": "aff:2", "tool": "click", "args": {}, "meta": {"kind": "button", "text": " Save "}},
+            {"ref": "aff:3", "tool": "click", "args": {}, "meta": {"kind": "button", "text": "Save all"}},
+        ],
+    )
+
+    chosen, _state, matches = session_manager.resolve_affordance_by_label("tab1", label="save", kind="button")
+    assert chosen is not None and chosen["ref"] == "aff:2"
+    assert [m["ref"] for m in matches] == ["aff:2"]
+
+    chosen, _state, matches = session_manager.resolve_affordance_by_label("tab1", label="SAVE")
+    assert chosen is None
+    assert {m["ref"] for m in matches} == {"aff:1", "aff:2"}
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import base64
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from mcp_servers.browser.body_capture import BodyCapture, CaptureRules
+from mcp_servers.browser.server.artifacts import ArtifactStore
+
+
+def _b64(data: bytes) -> str:
+    return base64.b64encode(data).decode("ascii")
+
+
+class _Wire:
+    """Records commands and lets the test answer them by id."""
+
+    def __init__(self) -> None:
+        self.sent: list[tuple[int, str, dict[str, Any]]] = []
+
+    def send(self, method: str, params: dict[str, Any]) -> int:
+        self.sent.append((len(self.sent) + 1, method, params))
+        return len(self.sent)
+
+    def last(self, method: str) -> int:
+        return [cid for cid, m, _p in self.sent if m == method][-1]
+
+
+def _capture(tmp_path: Path, **kw: Any) -> tuple[BodyCapture, _Wire, ArtifactStore]:
+    store = ArtifactStore(base_dir=tmp_path / "artifacts")
+    wire = _Wire()
+    rules = kw.pop("rules", CaptureRules(types=frozenset({"Fetch", "XHR"})))
+    return BodyCapture(store=store, rules=rules, send=wire.send, **kw), wire, store
+
+
+def _response(cap: BodyCapture, rid: str, url: str, *, rtype: str = "Fetch", mime: str = "application/json") -> None:
+    resp = {"url": url, "status": 200, "mimeType": mime}
+    cap.on_message(
+        {"method": "Network.responseReceived", "params": {"requestId": rid, "type": rtype, "response": resp}}
+    )
+
+
+def _streamed(cap: BodyCapture, wire: _Wire, rid: str, url: str, chunks: list[bytes]) -> None:
+    _response(cap, rid, url)
+    cap.on_message({"id": wire.last("Network.streamResourceContent"), "result": {"bufferedData": _b64(chunks[0])}})
+    for chunk in chunks[1:]:
+        cap.on_message({"method": "Network.dataReceived", "params": {"requestId": rid, "data": _b64(chunk)}})
+    cap.on_message({"method": "Network.loadingFinished", "params": {"requestId": rid}})
+
+
+def test_streamed_chunks_land_in_one_artifact_and_rules_filter(tmp_path: Path) -> None:
+    cap, wire, store = _capture(tmp_path)
+
+    _response(cap, "img", "https://cdn.example/a.png", rtype="Image", mime="image/png")
+    assert wire.sent == []  # type filtered: nothing armed
+
+    _streamed(cap, wire, "r1", "https://api.example/cart?token=abc", [b'{"total":', b" 42", b"}"])
+    entry = cap.lookup("r1")
+    assert entry is not None
+    assert entry["bytes"] == 13 and entry["mode"] == "stream" and entry["truncated"] is False
+    assert entry["url"] == "https://api.example/cart"
+    assert store.get_meta(artifact_id=entry["artifactId"])["kind"] == "response_body"
+    assert cap.read_body("r1", max_bytes=9) == (b'{"total":', True)
+    assert cap.read_body("r1", max_bytes=0) == (b'{"total": 42}', False)
+
+    # Failed requests leave nothing behind.
+    _response(cap, "r2", "https://api.example/x")
+    cap.on_message({"method": "Network.loadingFailed", "params": {"requestId": "r2"}})
+    assert cap.lookup("r2") is None and cap.status()["inFlight"] == 0
+
+
+def test_stream_unsupported_falls_back_to_get_response_body(tmp_path: Path) -> None:
+    cap, wire, _store = _capture(tmp_path)
+    _response(cap, "r1", "https://api.example/a")
+    cap.on_message({"id": wire.last("Network.streamResourceContent"), "error": {"message": "not supported"}})
+    cap.on_message({"method": "Network.loadingFinished", "params": {"requestId": "r1"}})
+
+    cap.on_message({"id": wire.last("Network.getResponseBody"), "result": {"body": "plain", "base64Encoded": False}})
+    entry = cap.lookup("r1")
+    assert entry is not None and entry["mode"] == "getResponseBody"
+    assert cap.read_body("r1", max_bytes=100) == (b"plain", False)
+
+
+def test_stream_result_after_loading_finished_is_not_written_twice(tmp_path: Path) -> None:
+    cap, wire, _store = _capture(tmp_path)
+    _response(cap, "r1", "https://api.example/a")
+    cap.on_message({"method": "Network.loadingFinished", "params": {"requestId": "r1"}})
+    cap.on_message({"id": wire.last("Network.streamResourceContent"), "result": {"bufferedData": _b64(b"whole")}})
+
+    cap.on_message({"id": wire.last("Network.getResponseBody"), "result": {"body": "whole", "base64Encoded": False}})
+    entry = cap.lookup("r1")
+    assert entry is not None and entry["mode"] == "getResponseBody" and entry["bytes"] == 5
+    assert cap.read_body("r1", max_bytes=100) == (b"whole", False)
+    assert cap.stored_bytes == 5
+
+
+def test_budget_evicts_oldest_or_skips(tmp_path: Path) -> None:
+    rules = CaptureRules(types=frozenset({"Fetch"}), max_body_bytes=1024)
+    cap, wire, store = _capture(tmp_path, rules=rules, budget_bytes=2048, evict="oldest")
+    for i in range(3):
+        _streamed(cap, wire, f"r{i}", f"https://api.example/{i}", [b"x" * 1000])
+    first = store.list(limit=10)
+    assert cap.lookup("r0") is None and cap.lookup("r2") is not None
+    assert cap.status()["evicted"] == 1 and cap.stored_bytes == 2000 and len(first) == 2
+
+    cap2, wire2, _ = _capture(tmp_path / "b", rules=rules, budget_bytes=2048, evict="none")
+    for i in range(4):
+        _streamed(cap2, wire2, f"r{i}", f"https://api.example/{i}", [b"y" * 700])
+    status = cap2.status()
+    assert cap2.lookup("r0") is not None and status["evicted"] == 0
+    assert status["storedBytes"] <= 2048 and status["skipped"] == 1
+    assert cap2.lookup("r2") is not None and cap2.lookup("r2")["truncated"] is True  # type: ignore[index]
+
+
+def test_replacing_a_capture_deletes_its_bodies_and_failed_start_closes_the_connection(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from mcp_servers.browser import body_capture
+
+    cap, wire, store = _capture(tmp_path)
+    for i in range(3):
+        _streamed(cap, wire, f"r{i}", f"https://api.example/{i}", [b"z" * 100])
+    cap.purge()
+    assert store.list(limit=10) == [] and cap.stored_bytes == 0 and cap.lookup("r0") is None
+
+    closed: list[bool] = []
+
+    class _Conn:
+        def __init__(self, *_a: Any, **_kw: Any) -> None: ...
+
+        def send(self, *_a: Any) -> dict:
+            raise OSError("tab gone")
+
+        def close(self) -> None:
+            closed.append(True)
+
+    monkeypatch.setattr(body_capture, "CdpConnection", _Conn)
+    worker = body_capture._CaptureWorker("ws://x", "t1", lambda send: _capture(tmp_path / "w")[0])
+    with pytest.raises(OSError):
+        worker.start()
+    assert closed == [True]
+
+
+def test_net_trace_prefers_captured_bodies(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from mcp_servers.browser import net_trace
+    from mcp_servers.browser.config import BrowserConfig
+    from mcp_servers.browser.session import session_manager
+
+    cap, wire, _store = _capture(tmp_path)
+    _streamed(cap, wire, "1", "https://api.example/a", [b'{"price": 10, "key": "sk-live-secret"}'])
+
+    class _T0:
+        _req_done = {
+            "1": {"type": "Fetch", "url": "https://api.example/a", "status": 200, "endTs": 1},
+            "2": {"type": "Fetch", "url": "https://api.example/b", "status": 200, "endTs": 2},
+        }
+
+    sent: list[list[dict[str, Any]]] = []
+
+    class _Sess:
+        def enable_network(self) -> None:
+            return
+
+        def send_many(self, cmds: list[dict[str, Any]], stop_on_error: bool = False) -> list[dict[str, Any]]:  # noqa: ARG002
+            sent.append(cmds)
+            return [{"body": "lazy", "base64Encoded": False} for _ in cmds]
+
+    monkeypatch.setattr(session_manager, "tier0_query", lambda _tab_id, query: query(_T0()))
+    monkeypatch.setattr(session_manager, "get_active_shared_session", lambda: (_Sess(), {"id": "tab1"}))
+    monkeypatch.setattr(net_trace, "get_body_capture", lambda _tab_id: cap)
+
+    out = net_trace.build_net_trace(BrowserConfig.from_env(), tab_id="tab1", capture="body", store=False)
+
+    assert sent == [[{"method": "Network.getResponseBody", "params": {"requestId": "2"}}]]
+    preview = {it["requestId"]: it for it in out["trace"]["preview"]}
+    assert preview["2"]["responseBody"] == "lazy"
+    assert '"price": 10' in preview["1"]["responseBody"]
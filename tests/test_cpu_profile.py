@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import json
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+from mcp_servers.browser.tools.page.cpu_profile import summarize_coverage, summarize_cpu_profile
+
+
+def _node(nid: int, name: str, url: str = "", children: list[int] | None = None, line: int = 0) -> dict:
+    return {
+        "id": nid,
+        "callFrame": {"functionName": name, "url": url, "lineNumber": line, "columnNumber": 4, "scriptId": "1"},
+        "children": children or [],
+    }
+
+
+def _profile() -> dict:
+    app = "https://app.example/static/app.js?v=123"
+    nodes = [
+        _node(1, "(root)", children=[2, 3, 4]),
+        _node(2, "(idle)"),
+        _node(3, "(program)"),
+        _node(4, "main", app, children=[5, 6], line=9),
+        _node(5, "render", app, children=[7], line=19),
+        _node(6, "parse", "https://cdn.example/lib.js", line=1),
+        _node(7, "render", app, line=19),  # recursion
+    ]
+    # 1 ms per sample: 20 idle, 80 busy (render x60 split across recursion, parse x20), 20 idle.
+    samples = [2] * 20 + [5] * 30 + [7] * 30 + [6] * 20 + [2] * 20
+    return {
+        "nodes": nodes,
+        "startTime": 0,
+        "endTime": 121_000,
+        "samples": samples,
+        "timeDeltas": [1000] * len(samples),
+    }
+
+
+def test_summary_self_total_urls_and_long_tasks() -> None:
+    out = summarize_cpu_profile(_profile())
+    assert out["samples"] == 120
+    assert out["durationMs"] == 121.0
+
+    top_self = {(f["function"], f["url"]): f for f in out["topSelf"]}
+    render = top_self[("render", "https://app.example/static/app.js")]
+    assert render["selfMs"] == 60.0
+    # Recursive frames count once toward total time.
+    assert render["totalMs"] == 60.0
+    assert render["line"] == 20
+
+    main = next(f for f in out["topTotal"] if f["function"] == "main")
+    assert main["totalMs"] == 80.0 and main["selfMs"] == 0.0
+    assert out["topUrls"][0] == {"url": "https://app.example/static/app.js", "selfMs": 60.0, "selfPct": 49.6}
+    assert out["categoriesMs"]["idle"] == 40.0
+
+    assert len(out["longTasks"]) == 1
+    task = out["longTasks"][0]
+    assert task["startMs"] == 21.0 and task["durationMs"] == 80.0
+    assert task["top"][0]["function"] == "render"
+
+
+def test_summary_handles_large_sample_arrays_quickly() -> None:
+    nodes = [_node(1, "(root)", children=list(range(2, 502)))]
+    nodes += [_node(i, f"fn{i}", f"https://app.example/{i % 7}.js") for i in range(2, 502)]
+    samples = [2 + (i * 7919) % 500 for i in range(400_000)]
+    profile = {"nodes": nodes, "startTime": 0, "endTime": 40_000_000, "samples": samples, "timeDeltas": [100] * 400_000}
+
+    started = time.perf_counter()
+    out = summarize_cpu_profile(profile, top=5)
+    elapsed = time.perf_counter() - started
+
+    assert out["samples"] == 400_000
+    assert len(out["topSelf"]) == 5 and len(out["topUrls"]) == 5
+    assert elapsed < 5.0
+
+
+def test_coverage_summary_ranks_least_used_scripts() -> None:
+    out = summarize_coverage(
+        {
+            "result": [
+                {
+                    "url": "https://app.example/a.js?x=1",
+                    "functions": [{"ranges": [{"count": 1}]}, {"ranges": [{"count": 0}]}, {"ranges": [{"count": 0}]}],
+                },
+                {"url": "https://app.example/b.js", "functions": [{"ranges": [{"count": 3}]}]},
+                {"url": "", "functions": [{"ranges": [{"count": 0}]}]},
+            ]
+        }
+    )
+    assert out["scripts"] == 2 and out["functions"] == 4 and out["executed"] == 2
+    assert out["leastUsed"][0] == {"url": "https://app.example/a.js", "functions": 3, "executed": 1}
+
+
+def test_profile_detail_stores_cpuprofile_artifact(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    from mcp_servers.browser.config import BrowserConfig
+    from mcp_servers.browser.server.artifacts import ArtifactStore
+    from mcp_servers.browser.server.handlers import page_capture
+    from mcp_servers.browser.tools.page import profile as profile_mod
+
+    sent: list[str] = []
+
+    class _Sess:
+        def send(self, method: str, params=None):  # noqa: ANN001,ARG002
+            sent.append(method)
+            return {"profile": _profile()} if method == "Profiler.stop" else {}
+
+    @contextmanager
+    def fake_get_session(_cfg, timeout: float = 5.0, **kwargs):  # noqa: ANN001,ARG001
+        yield _Sess(), {"id": "tab1"}
+
+    monkeypatch.setattr(profile_mod, "get_session", fake_get_session)
+    monkeypatch.setattr(profile_mod.time, "sleep", lambda _s: None)
+    store = ArtifactStore(base_dir=tmp_path / "artifacts")
+    monkeypatch.setattr(page_capture, "artifact_store", store)
+
+    out = page_capture.PAGE_CAPTURE_DETAILS["profile"](BrowserConfig.from_env(), {"duration_ms": 500})
+    assert sent[:3] == ["Profiler.enable", "Profiler.start", "Profiler.stop"]
+    assert "profilePath" not in out
+    assert out["summary"]["samples"] == 120
+    assert out["artifact"]["kind"] == "cpu_profile"
+
+    meta = store.get_meta(artifact_id=out["artifact"]["id"])
+    assert meta["mimeType"] == "application/json"
+    stored = json.loads((tmp_path / "artifacts" / f"{meta['id']}.cpuprofile").read_text(encoding="utf-8"))
+    assert len(stored["samples"]) == 120
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+from mcp_servers.browser.tools.page.dom_snapshot import DomSnapshot
+
+
+def _raw_snapshot() -> dict:
+    strings = [
+        "#document",  # 0
+        "HTML",  # 1
+        "BODY",  # 2
+        "A",  # 3
+        "href",  # 4
+        "/docs",  # 5
+        "#text",  # 6
+        "Read the docs",  # 7
+        "BUTTON",  # 8
+        "Save",  # 9
+        "DIV",  # 10
+        "hidden text",  # 11
+        "block",  # 12
+        "visible",  # 13
+        "1",  # 14
+        "hidden",  # 15
+        "pointer",  # 16
+        "https://example.com/",  # 17
+        "Example",  # 18
+        "aria-label",  # 19
+        "Save draft",  # 20
+    ]
+    # 0 doc, 1 html, 2 body, 3 a, 4 text, 5 button, 6 text, 7 div, 8 text
+    nodes = {
+        "parentIndex": [-1, 0, 1, 2, 3, 2, 5, 2, 7],
+        "nodeType": [9, 1, 1, 1, 3, 1, 3, 1, 3],
+        "nodeName": [0, 1, 2, 3, 6, 8, 6, 10, 6],
+        "nodeValue": [-1, -1, -1, -1, 7, -1, 9, -1, 11],
+        "backendNodeId": [1, 2, 3, 10, 11, 20, 21, 30, 31],
+        "attributes": [[], [], [], [4, 5], [], [19, 20], [], [], []],
+        "isClickable": {"index": [3, 5]},
+    }
+    layout = {
+        "nodeIndex": [1, 2, 3, 4, 5, 6, 7, 8],
+        "bounds": [
+            [0, 0, 800, 600],
+            [0, 0, 800, 600],
+            [10, 10, 100, 20],
+            [10, 10, 100, 20],
+            [10, 50, 80, 30],
+            [12, 52, 40, 20],
+            [0, 100, 800, 50],
+            [0, 100, 100, 20],
+        ],
+        "text": [-1, -1, -1, 7, -1, 9, -1, 11],
+        "styles": [
+            [12, 13, 14, 16],
+            [12, 13, 14, 16],
+            [12, 13, 14, 16],
+            [12, 13, 14, 16],
+            [12, 13, 14, 16],
+            [12, 13, 14, 16],
+            [12, 15, 14, 16],
+            [12, 15, 14, 16],
+        ],
+        "paintOrders": [0, 1, 2, 3, 4, 5, 6, 7],
+    }
+    doc = {
+        "documentURL": 17,
+        "title": 18,
+        "nodes": nodes,
+        "layout": layout,
+        "textBoxes": {},
+        "scrollOffsetX": 0,
+        "scrollOffsetY": 0,
+    }
+    return {"documents": [doc], "strings": strings}
+
+
+def test_snapshot_decodes_summary_and_visible_text() -> None:
+    snap = DomSnapshot.decode(_raw_snapshot())
+    summary = snap.summary()
+    assert summary["nodes"] == 9
+    assert summary["layoutNodes"] == 8
+    assert summary["url"] == "https://example.com/"
+
+    text = snap.visible_text()
+    assert text["text"] == "Read the docs Save"
+    assert "hidden text" not in text["text"]
+
+
+def test_snapshot_links_and_locators() -> None:
+    snap = DomSnapshot.decode(_raw_snapshot())
+
+    links = snap.links()
+    assert links == [{"text": "Read the docs", "href": "/docs", "backendDOMNodeId": 10}]
+
+    locs = snap.locators()
+    assert [(it["kind"], it["name"], it["backendDOMNodeId"]) for it in locs] == [
+        ("link", "Read the docs", 10),
+        ("button", "Save draft", 20),
+    ]
+    assert locs[1]["center"] == {"x": 50.0, "y": 65.0}
+    assert [it["kind"] for it in snap.locators(kind="button")] == ["button"]
+
+
+def test_snapshot_hit_test_prefers_topmost_paint_order() -> None:
+    snap = DomSnapshot.decode(_raw_snapshot())
+    hit = snap.hit_test(15, 55)
+    assert hit is not None
+    assert hit["tag"] == "button"
+    assert hit["backendDOMNodeId"] == 20
+    assert hit["path"][:2] == ["button", "body"]
+    assert snap.hit_test(5000, 5000) is None
+
+
+def test_snapshot_iframe_locators_and_hits_use_viewport_coordinates() -> None:
+    raw = _raw_snapshot()
+    strings = raw["strings"]
+    base = len(strings)
+    strings += ["IFRAME", "5px", "2px", "0px", "https://example.com/frame"]
+    iframe_tag, border, pad, zero, frame_url = range(base, base + 5)
+
+    main = raw["documents"][0]
+    nodes, layout = main["nodes"], main["layout"]
+    # 9: <iframe> under body at (100, 200), 5px border, 2px padding; page scrolled by 40px.
+    nodes["parentIndex"].append(2)
+    nodes["nodeType"].append(1)
+    nodes["nodeName"].append(iframe_tag)
+    nodes["nodeValue"].append(-1)
+    nodes["backendNodeId"].append(40)
+    nodes["attributes"].append([])
+    nodes["contentDocumentIndex"] = {"index": [9], "value": [1]}
+    layout["nodeIndex"].append(9)
+    layout["bounds"].append([100, 200, 300, 150])
+    layout["text"].append(-1)
+    layout["styles"].append([12, 13, 14, 16, border, border, pad, pad])
+    layout["paintOrders"].append(8)
+    main["scrollOffsetY"] = 40
+
+    frame = {
+        "documentURL": frame_url,
+        "title": -1,
+        "nodes": {
+            "parentIndex": [-1, 0, 1, 2, 3],
+            "nodeType": [9, 1, 1, 1, 3],
+            "nodeName": [0, 1, 2, 8, 6],
+            "nodeValue": [-1, -1, -1, -1, 9],
+            "backendNodeId": [100, 101, 102, 110, 111],
+            "attributes": [[], [], [], [], []],
+        },
+        "layout": {
+            "nodeIndex": [1, 2, 3, 4],
+            "bounds": [[0, 0, 286, 136], [0, 0, 286, 136], [10, 20, 60, 20], [10, 20, 30, 20]],
+            "text": [-1, -1, -1, 9],
+            "styles": [[12, 13, 14, 16, zero, zero, zero, zero]] * 4,
+            "paintOrders": [0, 1, 2, 3],
+        },
+        "scrollOffsetX": 0,
+        "scrollOffsetY": 0,
+    }
+    raw["documents"].append(frame)
+    snap = DomSnapshot.decode(raw)
+
+    # Frame origin: (100 + 5 + 2, 200 - 40 + 5 + 2) = (107, 167); button center (40, 30) inside.
+    framed = [it for it in snap.locators() if it.get("document") == 1]
+    assert [(it["backendDOMNodeId"], it["center"]) for it in framed] == [(110, {"x": 147.0, "y": 197.0})]
+
+    hit = snap.hit_test(147, 197)
+    assert hit is not None and hit["backendDOMNodeId"] == 110 and hit["document"] == 1
+    assert hit["bounds"] == {"x": 117.0, "y": 187.0, "w": 60.0, "h": 20.0}
+    outer = snap.hit_test(103, 163)  # on the iframe border, outside its document
+    assert outer is not None and outer["tag"] == "iframe" and "document" not in outer
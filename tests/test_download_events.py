@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from mcp_servers.browser.telemetry import Tier0Telemetry
+from mcp_servers.browser.tools.download_watch import DirWatcher, StreamingSha256
+
+
+def _ev(method: str, **params: Any) -> dict[str, Any]:
+    return {"method": method, "params": params}
+
+
+def test_tracker_maps_guids_and_hasher_follows_growing_file(tmp_path: Path) -> None:
+    t = Tier0Telemetry()
+    t.ingest(_ev("Page.downloadWillBegin", guid="g1", url="https://x.example/a?token=1", suggestedFilename="../r.csv"))
+    t.ingest(_ev("Browser.downloadProgress", guid="g1", state="inProgress", receivedBytes=5, totalBytes=10))
+    t.ingest(_ev("Page.downloadProgress", guid="g2", state="completed", receivedBytes=3, totalBytes=3))
+    t.ingest(_ev("Page.downloadProgress", guid="g2", state="inProgress", receivedBytes=1))  # late, ignored
+    first, second = t.downloads.after(0)
+    assert first["seq"] == 1 and first["fileName"] == "r.csv" and first["receivedBytes"] == 5
+    assert second["seq"] == 2 and second["state"] == "completed" and second["receivedBytes"] == 3
+    assert t.downloads.after(1) == [second] and t.downloads.version == 3
+
+    temp, final = tmp_path / "r.csv.crdownload", tmp_path / "r.csv"
+    hasher = StreamingSha256()
+    with temp.open("wb") as fh:
+        fh.write(b"a" * 1000)
+        fh.flush()
+        hasher.follow(temp)
+        hasher.advance()
+        fh.write(b"b" * 500)
+    temp.rename(final)  # the open descriptor keeps following the same inode
+    hasher.follow(final)
+    hasher.advance()
+    assert hasher.offset == 1500
+    assert hasher.finish(final) == hashlib.sha256(b"a" * 1000 + b"b" * 500).hexdigest()
+
+    capped = StreamingSha256(max_bytes=100)
+    capped.follow(final)
+    capped.advance()
+    assert capped.skipped and capped.finish(final) is None
+
+    with DirWatcher([tmp_path]) as watcher:
+        started = time.monotonic()
+        threading.Timer(0.05, lambda: (tmp_path / "new.bin").write_bytes(b"x")).start()
+        watcher.wait(2.0)
+        assert time.monotonic() - started < 1.5
+
+
+def test_wait_for_download_completes_from_events_with_streamed_sha256(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    from mcp_servers.browser.config import BrowserConfig
+    from mcp_servers.browser.session import session_manager
+    from mcp_servers.browser.telemetry import prepare_event
+    from mcp_servers.browser.telemetry_shards import TelemetryShard
+    from mcp_servers.browser.tools import downloads as downloads_mod
+    from mcp_servers.browser.tools.base import SmartToolError
+
+    shard = TelemetryShard()
+    monkeypatch.setitem(session_manager._telemetry, "tab-dl", shard)
+    monkeypatch.setattr(session_manager, "ensure_downloads", lambda _s: {"enabled": True, "available": True})
+    monkeypatch.setattr(session_manager, "get_download_dir", lambda _tab: tmp_path)
+    monkeypatch.setattr(downloads_mod, "_default_download_dirs", lambda _primary: [])
+
+    class DummySession:
+        tab_id = "tab-dl"
+
+    @contextmanager
+    def fake_get_session(_cfg: BrowserConfig):  # noqa: ANN001
+        yield DummySession(), {"id": "tab-dl"}
+
+    monkeypatch.setattr(downloads_mod, "get_session", fake_get_session)
+    old = tmp_path / "report.csv"  # same suggested name: Chrome uniquifies the new one
+    old.write_bytes(b"old")
+    os.utime(old, (time.time() - 60, time.time() - 60))
+    cursor = session_manager.tier0_downloads("tab-dl")["cursor"]
+    payload = [b"id,total\n", b"1,10\n" * 1000, b"2,20\n"]
+
+    def _browser() -> None:
+        shard.submit(prepare_event(_ev("Page.downloadWillBegin", guid="g9", suggestedFilename="report.csv")))
+        temp = tmp_path / "report (1).csv.crdownload"
+        with temp.open("wb") as fh:
+            for i, part in enumerate(payload):
+                fh.write(part)
+                fh.flush()
+                got = sum(len(p) for p in payload[: i + 1])
+                shard.submit(
+                    prepare_event(_ev("Page.downloadProgress", guid="g9", state="inProgress", receivedBytes=got))
+                )
+                time.sleep(0.05)
+        temp.rename(tmp_path / "report (1).csv")
+        shard.submit(prepare_event(_ev("Page.downloadProgress", guid="g9", state="completed")))
+
+    threading.Thread(target=_browser, daemon=True).start()
+    out = downloads_mod.wait_for_download(
+        BrowserConfig.from_env(), timeout=5, since_seq=cursor, since_ts=time.time(), sha256_max_bytes=0
+    )
+    dl = out["download"]
+    assert dl["fileName"] == "report (1).csv" and dl["completedByEvent"] is True
+    assert dl["bytes"] == sum(len(p) for p in payload)
+    assert dl["sha256"] == hashlib.sha256(b"".join(payload)).hexdigest()
+
+    cursor = session_manager.tier0_downloads("tab-dl")["cursor"]
+    shard.submit(prepare_event(_ev("Page.downloadWillBegin", guid="g10", suggestedFilename="big.iso")))
+    shard.submit(prepare_event(_ev("Page.downloadProgress", guid="g10", state="canceled")))
+    with pytest.raises(SmartToolError, match="canceled"):
+        downloads_mod.wait_for_download(BrowserConfig.from_env(), timeout=2, since_seq=cursor)
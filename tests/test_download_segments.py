@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+PAYLOAD = bytes(range(256)) * 4000  # ~1 MB
+
+
+class _Server:
+    def __init__(self) -> None:
+        self.ranges = True
+        self.fail_from: int | None = None  # cut connections for ranges starting at/after this offset
+        self.lost_from: int | None = None  # answer 200 (range lost) for ranges starting at/after this
+        self.slow_first = 0.0  # seconds to trickle the first segment over
+        self.requests: list[str] = []
+        self.sent = 0
+        outer = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *_args: Any) -> None:
+                return
+
+            def do_GET(self) -> None:  # noqa: N802
+                rng = self.headers.get("Range")
+                outer.requests.append(f"{self.path} {rng}")
+                if self.path == "/redirect":
+                    self.send_response(302)
+                    self.send_header("Location", "https://evil.example/x")
+                    self.end_headers()
+                    return
+                if not outer.ranges or not rng:
+                    self._send(200, PAYLOAD, {})
+                    return
+                start_s, end_s = rng.removeprefix("bytes=").split("-")
+                start, end = int(start_s), min(int(end_s), len(PAYLOAD) - 1)
+                body = PAYLOAD[start : end + 1]
+                headers = {"Content-Range": f"bytes {start}-{end}/{len(PAYLOAD)}"}
+                if outer.lost_from is not None and start >= outer.lost_from:
+                    self._send(200, PAYLOAD, {})
+                    return
+                if outer.slow_first and start == 0 and end > 0:
+                    self.send_response(206)
+                    self.send_header("Content-Length", str(len(body)))
+                    self.send_header("Content-Range", headers["Content-Range"])
+                    self.end_headers()
+                    step = len(body) // 10
+                    for i in range(10):
+                        time.sleep(outer.slow_first / 10)
+                        self.wfile.write(body[i * step : (i + 1) * step if i < 9 else len(body)])
+                    return
+                if outer.fail_from is not None and start >= outer.fail_from:
+                    self.send_response(206)
+                    self.send_header("Content-Length", str(len(body)))
+                    self.send_header("Content-Range", headers["Content-Range"])
+                    self.end_headers()
+                    self.wfile.write(body[:1000])  # then drop the connection
+                    self.close_connection = True
+                    return
+                self._send(206, body, headers)
+
+            def _send(self, status: int, body: bytes, headers: dict[str, str]) -> None:
+                self.send_response(status)
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("ETag", '"v1"')
+                self.send_header("Content-Disposition", 'attachment; filename="report.bin"')
+                for k, v in headers.items():
+                    self.send_header(k, v)
+                self.end_headers()
+                self.wfile.write(body)
+                outer.sent += len(body)
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+
+@pytest.fixture
+def server() -> Iterator[_Server]:
+    srv = _Server()
+    yield srv
+    srv.httpd.shutdown()
+
+
+def _fetch(tmp_path: Path, url: str, **cfg: Any) -> dict[str, Any]:
+    import dataclasses
+
+    from mcp_servers.browser.config import BrowserConfig
+    from mcp_servers.browser.tools.downloads import _download_via_url
+
+    config = dataclasses.replace(BrowserConfig.from_env(), **cfg)
+    return _download_via_url(config, url=url, file_name=None, max_bytes=0, timeout=5, dest_dir=tmp_path)
+
+
+def test_segmented_download_resumes_after_failure_and_hashes_incrementally(
+    server: _Server, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from mcp_servers.browser.tools import download_segments
+    from mcp_servers.browser.tools.base import SmartToolError
+
+    monkeypatch.setattr(download_segments, "SEGMENT_MIN_BYTES", 200_000)
+    monkeypatch.setenv("MCP_DOWNLOAD_SEGMENTS", "4")
+    expected = hashlib.sha256(PAYLOAD).hexdigest()
+
+    server.fail_from = 600_000  # the last segment keeps dropping mid-way
+    with pytest.raises(SmartToolError) as err:
+        _fetch(tmp_path, f"{server.url}/export")
+    assert err.value.details["resumable"] is True and err.value.details["bytes"] >= 768_000
+    assert not list(tmp_path.glob("report*"))
+
+    server.fail_from = None
+    server.requests.clear()
+    server.sent = 0
+    out = _fetch(tmp_path, f"{server.url}/export")
+    assert out["fileName"] == "report.bin" and out["bytes"] == len(PAYLOAD) and out["sha256"] == expected
+    assert out["segments"] == 4 and out["resumedBytes"] >= 768_000
+    assert server.sent < 300_000  # only the missing tail (plus the 1-byte probe) was fetched
+    assert (tmp_path / "report.bin").read_bytes() == PAYLOAD
+    assert not list(tmp_path.glob(".*.part*"))
+
+    server.ranges = False
+    plain = _fetch(tmp_path, f"{server.url}/export")
+    assert plain["fileName"] == "report-1.bin" and plain["sha256"] == expected and "segments" not in plain
+
+
+def test_segmented_download_keeps_allowlist_on_redirects(server: _Server, tmp_path: Path) -> None:
+    from mcp_servers.browser.tools.base import SmartToolError
+
+    with pytest.raises(SmartToolError, match="not in allowlist"):
+        _fetch(tmp_path, f"{server.url}/redirect", allow_hosts=["127.0.0.1"])
+
+
+def test_segment_failure_cancels_the_other_segments(
+    server: _Server, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from mcp_servers.browser.tools import download_segments
+    from mcp_servers.browser.tools.base import SmartToolError
+
+    monkeypatch.setattr(download_segments, "SEGMENT_MIN_BYTES", 200_000)
+    monkeypatch.setenv("MCP_DOWNLOAD_SEGMENTS", "4")
+    server.slow_first = 3.0
+    server.lost_from = 1
+
+    started = time.monotonic()
+    with pytest.raises(SmartToolError) as err:
+        _fetch(tmp_path, f"{server.url}/export")
+    assert time.monotonic() - started < 1.5  # did not wait for the slow segment
+    assert err.value.details["resumable"] is False and "restarts" in err.value.suggestion
+    assert not list(tmp_path.glob(".*.part*"))
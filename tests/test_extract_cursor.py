@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import json
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+
+class _PagedSession:
+    """Fake session that serves a materialized list like the in-page cursor cache would."""
+
+    tab_id = "tab1"
+
+    def __init__(self, items: list[dict], *, expire_first_read: bool = False) -> None:
+        self.items = items
+        self.expire_first_read = expire_first_read
+        self.calls: list[str] = []
+
+    def _page(self, offset: int, limit: int, cursor: str) -> dict:
+        total = len(self.items)
+        return {
+            "contentType": "main",
+            "total": total,
+            "offset": offset,
+            "limit": limit,
+            "hasMore": offset + limit < total,
+            "items": self.items[offset : offset + limit],
+            "cursor": cursor,
+        }
+
+    def eval_js(self, js: str, **_kwargs):  # noqa: ANN003
+        import re
+
+        cursor_m = re.search(r'const __mcpCursor = "([^"]+)"', js)
+        cursor = cursor_m.group(1) if cursor_m else ""
+        if "return !!(st && st.sessions.delete(" in js:
+            self.calls.append("release")
+            return True
+        m = re.search(r"__mcpPage\([^,]+, [^,]+, [^,]+, (\d+), (\d+), __mcpCursor\)", js)
+        assert m, js[:200]
+        offset, limit = int(m.group(1)), int(m.group(2))
+        if "sessions.set(" in js:
+            self.calls.append("materialize")
+            return self._page(offset, limit, cursor)
+        self.calls.append("page")
+        if self.expire_first_read:
+            self.expire_first_read = False
+            return {"expired": True, "cursor": cursor}
+        return self._page(offset, limit, cursor)
+
+
+def _patch_session(monkeypatch: pytest.MonkeyPatch, sess: _PagedSession) -> None:
+    from mcp_servers.browser.tools.page import extract as extract_mod
+
+    @contextmanager
+    def fake_get_session(_cfg, timeout: float = 5.0, **kwargs):  # noqa: ANN001,ARG001
+        yield sess, {"id": "tab1"}
+
+    monkeypatch.setattr(extract_mod, "get_session", fake_get_session)
+
+
+def test_extract_cursor_pages_without_rematerializing(monkeypatch: pytest.MonkeyPatch) -> None:
+    from mcp_servers.browser.config import BrowserConfig
+    from mcp_servers.browser.tools.page.extract import extract_content
+
+    sess = _PagedSession([{"tag": "p", "text": f"row {i}"} for i in range(25)])
+    _patch_session(monkeypatch, sess)
+    cfg = BrowserConfig.from_env()
+
+    first = extract_content(cfg, content_type="main", limit=10, cursor=True)
+    cursor = first["cursor"]
+    assert first["total"] == 25
+
+    second = extract_content(cfg, offset=10, limit=10, cursor=cursor)
+    assert second["items"][0]["text"] == "row 10"
+    assert sess.calls == ["materialize", "page"]
+
+
+def test_extract_cursor_rebuilds_after_mutation(monkeypatch: pytest.MonkeyPatch) -> None:
+    from mcp_servers.browser.config import BrowserConfig
+    from mcp_servers.browser.tools.page.extract import extract_content
+
+    sess = _PagedSession([{"tag": "p", "text": f"row {i}"} for i in range(5)])
+    _patch_session(monkeypatch, sess)
+    cfg = BrowserConfig.from_env()
+
+    cursor = extract_content(cfg, content_type="main", limit=2, cursor=True)["cursor"]
+    sess.expire_first_read = True
+    res = extract_content(cfg, offset=2, limit=2, cursor=cursor)
+    assert res["cursorRebuilt"] is True
+    assert res["cursor"] == cursor
+    assert sess.calls == ["materialize", "page", "materialize"]
+
+
+def test_extract_unknown_cursor_is_an_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    from mcp_servers.browser.config import BrowserConfig
+    from mcp_servers.browser.tools.base import SmartToolError
+    from mcp_servers.browser.tools.page.extract import extract_content
+
+    sess = _PagedSession([], expire_first_read=True)
+    _patch_session(monkeypatch, sess)
+
+    with pytest.raises(SmartToolError):
+        extract_content(BrowserConfig.from_env(), offset=0, limit=5, cursor="ex_missing")
+
+
+def test_extract_export_streams_jsonl_artifact(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    from mcp_servers.browser.config import BrowserConfig
+    from mcp_servers.browser.server.artifacts import ArtifactStore
+    from mcp_servers.browser.server.handlers import extract_export
+
+    store = ArtifactStore(base_dir=tmp_path / "artifacts")
+    monkeypatch.setattr(extract_export, "artifact_store", store)
+
+    sess = _PagedSession([{"tag": "p", "text": f"row {i}"} for i in range(1203)])
+    _patch_session(monkeypatch, sess)
+
+    out = extract_export.export_extract_jsonl(BrowserConfig.from_env(), {"content_type": "main"})
+    assert out["exported"] == 1203
+    assert out["complete"] is True
+    assert out["chunks"] == 3
+    assert sess.calls[-1] == "release"
+
+    meta = store.get_meta(artifact_id=out["artifact"]["id"])
+    assert meta["mimeType"] == "application/x-ndjson"
+    assert meta["meta"]["items"] == 1203 and meta["meta"]["complete"] is True
+    lines = Path(tmp_path / "artifacts" / f"{meta['id']}.jsonl").read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 1203
+    assert json.loads(lines[-1])["text"] == "row 1202"
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import dataclasses
+import json
+from contextlib import contextmanager
+from typing import Any
+
+import pytest
+
+
+def test_fetch_batch_pools_in_page_streams_results_and_summarizes(monkeypatch: pytest.MonkeyPatch) -> None:
+    from mcp_servers.browser.config import BrowserConfig
+    from mcp_servers.browser.tools import network as network_mod
+
+    cfg = dataclasses.replace(BrowserConfig.from_env(), allow_hosts=["api.example"])
+    started: dict[str, Any] = {}
+    drains = [
+        {"items": [{"i": 0, "ok": True, "status": 200, "body": "{}", "ms": 3}], "complete": False},
+        {"items": [], "complete": False},
+        {
+            "items": [
+                {"i": 2, "ok": False, "status": 404, "body": "", "ms": 2},
+                {"i": 3, "ok": False, "status": 0, "error": "The operation was aborted.", "errorType": "AbortError"},
+            ],
+            "complete": True,
+        },
+    ]
+
+    class DummySession:
+        def eval_js(self, expression: str, *, timeout: float | None = None) -> Any:  # noqa: ARG002
+            if expression.startswith("["):  # URL resolution
+                return [
+                    None if u is None else f"https://api.example{u}" if u.startswith("/") else u
+                    for u in json.loads(expression.split(".map(")[0])
+                ]
+            if "__mcpFetchBatch = " in expression:
+                started["reqs"] = json.loads(expression.split("const reqs = ")[1].split(";\n")[0])
+                started["workers"] = "Math.min(3," in expression
+                return len(started["reqs"])
+            return drains.pop(0)
+
+    @contextmanager
+    def fake_get_session(_cfg):  # noqa: ANN001
+        yield DummySession(), {"id": "tab1"}
+
+    monkeypatch.setattr(network_mod, "get_session", fake_get_session)
+
+    batches: list[list[dict[str, Any]]] = []
+    summary = network_mod.browser_fetch_batch(
+        cfg,
+        [
+            {"url": "/items?page=1"},
+            {"url": "https://evil.example/x"},
+            {"url": "/items?page=2", "method": "POST", "body": {"q": 1}, "timeout_ms": 500},
+            {"url": "/slow", "max_body_size": 10},
+            "nope",
+        ],
+        sink=batches.append,
+        concurrency=3,
+    )
+
+    assert [r["i"] for r in started["reqs"]] == [0, 2, 3] and started["workers"]
+    assert started["reqs"][1]["body"] == '{"q": 1}' and started["reqs"][1]["timeoutMs"] == 500
+    assert started["reqs"][2]["maxBody"] == 10
+    rejected = batches[0]
+    assert [r["i"] for r in rejected] == [1, 4] and "allowlist" in rejected[0]["error"]
+    assert batches[1][0]["url"] == "https://api.example/items?page=1" and batches[2][0]["method"] == "POST"
+    assert summary["total"] == 5 and summary["ok"] == 1 and summary["failed"] == 4
+    assert summary["byStatus"] == {"200": 1, "404": 1, "error": 3}
+    assert [e["i"] for e in summary["errors"]] == [1, 4, 2, 3]
+    assert not drains
+
+
+def test_fetch_batch_rejects_empty_and_oversized_batches() -> None:
+    from mcp_servers.browser.config import BrowserConfig
+    from mcp_servers.browser.tools.base import SmartToolError
+    from mcp_servers.browser.tools.network import browser_fetch_batch
+
+    cfg = BrowserConfig.from_env()
+    with pytest.raises(SmartToolError, match="non-empty"):
+        browser_fetch_batch(cfg, [], sink=lambda _items: None)
+    with pytest.raises(SmartToolError, match="Too many"):
+        browser_fetch_batch(cfg, [{"url": "/x"}] * 1001, sink=lambda _items: None)
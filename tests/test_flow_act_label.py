@@ -52,7 +52,7 @@ def test_flow_act_label_resolves_to_tool_call(monkeypatch: pytest.MonkeyPatch) -
 
     monkeypatch.setattr(session_manager, "shared_session", fake_shared_session)
     monkeypatch.setattr(session_manager, "ensure_telemetry", lambda _sess: {"enabled": True})
-    monkeypatch.setattr(session_manager, "get_telemetry", lambda _tab_id: None)
+    monkeypatch.setattr(session_manager, "tier0_query", lambda _tab_id, _query: None)
     monkeypatch.setattr(
         session_manager,
         "tier0_snapshot",
@@ -147,7 +147,7 @@ def test_flow_act_label_ambiguous_fails_closed(monkeypatch: pytest.MonkeyPatch)
 
     monkeypatch.setattr(session_manager, "shared_session", fake_shared_session)
     monkeypatch.setattr(session_manager, "ensure_telemetry", lambda _sess: {"enabled": True})
-    monkeypatch.setattr(session_manager, "get_telemetry", lambda _tab_id: None)
+    monkeypatch.setattr(session_manager, "tier0_query", lambda _tab_id, _query: None)
     monkeypatch.setattr(
         session_manager,
         "tier0_snapshot",
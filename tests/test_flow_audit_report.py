@@ -34,7 +34,7 @@ def test_flow_final_audit_attaches_audit_payload(monkeypatch: pytest.MonkeyPatch
 
     monkeypatch.setattr(session_manager, "shared_session", fake_shared_session)
     monkeypatch.setattr(session_manager, "ensure_telemetry", lambda _sess: {"enabled": True})
-    monkeypatch.setattr(session_manager, "get_telemetry", lambda _tab_id: None)
+    monkeypatch.setattr(session_manager, "tier0_query", lambda _tab_id, _query: None)
     monkeypatch.setattr(
         session_manager,
         "tier0_snapshot",
@@ -112,7 +112,7 @@ def test_run_report_audit_includes_audit(monkeypatch: pytest.MonkeyPatch) -> Non
 
     monkeypatch.setattr(session_manager, "shared_session", fake_shared_session)
     monkeypatch.setattr(session_manager, "ensure_telemetry", lambda _sess: {"enabled": True})
-    monkeypatch.setattr(session_manager, "get_telemetry", lambda _tab_id: None)
+    monkeypatch.setattr(session_manager, "tier0_query", lambda _tab_id, _query: None)
     monkeypatch.setattr(
         session_manager,
         "tier0_snapshot",
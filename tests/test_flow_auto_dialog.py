@@ -44,7 +44,7 @@ def test_flow_auto_dialog_dismiss(monkeypatch: pytest.MonkeyPatch) -> None:
     # Keep the test hermetic: no real CDP/Chrome.
     monkeypatch.setattr(session_manager, "shared_session", fake_shared_session)
     monkeypatch.setattr(session_manager, "ensure_telemetry", lambda _sess: {"enabled": True})
-    monkeypatch.setattr(session_manager, "get_telemetry", lambda _tab_id: telemetry)
+    monkeypatch.setattr(session_manager, "tier0_query", lambda _tab_id, query: query(telemetry))
     monkeypatch.setattr(session_manager, "_schedule_auto_dialog_handle", lambda *_a, **_k: None)
     session_manager._session_tab_id = "tab1"  # best-effort for code paths that read tab_id
 
@@ -110,7 +110,7 @@ def test_flow_start_at_skips_steps(monkeypatch: pytest.MonkeyPatch) -> None:
 
     monkeypatch.setattr(session_manager, "shared_session", fake_shared_session)
     monkeypatch.setattr(session_manager, "ensure_telemetry", lambda _sess: {"enabled": True})
-    monkeypatch.setattr(session_manager, "get_telemetry", lambda _tab_id: None)
+    monkeypatch.setattr(session_manager, "tier0_query", lambda _tab_id, _query: None)
     session_manager._session_tab_id = "tab1"  # best-effort for code paths that read tab_id
 
     from mcp_servers.browser import tools as tools_module
@@ -29,7 +29,7 @@ def test_flow_auto_download_after_click(monkeypatch: pytest.MonkeyPatch, tmp_pat
 
     monkeypatch.setattr(session_manager, "shared_session", fake_shared_session)
     monkeypatch.setattr(session_manager, "ensure_telemetry", lambda _sess: {"enabled": True})
-    monkeypatch.setattr(session_manager, "get_telemetry", lambda _tab_id: None)
+    monkeypatch.setattr(session_manager, "tier0_query", lambda _tab_id, _query: None)
     monkeypatch.setattr(session_manager, "ensure_downloads", lambda _sess: {"enabled": True, "available": True})
     session_manager._session_tab_id = "tab1"  # best-effort for code paths that read tab_id
 
@@ -32,7 +32,7 @@ def test_flow_auto_tab_switches_to_new_tab(monkeypatch: pytest.MonkeyPatch) -> N
 
     monkeypatch.setattr(session_manager, "shared_session", fake_shared_session)
     monkeypatch.setattr(session_manager, "ensure_telemetry", lambda _sess: {"enabled": True})
-    monkeypatch.setattr(session_manager, "get_telemetry", lambda _tab_id: None)
+    monkeypatch.setattr(session_manager, "tier0_query", lambda _tab_id, _query: None)
     monkeypatch.setattr(
         session_manager,
         "tier0_snapshot",
@@ -71,7 +71,7 @@ def test_flow_autohandles_dialog_open_between_steps(monkeypatch: pytest.MonkeyPa
 
     monkeypatch.setattr(session_manager, "shared_session", fake_shared_session)
     monkeypatch.setattr(session_manager, "ensure_telemetry", lambda _sess: {"enabled": True})
-    monkeypatch.setattr(session_manager, "get_telemetry", lambda _tab_id: t0)
+    monkeypatch.setattr(session_manager, "tier0_query", lambda _tab_id, query: query(t0))
     monkeypatch.setattr(session_manager, "_ingest_tier0_event", fake_ingest)
     monkeypatch.setattr(session_manager, "_schedule_auto_dialog_handle", lambda *_a, **_k: None)
     session_manager._session_tab_id = "tab1"
@@ -168,7 +168,7 @@ def test_flow_retries_js_once_when_blocked_by_dialog(monkeypatch: pytest.MonkeyP
         dialog_last = {"type": "alert", "message": "Hi", "url": "about:blank"}
 
     t0 = Telemetry()
-    monkeypatch.setattr(session_manager, "get_telemetry", lambda _tab_id: t0)
+    monkeypatch.setattr(session_manager, "tier0_query", lambda _tab_id, query: query(t0))
     monkeypatch.setattr(session_manager, "_schedule_auto_dialog_handle", lambda *_a, **_k: None)
     session_manager._session_tab_id = "tab1"
 
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import Any
+
+import pytest
+
+from mcp_servers.browser.server.flow.perf_budget import assert_perf, net_baseline, parse_budget
+from mcp_servers.browser.telemetry import Tier0Telemetry
+
+T0 = 1_700_000_000.0
+
+
+def _request(t: Tier0Telemetry, rid: str, *, status: int, size: int) -> None:
+    t.ingest(
+        {
+            "method": "Network.requestWillBeSent",
+            "params": {"requestId": rid, "type": "Fetch", "request": {"url": f"https://api.example/{rid}"}},
+        }
+    )
+    t.ingest({"method": "Network.responseReceived", "params": {"requestId": rid, "response": {"status": status}}})
+    t.ingest({"method": "Network.loadingFinished", "params": {"requestId": rid, "encodedDataLength": size}})
+
+
+def _page_with_vitals(*, long_tasks: bool = True) -> Tier0Telemetry:
+    t = Tier0Telemetry()
+    t.ingest(
+        {
+            "method": "Network.requestWillBeSent",
+            "params": {
+                "requestId": "L1",
+                "loaderId": "L1",
+                "type": "Document",
+                "wallTime": T0,
+                "request": {"url": "https://app.example/"},
+            },
+        }
+    )
+    t.ingest(
+        {
+            "method": "Page.frameNavigated",
+            "params": {"frame": {"id": "F", "loaderId": "L1", "url": "https://app.example/"}},
+        }
+    )
+    timeline = [
+        {"type": "largest-contentful-paint", "time": T0 + 2.9, "lcpDetails": {"renderTime": T0 + 2.9, "size": 900}},
+        {"type": "longtask", "time": T0 + 1.0, "duration": 0.25},
+    ][: 2 if long_tasks else 1]
+    for ev in timeline:
+        t.ingest({"method": "PerformanceTimeline.timelineEventAdded", "params": {"event": ev}})
+    return t
+
+
+def test_parse_budget_rejects_unknown_metrics() -> None:
+    assert parse_budget("transfer_kb <= 1500.5") == ("transfer_kb", "<=", 1500.5)
+    with pytest.raises(ValueError, match="Unknown metric"):
+        parse_budget("fcp_ms<1000")
+    with pytest.raises(ValueError, match="Invalid budget"):
+        parse_budget("lcp_ms less than 2500")
+
+
+def test_assert_perf_reports_measured_values_and_run_scoped_requests() -> None:
+    t = _page_with_vitals()
+    _request(t, "before", status=500, size=10_000)  # happened before the run: excluded
+    baseline = net_baseline(t, "tab1")
+    _request(t, "a", status=200, size=2048)
+    _request(t, "b", status=404, size=1024)
+
+    out = assert_perf(
+        {"budgets": ["lcp_ms<2500", "longtasks_total_ms<300", "failed_requests==0", "transfer_kb<1500"]},
+        telemetry=t,
+        tab_id="tab1",
+        baseline=baseline,
+    )
+    assert out["ok"] is False
+    assert out["measured"] == {"lcp_ms": 2900, "longtasks_total_ms": 250, "failed_requests": 1, "transfer_kb": 3.0}
+    assert [r["ok"] for r in out["budgets"]] == [False, True, False, True]
+    assert out["error"].startswith("Performance budget exceeded: lcp_ms<2500 (actual 2900)")
+
+    # Vitals never observed: fail closed with an actionable hint.
+    cold = assert_perf({"budgets": "cls<0.1"}, telemetry=Tier0Telemetry(), tab_id="tab1", baseline=None)
+    assert cold["ok"] is False and cold["budgets"][0]["actual"] is None and "navigate" in cold["suggestion"]
+
+
+def test_long_task_budgets_without_long_task_data_are_unmeasured_not_passing() -> None:
+    t = _page_with_vitals(long_tasks=False)  # LCP only: no long-task entries reached the tracker
+    out = assert_perf(
+        {"budgets": ["longtasks_count==0", "tbt_ms<200", "lcp_ms<5000"]}, telemetry=t, tab_id="tab1", baseline=None
+    )
+    assert out["ok"] is False
+    assert out["budgets"][:2] == [
+        {"budget": "longtasks_count==0", "actual": None, "ok": False, "unmeasured": True},
+        {"budget": "tbt_ms<200", "actual": None, "ok": False, "unmeasured": True},
+    ]
+    assert out["budgets"][2]["ok"] is True
+    assert out["error"] == "Performance budget exceeded: longtasks_count==0 (unmeasured), tbt_ms<200 (unmeasured)"
+    assert "Long tasks were not collected" in out["suggestion"]
+
+
+def test_run_assert_perf_step_uses_buffered_telemetry_only(monkeypatch: pytest.MonkeyPatch) -> None:
+    from mcp_servers.browser.config import BrowserConfig
+    from mcp_servers.browser.server.registry import create_default_registry
+    from mcp_servers.browser.server.types import ToolResult
+    from mcp_servers.browser.session import session_manager
+
+    session_manager.recover_reset()
+    telemetry = _page_with_vitals()
+
+    class DummySession:
+        tab_id = "tab1"
+        tab_url = "about:blank"
+
+        def eval_js(self, expression: str, *, timeout: float | None = None):  # noqa: ANN001,ARG002
+            return None
+
+        def close(self) -> None:
+            return
+
+    @contextmanager
+    def fake_shared_session(_cfg: BrowserConfig, timeout: float = 5.0):  # noqa: ARG001
+        yield DummySession(), {"id": "tab1", "webSocketDebuggerUrl": "ws://dummy", "url": "about:blank"}
+
+    monkeypatch.setattr(session_manager, "shared_session", fake_shared_session)
+    monkeypatch.setattr(session_manager, "ensure_telemetry", lambda _sess: {"enabled": True})
+    monkeypatch.setattr(session_manager, "tier0_query", lambda _tab_id, query: query(telemetry))
+    session_manager._session_tab_id = "tab1"
+
+    registry = create_default_registry()
+    dispatched: list[str] = []
+
+    def fake_dispatch(name: str, cfg: BrowserConfig, launcher, arguments: dict[str, Any]):  # noqa: ANN001,ARG001
+        dispatched.append(name)
+        return ToolResult.json({"ok": True})
+
+    monkeypatch.setattr(registry, "dispatch", fake_dispatch)
+
+    handler, _requires_browser = registry.get("run")  # type: ignore[assignment]
+    res = handler(
+        BrowserConfig.from_env(),
+        launcher=None,
+        args={
+            "actions": [
+                {"assert_perf": {"budgets": ["longtasks_max_ms<300", "failed_requests==0"]}},
+                {"assert_perf": {"budgets": ["lcp_ms<2500"]}},
+            ],
+            "report": "none",
+            "auto_recover": False,
+            "action_timeout": 0.5,
+        },
+    )
+
+    assert dispatched == []
+    data = res.data
+    assert data["ok"] is False
+    assert data["error"] == "Performance budget exceeded: lcp_ms<2500 (actual 2900)"
+    steps = data["actions"]
+    assert steps[0]["ok"] is True and steps[0]["measured"] == {"longtasks_max_ms": 250, "failed_requests": 0}
+    assert steps[1]["ok"] is False and steps[1]["budgets"] == [{"budget": "lcp_ms<2500", "actual": 2900, "ok": False}]
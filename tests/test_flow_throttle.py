@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import Any
+
+import pytest
+
+from mcp_servers.browser.server.flow.throttle import Throttle, measure_phases, parse_throttle, throttle_report
+from mcp_servers.browser.telemetry import Tier0Telemetry
+from tests.test_flow_perf_budget import _page_with_vitals
+
+
+def test_parse_throttle_profiles_and_request_timings(monkeypatch: pytest.MonkeyPatch) -> None:
+    assert parse_throttle("slow-4g+cpu4x") == ("slow-4g", 4.0)
+    assert parse_throttle(["3G", "cpu2.5x"]) == ("3g", 2.5)
+    assert parse_throttle(None) == (None, None)
+    with pytest.raises(ValueError, match="Unknown throttle profile"):
+        parse_throttle("2g")
+    with pytest.raises(ValueError, match="between 1x and 20x"):
+        parse_throttle("cpu50x")
+
+    clock = iter([1000, 1000, 1400, 1500, 1600])  # one tick per ingested event
+    monkeypatch.setattr("mcp_servers.browser.telemetry._now_ms", lambda: next(clock))
+    t = Tier0Telemetry()
+    for rid in ("a", "b"):
+        url = f"https://api.example/{rid}"
+        t.ingest({"method": "Network.requestWillBeSent", "params": {"requestId": rid, "request": {"url": url}}})
+    t.ingest({"method": "Network.responseReceived", "params": {"requestId": "a", "response": {"status": 200}}})
+    t.ingest({"method": "Network.loadingFinished", "params": {"requestId": "a", "encodedDataLength": 2048}})
+    t.ingest({"method": "Network.loadingFailed", "params": {"requestId": "b", "errorText": "net::ERR_FAILED"}})
+
+    phases = measure_phases(t, tab_id="t1", baseline={"tabId": "t1"}, duration_ms=900)
+    assert phases == {"run_ms": 900, "requests": 2, "transfer_kb": 2.0, "request_avg_ms": 550.0}
+
+
+def test_run_throttle_applies_restores_and_reports_stretch(monkeypatch: pytest.MonkeyPatch) -> None:
+    from mcp_servers.browser.config import BrowserConfig
+    from mcp_servers.browser.server.registry import create_default_registry
+    from mcp_servers.browser.session import session_manager
+
+    session_manager.recover_reset()
+    telemetry = _page_with_vitals()
+    sent: list[tuple[str, dict[str, Any]]] = []
+
+    class DummySession:
+        tab_id = "tab-throttle"
+        tab_url = "about:blank"
+
+        def eval_js(self, expression: str, *, timeout: float | None = None):  # noqa: ANN001,ARG002
+            return None
+
+        def send(self, method: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+            sent.append((method, params or {}))
+            return {}
+
+        def close(self) -> None:
+            return
+
+    @contextmanager
+    def fake_shared_session(_cfg: BrowserConfig, timeout: float = 5.0):  # noqa: ARG001
+        yield DummySession(), {"id": "tab-throttle", "webSocketDebuggerUrl": "ws://dummy", "url": "about:blank"}
+
+    monkeypatch.setattr(session_manager, "shared_session", fake_shared_session)
+    monkeypatch.setattr(session_manager, "ensure_telemetry", lambda _sess: {"enabled": True})
+    monkeypatch.setattr(session_manager, "tier0_query", lambda _tab_id, query: query(telemetry))
+    session_manager._session_tab_id = "tab-throttle"
+
+    handler, _requires_browser = create_default_registry().get("run")  # type: ignore[assignment]
+
+    def _run(**extra: Any) -> dict[str, Any]:
+        args = {"actions": [{"assert_perf": {"budgets": ["lcp_ms<5000"]}}], "report": "none", **extra}
+        return handler(BrowserConfig.from_env(), launcher=None, args=args).data
+
+    plain = _run()
+    assert plain["ok"] is True and "throttle" not in plain and sent == []
+
+    data = _run(throttle="slow-4g+cpu4x")
+    assert [m for m, _p in sent] == [
+        "Network.emulateNetworkConditions",
+        "Emulation.setCPUThrottlingRate",
+        "Network.emulateNetworkConditions",
+        "Emulation.setCPUThrottlingRate",
+    ]
+    assert sent[0][1]["latency"] == 563 and sent[1][1] == {"rate": 4.0}
+    assert sent[2][1]["downloadThroughput"] == -1 and sent[3][1] == {"rate": 1}
+    report = data["throttle"]
+    assert report["profile"] == "slow-4g+cpu4x" and report["restored"] is True and report["cpuRate"] == 4.0
+    assert report["phases"]["lcp_ms"] == 2900 and report["baseline"]["lcp_ms"] == 2900
+    assert report["stretch"]["lcp_ms"] == 1.0
+
+    bad = handler(BrowserConfig.from_env(), launcher=None, args={"actions": [{"wait": {}}], "throttle": "2g"})
+    assert bad.is_error and "Unknown throttle profile" in bad.data["error"]
+
+
+def test_unthrottled_report_without_baseline_hints_and_restore_errors_surface() -> None:
+    class FailingSession:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        def send(self, method: str, params: dict[str, Any] | None = None) -> dict[str, Any]:  # noqa: ARG002
+            self.calls += 1
+            if self.calls > 1:
+                raise RuntimeError("target closed")
+            return {}
+
+    thr = Throttle(FailingSession(), "3g", None)
+    thr.apply()
+    thr.restore()
+    thr.restore()  # idempotent
+    report = throttle_report(thr, tab_id="x", signature="never-ran", phases={"run_ms": 10}, completed=True)
+    assert report is not None and report["restored"] is False and report["restoreError"] == "target closed"
+    assert report["baseline"] is None and "without throttle" in report["hint"]
@@ -24,7 +24,7 @@ def _install_hermetic_flow_mocks(monkeypatch: pytest.MonkeyPatch) -> None:
 
     monkeypatch.setattr(session_manager, "shared_session", fake_shared_session)
     monkeypatch.setattr(session_manager, "ensure_telemetry", lambda _sess: {"enabled": True})
-    monkeypatch.setattr(session_manager, "get_telemetry", lambda _tab_id: None)
+    monkeypatch.setattr(session_manager, "tier0_query", lambda _tab_id, _query: None)
     monkeypatch.setattr(
         session_manager, "tier0_snapshot", lambda *_a, **_k: {"cursor": 1, "summary": {}, "harLite": []}
     )
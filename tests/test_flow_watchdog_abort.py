@@ -48,7 +48,7 @@ def test_flow_watchdog_uses_abort_in_threads(monkeypatch: pytest.MonkeyPatch) ->
     # Keep the test hermetic: no real Chrome.
     monkeypatch.setattr(session_manager, "shared_session", fake_shared_session)
     monkeypatch.setattr(session_manager, "ensure_telemetry", lambda _sess: {"enabled": True})
-    monkeypatch.setattr(session_manager, "get_telemetry", lambda _tab_id: None)
+    monkeypatch.setattr(session_manager, "tier0_query", lambda _tab_id, _query: None)
     session_manager._session_tab_id = "tab1"  # best-effort for code paths that read tab_id
 
     registry = create_default_registry()
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from mcp_servers.browser.frame_contexts import FrameContextRegistry
+
+
+def _ctx(cid: int, frame_id: str, origin: str, *, default: bool = True) -> dict:
+    return {
+        "method": "Runtime.executionContextCreated",
+        "params": {
+            "context": {
+                "id": cid,
+                "origin": origin,
+                "name": "",
+                "auxData": {"frameId": frame_id, "isDefault": default},
+            }
+        },
+    }
+
+
+def _nav(frame_id: str, url: str, origin: str, parent: str | None = None) -> dict:
+    frame = {"id": frame_id, "url": url, "securityOrigin": origin}
+    if parent:
+        frame["parentId"] = parent
+    return {"method": "Page.frameNavigated", "params": {"frame": frame}}
+
+
+def _registry() -> FrameContextRegistry:
+    from mcp_servers.browser.telemetry import Tier0Telemetry
+
+    t = Tier0Telemetry(max_events=50)
+    for ev in [
+        _nav("main", "https://shop.example/checkout", "https://shop.example"),
+        {"method": "Page.frameAttached", "params": {"frameId": "pay", "parentFrameId": "main"}},
+        _nav("pay", "https://pay.example/card", "https://pay.example", parent="main"),
+        {"method": "Page.frameAttached", "params": {"frameId": "ads", "parentFrameId": "main"}},
+        _nav("ads", "https://ads.example/slot", "https://ads.example", parent="main"),
+        _ctx(1, "main", "https://shop.example"),
+        _ctx(2, "pay", "https://pay.example"),
+        _ctx(3, "pay", "https://pay.example", default=False),
+        _ctx(4, "ads", "https://ads.example"),
+    ]:
+        t.ingest(ev)
+    return t.frames
+
+
+def test_registry_maps_frames_to_default_contexts() -> None:
+    reg = _registry()
+    frames = reg.frames()
+    assert [(f["frameId"], f["depth"], f.get("contextId")) for f in frames] == [
+        ("main", 0, 1),
+        ("pay", 1, 2),
+        ("ads", 1, 4),
+    ]
+    assert frames[1]["origin"] == "https://pay.example"
+    assert [f["frameId"] for f in reg.resolve("pay.example")] == ["pay"]
+    assert [f["frameId"] for f in reg.resolve("main")] == ["main"]
+
+
+def test_registry_handles_destroy_detach_and_swap() -> None:
+    reg = _registry()
+    reg.ingest("Runtime.executionContextDestroyed", {"executionContextId": 2})
+    assert reg.context_id("pay") is None
+
+    reg.ingest("Page.frameDetached", {"frameId": "ads", "reason": "remove"})
+    assert [f["frameId"] for f in reg.frames()] == ["main", "pay"]
+
+    reg.ingest("Runtime.executionContextCreated", _ctx(5, "pay", "https://pay.example")["params"])
+    reg.ingest("Page.frameDetached", {"frameId": "pay", "reason": "swap"})
+    assert [f["frameId"] for f in reg.frames()] == ["main", "pay"]
+    assert reg.context_id("pay") is None
+
+    reg.ingest("Runtime.executionContextsCleared", {})
+    assert reg.context_id("main") is None
+
+
+def test_eval_in_frames_pipelines_and_falls_back_to_isolated_world(monkeypatch: pytest.MonkeyPatch) -> None:
+    from mcp_servers.browser.tools.page import frames as frames_mod
+
+    reg = _registry()
+    reg.seeded = True
+    reg.ingest("Runtime.executionContextDestroyed", {"executionContextId": 4})
+
+    class DummyTelemetry:
+        frames = reg
+
+    monkeypatch.setattr(frames_mod.session_manager, "tier0_query", lambda _tab, query: query(DummyTelemetry()))
+
+    batches: list[list[dict]] = []
+
+    class DummyConn:
+        def send_pipelined(self, commands):  # noqa: ANN001
+            batches.append(commands)
+            out = []
+            for cmd in commands:
+                if cmd["method"] == "Page.createIsolatedWorld":
+                    out.append({"executionContextId": 40})
+                else:
+                    cid = cmd["params"]["contextId"]
+                    out.append({"result": {"type": "number", "value": cid * 10}})
+            return out
+
+    class DummySession:
+        tab_id = "tab1"
+        conn = DummyConn()
+
+        def enable_runtime(self) -> None:
+            return None
+
+        def send(self, method: str, params=None):  # noqa: ANN001
+            raise AssertionError(f"unexpected sequential CDP call: {method}")
+
+    out = frames_mod.eval_in_frames(DummySession(), "1", frame="all")
+    assert [(r["frameId"], r["world"], r["result"]) for r in out] == [
+        ("main", "main", 10),
+        ("pay", "main", 20),
+        ("ads", "isolated", 400),
+    ]
+    assert [len(b) for b in batches] == [1, 3]
+
+
+def test_eval_in_frames_attaches_out_of_process_frames_and_detaches(monkeypatch: pytest.MonkeyPatch) -> None:
+    from mcp_servers.browser.tools.page import frames as frames_mod
+
+    reg = _registry()
+    reg.seeded = True
+    reg.ingest("Runtime.executionContextDestroyed", {"executionContextId": 4})  # "ads" is now out of process
+
+    class DummyTelemetry:
+        frames = reg
+
+    monkeypatch.setattr(frames_mod.session_manager, "tier0_query", lambda _tab, query: query(DummyTelemetry()))
+
+    sent: list[dict] = []
+
+    class DummyConn:
+        flat_sessions = True
+
+        def __init__(self) -> None:
+            self.events = [
+                {"sessionId": "stale", "targetInfo": {"targetId": "ads", "type": "iframe"}},
+            ]
+
+        def pop_event(self, name: str):  # noqa: ANN001
+            assert name == "Target.attachedToTarget"
+            return self.events.pop(0) if self.events else None
+
+        def send(self, method: str, params=None):  # noqa: ANN001
+            sent.append({"method": method, "params": params})
+            assert method == "Target.setAutoAttach" and params["flatten"] is True
+            self.events = [
+                {"sessionId": "S-other", "targetInfo": {"targetId": "tracker", "type": "iframe"}},
+                {"sessionId": "S-ads", "targetInfo": {"targetId": "ads", "type": "iframe"}},
+            ]
+            return {}
+
+        def wait_for_event(self, name: str, timeout: float = 10.0):  # noqa: ANN001,ARG002
+            return self.pop_event(name)
+
+        def send_pipelined(self, commands):  # noqa: ANN001
+            sent.extend(commands)
+            out = []
+            for cmd in commands:
+                if cmd["method"] == "Page.createIsolatedWorld":
+                    out.append({"ok": False, "error": "No frame for given id found"})
+                elif cmd.get("sessionId") == "S-ads":
+                    out.append({"result": {"type": "string", "value": "in ads"}})
+                elif cmd["method"] == "Runtime.evaluate":
+                    out.append({"result": {"type": "number", "value": cmd["params"]["contextId"]}})
+                else:
+                    out.append({})
+            return out
+
+    class DummySession:
+        tab_id = "tab1"
+        conn = DummyConn()
+
+        def enable_runtime(self) -> None:
+            return None
+
+    out = frames_mod.eval_in_frames(DummySession(), "1", frame="all")
+    assert [(r["frameId"], r["world"], r["result"]) for r in out] == [
+        ("main", "main", 1),
+        ("pay", "main", 2),
+        ("ads", "oopif", "in ads"),
+    ]
+    assert sent[-2:] == [
+        {"method": "Target.detachFromTarget", "params": {"sessionId": "S-ads"}},
+        {"method": "Target.setAutoAttach", "params": {"autoAttach": False, "waitForDebuggerOnStart": False}},
+    ]
+
+    DummySession.conn.flat_sessions = False  # extension mode: no child sessions
+    out = frames_mod.eval_in_frames(DummySession(), "1", frame="ads")
+    assert "extension" in out[0]["error"]
+
+
+def test_cdp_send_pipelined_collects_out_of_order_responses() -> None:
+    from mcp_servers.browser.session_cdp import CdpConnection
+
+    class FakeWs:
+        def __init__(self) -> None:
+            self.sent: list[dict] = []
+            self.inbox: list[str] = []
+
+        def settimeout(self, _t: float) -> None:
+            return None
+
+        def send(self, raw: str) -> None:
+            self.sent.append(json.loads(raw))
+            if len(self.sent) == 2:
+                self.inbox = [
+                    json.dumps({"method": "Runtime.consoleAPICalled", "params": {}}),
+                    json.dumps({"id": self.sent[1]["id"], "error": {"message": "boom"}}),
+                    json.dumps({"id": self.sent[0]["id"], "result": {"ok": 1}}),
+                ]
+
+        def recv(self) -> str:
+            return self.inbox.pop(0)
+
+    conn = CdpConnection.__new__(CdpConnection)
+    conn.ws = FakeWs()
+    conn.timeout = 2.0
+    conn._next_id = 1
+    conn._event_queue = []
+    conn._max_event_queue = 10
+    conn._event_sink = None
+
+    out = conn.send_pipelined([{"method": "A.one"}, {"method": "A.two", "params": {"x": 1}}])
+    assert out[0] == {"ok": 1}
+    assert out[1]["ok"] is False and "boom" in out[1]["error"]
+    assert conn.pop_event("Runtime.consoleAPICalled") == {}
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from mcp_servers.browser.har_export import HarRecorder, _recorders, har_status
+from mcp_servers.browser.server.artifacts import ArtifactStore
+from mcp_servers.browser.telemetry import Tier0Telemetry
+
+T0 = 1_700_000_000.0
+MONO = 500.0
+
+
+def _request(rid: str, url: str, *, at: float = 0.0, **extra: Any) -> dict[str, Any]:
+    req = {"url": url, "method": "GET", "headers": {"Accept": "*/*", "Cookie": "sid=secret"}, **extra}
+    params = {"requestId": rid, "type": "Fetch", "wallTime": T0 + at, "timestamp": MONO + at, "request": req}
+    return {"method": "Network.requestWillBeSent", "params": params}
+
+
+def _response(rid: str, *, status: int = 200, mime: str = "application/json") -> dict[str, Any]:
+    timing = {
+        "requestTime": MONO,
+        "dnsStart": 1.0,
+        "dnsEnd": 5.0,
+        "connectStart": 5.0,
+        "connectEnd": 20.0,
+        "sslStart": 10.0,
+        "sslEnd": 20.0,
+        "sendStart": 21.0,
+        "sendEnd": 22.0,
+        "receiveHeadersEnd": 80.0,
+    }
+    resp = {
+        "url": "",
+        "status": status,
+        "statusText": "OK",
+        "mimeType": mime,
+        "protocol": "h2",
+        "headers": {"content-type": mime, "set-cookie": "sid=secret"},
+        "timing": timing,
+    }
+    return {"method": "Network.responseReceived", "params": {"requestId": rid, "type": "Fetch", "response": resp}}
+
+
+def _finished(rid: str, *, at: float, size: int) -> dict[str, Any]:
+    params = {"requestId": rid, "timestamp": MONO + at, "encodedDataLength": size}
+    return {"method": "Network.loadingFinished", "params": params}
+
+
+def _har(store: ArtifactStore, artifact_id: str) -> dict[str, Any]:
+    meta = store.get_meta(artifact_id=artifact_id)
+    path = store._content_path(artifact_id, str(meta["ext"]))
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def test_recorder_streams_valid_har_with_timings_sizes_and_redaction(tmp_path: Path) -> None:
+    store = ArtifactStore(base_dir=tmp_path / "artifacts")
+    rec = HarRecorder(store.open_stream(kind="har", mime_type="application/json", ext=".har"))
+    t = Tier0Telemetry(net_sink=rec.feed)
+
+    t.ingest(_request("1", "https://api.example/cart?token=abc&page=2"))
+    t.ingest(_response("1"))
+    t.ingest(_finished("1", at=0.1, size=4096))
+    t.ingest(_request("2", "https://api.example/gone"))
+    t.ingest({"method": "Network.loadingFailed", "params": {"requestId": "2", "errorText": "net::ERR_FAILED"}})
+    t.ingest(_request("3", "https://api.example/pending"))
+    assert rec.flush() and rec.stream.bytes > 0 and rec.entries == 2  # written as requests complete
+
+    ref = rec.close()
+    har = _har(store, ref.id)
+    assert har["log"]["version"] == "1.2"
+    ok, failed = har["log"]["entries"]
+    assert "token=abc" not in ok["request"]["url"] and {"name": "page", "value": "2"} in ok["request"]["queryString"]
+    assert {h["name"]: h["value"] for h in ok["request"]["headers"]}["Cookie"].startswith("<redacted")
+    assert {h["name"]: h["value"] for h in ok["response"]["headers"]}["set-cookie"].startswith("<redacted")
+    assert ok["timings"] == {
+        "blocked": 1.0,
+        "dns": 4.0,
+        "connect": 15.0,
+        "ssl": 10.0,
+        "send": 1.0,
+        "wait": 58.0,
+        "receive": 20.0,
+    }
+    # HAR 1.2: time == sum of non-negative phases (ssl is inside connect); the 1 ms
+    # connectEnd -> sendStart gap belongs to no phase.
+    assert ok["time"] == sum(v for k, v in ok["timings"].items() if k != "ssl" and v > 0) == 99.0
+    assert ok["response"]["_transferSize"] == 4096 and ok["response"]["httpVersion"] == "h2"
+    assert failed["response"]["status"] == 0 and failed["response"]["_error"] == "net::ERR_FAILED"
+    assert store.get_meta(artifact_id=ref.id)["meta"]["inFlightAtStop"] == 1
+
+
+def test_bodies_wait_for_eager_capture_and_memory_stays_bounded(tmp_path: Path) -> None:
+    store = ArtifactStore(base_dir=tmp_path / "artifacts")
+    captured: dict[str, bytes] = {}
+
+    def reader(rid: str, max_bytes: int) -> tuple[bytes, bool] | None:
+        data = captured.get(rid)
+        return (data[:max_bytes], len(data) > max_bytes) if data is not None else None
+
+    rec = HarRecorder(
+        store.open_stream(kind="har", mime_type="application/json", ext=".har"),
+        bodies=True,
+        max_body_bytes=64,
+        body_reader=reader,
+        max_in_flight=3,
+    )
+    rec.feed(
+        "Network.requestWillBeSent",
+        _request("b", "https://api.example/b", method="POST", postData='{"token":"abc123"}')["params"],
+    )
+    rec.feed("Network.responseReceived", _response("b")["params"])
+    rec.feed("Network.loadingFinished", _finished("b", at=0.05, size=30)["params"])
+    assert rec.flush() and rec.entries == 0  # waiting for the captured body
+
+    captured["b"] = b'{"price": 10}'
+    for i in range(5):  # more in flight than the cap: oldest are dropped, not buffered
+        rec.feed("Network.requestWillBeSent", _request(f"x{i}", f"https://cdn.example/{i}")["params"])
+    assert rec.flush() and rec.entries == 1 and rec.dropped == 2 and len(rec._inflight) == 3
+
+    entry = _har(store, rec.close().id)["log"]["entries"][0]
+    assert json.loads(entry["response"]["content"]["text"]) == {"price": 10}
+    assert "abc123" not in entry["request"]["postData"]["text"]
+
+
+def test_feed_never_blocks_on_io_and_status_reports_sink_failures(tmp_path: Path) -> None:
+    store = ArtifactStore(base_dir=tmp_path / "artifacts")
+    release = threading.Event()
+
+    def slow_reader(rid: str, max_bytes: int) -> tuple[bytes, bool] | None:
+        release.wait(5)
+        return b"{}", False
+
+    rec = HarRecorder(
+        store.open_stream(kind="har", mime_type="application/json", ext=".har"), bodies=True, body_reader=slow_reader
+    )
+    t = Tier0Telemetry(net_sink=rec.feed)
+    started = time.monotonic()
+    for rid in ("1", "2"):
+        t.ingest(_request(rid, f"https://api.example/{rid}"))
+        t.ingest(_response(rid))
+        t.ingest(_finished(rid, at=0.1, size=2))
+    assert time.monotonic() - started < 1.0  # body reads happen on the writer thread
+    release.set()
+    assert rec.flush() and rec.entries == 2
+
+    def broken(method: str, params: dict[str, Any]) -> None:
+        raise RuntimeError("disk full")
+
+    t.net_sink = broken
+    t.ingest(_request("3", "https://api.example/3"))
+    assert t.net_sink is None and t.net_sink_error == "RuntimeError: disk full"
+
+    _recorders["tab"] = rec
+    try:
+        status = har_status("tab", sink_error=lambda: t.net_sink_error)
+    finally:
+        _recorders.pop("tab", None)
+    assert status["recording"] is False and "disk full" in status["error"] and status["entries"] == 2
+    rec.close()
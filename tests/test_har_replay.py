@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import base64
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from mcp_servers.browser.har_replay import ReplayIndex, load_replay_index, normalize_url
+
+
+def _entry(method: str, url: str, status: int, text: str, *, post: str | None = None) -> dict[str, Any]:
+    req: dict[str, Any] = {"method": method, "url": url, "headers": []}
+    if post is not None:
+        req["postData"] = {"mimeType": "application/json", "text": post}
+    headers = [
+        {"name": "Content-Type", "value": "application/json"},
+        {"name": "Content-Encoding", "value": "br"},
+        {"name": "set-cookie", "value": "<redacted str len=9>"},
+    ]
+    return {"request": req, "response": {"status": status, "headers": headers, "content": {"text": text}}}
+
+
+def _paused(rid: str, method: str, url: str, post: str | None = None) -> dict[str, Any]:
+    req = {"method": method, "url": url, **({"postData": post} if post is not None else {})}
+    return {"requestId": rid, "resourceType": "XHR", "request": req}
+
+
+def test_normalize_url_sorts_query_and_drops_ignored_keys_and_fragment() -> None:
+    a = normalize_url("HTTPS://API.Example/items?b=2&a=1&_=123#top", ignore_query=frozenset({"_"}))
+    assert a == normalize_url("https://api.example/items?a=1&b=2")
+    assert a == "https://api.example/items?a=1&b=2"
+
+
+def test_har_replay_matches_method_url_and_body_then_falls_through(tmp_path: Path) -> None:
+    har = {
+        "log": {
+            "version": "1.2",
+            "entries": [
+                _entry("GET", "https://api.example/items?page=1", 200, '{"page": 1}'),
+                _entry("POST", "https://api.example/search", 200, '{"hits": "a"}', post='{"q": "a"}'),
+                _entry("POST", "https://api.example/search", 200, '{"hits": "b"}', post='{"q": "b"}'),
+                _entry("GET", "https://api.example/gone", 0, ""),
+            ],
+        }
+    }
+    src = tmp_path / "session.har"
+    src.write_text(json.dumps(har), encoding="utf-8")
+    index = load_replay_index(path=str(src), fallthrough="404")
+
+    method, reply, _delay = index.respond(_paused("1", "GET", "https://api.example/items?page=1#x"))  # type: ignore[misc]
+    assert method == "Fetch.fulfillRequest" and base64.b64decode(reply["body"]) == b'{"page": 1}'
+    assert reply["responseHeaders"] == [{"name": "Content-Type", "value": "application/json"}]
+
+    _m, reply, _d = index.respond(_paused("2", "POST", "https://api.example/search", '{"q": "b"}'))  # type: ignore[misc]
+    assert base64.b64decode(reply["body"]) == b'{"hits": "b"}'
+
+    assert index.respond(_paused("3", "GET", "https://api.example/gone"))[0] == "Fetch.failRequest"  # type: ignore[index]
+    miss = index.respond(_paused("4", "GET", "https://api.example/new"))
+    assert miss is not None and miss[1]["responseCode"] == 404
+    assert index.stats() == {"entries": 4, "keys": 3, "served": 3, "missed": 1, "fallthrough": "404"}
+
+    with pytest.raises(ValueError, match="fallthrough"):
+        load_replay_index(path=str(src), fallthrough="retry")
+
+
+def test_net_trace_items_replay_in_recorded_order_and_pass_when_continuing() -> None:
+    from mcp_servers.browser.har_replay import index_net_trace
+
+    index = ReplayIndex()
+    trace = {
+        "items": [
+            {"method": "GET", "urlFull": "https://api.example/poll", "status": 200, "responseBody": "one"},
+            {"method": "GET", "urlFull": "https://api.example/poll", "status": 200, "responseBody": "two"},
+        ]
+    }
+    index_net_trace(trace, index)
+    bodies = [
+        base64.b64decode(index.respond(_paused(str(i), "GET", "https://api.example/poll"))[1]["body"])  # type: ignore[index]
+        for i in range(3)
+    ]
+    assert bodies == [b"one", b"two", b"one"]
+    assert index.respond(_paused("x", "GET", "https://api.example/other")) is None  # live network
+
+
+def test_entries_recorded_without_bodies_go_to_the_network_not_empty_200s(tmp_path: Path) -> None:
+    from mcp_servers.browser.har_replay import replay_action
+    from mcp_servers.browser.tools.base import SmartToolError
+
+    no_body = _entry("GET", "https://api.example/cart", 200, "")
+    no_body["response"]["content"] = {"size": 512, "mimeType": "application/json"}
+    empty = _entry("DELETE", "https://api.example/cart/1", 204, "")
+    empty["response"]["content"] = {"size": 120, "mimeType": ""}
+    har = {"log": {"version": "1.2", "entries": [no_body, empty]}}
+    src = tmp_path / "meta-only.har"
+    src.write_text(json.dumps(har), encoding="utf-8")
+
+    index = load_replay_index(path=str(src))
+    assert index.respond(_paused("1", "GET", "https://api.example/cart")) is None  # live network
+    assert index.respond(_paused("2", "DELETE", "https://api.example/cart/1"))[1]["responseCode"] == 204  # type: ignore[index]
+    assert index.stats()["skippedNoBody"] == 1 and index.entries == 1
+
+    trace = tmp_path / "trace.json"
+    trace.write_text(
+        json.dumps(
+            {"items": [{"method": "GET", "urlFull": "https://api.example/a", "status": 200, "encodedDataLength": 90}]}
+        ),
+        encoding="utf-8",
+    )
+    with pytest.raises(SmartToolError, match="no recorded response bodies"):
+        replay_action(None, "tab1", {"path": str(trace)})  # type: ignore[arg-type]
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import json
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+from mcp_servers.browser.tools.page.heap_profile import memory_trend, summarize_heap_profile
+
+
+def _frame(name: str, url: str = "", line: int = 0) -> dict:
+    return {"functionName": name, "url": url, "lineNumber": line, "columnNumber": 0, "scriptId": "1"}
+
+
+def _heap_profile() -> dict:
+    app = "https://app.example/app.js?token=x"
+    return {
+        "head": {
+            "callFrame": _frame("(root)"),
+            "selfSize": 0,
+            "id": 1,
+            "children": [
+                {
+                    "callFrame": _frame("render", app, 9),
+                    "selfSize": 1000,
+                    "id": 2,
+                    "children": [
+                        {"callFrame": _frame("cache", app, 30), "selfSize": 6000, "id": 3, "children": []},
+                        # Recursion: render's total must count this subtree once.
+                        {"callFrame": _frame("render", app, 9), "selfSize": 500, "id": 4, "children": []},
+                    ],
+                },
+                {"callFrame": _frame("(V8 API)"), "selfSize": 2500, "id": 5, "children": []},
+            ],
+        },
+        "samples": [{"size": 1000, "nodeId": 2, "ordinal": 1}] * 10,
+    }
+
+
+def test_heap_profile_summary_top_sites_and_urls() -> None:
+    out = summarize_heap_profile(_heap_profile())
+    assert out["liveBytes"] == 10_000 and out["nodes"] == 5 and out["samples"] == 10
+
+    sites = {s["function"]: s for s in out["topSites"]}
+    assert [s["function"] for s in out["topSites"]] == ["cache", "render"]
+    assert sites["cache"] == {
+        "function": "cache",
+        "url": "https://app.example/app.js",
+        "line": 31,
+        "selfBytes": 6000,
+        "totalBytes": 6000,
+        "selfPct": 60.0,
+    }
+    assert sites["render"]["selfBytes"] == 1500 and sites["render"]["totalBytes"] == 7500
+    assert out["topUrls"] == [{"url": "https://app.example/app.js", "selfBytes": 7500, "selfPct": 75.0}]
+
+
+def test_memory_trend_flags_monotonic_growth_only() -> None:
+    leaking = [{"jsHeapUsed": 10_000_000 + i * 1_500_000, "nodes": 1000 + i * 3} for i in range(6)]
+    out = memory_trend(leaking)
+    assert out["leakSuspected"] is True and out["suspects"] == ["jsHeapUsed"]
+    assert out["jsHeapUsed"]["r2"] == 1.0 and out["jsHeapUsed"]["risingSteps"] == "5/5"
+    assert out["nodes"]["growing"] is False  # +15 nodes is below the material-growth floor
+
+    sawtooth = [{"jsHeapUsed": v} for v in (10e6, 14e6, 9e6, 15e6, 10e6, 13e6)]
+    assert memory_trend(sawtooth)["leakSuspected"] is False
+    assert memory_trend(leaking[:3])["leakSuspected"] is False  # too few points
+
+
+def test_memory_detail_stores_heapprofile_artifact(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    from mcp_servers.browser.config import BrowserConfig
+    from mcp_servers.browser.server.artifacts import ArtifactStore
+    from mcp_servers.browser.server.handlers import page_capture
+    from mcp_servers.browser.tools.page import memory as memory_mod
+
+    sent: list[str] = []
+    heap = iter([5_000_000, 7_000_000])
+
+    class _Sess:
+        def enable_performance(self) -> None:
+            return
+
+        def send(self, method: str, params=None):  # noqa: ANN001,ARG002
+            sent.append(method)
+            if method == "Runtime.getHeapUsage":
+                return {"usedSize": next(heap), "totalSize": 9_000_000}
+            if method == "Performance.getMetrics":
+                return {"metrics": [{"name": "Nodes", "value": 120}, {"name": "JSEventListeners", "value": 8}]}
+            if method == "HeapProfiler.stopSampling":
+                return {"profile": _heap_profile()}
+            return {}
+
+    @contextmanager
+    def fake_get_session(_cfg, timeout: float = 5.0, **kwargs):  # noqa: ANN001,ARG001
+        yield _Sess(), {"id": "tab1"}
+
+    monkeypatch.setattr(memory_mod, "get_session", fake_get_session)
+    monkeypatch.setattr(memory_mod.time, "sleep", lambda _s: None)
+    store = ArtifactStore(base_dir=tmp_path / "artifacts")
+    monkeypatch.setattr(page_capture, "artifact_store", store)
+
+    out = page_capture.PAGE_CAPTURE_DETAILS["memory"](BrowserConfig.from_env(), {"duration_ms": 500, "gc": True})
+    assert "HeapProfiler.startSampling" in sent and sent.count("HeapProfiler.collectGarbage") == 2
+    assert out["before"]["nodes"] == 120 and out["delta"]["jsHeapUsed"] == 2_000_000
+    assert out["summary"]["topSites"][0]["function"] == "cache"
+    assert out["artifact"]["kind"] == "heap_profile"
+
+    meta = store.get_meta(artifact_id=out["artifact"]["id"])
+    stored = json.loads((tmp_path / "artifacts" / f"{meta['id']}.heapprofile").read_text(encoding="utf-8"))
+    assert stored["head"]["children"][0]["selfSize"] == 1000
+
+
+def test_run_profile_memory_reports_series_and_leak_flag(monkeypatch: pytest.MonkeyPatch) -> None:
+    import mcp_servers.browser.tools as tools
+    from mcp_servers.browser.config import BrowserConfig
+    from mcp_servers.browser.server.registry import create_default_registry
+    from mcp_servers.browser.server.types import ToolResult
+    from mcp_servers.browser.session import session_manager
+
+    session_manager.recover_reset()
+
+    class DummySession:
+        tab_id = "tab1"
+        tab_url = "about:blank"
+
+        def eval_js(self, expression: str, *, timeout: float | None = None):  # noqa: ANN001,ARG002
+            return 1_000_000 if "Date.now" in expression else None
+
+        def close(self) -> None:
+            return
+
+    @contextmanager
+    def fake_shared_session(_cfg: BrowserConfig, timeout: float = 5.0):  # noqa: ARG001
+        yield DummySession(), {"id": "tab1", "webSocketDebuggerUrl": "ws://dummy", "url": "about:blank"}
+
+    monkeypatch.setattr(session_manager, "shared_session", fake_shared_session)
+    monkeypatch.setattr(session_manager, "ensure_telemetry", lambda _sess: {"enabled": True})
+    monkeypatch.setattr(session_manager, "tier0_query", lambda _tab_id, _query: None)
+    monkeypatch.setattr(
+        session_manager,
+        "tier0_snapshot",
+        lambda *a, **k: {"cursor": 1_000_000, "summary": {}, "harLite": [], "network": [], "dialogOpen": False},
+    )
+    session_manager._session_tab_id = "tab1"
+    monkeypatch.setattr(
+        tools,
+        "get_page_info",
+        lambda _cfg: {"pageInfo": {"url": "about:blank", "title": "Dummy", "readyState": "complete"}},
+    )
+
+    samples = iter(range(100))
+    monkeypatch.setattr(
+        tools,
+        "sample_page_memory",
+        lambda _cfg, **_k: {"jsHeapUsed": 20_000_000 + 2_000_000 * next(samples), "nodes": 500},
+    )
+
+    registry = create_default_registry()
+
+    def fake_dispatch(name: str, cfg: BrowserConfig, launcher, arguments):  # noqa: ANN001,ARG001
+        if name in {"navigate", "js", "page", "dialog"}:
+            return ToolResult.json({"ok": True})
+        return ToolResult.error(f"unexpected dispatch: {name}", tool=name)
+
+    monkeypatch.setattr(registry, "dispatch", fake_dispatch)
+
+    handler, _requires_browser = registry.get("run")  # type: ignore[assignment]
+    res = handler(
+        BrowserConfig.from_env(),
+        launcher=None,
+        args={
+            "actions": [{"tool": "page", "args": {"info": True}}] * 4,
+            "profile_memory": True,
+            "report": "none",
+            "auto_recover": False,
+            "action_timeout": 0.5,
+        },
+    )
+
+    assert not res.is_error
+    memory = res.data["memory"]
+    assert memory["points"] == 5 and memory["leakSuspected"] is True
+    assert memory["series"][0]["at"] == "start" and memory["series"][-1]["i"] == 3
+    assert memory["nodes"]["growing"] is False
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from mcp_servers.browser.money_scan import iter_json_tokens, scan_money_fields, scan_money_items
+
+DOC = {
+    "order": {
+        "items": [
+            {"price": {"grossPrice": 13498.0, "netPrice": 11248}, "qty": 2},
+            {"price": 5, "currency": "eur"},
+        ],
+        "total": 26996,
+        "flag\\total": True,
+        "meta": {"note": "amount: 1", "tax": -1.5e2},
+        "currency": "RUB",
+    },
+    "amount": 7,
+}
+
+
+def test_scanner_matches_tree_semantics_regardless_of_chunking() -> None:
+    text = json.dumps(DOC)
+    expected = [
+        ("order.items[0].price.grossPrice", 13498.0, "RUB"),
+        ("order.items[0].price.netPrice", 11248, "RUB"),
+        ("order.items[1].price", 5, "EUR"),
+        ("order.total", 26996, "RUB"),
+        ("order.meta.tax", -150.0, "RUB"),
+        ("amount", 7, None),
+    ]
+    for chunks in ([text], list(text), [text[i : i + 7] for i in range(0, len(text), 7)]):
+        hits = scan_money_fields(chunks, url="https://api.example/cart", source="responseBody")
+        assert [(h["path"], h["value"], h.get("currency")) for h in hits] == expected
+
+    assert list(iter_json_tokens(['{"a\\"b": [1.5e', "3, true, nu", "ll]}"])) == [
+        ("punct", "{"),
+        ("str", 'a\\"b'),
+        ("punct", ":"),
+        ("punct", "["),
+        ("num", 1500.0),
+        ("punct", ","),
+        ("lit", True),
+        ("punct", ","),
+        ("lit", None),
+        ("punct", "]"),
+        ("punct", "}"),
+    ]
+    assert scan_money_fields(['{"total": 1, "x": '], url="u", source="s")[0]["value"] == 1  # truncated input
+
+    capped = json.dumps({"rows": [{"price": 1, "n": [[{"tax": 1}]]}] * 250, "deep": {"a": {"b": 1}}, "total": 2})
+    hits = scan_money_fields([capped[i : i + 5] for i in range(0, len(capped), 5)], url="u", source="s")
+    assert len(hits) == 401 and hits[-2]["path"] == "rows[199].n[0][0].tax" and hits[-1]["path"] == "total"
+
+
+def test_items_scan_stops_early_and_reads_truncated_bodies_from_disk(tmp_path: Path) -> None:
+    rows = [{"amount": i, "currency": "USD"} for i in range(5000)]
+    big = json.dumps({"rows": rows})
+    hits = scan_money_fields([big], url="u", source="s", score=lambda r: 60, stop_after=10)
+    assert len(hits) == 10 and all(h["currency"] == "USD" for h in hits)
+
+    captured = tmp_path / "body.bin"
+    captured.write_text(json.dumps({"pad": "x" * 300_000, "checkout": {"amount": 607410, "currency": "RUB"}}))
+    items = [
+        {
+            "url": "https://pay.example/checkout/session",
+            "responseBody": '{"pad": "xxxx',  # truncated trace copy: the amount is only on disk
+            "responseBodyTruncated": True,
+            "bodyArtifact": {"id": "a1"},
+        },
+        {"url": "https://api.example/cart", "requestPostData": '{"price": 10.5, "currency": "RUB"}'},
+        {"url": "https://api.example/html", "responseBody": "<html>amount=1</html>"},
+        {
+            "url": "https://gone.example/x",
+            "responseBody": '{"total": 3}',
+            "responseBodyTruncated": True,
+            "bodyArtifact": {"id": "evicted"},
+        },
+    ]
+    paths = {"a1": captured, "evicted": tmp_path / "missing.bin"}
+    hits = scan_money_items(items, body_path=paths.get)
+    assert [(h["url"], h["path"], h["value"], h.get("currency")) for h in hits] == [
+        ("https://pay.example/checkout/session", "checkout.amount", 607410, "RUB"),
+        ("https://api.example/cart", "price", 10.5, "RUB"),
+        ("https://gone.example/x", "total", 3, None),
+    ]
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import base64
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from mcp_servers.browser.net_rules import _Interceptor, compile_rules, fetch_reply
+
+
+def test_rule_table_matches_hosts_globs_and_types_in_table_order(tmp_path: Path) -> None:
+    mock = tmp_path / "cart.json"
+    mock.write_text('{"items": []}', encoding="utf-8")
+    table = compile_rules(
+        [
+            {"match": "*.ads.example", "action": "block"},
+            {"match": "https://api.example/cart*", "action": "fulfill", "file": str(mock)},
+            {"match": "api.example", "action": "delay", "delayMs": 50},
+            {"match": "*/video/*", "action": "block", "types": ["Media"]},
+            {"types": ["Font"], "action": "block"},
+        ]
+    )
+
+    def action(url: str, rtype: str = "Fetch") -> str | None:
+        rule = table.decide(url, rtype)
+        return rule.action if rule is not None else None
+
+    assert action("https://ads.example/pixel") == "block"  # "*.x" covers x itself
+    assert action("https://a.b.ads.example/pixel") == "block"
+    assert action("https://api.example/cart?id=1") == "fulfill"  # earlier glob beats later host rule
+    assert action("https://api.example/other") == "delay"
+    assert action("https://sub.api.example/other") is None  # bare host rule: exact host only
+    assert action("https://cdn.example/video/a.mp4", "Media") == "block"
+    assert action("https://cdn.example/video/a.mp4", "XHR") is None
+    assert action("https://fonts.example/a.woff2", "Font") == "block"
+    assert [r.hits for r in table.rules] == [2, 1, 1, 1, 1]
+
+    ext = compile_rules(
+        [{"match": "*.png", "action": "block"}, {"match": "*.mp4", "action": "block", "types": ["Media"]}]
+    )
+    assert ext.decide("https://cdn.example/img/a.png?v=3", "Image") is ext.rules[0]
+    assert ext.decide("https://cdn.example/a.mp4#t=5", "Media") is ext.rules[1]
+    assert ext.decide("https://png.example/", "Image") is None  # not a host wildcard
+    assert ext.decide("https://cdn.example/a.png.html", "Document") is None
+
+    method, reply = fetch_reply(table.rules[1], "req-7")
+    assert method == "Fetch.fulfillRequest" and reply["responseCode"] == 200
+    assert base64.b64decode(reply["body"]) == b'{"items": []}'
+    assert reply["responseHeaders"] == [{"name": "Content-Type", "value": "application/json"}]
+    assert fetch_reply(None, "r")[0] == "Fetch.continueRequest"
+
+
+def test_fast_profile_blocks_trackers_and_heavy_types_and_rejects_bad_rules() -> None:
+    table = compile_rules([{"match": "*.example.org", "action": "continue"}], profile="fast")
+    assert table.decide("https://www.google-analytics.com/g/collect", "Ping").action == "block"  # type: ignore[union-attr]
+    assert table.decide("https://img.example.org/a.png", "Image").action == "block"  # type: ignore[union-attr]
+    assert table.decide("https://app.example.org/api", "XHR").action == "continue"  # type: ignore[union-attr]
+
+    with pytest.raises(ValueError, match="Unknown profile"):
+        compile_rules(None, profile="turbo")
+    with pytest.raises(ValueError, match="action must be one of"):
+        compile_rules([{"match": "x.example", "action": "redirect"}])
+    with pytest.raises(ValueError, match="file not found"):
+        compile_rules([{"match": "x.example", "action": "fulfill", "file": "/nonexistent/x.json"}])
+
+
+def test_interceptor_answers_paused_requests_through_extension_gateway() -> None:
+    from mcp_servers.browser.session_cdp import ExtensionCdpConnection
+
+    sent: list[tuple[str, dict[str, Any]]] = []
+
+    class _Gateway:
+        def cdp_send(self, _tab: str, method: str, params: dict[str, Any] | None, *, timeout: float) -> dict:  # noqa: ARG002
+            sent.append((method, params or {}))
+            return {}
+
+    conn = ExtensionCdpConnection(_Gateway(), "t1")  # type: ignore[arg-type]
+    icp = _Interceptor(conn, "t1")
+    icp.responders["rules"] = compile_rules([{"match": "*.tracker.example", "action": "block"}])
+    icp.handle({"requestId": "1", "resourceType": "Script", "request": {"url": "https://cdn.tracker.example/t.js"}})
+    icp.handle({"requestId": "2", "resourceType": "Document", "request": {"url": "https://app.example/"}})
+
+    assert sent == [
+        ("Fetch.failRequest", {"requestId": "1", "errorReason": "BlockedByClient"}),
+        ("Fetch.continueRequest", {"requestId": "2"}),
+    ]
+    status = icp.status("rules")
+    assert status["mode"] == "extension" and status["paused"] == 2
+    assert status["hits"] == [{"rule": 0, "match": "*.tracker.example", "action": "block", "hits": 1}]
+
+
+def test_interceptor_continues_on_responder_errors_and_releases_fetch_on_fatal_errors() -> None:
+    from mcp_servers.browser.session_cdp import ExtensionCdpConnection
+
+    sent: list[str] = []
+
+    class _Gateway:
+        def cdp_send(self, _tab: str, method: str, params: dict[str, Any] | None, *, timeout: float) -> dict:  # noqa: ARG002
+            if method == "Fetch.fulfillRequest":
+                raise RuntimeError("bad fulfill payload")
+            sent.append(f"{method}:{(params or {}).get('requestId', '')}")
+            return {}
+
+    class _Broken:
+        def respond(self, _params: dict[str, Any]) -> None:
+            raise KeyError("boom")
+
+        def stats(self) -> dict[str, Any]:
+            return {}
+
+    class _Fulfill(_Broken):
+        def respond(self, params: dict[str, Any]) -> tuple[str, dict[str, Any], int]:
+            return "Fetch.fulfillRequest", {"requestId": params["requestId"], "responseCode": 200}, 0
+
+    icp = _Interceptor(ExtensionCdpConnection(_Gateway(), "t1"), "t1")  # type: ignore[arg-type]
+    icp.responders["rules"] = _Broken()  # type: ignore[assignment]
+    icp.handle({"requestId": "1", "request": {"url": "https://app.example/"}})
+    icp.responders["rules"] = _Fulfill()  # type: ignore[assignment]
+    icp.handle({"requestId": "2", "request": {"url": "https://app.example/"}})
+    assert sent == ["Fetch.continueRequest:1", "Fetch.continueRequest:2"]
+    assert icp.status("rules")["failures"] == 2
+
+    def _dead() -> None:
+        raise ConnectionError("socket closed")
+
+    icp._next_event = _dead  # type: ignore[method-assign]
+    icp._run()
+    assert sent[-1] == "Fetch.disable:" and icp.error == "socket closed"
@@ -51,7 +51,7 @@ def test_build_net_trace_defaults_to_xhr_fetch_and_hides_urlfull(monkeypatch: py
         },
     }
 
-    monkeypatch.setattr(session_manager, "get_telemetry", lambda _tab_id: _T0(done))
+    monkeypatch.setattr(session_manager, "tier0_query", lambda _tab_id, query: query(_T0(done)))
 
     out = build_net_trace(cfg, tab_id="tab1", capture="meta", limit=50)
     assert isinstance(out, dict)
@@ -94,7 +94,7 @@ def test_build_net_trace_store_includes_urlfull_and_headers_in_artifact(monkeypa
         }
     }
 
-    monkeypatch.setattr(session_manager, "get_telemetry", lambda _tab_id: _T0(done))
+    monkeypatch.setattr(session_manager, "tier0_query", lambda _tab_id, query: query(_T0(done)))
 
     captured: dict = {}
 
@@ -149,7 +149,7 @@ def test_build_net_trace_include_exclude_filters(monkeypatch: pytest.MonkeyPatch
         "3": {"type": "XHR", "url": "https://example.com/other", "urlFull": "https://example.com/other", "endTs": 30},
     }
 
-    monkeypatch.setattr(session_manager, "get_telemetry", lambda _tab_id: _T0(done))
+    monkeypatch.setattr(session_manager, "tier0_query", lambda _tab_id, query: query(_T0(done)))
 
     out = build_net_trace(cfg, tab_id="tab1", include="api/", exclude=["bar"], types_raw=["XHR"], limit=50)
     trace = out.get("trace")
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import random
+from typing import Any
+
+import pytest
+
+from mcp_servers.browser.telemetry import Tier0Telemetry
+from mcp_servers.browser.telemetry_net_index import _record_keys, select_done
+
+HOSTS = ("api.example", "cdn.example", "pay.example")
+TYPES = ("XHR", "Fetch", "Image", "Script")
+STATUSES = (200, 204, 302, 404, 500)
+
+
+def _fill(t: Tier0Telemetry, n: int, seed: int = 7) -> None:
+    rng = random.Random(seed)
+    for i in range(n):
+        rid = f"r{i}"
+        url = f"https://{rng.choice(HOSTS)}/p/{i}?q=1"
+        t.ingest(
+            {
+                "method": "Network.requestWillBeSent",
+                "params": {"requestId": rid, "type": rng.choice(TYPES), "request": {"url": url, "method": "GET"}},
+            }
+        )
+        if i % 9 == 0:
+            t.ingest({"method": "Network.loadingFailed", "params": {"requestId": rid, "errorText": "net::ERR_FAILED"}})
+            continue
+        status = rng.choice(STATUSES)
+        t.ingest({"method": "Network.responseReceived", "params": {"requestId": rid, "response": {"status": status}}})
+        t.ingest({"method": "Network.loadingFinished", "params": {"requestId": rid, "encodedDataLength": 100 + i}})
+
+
+def _brute(t: Tier0Telemetry, *, types: set[str], hosts: set[str], buckets: set[str], since: int | None) -> list[str]:
+    out = []
+    for rid, meta in reversed(t._req_done.items()):
+        rtype, host, bucket = _record_keys(meta)
+        if (types and rtype not in types) or (hosts and host not in hosts) or (buckets and bucket not in buckets):
+            continue
+        if since is not None and meta["endTs"] <= since:
+            continue
+        out.append(rid)
+    return out
+
+
+def test_index_tracks_evictions_and_matches_full_scan() -> None:
+    t = Tier0Telemetry(max_done_requests=150)
+    _fill(t, 400)
+    index = t.done_index
+    assert len(t._req_done) == 150 and index.counters()["requests"] == 150
+    assert sum(len(v) for v in index.by_host.values()) == 150
+    assert index.failed == sum(1 for m in t._req_done.values() if m.get("ok") is False)
+    assert index.bytes == sum(int(m.get("encodedDataLength") or 0) for m in t._req_done.values())
+
+    mid = list(t._req_done.values())[60]["endTs"]
+    cases: list[dict[str, Any]] = [
+        {"types": {"XHR", "Fetch"}, "hosts": set(), "statuses": set(), "since": None},
+        {"types": set(), "hosts": {"pay.example"}, "statuses": {"4xx", "unknown"}, "since": None},
+        {"types": {"Script"}, "hosts": {"api.example", "cdn.example"}, "statuses": set(), "since": mid},
+    ]
+    for case in cases:
+        expected = _brute(t, types=case["types"], hosts=case["hosts"], buckets=case["statuses"], since=case["since"])
+        page, total = select_done(t._req_done, index, include=[], exclude=[], offset=0, limit=0, **case)
+        assert [rid for rid, _m in page] == expected and total == len(expected)
+
+    page, total = select_done(
+        t._req_done,
+        index,
+        types={"XHR", "Fetch"},
+        hosts=set(),
+        statuses=set(),
+        include=[],
+        exclude=[],
+        since=None,
+        offset=5,
+        limit=10,
+    )
+    full = _brute(t, types={"XHR", "Fetch"}, hosts=set(), buckets=set(), since=None)
+    assert [rid for rid, _m in page] == full[5:15] and total == len(full)  # exact without a full walk
+
+    page, _total = select_done(
+        t._req_done,
+        index,
+        types=set(),
+        hosts=set(),
+        statuses={"404"},
+        include=["/p/3"],
+        exclude=[],
+        since=None,
+        offset=0,
+        limit=0,
+    )
+    assert page and all(m["status"] == 404 and "/p/3" in m["urlFull"] for _rid, m in page)
+
+    t.clear_done_requests()
+    assert index.counters()["requests"] == 0 and not index.by_type
+
+
+def test_net_trace_filters_by_host_and_status_through_the_index(monkeypatch: pytest.MonkeyPatch) -> None:
+    from mcp_servers.browser import net_trace
+    from mcp_servers.browser.config import BrowserConfig
+    from mcp_servers.browser.session import session_manager
+    from mcp_servers.browser.telemetry_shards import TelemetryShard
+
+    shard = TelemetryShard(Tier0Telemetry())
+    _fill(shard.telemetry, 300)
+    monkeypatch.setitem(session_manager._telemetry, "tab-idx", shard)
+
+    out = net_trace.build_net_trace(
+        BrowserConfig.from_env(), tab_id="tab-idx", hosts_raw="PAY.example", status_raw=["5xx"], limit=3
+    )
+    trace = out["trace"]
+    expected = _brute(shard.telemetry, types=set(), hosts={"pay.example"}, buckets={"5xx"}, since=None)
+    assert [it["requestId"] for it in trace["items"]] == expected[:3]
+    assert trace["hosts"] == ["pay.example"] and trace["status"] == ["5xx"] and trace["types"] == []
+    assert trace["buffer"]["requests"] == 300 and trace["buffer"]["status"]["5xx"] >= len(expected)
+
+    default = net_trace.build_net_trace(BrowserConfig.from_env(), tab_id="tab-idx", limit=2)["trace"]
+    assert default["types"] == ["Fetch", "XHR"]
+    assert default["total"] == len(
+        _brute(shard.telemetry, types={"XHR", "Fetch"}, hosts=set(), buckets=set(), since=None)
+    )
+
+
+def test_index_survives_in_place_edits_and_matches_unindexed_scan() -> None:
+    t = Tier0Telemetry(max_done_requests=120)
+    _fill(t, 200)
+    # Records are shared dicts: edits after insert must not skew eviction bookkeeping.
+    for meta in list(t._req_done.values())[:40]:
+        meta["ok"] = not meta.get("ok", True)
+        meta["encodedDataLength"] = 10**6
+        meta["status"] = 599
+    _fill(t, 60, seed=11)
+
+    index = t.done_index
+    assert index.failed == sum(1 for m in t._req_done.values() if m.get("ok") is False)
+    assert index.bytes == sum(int(m.get("encodedDataLength") or 0) for m in t._req_done.values())
+    assert index.counters()["status"] == {
+        k: sum(1 for m in t._req_done.values() if _record_keys(m)[2] == k)
+        for k in {_record_keys(m)[2] for m in t._req_done.values()}
+    }
+
+    since = list(t._req_done.values())[30]["endTs"]
+    for hosts, statuses in (({"api.example", "pay.example"}, {"2xx"}), ({"cdn.example"}, {"404", "5xx"})):
+        case: dict[str, Any] = {"types": set(), "hosts": hosts, "statuses": statuses, "since": since}
+        expected, expected_total = select_done(t._req_done, None, include=[], exclude=[], offset=0, limit=0, **case)
+        page, total = select_done(t._req_done, index, include=[], exclude=[], offset=0, limit=0, **case)
+        assert expected and [rid for rid, _m in page] == [rid for rid, _m in expected]
+        assert total == expected_total
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import io
+import json
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+from mcp_servers.browser.tools.page.coverage import js_used_ranges, merge_ranges, summarize_page_coverage
+
+
+def test_merge_ranges_sorts_and_coalesces() -> None:
+    assert merge_ranges([(10, 20), (0, 5), (5, 8), (15, 30), (40, 40), (35, 36)]) == [(0, 8), (10, 30), (35, 36)]
+    assert merge_ranges([]) == []
+
+
+def test_js_block_coverage_innermost_count_wins() -> None:
+    functions = [
+        # Script top level: executed.
+        {"functionName": "", "ranges": [{"startOffset": 0, "endOffset": 1000, "count": 1}]},
+        # Executed function with an unexecuted block inside.
+        {
+            "functionName": "a",
+            "ranges": [
+                {"startOffset": 100, "endOffset": 300, "count": 2},
+                {"startOffset": 150, "endOffset": 200, "count": 0},
+            ],
+        },
+        # Never-called function containing a (nested) block range.
+        {
+            "functionName": "b",
+            "ranges": [
+                {"startOffset": 400, "endOffset": 700, "count": 0},
+                {"startOffset": 450, "endOffset": 500, "count": 0},
+            ],
+        },
+    ]
+    used, length = js_used_ranges(functions)
+    assert length == 1000
+    assert used == [(0, 150), (200, 400), (700, 1000)]
+
+
+def test_summary_ranks_unused_bytes_and_streams_ranges() -> None:
+    js = [
+        {
+            "url": "https://app.example/vendor.js?v=1",
+            "functions": [
+                {"ranges": [{"startOffset": 0, "endOffset": 10_000, "count": 1}]},
+                {"ranges": [{"startOffset": 1000, "endOffset": 9000, "count": 0}]},
+            ],
+        },
+        # Same script loaded twice: union, not double-count.
+        {
+            "url": "https://app.example/app.js",
+            "functions": [{"ranges": [{"startOffset": 0, "endOffset": 100, "count": 1}]}],
+        },
+        {
+            "url": "https://app.example/app.js",
+            "functions": [
+                {"ranges": [{"startOffset": 0, "endOffset": 100, "count": 0}]},
+            ],
+        },
+        {"url": "", "functions": [{"ranges": [{"startOffset": 0, "endOffset": 50, "count": 1}]}]},
+    ]
+    rules = [
+        {"styleSheetId": "s1", "startOffset": 0, "endOffset": 400, "used": True},
+        {"styleSheetId": "s1", "startOffset": 300, "endOffset": 600, "used": True},
+        {"styleSheetId": "s1", "startOffset": 600, "endOffset": 1500, "used": False},
+        {"styleSheetId": "s2", "startOffset": 0, "endOffset": 80, "used": False},
+    ]
+    sheets = {"s1": {"sourceURL": "https://app.example/site.css", "length": 2000}, "s2": {"isInline": True}}
+    sink = io.StringIO()
+
+    out = summarize_page_coverage(js, rules, sheets, page_url="https://app.example/", sink=sink)
+
+    assert out["js"] == {
+        "resources": 2,
+        "totalBytes": 10_100,
+        "usedBytes": 2100,
+        "unusedBytes": 8000,
+        "unusedPct": 79.2,
+    }
+    assert out["css"]["totalBytes"] == 2080 and out["css"]["usedBytes"] == 600
+    assert [(r["type"], r["url"], r["unusedBytes"]) for r in out["topUnused"]] == [
+        ("js", "https://app.example/vendor.js", 8000),
+        ("css", "https://app.example/site.css", 1400),
+        ("css", "https://app.example/", 80),
+        ("js", "https://app.example/app.js", 0),
+    ]
+    lines = [json.loads(line) for line in sink.getvalue().splitlines()]
+    assert len(lines) == 5 and lines[0]["used"] == [[0, 1000], [9000, 10_000]]
+
+
+def test_audit_coverage_phase_stores_jsonl_artifact(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    import mcp_servers.browser.tools as tools
+    from mcp_servers.browser.config import BrowserConfig
+    from mcp_servers.browser.server.artifacts import ArtifactStore
+    from mcp_servers.browser.server.handlers import page_capture
+    from mcp_servers.browser.server.registry import create_default_registry
+    from mcp_servers.browser.session import session_manager
+    from mcp_servers.browser.tools.page import audit as audit_mod
+    from mcp_servers.browser.tools.page import coverage as coverage_mod
+
+    sent: list[str] = []
+
+    class _Sess:
+        def send(self, method: str, params=None):  # noqa: ANN001,ARG002
+            sent.append(method)
+            if method == "Profiler.takePreciseCoverage":
+                return {
+                    "result": [
+                        {
+                            "url": "https://app.example/a.js",
+                            "functions": [{"ranges": [{"startOffset": 0, "endOffset": 400, "count": 0}]}],
+                        }
+                    ]
+                }
+            if method == "CSS.stopRuleUsageTracking":
+                return {"ruleUsage": [{"styleSheetId": "s1", "startOffset": 0, "endOffset": 10, "used": True}]}
+            return {}
+
+        def wait_load(self, timeout: float = 10.0) -> None:  # noqa: ARG002
+            sent.append("wait_load")
+
+        def wait_for_event(self, name: str, timeout: float = 10.0):  # noqa: ARG002
+            if name == "CSS.styleSheetAdded" and "header" not in sent:
+                sent.append("header")
+                return {"header": {"styleSheetId": "s1", "sourceURL": "https://app.example/a.css", "length": 100}}
+            return None
+
+        def eval_js(self, expression: str, **_kw):  # noqa: ARG002
+            return "https://app.example/"
+
+    @contextmanager
+    def fake_get_session(_cfg, timeout: float = 5.0, **kwargs):  # noqa: ANN001,ARG001
+        yield _Sess(), {"id": "tab1"}
+
+    @contextmanager
+    def fake_shared_session(_cfg: BrowserConfig, timeout: float = 5.0):  # noqa: ARG001
+        yield None, {"id": "tab1"}
+
+    session_manager.recover_reset()
+    monkeypatch.setattr(session_manager, "shared_session", fake_shared_session)
+    monkeypatch.setattr(coverage_mod, "get_session", fake_get_session)
+    monkeypatch.setattr(coverage_mod.time, "sleep", lambda _s: None)
+    monkeypatch.setattr(audit_mod, "get_page_info", lambda _cfg: {"pageInfo": {"url": "https://app.example/"}})
+    for name in ("get_page_diagnostics", "get_page_performance", "get_page_resources", "get_page_locators"):
+        monkeypatch.setattr(audit_mod, name, lambda *_a, **_k: None)
+    monkeypatch.setattr(tools, "get_page_audit", audit_mod.get_page_audit)
+    store = ArtifactStore(base_dir=tmp_path / "artifacts")
+    monkeypatch.setattr(page_capture, "artifact_store", store)
+
+    handler, _requires_browser = create_default_registry().get("page")  # type: ignore[assignment]
+    res = handler(BrowserConfig.from_env(), launcher=None, args={"detail": "audit", "coverage": True})
+
+    assert not res.is_error
+    audit = res.data["audit"]
+    assert sent.index("Profiler.startPreciseCoverage") < sent.index("Page.reload") < sent.index("wait_load")
+    assert audit["coverage"]["reloaded"] is True
+    assert audit["coverage"]["js"]["unusedBytes"] == 400 and audit["coverage"]["css"]["unusedBytes"] == 90
+    assert "coveragePath" not in audit
+    meta = store.get_meta(artifact_id=audit["coverageArtifact"]["id"])
+    lines = (tmp_path / "artifacts" / f"{meta['id']}.jsonl").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["type"] for line in lines] == ["js", "css"]
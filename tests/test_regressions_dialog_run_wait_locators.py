@@ -42,7 +42,7 @@ def test_dialog_closes_when_telemetry_says_open(monkeypatch: pytest.MonkeyPatch)
         yield DummySession(), {"id": "tab1"}
 
     monkeypatch.setattr(dialog_tool, "get_session", fake_get_session)
-    monkeypatch.setattr(session_manager, "get_telemetry", lambda _tid: telemetry)
+    monkeypatch.setattr(session_manager, "tier0_query", lambda _tid, query: query(telemetry))
     monkeypatch.setattr(session_manager, "note_dialog_closed", note_closed)
 
     cfg = BrowserConfig.from_env()
@@ -87,7 +87,7 @@ def test_dialog_clears_stale_open_state(monkeypatch: pytest.MonkeyPatch) -> None
         yield DummySession(), {"id": "tab1"}
 
     monkeypatch.setattr(dialog_tool, "get_session", fake_get_session)
-    monkeypatch.setattr(session_manager, "get_telemetry", lambda _tid: telemetry)
+    monkeypatch.setattr(session_manager, "tier0_query", lambda _tid, query: query(telemetry))
     monkeypatch.setattr(session_manager, "note_dialog_closed", note_closed)
 
     cfg = BrowserConfig.from_env()
@@ -130,7 +130,7 @@ def test_dialog_returns_runtime_ok_flag(monkeypatch: pytest.MonkeyPatch) -> None
         yield DummySession(), {"id": "tab1"}
 
     monkeypatch.setattr(dialog_tool, "get_session", fake_get_session)
-    monkeypatch.setattr(session_manager, "get_telemetry", lambda _tid: telemetry)
+    monkeypatch.setattr(session_manager, "tier0_query", lambda _tid, query: query(telemetry))
     monkeypatch.setattr(session_manager, "note_dialog_closed", lambda *a, **k: None)
 
     cfg = BrowserConfig.from_env()
@@ -194,7 +194,7 @@ def test_dialog_soft_recovers_when_next_call_is_bricked(monkeypatch: pytest.Monk
         yield sess, {"id": sess.tab_id}
 
     monkeypatch.setattr(dialog_tool, "get_session", fake_get_session)
-    monkeypatch.setattr(session_manager, "get_telemetry", lambda _tid: t0)
+    monkeypatch.setattr(session_manager, "tier0_query", lambda _tid, query: query(t0))
     monkeypatch.setattr(session_manager, "note_dialog_closed", lambda *a, **k: None)
 
     recover_reset_calls: list[dict] = []
@@ -263,7 +263,7 @@ def test_wait_navigation_uses_cdp_events(monkeypatch: pytest.MonkeyPatch) -> Non
         yield DummySession(), {"id": "tab1"}
 
     monkeypatch.setattr(wait_tool, "get_session", fake_get_session)
-    monkeypatch.setattr(session_manager, "get_telemetry", lambda _tid: None)
+    monkeypatch.setattr(session_manager, "tier0_query", lambda _tid, _query: None)
     session_manager._session_tab_id = "tab1"
 
     cfg = BrowserConfig.from_env()
@@ -309,7 +309,7 @@ def test_wait_navigation_detects_commit_via_loader_id(monkeypatch: pytest.Monkey
         yield DummySession(), {"id": "tab1"}
 
     monkeypatch.setattr(wait_tool, "get_session", fake_get_session)
-    monkeypatch.setattr(session_manager, "get_telemetry", lambda _tid: None)
+    monkeypatch.setattr(session_manager, "tier0_query", lambda _tid, _query: None)
     session_manager._session_tab_id = "tab1"
 
     cfg = BrowserConfig.from_env()
@@ -348,7 +348,7 @@ def test_wait_navigation_uses_tier0_events_for_race(monkeypatch: pytest.MonkeyPa
         yield DummySession(), {"id": "tab1"}
 
     monkeypatch.setattr(wait_tool, "get_session", fake_get_session)
-    monkeypatch.setattr(session_manager, "get_telemetry", lambda _tid: None)
+    monkeypatch.setattr(session_manager, "tier0_query", lambda _tid, _query: None)
     monkeypatch.setattr(
         session_manager,
         "tier0_snapshot",
@@ -490,7 +490,7 @@ def test_flow_watchdog_action_timeout_does_not_hang(monkeypatch: pytest.MonkeyPa
 
     monkeypatch.setattr(session_manager, "shared_session", fake_shared_session)
     monkeypatch.setattr(session_manager, "ensure_telemetry", lambda _sess: {"enabled": True})
-    monkeypatch.setattr(session_manager, "get_telemetry", lambda _tab_id: None)
+    monkeypatch.setattr(session_manager, "tier0_query", lambda _tab_id, _query: None)
     session_manager._session_tab_id = "tab1"
 
     registry = create_default_registry()
@@ -568,7 +568,7 @@ def test_dialog_soft_recovers_when_post_handle_cdp_times_out(monkeypatch: pytest
         yield DummySession(), {"id": "tab1"}
 
     monkeypatch.setattr(dialog_tool, "get_session", fake_get_session)
-    monkeypatch.setattr(session_manager, "get_telemetry", lambda _tid: telemetry)
+    monkeypatch.setattr(session_manager, "tier0_query", lambda _tid, query: query(telemetry))
     monkeypatch.setattr(session_manager, "close_tab", fake_close_tab)
     monkeypatch.setattr(session_manager, "new_tab", fake_new_tab)
 
@@ -627,7 +627,7 @@ def test_dialog_stale_state_still_recovers_on_cdp_brick(monkeypatch: pytest.Monk
         yield DummySession(), {"id": "tab1"}
 
     monkeypatch.setattr(dialog_tool, "get_session", fake_get_session)
-    monkeypatch.setattr(session_manager, "get_telemetry", lambda _tid: telemetry)
+    monkeypatch.setattr(session_manager, "tier0_query", lambda _tid, query: query(telemetry))
     monkeypatch.setattr(session_manager, "close_tab", fake_close_tab)
     monkeypatch.setattr(session_manager, "new_tab", fake_new_tab)
 
@@ -689,7 +689,7 @@ def test_dialog_soft_recovers_when_runtime_eval_times_out(monkeypatch: pytest.Mo
         yield DummySession(), {"id": "tab1"}
 
     monkeypatch.setattr(dialog_tool, "get_session", fake_get_session)
-    monkeypatch.setattr(session_manager, "get_telemetry", lambda _tid: telemetry)
+    monkeypatch.setattr(session_manager, "tier0_query", lambda _tid, query: query(telemetry))
     monkeypatch.setattr(session_manager, "close_tab", fake_close_tab)
     monkeypatch.setattr(session_manager, "new_tab", fake_new_tab)
 
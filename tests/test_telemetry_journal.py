@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from mcp_servers.browser.telemetry import Tier0Telemetry
+from mcp_servers.browser.telemetry_journal import TelemetryJournal, query_journal, tab_dir
+from mcp_servers.browser.telemetry_shards import TelemetryShard
+
+
+def _error(i: int) -> dict:
+    return {
+        "method": "Runtime.consoleAPICalled",
+        "params": {"type": "error", "args": [{"type": "string", "value": f"boom {i} " + "x" * 200}]},
+    }
+
+
+def _fill(journal: TelemetryJournal, n: int, *, start: int = 0) -> Tier0Telemetry:
+    t = Tier0Telemetry(max_events=20)
+    t.seq = journal.last_seq
+    t.sink = journal.append
+    for i in range(start, start + n):
+        t.ingest(_error(i))
+        if i % 50 == 49:
+            assert journal.flush()
+    assert journal.flush()
+    return t
+
+
+def test_journal_rotates_segments_and_seeks_by_seq(tmp_path: Path) -> None:
+    jr = TelemetryJournal(tmp_path / "tab", segment_bytes=2048, max_segments=0)
+    t = _fill(jr, 1000)
+    assert len(t.console) == 20  # memory stays bounded
+    assert jr.last_seq == 1000
+
+    stats = jr.stats()
+    assert stats["segments"] > 2
+    assert stats["written"] == 1000
+
+    page = jr.read(since_seq=990, limit=100)
+    assert [r["seq"] for r in page["records"]] == list(range(991, 1001))
+    assert page["records"][0]["kind"] == "console"
+    assert page["blocksRead"] <= 2 < page["blocksTotal"]
+
+    first = jr.read(since_seq=0, limit=5)
+    assert [r["seq"] for r in first["records"]] == [1, 2, 3, 4, 5]
+    assert first["hasMore"] is True and first["nextSinceSeq"] == 5
+    jr.close()
+
+
+def test_journal_survives_reopen_torn_tail_and_retention(tmp_path: Path) -> None:
+    directory = tmp_path / "tab"
+    jr = TelemetryJournal(directory, segment_bytes=512, max_segments=3)
+    _fill(jr, 400)
+    jr.close()
+    segs = sorted(directory.glob("*.seg"))
+    assert len(segs) == 3
+    assert not (directory / f"{1:016d}.seg").exists()
+
+    # Crash simulation: torn block at the tail and a lost index.
+    with segs[-1].open("ab") as fh:
+        fh.write(b"\x00\x00\x10\x00garbage")
+    segs[-1].with_suffix(".idx").unlink()
+
+    reopened = TelemetryJournal(directory, segment_bytes=512, max_segments=3)
+    assert reopened.last_seq == 400
+    tail = reopened.read(since_seq=395)
+    assert [r["seq"] for r in tail["records"]] == [396, 397, 398, 399, 400]
+
+    # Sequence ids continue across the restart.
+    _fill(reopened, 10, start=400)
+    assert [r["seq"] for r in reopened.read(since_seq=405)["records"]] == [406, 407, 408, 409, 410]
+    reopened.close()
+
+
+def test_shard_journal_continuity_and_query_shape(tmp_path: Path) -> None:
+    root = tmp_path / "telemetry"
+    first = TelemetryShard(journal=TelemetryJournal(tab_dir("tab/1", root=root)))
+    for i in range(3):
+        first.telemetry.ingest(_error(i))
+    first.close()
+
+    second = TelemetryShard(journal=TelemetryJournal(tab_dir("tab/1", root=root)))
+    assert second.telemetry.seq == 3
+    second.telemetry.ingest(_error(3))
+    second.drain()
+
+    out = query_journal("tab/1", journal=second.journal, since_seq=1)
+    assert out["tier"] == "journal"
+    assert [c["seq"] for c in out["console"]] == [2, 3, 4]
+    assert out["summary"]["consoleErrors"] == 3
+    assert out["nextSinceSeq"] == 4 and out["hasMore"] is False
+    second.close()
+
+
+def test_diagnostics_reads_a_closed_tabs_journal_by_id(tmp_path: Path, monkeypatch) -> None:  # noqa: ANN001
+    from mcp_servers.browser.config import BrowserConfig
+    from mcp_servers.browser.tools.page import diagnostics
+
+    monkeypatch.setenv("MCP_TIER0_JOURNAL_DIR", str(tmp_path))
+    closed = TelemetryShard(journal=TelemetryJournal(tab_dir("closed-tab")))
+    for i in range(4):
+        closed.telemetry.ingest(_error(i))
+    closed.close()
+
+    out = diagnostics.get_page_diagnostics(BrowserConfig.from_env(), source="journal", tab_id="closed-tab", since_seq=2)
+    assert out["target"] == "closed-tab"
+    assert [c["seq"] for c in out["diagnostics"]["console"]] == [3, 4]
+    assert tab_dir("..", root=tmp_path) == tmp_path / "_"
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import logging
+import threading
+
+import pytest
+
+from mcp_servers.browser.telemetry import Tier0Telemetry, prepare_event
+from mcp_servers.browser.telemetry_shards import TelemetryShard
+
+
+def _console(i: int) -> dict:
+    return {
+        "method": "Runtime.consoleAPICalled",
+        "params": {"type": "error", "args": [{"type": "string", "value": f"m{i}"}]},
+    }
+
+
+def test_shard_applies_concurrent_producers_in_one_writer() -> None:
+    shard = TelemetryShard(Tier0Telemetry(max_events=5000))
+    threads_n, per_thread = 8, 250
+
+    def _produce(base: int) -> None:
+        for i in range(per_thread):
+            shard.submit(prepare_event(_console(base + i)))
+
+    threads = [threading.Thread(target=_produce, args=(t * per_thread,)) for t in range(threads_n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    shard.drain()
+
+    with shard.locked() as telemetry:
+        snap = telemetry.snapshot(limit=5000)
+    assert snap["summary"]["consoleErrors"] == threads_n * per_thread
+    assert len({c["args"][0] for c in snap["console"]}) == threads_n * per_thread
+
+    stats = shard.stats()
+    assert stats["applied"] == threads_n * per_thread
+    assert stats["queued"] == 0
+    assert stats["lockAcquired"] >= 2
+    assert stats["lockWaitMsMax"] >= 0
+
+
+def test_prepare_event_is_pure_and_apply_matches_ingest() -> None:
+    ev = {
+        "method": "Network.requestWillBeSent",
+        "params": {
+            "requestId": "r1",
+            "type": "Fetch",
+            "request": {"url": "https://api.example/x?token=secret", "method": "GET", "headers": {}},
+        },
+    }
+    prepared = prepare_event(ev)
+    assert prepared is not None
+    method, _params, prep = prepared
+    assert method == "Network.requestWillBeSent"
+    assert "secret" not in str(prep["url"])
+    assert prepare_event({"params": {}}) is None
+
+
+def test_session_manager_ingest_goes_through_tab_shards() -> None:
+    from mcp_servers.browser.session_manager import SessionManager
+
+    mgr = SessionManager.__new__(SessionManager)
+    mgr._telemetry = {}
+    mgr._telemetry_lock = threading.Lock()
+    mgr.get_auto_dialog_mode = lambda _tab: None  # type: ignore[method-assign]
+
+    mgr._ingest_tier0_event("tabA", _console(1))
+    mgr._ingest_tier0_event("tabB", _console(2))
+    mgr.note_dialog_closed("tabA", accepted=True)
+
+    snap = mgr.tier0_snapshot("tabA")
+    assert snap is not None and snap["summary"]["consoleErrors"] == 1
+    assert mgr.tier0_snapshot("missing") is None
+    stats = mgr.telemetry_ingest_stats()
+    assert set(stats) == {"tabA", "tabB"}
+    assert stats["tabA"]["applied"] == 2
+
+
+def test_failing_journal_sink_is_logged_and_reported_in_stats(caplog: pytest.LogCaptureFixture) -> None:
+    shard = TelemetryShard(Tier0Telemetry())
+
+    def broken(kind: str, seq: int, ts: int, item: dict) -> None:
+        raise OSError("journal disk full")
+
+    with shard.locked() as telemetry:
+        telemetry.sink = broken
+    with caplog.at_level(logging.WARNING, logger="mcp.browser.telemetry"):
+        shard.submit(prepare_event(_console(1)))
+        shard.submit(prepare_event(_console(2)))
+        shard.drain()
+
+    assert [r.message for r in caplog.records] == ["Tier-0 record sink detached after error"]
+    assert shard.stats()["sinkErrors"] == {"journal": "OSError: journal disk full"}
+    with shard.locked() as telemetry:
+        assert telemetry.snapshot()["summary"]["consoleErrors"] == 2  # buffers keep working
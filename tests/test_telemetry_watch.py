@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+
+import pytest
+
+from mcp_servers.browser.telemetry import prepare_event
+from mcp_servers.browser.telemetry_shards import TelemetryShard
+from mcp_servers.browser.telemetry_watch import WatchFilter
+
+
+def _request(req_id: str, url: str, status: int) -> list[dict]:
+    return [
+        {
+            "method": "Network.requestWillBeSent",
+            "params": {"requestId": req_id, "type": "Fetch", "request": {"url": url, "method": "GET", "headers": {}}},
+        },
+        {
+            "method": "Network.responseReceived",
+            "params": {"requestId": req_id, "type": "Fetch", "response": {"url": url, "status": status, "headers": {}}},
+        },
+    ]
+
+
+def _feed(shard: TelemetryShard, events: list[dict]) -> None:
+    for ev in events:
+        shard.submit(prepare_event(ev))
+
+
+def test_watch_blocks_until_matching_event_arrives() -> None:
+    shard = TelemetryShard()
+    match = WatchFilter.build(kinds=["network"], url="*/api/*", status=["5xx"])
+
+    def _producer() -> None:
+        time.sleep(0.05)
+        _feed(shard, _request("r1", "https://app.example/static/app.js", 503))
+        _feed(shard, _request("r2", "https://app.example/api/cart", 404))
+        time.sleep(0.05)
+        _feed(shard, _request("r3", "https://app.example/api/cart", 502))
+
+    thread = threading.Thread(target=_producer)
+    started = time.monotonic()
+    thread.start()
+    out = shard.watch(match, timeout_s=5.0)
+    thread.join()
+
+    assert time.monotonic() - started < 2.0
+    assert out["timedOut"] is False
+    assert [(e["kind"], e["status"]) for e in out["events"]] == [("network", 502)]
+    assert out["cursor"] >= out["events"][-1]["seq"]
+
+    again = shard.watch(match, since_seq=out["cursor"], timeout_s=0.05)
+    assert again["timedOut"] is True and again["events"] == []
+
+
+def test_watch_returns_backlog_after_cursor_with_limit() -> None:
+    shard = TelemetryShard()
+    for i in range(5):
+        _feed(
+            shard, [{"method": "Runtime.consoleAPICalled", "params": {"type": "error", "args": [{"value": f"e{i}"}]}}]
+        )
+
+    out = shard.watch(WatchFilter.build(kinds="console", level="error"), since_seq=0, timeout_s=0, limit=2)
+    assert [e["args"] for e in out["events"]] == [["e0"], ["e1"]]
+    assert out["hasMore"] is True
+
+    rest = shard.watch(WatchFilter.build(kinds="console"), since_seq=out["cursor"], timeout_s=0)
+    assert [e["args"] for e in rest["events"]] == [["e2"], ["e3"], ["e4"]]
+
+    _feed(shard, [{"method": "Page.navigatedWithinDocument", "params": {"url": "https://app.example/#/b"}}])
+    nav = shard.watch(WatchFilter.build(kinds="navigation"), since_seq=0, timeout_s=0)
+    assert [(e["kind"], e["recordKind"]) for e in nav["events"]] == [("navigation", "spa")]
+
+
+def test_watch_filter_validation() -> None:
+    with pytest.raises(ValueError):
+        WatchFilter.build(kinds=["bogus"])
+    with pytest.raises(ValueError):
+        WatchFilter.build(status=["6xx"])
+    f = WatchFilter.build(url="checkout", status="failed")
+    assert f.matches("network", {"url": "https://x.example/Checkout", "status": None, "errorText": "net::ERR"})
+    assert not f.matches("network", {"url": "https://x.example/checkout", "status": 200})
+
+
+def test_wait_event_tool_uses_shard_condition(monkeypatch: pytest.MonkeyPatch) -> None:
+    from mcp_servers.browser.config import BrowserConfig
+    from mcp_servers.browser.tools.page import watch as watch_mod
+
+    shard = TelemetryShard()
+
+    class _Sess:
+        tab_id = "tab1"
+
+    @contextmanager
+    def fake_get_session(_cfg, timeout: float = 5.0, **kwargs):  # noqa: ANN001,ARG001
+        yield _Sess(), {"id": "tab1"}
+
+    monkeypatch.setattr(watch_mod, "get_session", fake_get_session)
+    monkeypatch.setattr(watch_mod.session_manager, "ensure_telemetry", lambda _s: {"enabled": True, "bus": True})
+    monkeypatch.setattr(
+        watch_mod.session_manager,
+        "watch_tier0",
+        lambda _tab, match, **kw: shard.watch(match, **kw),
+    )
+
+    timer = threading.Timer(
+        0.05,
+        lambda: _feed(
+            shard, [{"method": "Page.javascriptDialogOpening", "params": {"type": "alert", "message": "hi"}}]
+        ),
+    )
+    timer.start()
+    out = watch_mod.watch_events(BrowserConfig.from_env(), events=["dialogs"], timeout=5)
+    timer.join()
+    assert out["timedOut"] is False
+    assert out["events"][0]["kind"] == "dialogs"
+    assert out["filter"] == {"events": ["dialogs"]}
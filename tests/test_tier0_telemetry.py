@@ -176,3 +176,32 @@ def test_tier0_recent_downloads() -> None:
     item = recent[0]
     assert "report.csv" in str(item.get("fileName") or "")
     assert "report.csv" in str(item.get("url") or "")
+
+
+def test_tier0_ring_buffers_evict_oldest_and_delta_by_seq() -> None:
+    t = Tier0Telemetry(max_events=3)
+    for i in range(5):
+        t.ingest({"method": "Runtime.exceptionThrown", "params": {"exceptionDetails": {"text": f"e{i}"}}})
+
+    snap = t.snapshot()
+    assert [e["message"] for e in snap["errors"]] == ["e2", "e3", "e4"]
+    assert snap["seq"] == 5
+
+    # Same-millisecond events are still separable by sequence id.
+    t.ingest({"method": "Runtime.exceptionThrown", "params": {"exceptionDetails": {"text": "e5"}}})
+    delta = t.snapshot(since_seq=snap["seq"])
+    assert [e["message"] for e in delta["errors"]] == ["e5"]
+    assert delta["sinceSeq"] == 5
+    assert t.snapshot(since_seq=delta["seq"])["errors"] == []
+
+
+def test_tier0_request_maps_evict_in_insertion_order() -> None:
+    t = Tier0Telemetry(max_events=10, max_request_map=2)
+    for rid in ("a", "b", "c"):
+        t.ingest(
+            {
+                "method": "Network.requestWillBeSent",
+                "params": {"requestId": rid, "request": {"url": f"https://x.test/{rid}", "method": "GET"}},
+            }
+        )
+    assert list(t._req) == ["b", "c"]
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from typing import Any
+
+from mcp_servers.browser.session import BrowserSession
+from mcp_servers.browser.telemetry import Tier0Telemetry
+
+T0 = 1_700_000_000.0  # epoch seconds (CDP TimeSinceEpoch)
+
+
+def _navigate(t: Tier0Telemetry, loader: str, wall: float, url: str = "https://app.example/") -> None:
+    t.ingest(
+        {
+            "method": "Network.requestWillBeSent",
+            "params": {
+                "requestId": loader,
+                "loaderId": loader,
+                "type": "Document",
+                "wallTime": wall,
+                "request": {"url": url, "method": "GET"},
+            },
+        }
+    )
+    t.ingest({"method": "Page.frameNavigated", "params": {"frame": {"id": "F", "loaderId": loader, "url": url}}})
+
+
+def _timeline(event: dict[str, Any]) -> dict[str, Any]:
+    return {"method": "PerformanceTimeline.timelineEventAdded", "params": {"event": {"frameId": "F", **event}}}
+
+
+def _lcp(at: float, size: int, url: str = "") -> dict[str, Any]:
+    details = {"renderTime": at, "loadTime": at - 0.01, "size": size, "url": url, "elementId": "hero"}
+    return _timeline({"type": "largest-contentful-paint", "name": "", "time": at, "lcpDetails": details})
+
+
+def _shift(at: float, value: float, *, had_input: bool = False) -> dict[str, Any]:
+    details = {"value": value, "hadRecentInput": had_input, "lastInputTime": 0, "sources": []}
+    return _timeline({"type": "layout-shift", "name": "", "time": at, "layoutShiftDetails": details})
+
+
+def _longtask(at: float, duration_s: float) -> dict[str, Any]:
+    return _timeline({"type": "longtask", "name": "self", "time": at, "duration": duration_s})
+
+
+def test_timeline_events_fold_into_vitals_snapshot() -> None:
+    t = Tier0Telemetry()
+    assert "vitals" not in t.snapshot()
+    _navigate(t, "L1", T0)
+
+    t.ingest(_lcp(T0 + 0.8, 1000))
+    t.ingest(_lcp(T0 + 1.9, 50_000, "https://cdn.example/hero.jpg?sig=secret"))
+    # Session windows: [0.10 + 0.05] then a gap > 1s starts [0.02]; input-driven shift ignored.
+    for at, value in ((1.0, 0.10), (1.5, 0.05), (3.0, 0.02)):
+        t.ingest(_shift(T0 + at, value))
+    t.ingest(_shift(T0 + 3.2, 0.9, had_input=True))
+    t.ingest(_longtask(T0 + 0.5, 0.120))
+    t.ingest(_longtask(T0 + 2.0, 0.060))
+
+    vitals = t.snapshot()["vitals"]
+    assert vitals["lcp"] == {
+        "ms": 1900,
+        "size": 50_000,
+        "url": "https://cdn.example/hero.jpg",
+        "elementId": "hero",
+        "candidates": 2,
+    }
+    assert vitals["cls"] == 0.15 and vitals["layoutShifts"] == 3
+    assert vitals["longTasks"] == {
+        "count": 2,
+        "totalMs": 180,
+        "maxMs": 120,
+        "blockingMs": 80,
+        "recent": [{"startMs": 500, "durationMs": 120}, {"startMs": 2000, "durationMs": 60}],
+    }
+
+
+def test_replayed_entries_are_deduplicated_and_navigation_resets() -> None:
+    t = Tier0Telemetry()
+    _navigate(t, "L1", T0)
+    for _ in range(2):  # bus reconnect replays buffered entries
+        t.ingest(_shift(T0 + 1.0, 0.2))
+        t.ingest(_longtask(T0 + 1.0, 0.1))
+    vitals = t.snapshot()["vitals"]
+    assert vitals["cls"] == 0.2 and vitals["longTasks"]["count"] == 1
+
+    _navigate(t, "L2", T0 + 10)
+    assert "vitals" not in t.snapshot()
+    t.ingest(_lcp(T0 + 10.4, 10))
+    assert t.snapshot()["vitals"]["lcp"]["ms"] == 400
+    assert "longTasks" not in t.snapshot()["vitals"]  # no longtask data: absent, not zero
+
+
+def test_enable_domains_batches_performance_timeline_once() -> None:
+    batches: list[list[dict[str, Any]]] = []
+
+    class DummyConn:
+        def send_many(self, cmds: list[dict[str, Any]]) -> list[dict[str, Any]]:
+            batches.append(cmds)
+            return [{} for _ in cmds]
+
+    session = BrowserSession(DummyConn(), tab_id="t1")  # type: ignore[arg-type]
+    session.enable_domains(network=True, timeline=True)
+    session.enable_domains(network=True, timeline=True)
+
+    assert len(batches) == 1
+    timeline = [c for c in batches[0] if c["method"] == "PerformanceTimeline.enable"]
+    # Chromium rejects the whole enable call for any other type (e.g. "longtask").
+    assert timeline[0]["params"]["eventTypes"] == ["largest-contentful-paint", "layout-shift"]
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import base64
+import gzip
+import io
+import json
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+from mcp_servers.browser.tools.page.trace_summary import TraceSummary, iter_trace_events, summarize_trace_file
+
+_MAIN = {"pid": 7, "tid": 1}
+
+
+def _events() -> list[dict]:
+    evs: list[dict] = [
+        {"ph": "M", "name": "thread_name", "args": {"name": "CrRendererMain"}, **_MAIN},
+        {"ph": "M", "name": "thread_name", "args": {"name": "Compositor"}, "pid": 7, "tid": 2},
+        # Main thread: a 120 ms task, a 60 ms task (B/E), a 10 ms task.
+        {"ph": "X", "name": "RunTask", "ts": 1_000_000, "dur": 120_000, **_MAIN},
+        {"ph": "X", "name": "Layout", "ts": 1_010_000, "dur": 5_000, **_MAIN},
+        {"ph": "X", "name": "UpdateLayoutTree", "ts": 1_020_000, "dur": 3_000, **_MAIN},
+        {"ph": "X", "name": "MajorGC", "ts": 1_030_000, "dur": 8_000, **_MAIN},
+        {"ph": "B", "name": "RunTask", "ts": 1_200_000, **_MAIN},
+        {"ph": "X", "name": "MinorGC", "ts": 1_210_000, "dur": 2_000, **_MAIN},
+        {"ph": "E", "name": "RunTask", "ts": 1_260_000, **_MAIN},
+        {"ph": "X", "name": "RunTask", "ts": 1_300_000, "dur": 10_000, **_MAIN},
+        # Another thread with more tasks must not be picked as the main thread.
+        {"ph": "X", "name": "RunTask", "ts": 1_000_000, "dur": 300_000, "pid": 7, "tid": 2},
+        # Frames.
+        {"ph": "I", "name": "DroppedFrame", "ts": 1_100_000, "pid": 7, "tid": 2},
+        {
+            "ph": "X",
+            "name": "PipelineReporter",
+            "ts": 1_150_000,
+            "dur": 16_000,
+            "pid": 7,
+            "tid": 2,
+            "args": {"chrome_frame_reporter": {"state": "STATE_PRESENTED_ALL"}},
+        },
+        {
+            "ph": "X",
+            "name": "PipelineReporter",
+            "ts": 1_400_000,
+            "dur": 16_000,
+            "pid": 7,
+            "tid": 2,
+            "args": {"chrome_frame_reporter": {"state": "STATE_DROPPED"}},
+        },
+    ]
+    return evs
+
+
+def test_iter_trace_events_streams_across_small_chunks() -> None:
+    doc = json.dumps({"traceEvents": _events(), "metadata": {"x": "]"}}, indent=1)
+    got = list(iter_trace_events(io.StringIO(doc), chunk_chars=7))
+    assert got == _events()
+
+    bare = json.dumps(_events()[:3])
+    assert list(iter_trace_events(io.StringIO(bare), chunk_chars=5)) == _events()[:3]
+
+    # Truncated stream: stop at the last complete event instead of failing.
+    truncated = doc[: doc.index('"MinorGC"')]
+    assert len(list(iter_trace_events(io.StringIO(truncated), chunk_chars=16))) == 7
+
+
+def test_summary_reports_main_thread_tasks_layout_gc_and_frames() -> None:
+    summary = TraceSummary()
+    for ev in _events():
+        summary.add(ev)
+    out = summary.result()
+
+    main = out["mainThread"]
+    assert (main["pid"], main["tid"], main["name"]) == (7, 1, "CrRendererMain")
+    assert main["busyMs"] == 190.0 and main["tasks"] == 3
+    assert main["longTasks"] == [{"startMs": 0.0, "durationMs": 120.0}, {"startMs": 200.0, "durationMs": 60.0}]
+    assert main["layout"] == {"count": 1, "ms": 5.0}
+    assert main["styleRecalc"] == {"count": 1, "ms": 3.0}
+    assert main["gc"] == {"count": 2, "ms": 10.0, "maxMs": 8.0}
+    assert out["frames"] == {"dropped": 2, "presented": 1, "dropRate": 0.667}
+    assert out["durationMs"] == 400.0
+
+
+def test_summarize_trace_file_reads_gzip(tmp_path: Path) -> None:
+    path = tmp_path / "t.json.gz"
+    with gzip.open(path, "wt", encoding="utf-8") as fh:
+        json.dump({"traceEvents": _events()}, fh)
+    assert summarize_trace_file(path)["mainThread"]["busyMs"] == 190.0
+
+
+def test_trace_detail_streams_io_chunks_into_artifact(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    from mcp_servers.browser.config import BrowserConfig
+    from mcp_servers.browser.server.artifacts import ArtifactStore
+    from mcp_servers.browser.server.handlers import page_capture
+    from mcp_servers.browser.tools.page import trace as trace_mod
+
+    payload = gzip.compress(json.dumps({"traceEvents": _events()}).encode("utf-8"))
+    chunks = [payload[i : i + 100] for i in range(0, len(payload), 100)]
+    sent: list[tuple[str, dict]] = []
+
+    class _Sess:
+        def send(self, method: str, params=None):  # noqa: ANN001
+            sent.append((method, params or {}))
+            if method == "IO.read":
+                data = chunks.pop(0)
+                return {"data": base64.b64encode(data).decode("ascii"), "base64Encoded": True, "eof": not chunks}
+            return {}
+
+        def wait_for_event(self, name: str, timeout: float = 10.0):  # noqa: ARG002
+            return {"stream": "h1"} if name == "Tracing.tracingComplete" else None
+
+    @contextmanager
+    def fake_get_session(_cfg, timeout: float = 5.0, **kwargs):  # noqa: ANN001,ARG001
+        yield _Sess(), {"id": "tab1"}
+
+    monkeypatch.setattr(trace_mod, "get_session", fake_get_session)
+    monkeypatch.setattr(trace_mod.time, "sleep", lambda _s: None)
+    store = ArtifactStore(base_dir=tmp_path / "artifacts")
+    monkeypatch.setattr(page_capture, "artifact_store", store)
+
+    out = page_capture.PAGE_CAPTURE_DETAILS["trace"](BrowserConfig.from_env(), {"duration_ms": 500})
+    methods = [m for m, _ in sent]
+    assert methods[0] == "Tracing.start" and sent[0][1]["transferMode"] == "ReturnAsStream"
+    assert methods.count("IO.read") > 1 and methods[-1] == "IO.close"
+    assert "tracePath" not in out
+    assert out["summary"]["mainThread"]["gc"]["count"] == 2
+    assert out["summary"]["compressedBytes"] == len(payload)
+
+    meta = store.get_meta(artifact_id=out["artifact"]["id"])
+    assert meta["kind"] == "trace" and meta["mimeType"] == "application/gzip"
+    assert (tmp_path / "artifacts" / f"{meta['id']}.json.gz").read_bytes() == payload
@@ -20,7 +20,7 @@ def test_upload_auto_finds_file_input_deep(monkeypatch: pytest.MonkeyPatch, tmp_
     class DummyTelemetry:
         dialog_open = False
 
-    monkeypatch.setattr(session_manager, "get_telemetry", lambda _tab_id: DummyTelemetry())
+    monkeypatch.setattr(session_manager, "tier0_query", lambda _tab_id, query: query(DummyTelemetry()))
 
     calls: list[tuple[str, object]] = []
 